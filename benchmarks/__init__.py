@@ -0,0 +1,5 @@
+"""
+benchmarks
+
+Description: Stand-alone performance benchmarks; run modules with python -m benchmarks.<name>
+"""
@@ -0,0 +1,125 @@
+"""
+bench_date_filter.py
+
+Description: Benchmark DateFilter over a month of daily imports, with and without the sorted date index
+Usage:
+    python -m benchmarks.bench_date_filter --rows-per-day 20000 --repeat 20
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.filters.date_filter import DateFilter
+
+
+def make_daily_import(day: pd.Timestamp, rows: int, seed: int) -> pd.DataFrame:
+    """
+    Create one day's import of synthetic chest entries.
+
+    Args:
+        day: Import date
+        rows: Number of entries
+        seed: Random seed
+
+    Returns:
+        DataFrame with the entry columns and a string "date" column
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "chest_type": rng.choice(["Cobra Chest", "Elegant Chest", "Barbarian Chest"], rows),
+            "player": rng.choice([f"Player{i}" for i in range(200)], rows),
+            "source": rng.choice(["Level 25 Crypt", "Level 20 Crypt", "Mercenary Exchange"], rows),
+            "status": "Pending",
+            "date": day.strftime("%Y-%m-%d"),
+        }
+    )
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(rows_per_day: int, days: int, repeat: int) -> Dict[str, Any]:
+    """
+    Import the days one by one into a store and time a one-week range filter.
+
+    Args:
+        rows_per_day: Entries per daily import
+        days: Number of daily imports
+        repeat: Runs per measurement
+
+    Returns:
+        Dict of results
+    """
+    store = DataFrameStore()
+    raw = pd.DataFrame()
+    import_times = []
+    for i, day in enumerate(pd.date_range("2025-03-01", periods=days, freq="D")):
+        daily = make_daily_import(day, rows_per_day, seed=i)
+        raw = pd.concat([raw, daily], ignore_index=True)
+        start = time.perf_counter()
+        store.set_entries(raw, emit_event=False)
+        import_times.append(time.perf_counter() - start)
+
+    entries = store.get_entries()
+
+    plain = DateFilter("plain", "Date", "date")
+    plain.set_date_range("2025-03-10", "2025-03-16")
+    indexed = DateFilter("indexed", "Date", "date")
+    indexed.set_date_index(store.get_date_index())
+    indexed.set_date_range("2025-03-10", "2025-03-16")
+
+    # Build the index once, as the first filter after an import would
+    indexed.apply(entries)
+
+    string_ms = time_call(lambda: plain.apply(raw), repeat)
+    datetime_ms = time_call(lambda: plain.apply(entries), repeat)
+    indexed_ms = time_call(lambda: indexed.apply(entries), repeat)
+
+    return {
+        "rows": len(entries),
+        "days": days,
+        "matched": len(indexed.apply(entries)),
+        "last_import_ms": import_times[-1] * 1000,
+        "string_column_ms": string_ms,
+        "datetime_column_ms": datetime_ms,
+        "sorted_index_ms": indexed_ms,
+        "speedup_vs_string": string_ms / indexed_ms if indexed_ms else None,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--rows-per-day", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rows_per_day, args.days, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+bench_entry_parser.py
+
+Description: Benchmark loading chest export text files as ChestEntry objects vs streamed column chunks
+Usage:
+    python -m benchmarks.bench_entry_parser --file data/input/chests_2025-03-17.txt --repeat 20
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.entry_reader import iter_entry_chunks
+from src.services.file_parser import FileParser
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(file_path: Path, repeat: int) -> Dict[str, Any]:
+    """
+    Time the entry loading paths on one file.
+
+    Args:
+        file_path: Chest export text file
+        repeat: Runs per measurement
+
+    Returns:
+        Dict of results
+    """
+    parser = FileParser()
+    store = DataFrameStore()
+    entry_count = len(parser.parse_entry_file(file_path))
+
+    objects_ms = time_call(lambda: parser.parse_entry_file(file_path), repeat)
+    chunks_ms = time_call(lambda: list(iter_entry_chunks(file_path)), repeat)
+    store_ms = time_call(
+        lambda: store.set_entries_from_chunks(iter_entry_chunks(file_path), emit_event=False),
+        repeat,
+    )
+
+    return {
+        "file": str(file_path),
+        "entries": entry_count,
+        "chest_entry_objects_ms": objects_ms,
+        "column_chunks_ms": chunks_ms,
+        "chunks_into_store_ms": store_ms,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark chest export parsing")
+    parser.add_argument("--file", type=Path, default=Path("data/input/chests_2025-03-17.txt"))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Keep per-file INFO logging out of the timings
+    logging.disable(logging.INFO)
+    print(json.dumps(run(args.file, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
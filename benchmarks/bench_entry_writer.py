@@ -0,0 +1,105 @@
+"""
+bench_entry_writer.py
+
+Description: Benchmark the vectorized entries exporter against writing ChestEntry objects one by one
+Usage:
+    python -m benchmarks.bench_entry_writer --entries 1000000 --repeat 3
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pandas as pd
+
+from src.models.chest_entry import ChestEntry
+from src.services.entry_writer import write_entries
+from src.services.session_cache import is_available as is_pyarrow_available
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(entries: int, repeat: int) -> Dict[str, Any]:
+    """
+    Time exporting synthetic entries in every format.
+
+    Args:
+        entries: Number of entries
+        repeat: Runs per measurement
+
+    Returns:
+        Dict of results
+    """
+    entries_df = pd.DataFrame(
+        {
+            "chest_type": [f"Chest {i % 50}" for i in range(entries)],
+            "player": [f"Player {i % 2000}" for i in range(entries)],
+            "source": [f"Level {i % 30} Crypt" for i in range(entries)],
+            "status": ["Valid"] * entries,
+            "validation_errors": [[] for _ in range(entries)],
+        }
+    )
+    chest_entries = [
+        ChestEntry(row.chest_type, row.player, row.source) for row in entries_df.itertuples()
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+
+        def write_objects() -> None:
+            with open(temp_dir / "objects.txt", "w", encoding="utf-8") as f:
+                for i, entry in enumerate(chest_entries):
+                    if i > 0:
+                        f.write("\n")
+                    f.write(entry.to_text())
+
+        results = {
+            "entries": entries,
+            "text_objects_ms": time_call(write_objects, repeat),
+            "text_ms": time_call(lambda: write_entries(entries_df, temp_dir / "x.txt"), repeat),
+            "csv_ms": time_call(lambda: write_entries(entries_df, temp_dir / "x.csv"), repeat),
+        }
+        if is_pyarrow_available():
+            results["parquet_ms"] = time_call(
+                lambda: write_entries(entries_df, temp_dir / "x.parquet"), repeat
+            )
+            results["parquet_bytes"] = (temp_dir / "x.parquet").stat().st_size
+        results["csv_bytes"] = (temp_dir / "x.csv").stat().st_size
+        return results
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the entries exporter")
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Keep per-file INFO logging out of the timings
+    logging.disable(logging.INFO)
+    print(json.dumps(run(args.entries, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+bench_logging.py
+
+Description: Benchmark per-row f-string logging vs sampled lazy logging, and file vs queued handlers, with DEBUG on and off
+Usage:
+    python -m benchmarks.bench_logging --rows 100000 --entries 20000 --repeat 3
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import logging.handlers
+import queue
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator
+
+from benchmarks.synthetic import entries_to_objects, make_entries, make_rules, rules_to_objects
+from src.services.corrector import Corrector
+from src.utils.logging_config import LogSampler
+
+
+logger = logging.getLogger("benchmarks.bench_logging")
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+@contextlib.contextmanager
+def logging_to(log_file: Path, level: int, queued: bool) -> Iterator[None]:
+    """
+    Send all records to a file, directly or through a queue listener thread.
+
+    Args:
+        log_file: File to write
+        level: Root logger level
+        queued: Whether a QueueListener thread writes the records
+    """
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s.%(msecs)03d - %(levelname)s - %(name)s - %(message)s")
+    )
+    listener = None
+    handler: logging.Handler = file_handler
+    if queued:
+        log_queue = queue.SimpleQueue()
+        handler = logging.handlers.QueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = list(root_logger.handlers), root_logger.level
+    for saved in saved_handlers:
+        root_logger.removeHandler(saved)
+    root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+    try:
+        yield
+    finally:
+        root_logger.removeHandler(handler)
+        if listener is not None:
+            listener.stop()
+        file_handler.close()
+        for saved in saved_handlers:
+            root_logger.addHandler(saved)
+        root_logger.setLevel(saved_level)
+
+
+def per_row_fstring(rows: int) -> None:
+    """Log every row with an f-string, as hot loops did before."""
+    for index in range(rows):
+        value = f"Player {index}"
+        logger.debug(f"Applied correction: {index:3d} player '{value}' -> 'Player'")
+
+
+def per_row_sampled(rows: int) -> None:
+    """Log the rows through a LogSampler with lazy %-style arguments."""
+    sampler = LogSampler(logger, "Applied correction")
+    for index in range(rows):
+        value = f"Player {index}"
+        sampler.log("Applied correction: %3d player '%s' -> 'Player'", index, value)
+    sampler.flush()
+
+
+def modes() -> Iterator[tuple]:
+    """
+    Get the logging setups to compare.
+
+    Yields:
+        (name, level, queued) per setup
+    """
+    for level in (logging.DEBUG, logging.INFO):
+        for queued in (False, True):
+            handler = "queue" if queued else "file"
+            yield f"{logging.getLevelName(level).lower()}_{handler}", level, queued
+
+
+def run(rows: int, entries: int, rules: int, repeat: int) -> Dict[str, Any]:
+    """
+    Time a logging loop and Corrector.apply_corrections under each logging setup.
+
+    Args:
+        rows: Iterations of the logging loops
+        entries: Entries corrected by Corrector.apply_corrections
+        rules: Correction rules
+        repeat: Runs per measurement
+
+    Returns:
+        Dict of results in milliseconds per logging setup
+    """
+    entries_df = make_entries(entries)
+    corrector = Corrector(rules_to_objects(make_rules(rules)))
+
+    def correct() -> None:
+        corrector.apply_corrections(entries_to_objects(entries_df))
+
+    results: Dict[str, Any] = {"rows": rows, "entries": entries, "rules": rules}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, level, queued in modes():
+            log_file = Path(temp_dir) / f"{name}.log"
+            with logging_to(log_file, level, queued):
+                results[name] = {
+                    "per_row_fstring_ms": time_call(lambda: per_row_fstring(rows), repeat),
+                    "per_row_sampled_ms": time_call(lambda: per_row_sampled(rows), repeat),
+                    "corrector_ms": time_call(correct, repeat),
+                }
+            results[name]["log_bytes"] = log_file.stat().st_size
+    return results
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Logging is what is measured here, so it is not disabled as in the other benchmarks
+    print(json.dumps(run(args.rows, args.entries, args.rules, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+bench_session_cache.py
+
+Description: Benchmark reopening a session from the columnar cache vs re-parsing the inputs
+Usage:
+    python -m benchmarks.bench_session_cache --copies 50 --repeat 5
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_service import FileService
+from src.services.session_cache import SessionCache
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run(copies: int, repeat: int) -> Dict[str, Any]:
+    """
+    Time loading the inputs from text and from the session cache.
+
+    Args:
+        copies: Number of times the sample entries file is repeated
+        repeat: Runs per measurement
+
+    Returns:
+        Dict of results
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        entries_path = temp_dir / "chests.txt"
+        text = Path("data/input/chests_2025-03-17.txt").read_text(encoding="utf-8")
+        entries_path.write_text(text * copies, encoding="utf-8")
+        sources = {
+            "entries": entries_path,
+            "correction_rules": Path("data/corrections/standard_corrections.csv"),
+            "player": Path("data/validation/players.txt"),
+            "chest_type": Path("data/validation/chest_types.txt"),
+            "source": Path("data/validation/sources.txt"),
+        }
+
+        def parse_inputs() -> DataFrameStore:
+            store = DataFrameStore()
+            file_service = FileService(store)
+            file_service.load_entries(sources["entries"])
+            file_service.load_correction_rules(sources["correction_rules"])
+            for list_type in ("player", "chest_type", "source"):
+                file_service.load_validation_list(list_type, sources[list_type])
+            return store
+
+        cache = SessionCache(temp_dir / "cache")
+        store = parse_inputs()
+        cache.save(store, sources)
+
+        return {
+            "entries": len(store.get_entries()),
+            "parse_inputs_ms": time_call(parse_inputs, repeat),
+            "restore_session_ms": time_call(
+                lambda: cache.restore(DataFrameStore(), sources), repeat
+            ),
+            "save_session_ms": time_call(lambda: cache.save(store, sources), repeat),
+        }
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    parser = argparse.ArgumentParser(description="Benchmark the session cache")
+    parser.add_argument("--copies", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # Keep per-file INFO logging out of the timings
+    logging.disable(logging.INFO)
+    print(json.dumps(run(args.copies, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+"""
+bench_suite.py
+
+Description: Benchmark parsing, correction, validation, filtering and table refresh over growing synthetic data
+Usage:
+    python -m benchmarks.bench_suite --entries 1000 10000 --rules 10 1000 --repeat 3
+    python -m benchmarks.bench_suite --cases corrector validation_fuzzy --compare benchmarks/results/last.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from benchmarks.synthetic import (
+    entries_to_objects,
+    make_entries,
+    make_rules,
+    make_validation_lists,
+    rules_to_objects,
+    write_export,
+)
+from src.models.validation_list import ValidationList
+from src.services.correction_service import CorrectionService
+from src.services.corrector import Corrector
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_parser import FileParser
+from src.services.filters.filter_manager import FilterManager
+from src.services.filters.text_filter import TextFilter
+from src.services.filters.validation_list_filter import ValidationListFilter
+from src.services.validation_service import ValidationService
+
+
+DEFAULT_ENTRIES = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_RULES = [10, 1_000, 50_000]
+
+# Seconds a single run may take; larger sizes of a case that exceeded it are skipped
+DEFAULT_BUDGET = 30.0
+
+# A case counts as a regression when it is this much slower than in the compared results
+DEFAULT_TOLERANCE = 0.2
+
+# Rows and columns a table view shows without scrolling
+VISIBLE_ROWS = 40
+VISIBLE_COLUMNS = 6
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def time_call(
+    func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], None]] = None
+) -> float:
+    """
+    Get the best wall time of a call.
+
+    Args:
+        func: Function to time
+        repeat: Number of runs
+        setup: Untimed function called before every run, for calls that change their input
+
+    Returns:
+        Best time in milliseconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def store_with(
+    entries_df: pd.DataFrame, rules_df: Optional[pd.DataFrame] = None, lists: bool = False
+) -> DataFrameStore:
+    """
+    Create a store holding synthetic data.
+
+    Args:
+        entries_df: Entries to store
+        rules_df: Correction rules to store, if any
+        lists: Whether to store the validation lists
+
+    Returns:
+        The store
+    """
+    store = DataFrameStore()
+    store.set_entries(entries_df, emit_event=False)
+    if rules_df is not None:
+        store.set_correction_rules(rules_df, emit_event=False)
+    if lists:
+        for list_type, list_df in make_validation_lists().items():
+            store.set_validation_list(list_type, list_df, emit_event=False)
+    return store
+
+
+def bench_file_parser(entries: int, rules: int, repeat: int) -> float:
+    """Time FileParser.parse_entry_file on an export file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "chests_2025-03-01.txt"
+        write_export(make_entries(entries), file_path)
+        parser = FileParser()
+        return time_call(lambda: parser.parse_entry_file(file_path), repeat)
+
+
+def bench_correction_service(entries: int, rules: int, repeat: int) -> float:
+    """Time CorrectionService.apply_corrections on a store with rules."""
+    entries_df, rules_df = make_entries(entries), make_rules(rules)
+    service = CorrectionService(store_with(entries_df, rules_df))
+
+    def reset() -> None:
+        # Corrections are written back to the store, so every run starts from the raw entries
+        service._store.set_entries(entries_df, emit_event=False)
+
+    return time_call(service.apply_corrections, repeat, setup=reset)
+
+
+def bench_corrector(entries: int, rules: int, repeat: int) -> float:
+    """Time Corrector.apply_corrections on ChestEntry objects."""
+    entries_df = make_entries(entries)
+    corrector = Corrector(rules_to_objects(make_rules(rules)))
+    state = {}
+
+    def reset() -> None:
+        # Corrections change the entries in place
+        state["entries"] = entries_to_objects(entries_df)
+
+    return time_call(lambda: corrector.apply_corrections(state["entries"]), repeat, setup=reset)
+
+
+def bench_validation_service(entries: int, rules: int, repeat: int) -> float:
+    """Time ValidationService.validate_entries against exact validation lists."""
+    service = ValidationService(store_with(make_entries(entries), lists=True))
+    return time_call(service.validate_entries, repeat)
+
+
+def _bench_validation_list(entries: int, repeat: int, use_fuzzy_matching: bool) -> float:
+    """
+    Time ValidationList.validate_many on the player column.
+
+    Args:
+        entries: Number of entries
+        repeat: Runs per measurement
+        use_fuzzy_matching: Whether invalid names are matched fuzzily
+
+    Returns:
+        Best time in milliseconds
+    """
+    players = make_validation_lists()["player"]["entry"].tolist()
+    values = make_entries(entries)["player"].tolist()
+
+    def validate() -> None:
+        # A new list per run, so fuzzy results are not reused from a previous run
+        validation_list = ValidationList("player", players, use_fuzzy_matching=use_fuzzy_matching)
+        validation_list.validate_many(values)
+
+    return time_call(validate, repeat)
+
+
+def bench_validation_exact(entries: int, rules: int, repeat: int) -> float:
+    """Time ValidationList.validate_many without fuzzy matching."""
+    return _bench_validation_list(entries, repeat, use_fuzzy_matching=False)
+
+
+def bench_validation_fuzzy(entries: int, rules: int, repeat: int) -> float:
+    """Time ValidationList.validate_many with fuzzy matching."""
+    return _bench_validation_list(entries, repeat, use_fuzzy_matching=True)
+
+
+def bench_filter_manager(entries: int, rules: int, repeat: int) -> float:
+    """Time FilterManager.apply_filters with a text and a validation list filter."""
+    entries_df = make_entries(entries)
+    manager = FilterManager()
+    text_filter = TextFilter("search", "Search", target_columns=["player", "source"])
+    text_filter.set_search_text("Player 1")
+    chest_filter = ValidationListFilter("chest_type", "Chest Type", "chest_type")
+    chest_filter.set_selected_values(["Cobra Chest", "Orc Chest"])
+    manager.register_filter("search", text_filter)
+    manager.register_filter("chest_type", chest_filter)
+    return time_call(lambda: manager.apply_filters(entries_df), repeat)
+
+
+def bench_table_refresh(entries: int, rules: int, repeat: int) -> float:
+    """Time refreshing the entry table model from the store and reading the visible cells."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    from src.ui.adapters.entry_table_adapter import EntryTableModel
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    DataFrameStore.get_instance().set_entries(make_entries(entries), emit_event=False)
+    model = EntryTableModel()
+
+    def refresh() -> None:
+        model.refresh_data()
+        for row in range(min(VISIBLE_ROWS, model.rowCount())):
+            for column in range(min(VISIBLE_COLUMNS, model.columnCount())):
+                model.data(model.index(row, column))
+
+    elapsed = time_call(refresh, repeat)
+    app.processEvents()
+    return elapsed
+
+
+# Benchmarks by case name, and whether they scale with the number of rules
+CASES: Dict[str, Tuple[Callable[[int, int, int], float], bool]] = {
+    "file_parser": (bench_file_parser, False),
+    "correction_service": (bench_correction_service, True),
+    "corrector": (bench_corrector, True),
+    "validation_service": (bench_validation_service, False),
+    "validation_exact": (bench_validation_exact, False),
+    "validation_fuzzy": (bench_validation_fuzzy, False),
+    "filter_manager": (bench_filter_manager, False),
+    "table_refresh": (bench_table_refresh, False),
+}
+
+
+def sizes(case: str, entries: List[int], rules: List[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Get the sizes a case runs at, smallest first.
+
+    Args:
+        case: Case name
+        entries: Entry counts
+        rules: Rule counts
+
+    Yields:
+        (entries, rules) pairs; rules is 0 for cases that do not use rules
+    """
+    for entry_count in sorted(entries):
+        for rule_count in sorted(rules) if CASES[case][1] else [0]:
+            yield entry_count, rule_count
+
+
+def run(
+    cases: List[str], entries: List[int], rules: List[int], repeat: int, budget: float
+) -> Dict[str, Any]:
+    """
+    Run the cases at every size within the time budget.
+
+    A size is skipped when a run at a size no larger in both dimensions
+    already took longer than the budget.
+
+    Args:
+        cases: Case names
+        entries: Entry counts
+        rules: Rule counts
+        repeat: Runs per measurement
+        budget: Seconds a single run may take
+
+    Returns:
+        Dict with the environment and one result per case and size
+    """
+    results = []
+    for case in cases:
+        bench = CASES[case][0]
+        over_budget: List[Tuple[int, int]] = []
+        for entry_count, rule_count in sizes(case, entries, rules):
+            result: Dict[str, Any] = {"case": case, "entries": entry_count, "rules": rule_count}
+            if any(entry_count >= e and rule_count >= r for e, r in over_budget):
+                result["skipped"] = "over budget"
+            else:
+                result["ms"] = round(bench(entry_count, rule_count, repeat), 3)
+                if result["ms"] > budget * 1000:
+                    over_budget.append((entry_count, rule_count))
+            print(json.dumps(result), file=sys.stderr)
+            results.append(result)
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.platform(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], previous: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Find the cases that got slower than in previous results.
+
+    Args:
+        current: Results of this run
+        previous: Results to compare against
+        tolerance: Allowed slowdown as a fraction of the previous time
+
+    Returns:
+        One message per regression
+    """
+    previous_ms = {
+        (result["case"], result["entries"], result["rules"]): result["ms"]
+        for result in previous["results"]
+        if "ms" in result
+    }
+    regressions = []
+    for result in current["results"]:
+        key = (result["case"], result["entries"], result["rules"])
+        if "ms" in result and key in previous_ms and previous_ms[key] > 0:
+            ratio = result["ms"] / previous_ms[key]
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{key[0]} (entries={key[1]}, rules={key[2]}): "
+                    f"{previous_ms[key]:.1f} ms -> {result['ms']:.1f} ms ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main() -> int:
+    """
+    Run the suite, write the results as JSON and compare them to previous results.
+
+    Returns:
+        Exit status: 1 if a case regressed, 0 otherwise
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--entries", nargs="+", type=int, default=DEFAULT_ENTRIES)
+    parser.add_argument("--rules", nargs="+", type=int, default=DEFAULT_RULES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--budget", type=float, default=DEFAULT_BUDGET, help="seconds a single run may take"
+    )
+    parser.add_argument("--output", type=Path, help="results file (default: benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, help="previous results file to check against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    current = run(args.cases, args.entries, args.rules, args.repeat, args.budget)
+
+    output = args.output or RESULTS_DIR / f"bench_suite_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    print(json.dumps(current, indent=2))
+
+    if args.compare:
+        regressions = compare(
+            current, json.loads(args.compare.read_text(encoding="utf-8")), args.tolerance
+        )
+        for message in regressions:
+            print(f"Regression: {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+synthetic.py
+
+Description: Seeded generators of chest entries, correction rules and validation lists for benchmarks
+Usage:
+    from benchmarks.synthetic import make_entries, make_rules
+
+    entries_df = make_entries(100_000)
+    rules_df = make_rules(1_000)
+"""
+
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from src.models.chest_entry import ChestEntry
+from src.models.correction_rule import CorrectionRule
+from src.services.entry_writer import write_entries_text
+
+
+# Distinct valid values per field
+PLAYER_COUNT = 2000
+CHEST_TYPES = [
+    "Cobra Chest",
+    "Elegant Chest",
+    "Barbarian Chest",
+    "Orc Chest",
+    "Forgotten Chest",
+    "Infernal Chest",
+    "Bone Chest",
+    "Chest of the Cursed",
+]
+SOURCES = [f"Level {level} Crypt" for level in range(5, 40, 5)] + [
+    "Mercenary Exchange",
+    "Arena",
+    "Epic Undead Citadel",
+]
+
+# Only the first players get misspelled variants, so the number of distinct
+# invalid values (which fuzzy validation compares against the whole list) stays bounded
+MISSPELLED_PLAYERS = 200
+MISSPELLED_SHARE = 0.1
+
+# Every n-th rule has the "general" category and applies to all fields
+GENERAL_RULE_EVERY = 10
+
+
+def player_name(index: int) -> str:
+    """
+    Get the valid name of a synthetic player.
+
+    Args:
+        index: Player number
+
+    Returns:
+        Player name
+    """
+    return f"Player {index}"
+
+
+def misspelled_name(index: int) -> str:
+    """
+    Get the misspelled name of a synthetic player, as OCR would produce it.
+
+    Args:
+        index: Player number
+
+    Returns:
+        Misspelled player name
+    """
+    return f"Playr {index}"
+
+
+def make_entries(count: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Create synthetic chest entries with a share of misspelled player names.
+
+    Args:
+        count: Number of entries
+        seed: Random seed
+
+    Returns:
+        DataFrame indexed by "id" with the columns of loaded entries, as in DataFrameStore
+    """
+    rng = np.random.default_rng(seed)
+    player_ids = rng.integers(0, PLAYER_COUNT, count)
+    misspelled = (rng.random(count) < MISSPELLED_SHARE) & (player_ids < MISSPELLED_PLAYERS)
+    players = np.where(
+        misspelled,
+        np.char.add("Playr ", player_ids.astype(str)),
+        np.char.add("Player ", player_ids.astype(str)),
+    )
+    days = pd.date_range("2025-03-01", periods=30, freq="D").strftime("%Y-%m-%d")
+    return pd.DataFrame(
+        {
+            "chest_type": rng.choice(CHEST_TYPES, count),
+            "player": players.astype(object),
+            "source": rng.choice(SOURCES, count),
+            "status": "Pending",
+            "date": rng.choice(days, count),
+            "validation_errors": [[] for _ in range(count)],
+            "original_values": [{} for _ in range(count)],
+        },
+        index=pd.RangeIndex(count, name="id"),
+    )
+
+
+def make_rules(count: int) -> pd.DataFrame:
+    """
+    Create correction rules in the layout of rule files.
+
+    The first MISSPELLED_PLAYERS rules fix names that occur in make_entries;
+    the rest target misspellings that never occur, like most rules of a large rule file.
+
+    Args:
+        count: Number of rules
+
+    Returns:
+        DataFrame with from_text, to_text, category and enabled columns
+    """
+    ids = np.arange(count)
+    return pd.DataFrame(
+        {
+            "from_text": [misspelled_name(i) for i in ids],
+            "to_text": [player_name(i % PLAYER_COUNT) for i in ids],
+            "category": np.where(ids % GENERAL_RULE_EVERY == 0, "general", "player"),
+            "enabled": True,
+        }
+    )
+
+
+def make_validation_lists() -> Dict[str, pd.DataFrame]:
+    """
+    Create the validation lists of all valid synthetic values.
+
+    Returns:
+        Dict of list type to DataFrame with an "entry" column
+    """
+    return {
+        "player": pd.DataFrame({"entry": [player_name(i) for i in range(PLAYER_COUNT)]}),
+        "chest_type": pd.DataFrame({"entry": CHEST_TYPES}),
+        "source": pd.DataFrame({"entry": SOURCES}),
+    }
+
+
+def rules_to_objects(rules_df: pd.DataFrame) -> List[CorrectionRule]:
+    """
+    Convert a rules frame to CorrectionRule objects.
+
+    Args:
+        rules_df: Rules created by make_rules
+
+    Returns:
+        List of exact-match rules
+    """
+    return [
+        CorrectionRule(from_text=from_text, to_text=to_text, category=category)
+        for from_text, to_text, category in zip(
+            rules_df["from_text"], rules_df["to_text"], rules_df["category"]
+        )
+    ]
+
+
+def entries_to_objects(entries_df: pd.DataFrame) -> List[ChestEntry]:
+    """
+    Convert an entries frame to ChestEntry objects.
+
+    Args:
+        entries_df: Entries created by make_entries
+
+    Returns:
+        List of entries
+    """
+    return [
+        ChestEntry(chest_type=chest_type, player=player, source=source)
+        for chest_type, player, source in zip(
+            entries_df["chest_type"], entries_df["player"], entries_df["source"]
+        )
+    ]
+
+
+def write_export(entries_df: pd.DataFrame, file_path: Union[str, Path]) -> int:
+    """
+    Write entries as a chest export text file.
+
+    Args:
+        entries_df: Entries created by make_entries
+        file_path: Target file
+
+    Returns:
+        Number of entries written
+    """
+    return write_entries_text(entries_df, file_path)
@@ -5,8 +5,15 @@ main.py
 Description: Main entry point for the Chest Tracker Correction Tool
 Usage:
     python main.py
+
+    # Record startup timings as a Chrome trace plus a summary table in the log
+    python main.py --profile-startup [TRACE_PATH]
+
+    # Record hot path metrics and write them as JSON on exit (see src.utils.metrics)
+    python main.py --metrics [JSON_PATH]
 """
 
+import argparse
 import sys
 import traceback
 import logging
@@ -17,6 +24,15 @@ from src.app_bootstrapper import AppBootstrapper
 from src.ui.styles import get_stylesheet
 from src.utils.logging_config import configure_logging
 from src.interfaces.i_config_manager import IConfigManager
+from src.services.warm_up import get_warm_up
+from src.utils.metrics import add_metrics_argument, metrics
+from src.utils.startup_profiler import (
+    add_profile_argument,
+    finish_after_startup,
+    profile_phase,
+    rerun_with_import_times,
+    start_profiling,
+)
 
 
 def setup_environment():
@@ -25,6 +41,9 @@ def setup_environment():
 
     Creates necessary directories if they don't exist and
     initializes basic configuration.
+
+    Returns:
+        The initialized AppBootstrapper, or None on error
     """
     try:
         # Initialize bootstrapper instead of directly using ConfigManager
@@ -66,22 +85,42 @@ def setup_environment():
             config_manager.save()
             config_manager._create_default_directories()
 
-        return service_factory
+        return bootstrapper
     except Exception as e:
         logging.error(f"Error setting up environment: {e}")
         traceback.print_exc()
         return None
 
 
-def main():
+def main(argv=None):
     """
     Main entry point for the application.
 
     Creates the Qt application and main window.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:]); Qt options are passed on
+
+    Returns:
+        Exit code of the application
     """
+    parser = argparse.ArgumentParser(description="Chest Tracker Correction Tool")
+    add_profile_argument(parser)
+    add_metrics_argument(parser)
+    args, _ = parser.parse_known_args(argv)
+    if args.profile_startup is not None:
+        # Import times can only be recorded from interpreter start
+        exit_code = rerun_with_import_times()
+        if exit_code is not None:
+            return exit_code
+
     try:
         # Set up enhanced logging with timestamps
         configure_logging(log_to_file=True, debug_mode=True)
+        if args.profile_startup is not None:
+            start_profiling()
+        if args.metrics is not None:
+            metrics.enable()
 
         # Log starting of application with details
         logging.info("=" * 80)
@@ -92,29 +131,40 @@ def main():
         logging.info("=" * 80)
 
         # Initialize environment and get service factory
-        service_factory = setup_environment()
-        if not service_factory:
+        with profile_phase("bootstrap"):
+            bootstrapper = setup_environment()
+        if not bootstrapper:
             logging.critical("Failed to initialize environment")
             return 1
+        service_factory = bootstrapper.service_factory
 
         # Create QApplication instance
-        app = QApplication(sys.argv)
+        with profile_phase("qt_application"):
+            app = QApplication(sys.argv)
         app.setApplicationName("Chest Tracker Correction Tool")
         app.setOrganizationName("TotalBattleTools")
 
         # Set application stylesheet
-        app.setStyleSheet(get_stylesheet())
+        with profile_phase("stylesheet"):
+            app.setStyleSheet(get_stylesheet())
+
+        # Snapshot the store for a fast restore on the next start
+        app.aboutToQuit.connect(bootstrapper.save_session)
+        if args.metrics is not None:
+            app.aboutToQuit.connect(lambda: metrics.dump(args.metrics))
 
         # Set up signal tracking
         logging.info("Setting up MainWindowInterface")
 
         try:
             # Create main window using the service factory
-            main_window = MainWindowInterface(service_factory)
+            with profile_phase("window"):
+                main_window = MainWindowInterface(service_factory)
             logging.info("MainWindowInterface created successfully")
 
             # Show main window
-            main_window.show()
+            with profile_phase("show_window"):
+                main_window.show()
             logging.info("MainWindowInterface shown successfully")
         except Exception as window_error:
             logging.critical(
@@ -123,6 +173,8 @@ def main():
             raise
 
         logging.info("Application started successfully")
+        if args.profile_startup is not None:
+            finish_after_startup(args.profile_startup, get_warm_up(service_factory))
 
         # Start the event loop
         return app.exec()
@@ -6,10 +6,14 @@ Usage:
     from src.app_bootstrapper import AppBootstrapper
     bootstrapper = AppBootstrapper()
     bootstrapper.initialize()
+
+    # Rules and validation lists are read in the background; publish them with
+    bootstrapper.warm_up.wait()  # or warm_up.publish_ready() from the GUI thread
 """
 
 import logging
-from typing import Dict, Any, Type
+from pathlib import Path
+from typing import Dict, Any, Optional, Type
 
 # Import interface types
 from src.interfaces.i_data_store import IDataStore
@@ -28,6 +32,9 @@ from src.services.validation_service import ValidationService
 from src.services.correction_service import CorrectionService
 from src.services.service_factory import ServiceFactory
 from src.services.filters.filter_manager import FilterManager
+from src.services.session_cache import VALIDATION_LIST_TYPES, SessionCache
+from src.services.warm_up import WarmUp
+from src.utils.startup_profiler import profile_phase
 
 
 class AppBootstrapper:
@@ -39,6 +46,9 @@ class AppBootstrapper:
 
     Attributes:
         service_factory: ServiceFactory instance
+        session_cache: SessionCache for the store state, or None if disabled
+        session_restored: Whether the store was filled from the session cache
+        warm_up: Background read of the correction rules and validation lists, or None
         _logger: Logger instance
         _initialized: Flag indicating if bootstrapper has been initialized
 
@@ -47,6 +57,9 @@ class AppBootstrapper:
         - Initializes services in the correct order
         - Registers services with the service factory
         - Provides methods for resolving service implementations
+        - Restores the store from the session cache when the inputs are unchanged
+        - Starts reading the saved rules and validation lists on a thread pool;
+          the warm-up is registered as a service and published by the UI
     """
 
     def __init__(self):
@@ -55,6 +68,9 @@ class AppBootstrapper:
         """
         self._logger = logging.getLogger(__name__)
         self.service_factory = None
+        self.session_cache: Optional[SessionCache] = None
+        self.session_restored = False
+        self.warm_up: Optional[WarmUp] = None
         self._initialized = False
 
     def initialize(self) -> None:
@@ -68,13 +84,22 @@ class AppBootstrapper:
         self._logger.info("Initializing application...")
 
         # Initialize services in the correct order
-        self._initialize_config_manager()
-        self._initialize_data_store()
-        self._initialize_services()
-        self._initialize_filter_manager()
+        with profile_phase("bootstrap.config_manager"):
+            self._initialize_config_manager()
+        with profile_phase("bootstrap.data_store"):
+            self._initialize_data_store()
+        with profile_phase("bootstrap.services"):
+            self._initialize_services()
+        with profile_phase("bootstrap.filter_manager"):
+            self._initialize_filter_manager()
+        with profile_phase("bootstrap.restore_session"):
+            self._restore_session()
+        with profile_phase("bootstrap.start_warm_up"):
+            self._start_warm_up()
 
         # Register all services with the service factory
-        self._register_services_with_factory()
+        with profile_phase("bootstrap.register_services"):
+            self._register_services_with_factory()
 
         self._initialized = True
         self._logger.info("Application initialized successfully.")
@@ -101,8 +126,15 @@ class AppBootstrapper:
         # Get the config manager from the service factory
         config_manager = self.service_factory.get_service(IConfigManager)
 
-        # Create the DataFrameStore with dependency injection
-        data_store = DataFrameStore.get_instance()
+        # Create the DataFrameStore, or the SQLite history backend if configured
+        if config_manager.get_str("Storage", "backend", fallback="memory") == "sqlite":
+            # Imported here so the default in-memory backend does not load sqlite3
+            from src.services.sqlite_store import SQLiteDataStore
+
+            db_path = config_manager.get_str("Storage", "sqlite_path", fallback="data/history.db")
+            data_store = SQLiteDataStore(config_manager.get_absolute_path(db_path))
+        else:
+            data_store = DataFrameStore.get_instance()
 
         # Register as IDataStore implementation
         self.service_factory.register_service(IDataStore, data_store)
@@ -143,6 +175,90 @@ class AppBootstrapper:
         # Register as IFilterManager implementation
         self.service_factory.register_service(IFilterManager, filter_manager)
 
+    def session_sources(self) -> Dict[str, Optional[Path]]:
+        """
+        Get the input files the session cache is keyed on.
+
+        Returns:
+            Mapping of source name to absolute path (None if not configured)
+        """
+        config_manager = self.service_factory.get_service(IConfigManager)
+        paths = {
+            "entries": config_manager.get_last_used_path("last_input_file"),
+            "correction_rules": config_manager.get_path("correction_rules_file"),
+        }
+        for list_type in VALIDATION_LIST_TYPES:
+            paths[list_type] = config_manager.get_path(f"{list_type}_list_file")
+
+        return {
+            name: config_manager.get_absolute_path(path) if str(path) not in ("", ".") else None
+            for name, path in paths.items()
+        }
+
+    def _restore_session(self) -> None:
+        """
+        Fill the data store from the session cache if the inputs are unchanged.
+
+        Any error leaves the store empty, so the inputs are loaded as usual.
+        """
+        try:
+            config_manager = self.service_factory.get_service(IConfigManager)
+            if not config_manager.get_bool("Session", "cache_enabled", fallback=True):
+                return
+
+            data_dir = config_manager.get_absolute_path(config_manager.get_path("data_dir", "data"))
+            self.session_cache = SessionCache(data_dir / "cache" / "session")
+
+            sources = self.session_sources()
+            data_store = self.service_factory.get_service(IDataStore)
+            self.session_restored = self.session_cache.restore(data_store, sources)
+            if self.session_restored:
+                self._logger.info("Restored data store from the session cache")
+                file_service = self.service_factory.get_service(IFileService)
+                file_service.set_restored_sources(sources)
+        except Exception as e:
+            self._logger.error(f"Error restoring session: {e}")
+            self.session_cache = None
+            self.session_restored = False
+
+    def _start_warm_up(self) -> None:
+        """
+        Start reading the saved correction rules and validation lists in the background.
+
+        Sources restored from the session cache are not read again. Disabled
+        with [Startup] warm_up = false, in which case the UI loads them itself.
+        """
+        try:
+            config_manager = self.service_factory.get_service(IConfigManager)
+            if not config_manager.get_bool("Startup", "warm_up", fallback=True):
+                return
+
+            sources = self.session_sources()
+            sources.pop("entries")
+            file_service = self.service_factory.get_service(IFileService)
+            self.warm_up = file_service.start_warm_up(sources)
+            self.service_factory.register_service(WarmUp, self.warm_up)
+        except Exception as e:
+            self._logger.error(f"Error starting warm-up: {e}")
+            self.warm_up = None
+
+    def save_session(self) -> bool:
+        """
+        Write the data store state to the session cache.
+
+        Returns:
+            bool: True if the session was saved, False otherwise
+        """
+        if not self._initialized or self.session_cache is None:
+            return False
+
+        try:
+            data_store = self.service_factory.get_service(IDataStore)
+            return self.session_cache.save(data_store, self.session_sources())
+        except Exception as e:
+            self._logger.error(f"Error saving session: {e}")
+            return False
+
     def _register_services_with_factory(self) -> None:
         """
         Register all services with the service factory.
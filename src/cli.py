@@ -0,0 +1,575 @@
+"""
+cli.py
+
+Description: Headless batch pipeline that loads, corrects, validates and exports entry files
+Usage:
+    python -m src.cli data/input/chests_2025-03-*.txt --output-dir data/output --workers 4
+
+    # Exit with status 3 if more than 5% of the entries are invalid
+    python -m src.cli data/input --max-invalid-ratio 0.05 --stats stats.json
+
+    # Process new and changed chests_*.txt files in data/input as they arrive,
+    # appending them to the SQLite history
+    python -m src.cli --watch [FOLDER] [--once]
+
+Correction rules and validation lists default to the files configured in
+config.ini. Statistics are printed to stdout as JSON (one line per batch in
+watch mode); logs go to stderr.
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.app_bootstrapper import AppBootstrapper
+from src.interfaces.i_config_manager import IConfigManager
+from src.interfaces.i_data_store import IDataStore
+from src.interfaces.i_file_service import IFileService
+from src.services.bulk_import import resolve_entry_paths
+from src.services.config_manager import ConfigManager
+from src.services.correction_service import CorrectionService
+from src.services.dataframe_store import DataFrameStore
+from src.services.entry_writer import EXPORT_FORMATS, write_entries
+from src.services.file_service import FileService
+from src.services.session_cache import VALIDATION_LIST_TYPES
+from src.services.sqlite_store import SQLiteDataStore
+from src.services.validation_service import ValidationService
+from src.services.watch_folder import (
+    DEFAULT_INTERVAL,
+    DEFAULT_PATTERN,
+    DEFAULT_SETTLE_SECONDS,
+    FolderWatcher,
+    PendingFile,
+    WatchManifest,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Exit statuses; argparse exits with 2 on usage errors
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_THRESHOLD_EXCEEDED = 3
+
+# File extension per export format
+FORMAT_EXTENSIONS = {export_format: ext for ext, export_format in EXPORT_FORMATS.items()}
+
+# Correction rules and validation lists of the current worker process, see _init_worker
+_worker_inputs: Dict[str, pd.DataFrame] = {}
+
+
+@dataclass
+class FileResult:
+    """
+    Outcome of running the pipeline on one file.
+
+    Attributes:
+        path (str): Input file
+        output (Optional[str]): Exported file, if the file was processed
+        entries (int): Number of entries loaded
+        corrections (int): Number of corrections applied
+        correction_errors (int): Number of corrections that failed and were skipped
+        valid (int): Number of valid entries
+        invalid (int): Number of invalid entries
+        seconds (float): Processing time
+        error (Optional[str]): Error message if the file could not be processed
+    """
+
+    path: str
+    output: Optional[str] = None
+    entries: int = 0
+    corrections: int = 0
+    correction_errors: int = 0
+    valid: int = 0
+    invalid: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def _init_worker(inputs: Mapping[str, pd.DataFrame]) -> None:
+    """
+    Keep the correction rules and validation lists for the files of this process.
+
+    Args:
+        inputs: DataFrame per source name ("correction_rules" or a validation list type)
+    """
+    _worker_inputs.clear()
+    _worker_inputs.update(inputs)
+
+
+def process_file(
+    path: str, output_path: str, export_format: str, keep_entries: bool = False
+) -> Tuple[FileResult, Optional[pd.DataFrame]]:
+    """
+    Load, correct, validate and export one entry file (runs in a worker process).
+
+    Each file gets its own data store, filled with the inputs from _init_worker.
+
+    Args:
+        path: Input file
+        output_path: File to export to
+        export_format: "text", "csv" or "parquet"
+        keep_entries: Return the validated entries
+
+    Returns:
+        Tuple of the file's statistics and its validated entries (None unless
+        keep_entries is set and the file was processed)
+    """
+    start = time.perf_counter()
+    result = FileResult(path=path)
+    entries_df = None
+    try:
+        store = DataFrameStore()
+        for name, data_df in _worker_inputs.items():
+            if name == "correction_rules":
+                store.set_correction_rules(data_df)
+            else:
+                store.set_validation_list(name, data_df)
+
+        if not FileService(store).load_entries(Path(path)):
+            raise ValueError("no entries loaded")
+        result.entries = len(store.get_entries())
+
+        corrections = CorrectionService(store).apply_corrections()
+        result.corrections = corrections["applied"]
+        result.correction_errors = corrections["errors"]
+        validation = ValidationService(store).validate_entries()
+        result.valid, result.invalid = validation["valid"], validation["invalid"]
+
+        write_entries(store.get_entries(), output_path, export_format)
+        result.output = output_path
+        if keep_entries:
+            entries_df = store.get_entries()
+    except Exception as e:
+        result.error = str(e)
+    result.seconds = round(time.perf_counter() - start, 3)
+    return result, entries_df
+
+
+def run_pipeline(
+    files: Sequence[Path],
+    inputs: Mapping[str, pd.DataFrame],
+    output_dir: Path,
+    export_format: str = "csv",
+    max_workers: int = 1,
+    keep_entries: bool = False,
+) -> Tuple[List[FileResult], List[Optional[pd.DataFrame]]]:
+    """
+    Run the pipeline over many files.
+
+    Files are processed on a process pool (inline for max_workers=1), and
+    serially if the pool cannot be used.
+
+    Args:
+        files: Input files
+        inputs: Correction rules and validation lists, see _init_worker
+        output_dir: Directory for the exported files
+        export_format: "text", "csv" or "parquet"
+        max_workers: Number of worker processes
+        keep_entries: Return the validated entries of each file
+
+    Returns:
+        Tuple of one result and one entries DataFrame (or None) per file, in file order
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    extension = FORMAT_EXTENSIONS[export_format]
+    jobs = [
+        (
+            str(path),
+            str(output_dir / f"{path.stem}_corrected{extension}"),
+            export_format,
+            keep_entries,
+        )
+        for path in files
+    ]
+    outcomes: List[Optional[Tuple[FileResult, Optional[pd.DataFrame]]]] = [None] * len(jobs)
+
+    if max_workers > 1 and len(jobs) > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(dict(inputs),)
+            ) as executor:
+                futures = {
+                    executor.submit(process_file, *job): index for index, job in enumerate(jobs)
+                }
+                for future in as_completed(futures):
+                    try:
+                        outcomes[futures[future]] = future.result()
+                    except BrokenProcessPool:
+                        pass
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Process pool unavailable, processing serially: {e}")
+
+    pending = [index for index, outcome in enumerate(outcomes) if outcome is None]
+    if pending:
+        _init_worker(inputs)
+        for index in pending:
+            outcomes[index] = process_file(*jobs[index])
+
+    results = [result for result, _ in outcomes]
+    for result in results:
+        if result.error is not None:
+            logger.error(f"Error processing {result.path}: {result.error}")
+    return results, [entries_df for _, entries_df in outcomes]
+
+
+def summarize(results: Sequence[FileResult], seconds: float, workers: int) -> Dict[str, Any]:
+    """
+    Build the statistics summary.
+
+    Args:
+        results: Results of all files
+        seconds: Wall time of the pipeline
+        workers: Number of worker processes
+
+    Returns:
+        Dict[str, Any]: Totals, per-file results and timing
+    """
+    entries = sum(result.entries for result in results)
+    invalid = sum(result.invalid for result in results)
+    return {
+        "totals": {
+            "files": len(results),
+            "failed_files": sum(result.error is not None for result in results),
+            "entries": entries,
+            "corrections": sum(result.corrections for result in results),
+            "correction_errors": sum(result.correction_errors for result in results),
+            "valid": sum(result.valid for result in results),
+            "invalid": invalid,
+            "invalid_ratio": round(invalid / entries, 6) if entries else 0.0,
+        },
+        "files": [asdict(result) for result in results],
+        "seconds": round(seconds, 3),
+        "workers": workers,
+    }
+
+
+def _load_inputs(
+    bootstrapper: AppBootstrapper, overrides: Mapping[str, Optional[str]]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Load the correction rules and validation lists through the file service.
+
+    Args:
+        bootstrapper: Initialized bootstrapper
+        overrides: Path per source name given on the command line (None for the configured file)
+
+    Returns:
+        Dict[str, pd.DataFrame]: DataFrame per loaded source
+
+    Raises:
+        ValueError: If a file given on the command line cannot be loaded
+    """
+    service_factory = bootstrapper.service_factory
+    file_service = service_factory.get_service(IFileService)
+    data_store = service_factory.get_service(IDataStore)
+
+    sources = bootstrapper.session_sources()
+    sources.pop("entries")
+    sources.update({name: Path(path) for name, path in overrides.items() if path})
+
+    inputs = {}
+    for name, path in sources.items():
+        if path is None or not path.is_file():
+            if name in overrides and overrides[name]:
+                raise ValueError(f"File not found: {path}")
+            logger.warning(f"No {name.replace('_', ' ')} file, skipping")
+            continue
+        if name == "correction_rules":
+            loaded = file_service.load_correction_rules(path)
+            data_df = data_store.get_correction_rules()
+        else:
+            loaded = file_service.load_validation_list(name, path)
+            data_df = data_store.get_validation_list(name)
+        if not loaded:
+            raise ValueError(f"Could not load {name.replace('_', ' ')} from {path}")
+        inputs[name] = data_df
+    return inputs
+
+
+def check_thresholds(
+    summary: Mapping[str, Any],
+    max_invalid: Optional[int] = None,
+    max_invalid_ratio: Optional[float] = None,
+) -> List[str]:
+    """
+    Check the validation results against the failure thresholds.
+
+    Args:
+        summary: Result of summarize()
+        max_invalid: Maximum number of invalid entries, None for no limit
+        max_invalid_ratio: Maximum share of invalid entries (0-1), None for no limit
+
+    Returns:
+        List[str]: Description of each exceeded threshold
+    """
+    totals = summary["totals"]
+    exceeded = []
+    if max_invalid is not None and totals["invalid"] > max_invalid:
+        exceeded.append(f"{totals['invalid']} invalid entries (max {max_invalid})")
+    if max_invalid_ratio is not None and totals["invalid_ratio"] > max_invalid_ratio:
+        exceeded.append(
+            f"{totals['invalid_ratio']:.2%} invalid entries (max {max_invalid_ratio:.2%})"
+        )
+    return exceeded
+
+
+def _default_workers(file_count: int) -> int:
+    """
+    Get the default number of worker processes.
+
+    Args:
+        file_count: Number of files to process
+
+    Returns:
+        int: Number of workers, at most one per file
+    """
+    return max(1, min(file_count, os.cpu_count() or 1))
+
+
+def _report(summary: Dict[str, Any], args: argparse.Namespace, indent: Optional[int] = 2) -> int:
+    """
+    Check the thresholds, print the statistics and get the exit status.
+
+    Args:
+        summary: Result of summarize(); gets the exceeded thresholds added
+        args: Parsed command line
+        indent: JSON indentation, None for a single line
+
+    Returns:
+        int: EXIT_ERROR if a file or any correction failed,
+        EXIT_THRESHOLD_EXCEEDED if too many entries are invalid, EXIT_OK otherwise
+    """
+    exceeded = check_thresholds(summary, args.max_invalid, args.max_invalid_ratio)
+    summary["thresholds_exceeded"] = exceeded
+
+    text = json.dumps(summary, indent=indent)
+    print(text, flush=True)
+    if args.stats:
+        Path(args.stats).write_text(text, encoding="utf-8")
+
+    if summary["totals"]["failed_files"]:
+        return EXIT_ERROR
+    if summary["totals"]["correction_errors"]:
+        logger.error(f"{summary['totals']['correction_errors']} corrections failed")
+        return EXIT_ERROR
+    if exceeded:
+        logger.error(f"Validation failure threshold exceeded: {'; '.join(exceeded)}")
+        return EXIT_THRESHOLD_EXCEEDED
+    return EXIT_OK
+
+
+def watch(
+    args: argparse.Namespace,
+    inputs: Mapping[str, pd.DataFrame],
+    output_dir: Path,
+    config_manager: Any,
+) -> int:
+    """
+    Process new and changed files of the input folder as they arrive.
+
+    Each file is corrected, validated, exported and appended to the SQLite
+    history as its own import; a changed file replaces its earlier import.
+    Processed files are tracked in a manifest, so a restart only processes
+    what changed in the meantime.
+
+    Args:
+        args: Parsed command line
+        inputs: Correction rules and validation lists
+        output_dir: Directory for the exported files
+        config_manager: Configuration for the default folder, manifest and database
+
+    Returns:
+        int: Exit status of the last batch with --once, EXIT_OK otherwise
+    """
+
+    def configured_path(key: str, default: str) -> Path:
+        return config_manager.get_absolute_path(config_manager.get_path(key, default))
+
+    folder = Path(args.inputs[0]) if args.inputs else configured_path("input_dir", "data/input")
+    manifest = WatchManifest(
+        args.manifest or configured_path("data_dir", "data") / "cache" / "watch_manifest.json"
+    )
+    db_path = args.db or config_manager.get_absolute_path(
+        config_manager.get_str("Storage", "sqlite_path", fallback="data/history.db")
+    )
+    history = SQLiteDataStore(db_path)
+    watcher = FolderWatcher(folder, manifest, args.pattern, args.interval, args.settle)
+    statuses: List[int] = []
+
+    def ingest(pending: List[PendingFile]) -> None:
+        start = time.perf_counter()
+        workers = args.workers or _default_workers(len(pending))
+        results, frames = run_pipeline(
+            [item.path for item in pending], inputs, output_dir, args.format, workers, True
+        )
+        for item, result, entries_df in zip(pending, results, frames):
+            if result.error is None and not history.append_import(entries_df, str(item.path)):
+                result.error = "could not append to the history"
+            manifest.record(item, result.entries, result.error)
+        manifest.save()
+        summary = summarize(results, time.perf_counter() - start, workers)
+        statuses.append(_report(summary, args, indent=None))
+
+    stop = threading.Event()
+    previous_handler = signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        watcher.watch(ingest, stop, max_polls=1 if args.once else None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+        history.close()
+
+    if not args.once:
+        return EXIT_OK
+    if not statuses:
+        return _report(summarize([], 0.0, 0), args, indent=None)
+    return statuses[-1]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli", description="Correct and validate chest export files"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="entry files, directories or glob patterns; with --watch the folder to watch",
+    )
+    parser.add_argument("--config", help="config file (default: config.ini of the application)")
+    parser.add_argument("--rules", help="correction rules file (default: from the config)")
+    for list_type in VALIDATION_LIST_TYPES:
+        parser.add_argument(
+            f"--{list_type.replace('_', '-')}-list",
+            dest=f"{list_type}_list",
+            help=f"{list_type.replace('_', ' ')} validation list (default: from the config)",
+        )
+    parser.add_argument(
+        "--output-dir", help="directory for corrected files (default: output_dir from the config)"
+    )
+    parser.add_argument(
+        "--format", choices=sorted(FORMAT_EXTENSIONS), default="csv", help="export format"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--max-invalid", type=int, default=None, help="fail if more entries are invalid"
+    )
+    parser.add_argument(
+        "--max-invalid-ratio",
+        type=float,
+        default=None,
+        help="fail if a larger share (0-1) of the entries is invalid",
+    )
+    parser.add_argument("--stats", help="also write the JSON statistics to this file")
+
+    watch_group = parser.add_argument_group("watch mode")
+    watch_group.add_argument(
+        "--watch",
+        action="store_true",
+        help="process new and changed files of the folder (default: input_dir from the config) "
+        "as they arrive, appending them to the SQLite history",
+    )
+    watch_group.add_argument(
+        "--once", action="store_true", help="scan the folder once instead of polling"
+    )
+    watch_group.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls"
+    )
+    watch_group.add_argument(
+        "--settle",
+        type=float,
+        default=DEFAULT_SETTLE_SECONDS,
+        help="seconds a file must be unmodified before it is processed",
+    )
+    watch_group.add_argument(
+        "--pattern", default=DEFAULT_PATTERN, help="glob pattern of the files to process"
+    )
+    watch_group.add_argument(
+        "--manifest", help="processed files manifest (default: data/cache/watch_manifest.json)"
+    )
+    watch_group.add_argument(
+        "--db", help="SQLite history (default: sqlite_path of [Storage] in the config)"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress to stderr")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the batch pipeline.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        int: EXIT_OK, EXIT_ERROR if a file, a correction or setup failed, or
+        EXIT_THRESHOLD_EXCEEDED if too many entries are invalid
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.watch and len(args.inputs) > 1:
+        parser.error("--watch takes a single folder")
+    if not args.watch and not args.inputs:
+        parser.error("the following arguments are required: inputs")
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+
+    start = time.perf_counter()
+    try:
+        if args.config:
+            ConfigManager(args.config)
+        bootstrapper = AppBootstrapper()
+        bootstrapper.initialize()
+        config_manager = bootstrapper.service_factory.get_service(IConfigManager)
+
+        overrides = {"correction_rules": args.rules}
+        for list_type in VALIDATION_LIST_TYPES:
+            overrides[list_type] = getattr(args, f"{list_type}_list")
+        inputs = _load_inputs(bootstrapper, overrides)
+
+        output_dir = Path(
+            args.output_dir
+            or config_manager.get_absolute_path(
+                config_manager.get_path("output_dir", "data/output")
+            )
+        )
+    except Exception as e:
+        logger.error(f"Error setting up the pipeline: {e}")
+        return EXIT_ERROR
+
+    if args.watch:
+        return watch(args, inputs, output_dir, config_manager)
+
+    files = resolve_entry_paths(args.inputs)
+    workers = args.workers or _default_workers(len(files))
+    results, _ = run_pipeline(files, inputs, output_dir, args.format, workers)
+    status = _report(summarize(results, time.perf_counter() - start, workers), args)
+    return status if files else EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,8 +26,17 @@ from src.interfaces.i_config_manager import IConfigManager
 # Filters
 from src.interfaces.i_filter import IFilter, IFilterManager
 
-# UI Adapters
-from src.interfaces.ui_adapters import IUiAdapter, ITableAdapter, IComboBoxAdapter, IStatusAdapter
+# UI Adapters, imported on first use so headless code does not load Qt
+_UI_ADAPTERS = ("IUiAdapter", "ITableAdapter", "IComboBoxAdapter", "IStatusAdapter")
+
+
+def __getattr__(name):
+    if name in _UI_ADAPTERS:
+        from src.interfaces import ui_adapters
+
+        return getattr(ui_adapters, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Events
@@ -25,6 +25,7 @@ class EventType(Enum):
     CORRECTION_RULES_UPDATED = auto()
     VALIDATION_LISTS_UPDATED = auto()
     VALIDATION_LIST_UPDATED = auto()  # Individual list update
+    CONFIG_CHANGED = auto()
 
     # Process events
     VALIDATION_STARTED = auto()
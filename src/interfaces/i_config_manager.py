@@ -9,7 +9,8 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
 
 class IConfigManager(ABC):
@@ -126,3 +127,25 @@ class IConfigManager(ABC):
             bool: Boolean value
         """
         pass
+
+    @contextmanager
+    def batch(self) -> Iterator["IConfigManager"]:
+        """
+        Group several changes so they are saved together.
+
+        The default implementation does not defer anything; implementations
+        that write changes behind override it.
+
+        Yields:
+            IConfigManager: This config manager
+        """
+        yield self
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to the configuration file.
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_config()
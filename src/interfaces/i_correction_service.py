@@ -28,7 +28,7 @@ class ICorrectionService(ABC):
             specific_entries: Optional list of entry IDs to correct (corrects all if None)
 
         Returns:
-            Dict[str, int]: Correction statistics (applied, total)
+            Dict[str, int]: Correction statistics (applied, errors, total)
         """
         pass
 
@@ -9,7 +9,7 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, List, Optional, Any, Union
 import pandas as pd
 from pathlib import Path
 
@@ -49,6 +49,79 @@ class IDataStore(ABC):
         """
         pass
 
+    def get_entries_version(self) -> Optional[int]:
+        """
+        Get the version counter of the entries DataFrame.
+
+        The counter increases on every change to the entries, so consumers can
+        cache values derived from them. Stores that do not track versions
+        return None, which disables such caching.
+
+        Returns:
+            Optional[int]: Current entries version, or None if not tracked
+        """
+        return None
+
+    def set_entries_from_chunks(
+        self, chunks: Iterable[Dict[str, List[str]]], source: str = ""
+    ) -> bool:
+        """
+        Set the entries from streamed column chunks.
+
+        Args:
+            chunks: Chunks mapping "chest_type", "player" and "source" to lists of values,
+                e.g. from src.services.entry_reader.iter_entry_chunks
+            source: Optional source identifier for the update
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        from src.services.entry_reader import build_entries_frame
+
+        return self.set_entries(build_entries_frame(chunks), source)
+
+    def get_text_index(self) -> Optional[Any]:
+        """
+        Get the search index over the entries text columns.
+
+        Stores without an index return None; text filters then scan the data.
+
+        Returns:
+            Optional[Any]: TextSearchIndex for the current entries, or None
+        """
+        return None
+
+    def get_date_index(self) -> Optional[Any]:
+        """
+        Get the sorted index over the entries date columns.
+
+        Stores without an index return None; date filters then compare the column directly.
+
+        Returns:
+            Optional[Any]: DateSearchIndex for the current entries, or None
+        """
+        return None
+
+    def get_value_counts(self, column: str) -> Dict[Any, int]:
+        """
+        Get the value -> count catalog of an entries column.
+
+        The default implementation counts the values of the current entries;
+        stores may maintain the catalog incrementally instead.
+
+        Args:
+            column: Column name
+
+        Returns:
+            Dict[Any, int]: Mapping of each distinct value to its number of rows
+        """
+        from src.services.value_catalog import count_values
+
+        entries = self.get_entries()
+        if entries is None or column not in entries.columns:
+            return {}
+        return dict(count_values(entries[column]))
+
     @abstractmethod
     def get_validation_list(self, list_type: str) -> pd.DataFrame:
         """
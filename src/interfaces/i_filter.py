@@ -55,6 +55,19 @@ class IFilter(ABC):
         """
         pass
 
+    @abstractmethod
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Compute the rows of a DataFrame that pass the filter.
+
+        Args:
+            df: DataFrame to evaluate
+
+        Returns:
+            Boolean Series aligned with df.index
+        """
+        pass
+
     @abstractmethod
     def is_active(self) -> bool:
         """
@@ -143,12 +156,13 @@ class IFilterManager(ABC):
         pass
 
     @abstractmethod
-    def apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+    def apply_filters(self, df: pd.DataFrame, data_version: Optional[int] = None) -> pd.DataFrame:
         """
         Apply all active filters to a DataFrame.
 
         Args:
             df: DataFrame to filter
+            data_version: Version of the data in df, used to cache filter masks
 
         Returns:
             Filtered DataFrame
@@ -305,7 +305,7 @@ class CorrectionRule:
                 enabled_value = row[key]
                 if enabled_value and isinstance(enabled_value, str):
                     # If enabled is false, set disabled to true
-                    disabled = enabled_value.lower() not in ("true", "yes", "1", "t")
+                    disabled = enabled_value.lower() not in ("true", "yes", "1", "t", "enabled")
                 break
 
         # If no 'Enabled' field, check for 'Disabled' field for backward compatibility
@@ -9,16 +9,31 @@ Usage:
 
 import csv
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, Iterable, List, Literal, Optional, Set, Tuple, Union
 import logging
 import os
 
 # Remove direct import to break circular dependency
 # from src.services.config_manager import ConfigManager
 from src.interfaces.i_config_manager import IConfigManager
+from src.services.config_settings import Settings
 from src.services.fuzzy_matcher import FuzzyMatcher
 
 
+def _typed_settings(config: IConfigManager) -> Optional[Settings]:
+    """
+    Get the typed settings snapshot of a config manager that has one.
+
+    Args:
+        config: Config manager
+
+    Returns:
+        Optional[Settings]: The snapshot, or None for config managers without one
+    """
+    settings = getattr(config, "settings", None)
+    return settings if isinstance(settings, Settings) else None
+
+
 class ValidationList:
     """
     Represents a list of valid entries for validation purposes.
@@ -27,7 +42,7 @@ class ValidationList:
 
     Attributes:
         list_type (str): Type of list ('player', 'chest_type', 'source')
-        entries (Set[str]): Set of valid entries
+        entries (FrozenSet[str]): Read-only set of valid entries
         items (List[str]): Same as entries but as a list for easier UI integration
         name (str): Name of the validation list
         use_fuzzy_matching (bool): Whether to use fuzzy matching for validation
@@ -36,6 +51,12 @@ class ValidationList:
 
     Implementation Notes:
         - Uses set for O(1) lookup time
+        - Case-insensitive lookups use a lowercase -> entry dict, kept in sync by
+          add_entry/remove_entry/clear and rebuilt lazily after other changes
+        - Settings come from the config's typed snapshot when it has one;
+          otherwise case_sensitive is cached until the config revision changes,
+          and read on every call from configs without a revision
+        - Fuzzy matching only runs for entries without an exact match
         - Supports import/export from CSV
         - Supports exact, case-insensitive, and fuzzy matching
     """
@@ -66,33 +87,30 @@ class ValidationList:
             logger.warning(f"Non-standard list type: {list_type}")
 
         self.list_type = list_type
-        self.entries: Set[str] = set()
+        self._entries: Set[str] = set()
+        self._entries_view: Optional[FrozenSet[str]] = None
+        self._lookup: Optional[Dict[str, str]] = None
+        self._fuzzy_candidates: Optional[List[str]] = None
         self.name = name
         self.file_path = file_path
 
         # Initialize private attributes for property accessors
         self._use_fuzzy_matching = use_fuzzy_matching
         self._config_manager = config_manager
+        self._default_config: Optional[IConfigManager] = None
+        self._case_sensitive_cache: Optional[Tuple[object, bool]] = None
 
         # Initialize fuzzy matcher with default threshold
         threshold = 0.75  # Default threshold
 
         # If config_manager is provided, use it to get threshold
         if self._config_manager:
-            threshold = (
-                self._config_manager.get_float("Validation", "fuzzy_threshold", fallback=75) / 100.0
-            )
+            threshold = self._get_fuzzy_threshold(self._config_manager)
         # Otherwise, try to get ConfigManager lazily but only if needed
         elif use_fuzzy_matching:
-            # Import ConfigManager only when needed (lazy import)
-            try:
-                from src.services.config_manager import ConfigManager
-
-                config = ConfigManager()
-                threshold = config.get_float("Validation", "fuzzy_threshold", fallback=75) / 100.0
-            except ImportError:
-                logger = logging.getLogger(__name__)
-                logger.warning("Could not import ConfigManager, using default threshold")
+            config = self._get_config()
+            if config:
+                threshold = self._get_fuzzy_threshold(config)
 
         self._fuzzy_matcher = FuzzyMatcher(threshold=threshold)
 
@@ -101,6 +119,32 @@ class ValidationList:
             for entry in entries:
                 self.add_entry(entry)
 
+    @property
+    def entries(self) -> FrozenSet[str]:
+        """
+        Get the set of valid entries.
+
+        The set is read-only: use add_entry/remove_entry/clear to change it,
+        or assign a new collection; both keep the lookup index up to date.
+
+        Returns:
+            FrozenSet[str]: Set of entries
+        """
+        if self._entries_view is None:
+            self._entries_view = frozenset(self._entries)
+        return self._entries_view
+
+    @entries.setter
+    def entries(self, value: Iterable[str]) -> None:
+        """
+        Replace all entries.
+
+        Args:
+            value (Iterable[str]): New entries (copied)
+        """
+        self._entries = set(value)
+        self._invalidate_lookup()
+
     @property
     def items(self) -> List[str]:
         """
@@ -177,7 +221,14 @@ class ValidationList:
         Args:
             entry (str): Entry to add
         """
-        self.entries.add(entry.strip())
+        entry = entry.strip()
+        if entry in self._entries:
+            return
+        self._entries.add(entry)
+        if self._lookup is not None:
+            self._lookup.setdefault(entry.lower(), entry)
+        self._entries_view = None
+        self._fuzzy_candidates = None
 
     def remove_entry(self, entry: str) -> bool:
         """
@@ -189,8 +240,10 @@ class ValidationList:
         Returns:
             bool: True if entry was removed, False if it wasn't in the list
         """
-        if entry in self.entries:
-            self.entries.remove(entry)
+        if entry in self._entries:
+            self._entries.remove(entry)
+            # Another entry may differ only in case, so rebuild on the next lookup
+            self._invalidate_lookup()
             return True
         return False
 
@@ -207,48 +260,64 @@ class ValidationList:
                 - Confidence score (1.0 for exact match, lower for fuzzy)
                 - Matched entry (for fuzzy matches) or None for exact/no match
         """
-        if not entry:
-            return False, 0.0, None
+        return self._match(entry, self._is_case_sensitive())
 
-        # Default values
-        case_sensitive = False
+    def validate_many(self, values: Iterable[str]) -> List[Tuple[bool, float, Optional[str]]]:
+        """
+        Check many entries at once.
 
-        # Get config settings if available
-        if self._config_manager:
-            case_sensitive = self._config_manager.get_bool(
-                "Validation", "case_sensitive", fallback=False
-            )
-        else:
-            # Try to get ConfigManager lazily if needed
-            try:
-                from src.services.config_manager import ConfigManager
+        Settings are read once for the whole batch and each distinct value is
+        matched only once, so repeated misses do not repeat the fuzzy search.
 
-                config = ConfigManager()
-                case_sensitive = config.get_bool("Validation", "case_sensitive", fallback=False)
-            except ImportError:
-                logger = logging.getLogger(__name__)
-                logger.warning("Could not import ConfigManager, using default case sensitivity")
+        Args:
+            values (Iterable[str]): Entries to validate
+
+        Returns:
+            List[Tuple[bool, float, Optional[str]]]: One is_valid result per value, in order
+        """
+        case_sensitive = self._is_case_sensitive()
+        results: Dict[str, Tuple[bool, float, Optional[str]]] = {}
+        output = []
+        for value in values:
+            result = results.get(value)
+            if result is None:
+                result = results[value] = self._match(value, case_sensitive)
+            output.append(result)
+        return output
+
+    def _match(self, entry: str, case_sensitive: bool) -> Tuple[bool, float, Optional[str]]:
+        """
+        Match an entry against the list.
+
+        Args:
+            entry (str): Entry to validate
+            case_sensitive (bool): Whether exact matches must have the same case
+
+        Returns:
+            Tuple[bool, float, Optional[str]]: See is_valid
+        """
+        if not entry:
+            return False, 0.0, None
 
         # Normalize entry for comparison
         normalized_entry = entry.strip()
 
         # First try exact match (case sensitive or insensitive)
-        for valid_entry in self.entries:
-            # For exact matching
-            if case_sensitive:
-                if normalized_entry == valid_entry:
-                    return True, 1.0, None
-            else:
-                if normalized_entry.lower() == valid_entry.lower():
-                    return True, 1.0, None
+        if case_sensitive:
+            if normalized_entry in self._entries:
+                return True, 1.0, None
+        elif normalized_entry.lower() in self._get_lookup():
+            return True, 1.0, None
 
         # If no exact match and fuzzy matching is enabled, try fuzzy matching
-        if self._use_fuzzy_matching and self.entries:
-            # Convert entries to list for fuzzy matching
-            entries_list = list(self.entries)
+        if self._use_fuzzy_matching and self._entries:
+            if self._fuzzy_candidates is None:
+                self._fuzzy_candidates = list(self._entries)
 
             # Find best match
-            best_match, score = self._fuzzy_matcher.find_best_match(normalized_entry, entries_list)
+            best_match, score = self._fuzzy_matcher.find_best_match(
+                normalized_entry, self._fuzzy_candidates
+            )
 
             # If score exceeds threshold, consider it valid
             if score >= self._fuzzy_matcher.threshold:
@@ -257,6 +326,91 @@ class ValidationList:
         # No match found
         return False, 0.0, None
 
+    def _get_lookup(self) -> Dict[str, str]:
+        """
+        Get the lowercase -> entry index, building it if needed.
+
+        Returns:
+            Dict[str, str]: Lowercased entries mapped to the stored entry
+        """
+        if self._lookup is None:
+            self._lookup = {}
+            for entry in self._entries:
+                self._lookup.setdefault(entry.lower(), entry)
+        return self._lookup
+
+    def _invalidate_lookup(self) -> None:
+        """Drop the derived lookups after the entries changed."""
+        self._entries_view = None
+        self._lookup = None
+        self._fuzzy_candidates = None
+
+    def _get_config(self) -> Optional[IConfigManager]:
+        """
+        Get the config manager, falling back to the shared ConfigManager.
+
+        Returns:
+            Optional[IConfigManager]: Config manager, or None if it cannot be imported
+        """
+        if self._config_manager:
+            return self._config_manager
+        if self._default_config is None:
+            # Import ConfigManager only when needed (lazy import)
+            try:
+                from src.services.config_manager import ConfigManager
+
+                self._default_config = ConfigManager()
+            except ImportError:
+                logger = logging.getLogger(__name__)
+                logger.warning("Could not import ConfigManager, using default settings")
+        return self._default_config
+
+    @staticmethod
+    def _get_fuzzy_threshold(config: IConfigManager) -> float:
+        """
+        Get the fuzzy_threshold validation setting.
+
+        Args:
+            config: Config manager
+
+        Returns:
+            float: Threshold between 0 and 1
+        """
+        settings = _typed_settings(config)
+        if settings is not None:
+            return settings.validation.fuzzy_threshold / 100.0
+        return config.get_float("Validation", "fuzzy_threshold", fallback=75) / 100.0
+
+    def _is_case_sensitive(self) -> bool:
+        """
+        Get the case_sensitive validation setting.
+
+        Read from the typed settings snapshot when the config has one; for
+        other config managers the value is cached until the revision changes.
+        IConfigManager does not declare a revision, so configs without one
+        are read on every call.
+
+        Returns:
+            bool: Whether exact matches must have the same case
+        """
+        config = self._get_config()
+        if config is None:
+            return False
+
+        settings = _typed_settings(config)
+        if settings is not None:
+            return settings.validation.case_sensitive
+
+        config_revision = getattr(config, "revision", None)
+        if not isinstance(config_revision, int):
+            return config.get_bool("Validation", "case_sensitive", fallback=False)
+
+        revision = (id(config), config_revision)
+        if self._case_sensitive_cache is None or self._case_sensitive_cache[0] != revision:
+            case_sensitive = config.get_bool("Validation", "case_sensitive", fallback=False)
+            self._case_sensitive_cache = (revision, case_sensitive)
+        return self._case_sensitive_cache[1]
+
     def get_entries(self) -> List[str]:
         """
         Get all entries in the validation list.
@@ -270,7 +424,8 @@ class ValidationList:
         """
         Clear all entries from the validation list.
         """
-        self.entries.clear()
+        self._entries.clear()
+        self._invalidate_lookup()
 
     def count(self) -> int:
         """
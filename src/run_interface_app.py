@@ -5,8 +5,15 @@ run_interface_app.py
 Description: Entry point for the interface-based application
 Usage:
     python -m src.run_interface_app
+
+    # Record startup timings as a Chrome trace plus a summary table in the log
+    python -m src.run_interface_app --profile-startup [TRACE_PATH]
+
+    # Record hot path metrics and write them as JSON on exit (see src.utils.metrics)
+    python -m src.run_interface_app --metrics [JSON_PATH]
 """
 
+import argparse
 import sys
 import logging
 from pathlib import Path
@@ -14,7 +21,16 @@ from pathlib import Path
 from PySide6.QtWidgets import QApplication
 
 from src.app_bootstrapper import AppBootstrapper
+from src.services.warm_up import get_warm_up
 from src.ui.main_window_interface import MainWindowInterface
+from src.utils.metrics import add_metrics_argument, metrics
+from src.utils.startup_profiler import (
+    add_profile_argument,
+    finish_after_startup,
+    profile_phase,
+    rerun_with_import_times,
+    start_profiling,
+)
 
 
 def setup_logging():
@@ -33,15 +49,38 @@ def setup_logging():
     )
 
 
-def main():
-    """Run the interface-based application."""
+def main(argv=None):
+    """
+    Run the interface-based application.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:]); Qt options are passed on
+
+    Returns:
+        Exit code of the application
+    """
+    parser = argparse.ArgumentParser(description="Chest Tracker Correction Tool")
+    add_profile_argument(parser)
+    add_metrics_argument(parser)
+    args, _ = parser.parse_known_args(argv)
+    if args.profile_startup is not None:
+        # Import times can only be recorded from interpreter start
+        exit_code = rerun_with_import_times()
+        if exit_code is not None:
+            return exit_code
+
     # Set up logging
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info("Starting interface-based application")
+    if args.profile_startup is not None:
+        start_profiling()
+    if args.metrics is not None:
+        metrics.enable()
 
     # Create Qt application
-    app = QApplication(sys.argv)
+    with profile_phase("qt_application"):
+        app = QApplication(sys.argv)
     app.setApplicationName("Chest Tracker Correction Tool")
     app.setOrganizationName("Chest Tracker")
 
@@ -51,15 +90,25 @@ def main():
     try:
         # Initialize the bootstrapper
         logger.info("Initializing bootstrapper")
-        bootstrapper.initialize()
+        with profile_phase("bootstrap"):
+            bootstrapper.initialize()
 
         # Get service factory
         logger.info("Creating main window with interface implementation")
         service_factory = bootstrapper.service_factory
 
         # Create main window using the interface directly
-        main_window = MainWindowInterface(service_factory)
-        main_window.show()
+        with profile_phase("window"):
+            main_window = MainWindowInterface(service_factory)
+        with profile_phase("show_window"):
+            main_window.show()
+        if args.profile_startup is not None:
+            finish_after_startup(args.profile_startup, get_warm_up(service_factory))
+
+        # Snapshot the store for a fast restore on the next start
+        app.aboutToQuit.connect(bootstrapper.save_session)
+        if args.metrics is not None:
+            app.aboutToQuit.connect(lambda: metrics.dump(args.metrics))
 
         # Run the application
         logger.info("Running application")
@@ -0,0 +1,253 @@
+"""
+bulk_import.py
+
+Description: Parallel import of many chest export files, tagged with the date from each file name
+Usage:
+    from src.services.bulk_import import import_entry_files
+
+    entries_df, results = import_entry_files("data/input/chests_2025-03-*.txt")
+    data_store.set_entries(entries_df, source="bulk import")
+"""
+
+import glob
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from src.services.entry_reader import (
+    DEFAULT_ENCODINGS,
+    ENTRY_COLUMNS,
+    DataFrameSink,
+    EntryChunk,
+    iter_entry_chunks,
+)
+from src.services.file_parser import FileParser
+
+
+logger = logging.getLogger(__name__)
+
+# Column holding the date taken from each file name
+DATE_COLUMN = "date"
+
+PathSpec = Union[str, Path, Iterable[Union[str, Path]]]
+
+
+@dataclass
+class FileImportResult:
+    """
+    Outcome of importing one file.
+
+    Attributes:
+        path (str): Path of the file
+        date (Optional[str]): Date from the file name (YYYY-MM-DD), if any
+        entry_count (int): Number of entries parsed
+        error (Optional[str]): Error message if the file could not be parsed
+    """
+
+    path: str
+    date: Optional[str] = None
+    entry_count: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check whether the file was parsed.
+
+        Returns:
+            True if there was no error
+        """
+        return self.error is None
+
+
+# Called in the calling thread after each file: (result, files done, total files)
+ProgressCallback = Callable[[FileImportResult, int, int], None]
+
+
+def resolve_entry_paths(paths: PathSpec, pattern: str = "*.txt") -> List[Path]:
+    """
+    Expand paths, directories and glob patterns into a list of files.
+
+    Args:
+        paths: A path, directory or glob pattern, or an iterable of them
+        pattern: Pattern for the files of a directory
+
+    Returns:
+        Existing files in the given order (sorted within each directory or
+        glob), without duplicates
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    resolved: List[Path] = []
+    seen = set()
+    for spec in paths:
+        spec_path = Path(spec)
+        if spec_path.is_dir():
+            matches = sorted(spec_path.glob(pattern))
+        elif glob.has_magic(str(spec)):
+            matches = [Path(match) for match in sorted(glob.glob(str(spec)))]
+        else:
+            matches = [spec_path]
+
+        for match in matches:
+            if match.is_file() and match not in seen:
+                seen.add(match)
+                resolved.append(match)
+            elif not match.exists():
+                logger.warning(f"File not found: {match}")
+    return resolved
+
+
+def _parse_file(path: str, encodings: Sequence[str]) -> EntryChunk:
+    """
+    Parse one file into entry columns (runs in a worker process).
+
+    Entry IDs are not computed here: str hashes differ between processes,
+    and identical entries from different files must not share an ID, so
+    they are assigned when the results are merged.
+
+    Args:
+        path: Path of the file
+        encodings: Encodings to try for files without a byte order mark
+
+    Returns:
+        Dict mapping each of ENTRY_COLUMNS to the file's values
+    """
+    columns: EntryChunk = {column: [] for column in ENTRY_COLUMNS}
+    for chunk in iter_entry_chunks(path, encodings=encodings):
+        for column in ENTRY_COLUMNS:
+            columns[column].extend(chunk[column])
+    return columns
+
+
+def _default_workers(file_count: int) -> int:
+    """
+    Get the default number of worker processes.
+
+    Args:
+        file_count: Number of files to import
+
+    Returns:
+        Number of workers, at most one per file
+    """
+    return max(1, min(file_count, os.cpu_count() or 1))
+
+
+def import_entry_files(
+    paths: PathSpec,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    encodings: Optional[Sequence[str]] = None,
+) -> Tuple[pd.DataFrame, List[FileImportResult]]:
+    """
+    Parse many chest export files in parallel and merge them into one entries DataFrame.
+
+    Files are parsed on a process pool (inline for a single file or
+    max_workers=1). Every row gets a "date" column with the date from its
+    file name. Rows are merged in file order, regardless of which file
+    finished first, and numbered by a RangeIndex named "id": content-based
+    IDs would repeat for identical entries, e.g. the same chest on two days.
+
+    Args:
+        paths: Files, directories or glob patterns (see resolve_entry_paths)
+        max_workers: Number of worker processes (default: one per file, up to the CPU count)
+        progress: Called after each file with (result, files done, total files)
+        encodings: Encodings to try for files without a byte order mark
+
+    Returns:
+        Tuple of the merged entries DataFrame and one FileImportResult per file
+    """
+    files = resolve_entry_paths(paths)
+    encodings = tuple(encodings or DEFAULT_ENCODINGS)
+    parser = FileParser()
+
+    results = [
+        FileImportResult(path=str(path), date=parser.extract_date_from_filename(path))
+        for path in files
+    ]
+    columns: List[Optional[EntryChunk]] = [None] * len(files)
+    workers = max_workers or _default_workers(len(files))
+    done = 0
+
+    def record(index: int, parsed: Optional[EntryChunk], error: Optional[str]) -> None:
+        nonlocal done
+        result = results[index]
+        if error is not None:
+            result.error = error
+            logger.error(f"Error importing {result.path}: {error}")
+        else:
+            columns[index] = parsed
+            result.entry_count = len(parsed["chest_type"])
+        done += 1
+        if progress:
+            progress(result, done, len(files))
+
+    pending = list(range(len(files)))
+    if workers > 1 and len(files) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = _run_on_pool(executor, files, encodings, record)
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Process pool unavailable, importing serially: {e}")
+
+    for index in pending:
+        try:
+            record(index, _parse_file(str(files[index]), encodings), None)
+        except Exception as e:
+            record(index, None, str(e))
+
+    sink = DataFrameSink()
+    dates: List[Optional[str]] = []
+    for result, parsed in zip(results, columns):
+        if parsed is not None:
+            sink.add_chunk(parsed)
+            dates.extend([result.date] * result.entry_count)
+    entries_df = sink.result()
+    entries_df.index = pd.RangeIndex(len(entries_df), name="id")
+    entries_df[DATE_COLUMN] = dates
+
+    logger.info(
+        f"Imported {len(entries_df)} entries from {sum(r.ok for r in results)}/{len(files)} files"
+    )
+    return entries_df, results
+
+
+def _run_on_pool(
+    executor: Executor,
+    files: List[Path],
+    encodings: Sequence[str],
+    record: Callable[[int, Optional[EntryChunk], Optional[str]], None],
+) -> List[int]:
+    """
+    Parse files on an executor, recording each result as it completes.
+
+    Args:
+        executor: Process pool
+        files: Files to parse
+        encodings: Encodings to try for files without a byte order mark
+        record: Called with (file index, columns, error) for each finished file
+
+    Returns:
+        Indexes of files that were not parsed because the pool broke
+    """
+    futures = {
+        executor.submit(_parse_file, str(path), encodings): index
+        for index, path in enumerate(files)
+    }
+    unfinished = []
+    for future in as_completed(futures):
+        index = futures[future]
+        try:
+            record(index, future.result(), None)
+        except BrokenProcessPool:
+            unfinished.append(index)
+        except Exception as e:
+            record(index, None, str(e))
+    return sorted(unfinished)
@@ -0,0 +1,125 @@
+"""
+column_index.py
+
+Description: Base class for per-column indexes derived from one version of the entries DataFrame
+Usage:
+    from src.services.column_index import ColumnIndexSet
+
+    class MyIndex(ColumnIndexSet):
+        def _build_column(self, name, values):
+            # Return the column index, or None if the column is not indexable
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+
+class ColumnIndexSet(ABC):
+    """
+    Per-column indexes for one version of the entries DataFrame.
+
+    DataFrameStore resets the set whenever the entries change; column indexes
+    are then built lazily the first time a column is queried.
+
+    Attributes:
+        _df (Optional[pd.DataFrame]): Entries DataFrame the indexes describe
+        _version (Optional[int]): Entries version the indexes describe
+        _columns (Dict[str, Any]): Column indexes built so far
+        _lock (threading.Lock): Guards lazy column builds
+    """
+
+    def __init__(self):
+        """Initialize an empty index set."""
+        self._df: Optional[pd.DataFrame] = None
+        self._version: Optional[int] = None
+        self._columns: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(self.__class__.__module__)
+
+    @property
+    def version(self) -> Optional[int]:
+        """
+        Get the entries version the indexes describe.
+
+        Returns:
+            Entries version, or None if the set is empty
+        """
+        return self._version
+
+    def reset(self, df: pd.DataFrame, version: Optional[int] = None) -> None:
+        """
+        Point the set at a new version of the data and drop the column indexes.
+
+        Args:
+            df: Entries DataFrame
+            version: Entries version
+        """
+        with self._lock:
+            self._df = df
+            self._version = version
+            self._columns = {}
+
+    def covers(self, df: pd.DataFrame) -> bool:
+        """
+        Check whether the indexes describe the rows of a DataFrame.
+
+        Args:
+            df: DataFrame to check (usually a copy from DataFrameStore.get_entries())
+
+        Returns:
+            True if df has the same rows, in the same order, as the indexed data
+        """
+        if self._df is None or df is None or len(df) != len(self._df):
+            return False
+        return df is self._df or df.index.equals(self._df.index)
+
+    def column(self, name: str) -> Optional[Any]:
+        """
+        Get the index for a column, building it on first use.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Column index, or None if the column does not exist or cannot be indexed
+        """
+        column_index = self._columns.get(name)
+        if column_index is not None:
+            return column_index
+
+        with self._lock:
+            column_index = self._columns.get(name)
+            if column_index is not None:
+                return column_index
+
+            if self._df is None or name not in self._df.columns:
+                return None
+
+            try:
+                column_index = self._build_column(name, self._df[name])
+            except Exception as e:
+                self._logger.error(f"Error building index for column '{name}': {e}")
+                return None
+
+            if column_index is not None:
+                self._columns[name] = column_index
+                self._logger.debug(f"Built {self.__class__.__name__} for column '{name}'")
+            return column_index
+
+    @abstractmethod
+    def _build_column(self, name: str, values: pd.Series) -> Optional[Any]:
+        """
+        Build the index for one column.
+
+        Args:
+            name: Column name
+            values: Column values
+
+        Returns:
+            Column index, or None if the column cannot be indexed
+        """
+        pass
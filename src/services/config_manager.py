@@ -6,17 +6,32 @@ Usage:
     from src.services.config_manager import ConfigManager
     config = ConfigManager()
     value = config.get("Section", "key")
+
+    with config.batch():
+        config.set("Validation", "player_list", path)
+        config.set("Validation", "source_list", path)
+    config.flush()  # write pending changes now instead of after the auto-flush delay
+
+    # Typed values, rebuilt only after the config changed
+    if config.settings.validation.case_sensitive:
+        ...
 """
 
+import atexit
 import configparser
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Dict, Iterator, Optional, Union, List
 from functools import lru_cache
 import json
 
+from src.interfaces.events import EventType
 from src.interfaces.i_config_manager import IConfigManager
+from src.services.config_settings import Settings
+from src.services.event_manager import EventManager
 
 
 class ConfigManager(IConfigManager):
@@ -33,11 +48,26 @@ class ConfigManager(IConfigManager):
         - Uses ConfigParser to handle INI file format
         - Provides default values for missing settings
         - Supports saving configuration changes
+        - set/set_value and remove_* only mark the config dirty; the file is
+          written by flush(), at the end of a batch(), after auto_flush_delay
+          seconds without further changes, or at interpreter exit
+        - The file is written to a temporary file and swapped in with os.replace
+        - settings is a typed snapshot rebuilt on first access after a change;
+          every change also emits EventType.CONFIG_CHANGED
     """
 
     _instance = None
     _DEFAULT_CONFIG_FILE = Path("config.ini")
 
+    # Bumped on every change so callers can cache values derived from the config
+    _revision = 0
+
+    # Typed snapshot of the config, valid while its revision matches _revision
+    _settings: Optional[Settings] = None
+
+    # Seconds without changes before pending changes are written; 0 writes immediately
+    auto_flush_delay = 0.5
+
     def __new__(cls, config_file: Optional[Path] = None) -> "ConfigManager":
         """
         Create or return the singleton instance of ConfigManager.
@@ -66,6 +96,13 @@ class ConfigManager(IConfigManager):
 
         self._initialized = True
 
+        # Write-behind state
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing ConfigManager")
 
@@ -277,6 +314,52 @@ class ConfigManager(IConfigManager):
 
         return self.config.get(section, key, fallback=fallback)
 
+    @property
+    def revision(self) -> int:
+        """
+        Get the configuration revision.
+
+        Returns:
+            int: Counter that changes whenever a configuration value may have changed
+        """
+        return self._revision
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Get the typed settings snapshot.
+
+        The snapshot is built on first access and rebuilt only after the
+        config changed, so reading it is as cheap as an attribute lookup.
+
+        Returns:
+            Settings: Snapshot of the current configuration
+        """
+        settings = self._settings
+        if settings is None or settings.revision != self._revision:
+            with self._lock:
+                settings = Settings.from_parser(self.config, self._revision)
+                self._settings = settings
+        return settings
+
+    def _notify_changed(self, section: Optional[str] = None, key: Optional[str] = None) -> None:
+        """
+        Emit a CONFIG_CHANGED event.
+
+        Args:
+            section: Changed section, None if the whole config may have changed
+            key: Changed key, None if the whole section may have changed
+        """
+        EventManager.emit(
+            EventType.CONFIG_CHANGED,
+            {
+                "source": "config_manager",
+                "section": section,
+                "key": key,
+                "revision": self._revision,
+            },
+        )
+
     def _ensure_core_sections_exist(self):
         """
         Ensure that core configuration sections exist with default values.
@@ -497,15 +580,19 @@ class ConfigManager(IConfigManager):
             key (str): The configuration key
             value (str): The value to set
         """
-        # Create the section if it doesn't exist
-        if not self.config.has_section(section):
-            self.config.add_section(section)
+        with self._lock:
+            # Create the section if it doesn't exist
+            if not self.config.has_section(section):
+                self.config.add_section(section)
 
-        # Set the value
-        self.config.set(section, key, value)
+            # Set the value
+            self.config.set(section, key, value)
+            self._revision += 1
 
-        # Save the configuration
-        self.save_config()
+            # Schedule the write
+            self._mark_dirty()
+
+        self._notify_changed(section, key)
 
     def set_value(self, section: str, key: str, value: Any) -> None:
         """
@@ -529,8 +616,11 @@ class ConfigManager(IConfigManager):
         Returns:
             bool: True if the option was removed, False otherwise
         """
-        result = self.config.remove_option(section, key)
-        self.save_config()
+        with self._lock:
+            result = self.config.remove_option(section, key)
+            self._revision += 1
+            self._mark_dirty()
+        self._notify_changed(section, key)
         return result
 
     def remove_section(self, section: str) -> bool:
@@ -543,8 +633,11 @@ class ConfigManager(IConfigManager):
         Returns:
             bool: True if the section was removed, False otherwise
         """
-        result = self.config.remove_section(section)
-        self.save_config()
+        with self._lock:
+            result = self.config.remove_section(section)
+            self._revision += 1
+            self._mark_dirty()
+        self._notify_changed(section)
         return result
 
     def get_sections(self) -> list:
@@ -607,6 +700,8 @@ class ConfigManager(IConfigManager):
         """
         try:
             self.config.read(config_file)
+            self._revision += 1
+            self._notify_changed()
             return True
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
@@ -631,14 +726,86 @@ class ConfigManager(IConfigManager):
             else:
                 file_path = self.config_path
 
-            with open(file_path, "w") as configfile:
-                self.config.write(configfile)
+            with self._lock:
+                # Write a temporary file and swap it in, so a crash never truncates the config
+                temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+                with open(temp_path, "w") as configfile:
+                    self.config.write(configfile)
+                os.replace(temp_path, file_path)
+                if file_path == self.config_path:
+                    self._dirty = False
             self.logger.info(f"Configuration saved to {file_path}")
             return True
         except Exception as e:
             self.logger.error(f"Error saving configuration: {str(e)}")
             return False
 
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Check whether there are changes that have not been written yet.
+
+        Returns:
+            bool: True if the file is out of date
+        """
+        return self._dirty
+
+    def flush(self) -> bool:
+        """
+        Write pending changes to the configuration file.
+
+        Returns:
+            bool: True if there was nothing to write or the write succeeded
+        """
+        with self._lock:
+            self._cancel_flush_timer()
+            if not self._dirty:
+                return True
+            return self.save_config()
+
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """
+        Group several changes into one write.
+
+        Changes inside the block are written once when the outermost batch
+        ends. Batches can be nested.
+
+        Yields:
+            ConfigManager: This config manager
+        """
+        with self._lock:
+            self._batch_depth += 1
+            self._cancel_flush_timer()
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._dirty:
+                    self.flush()
+
+    def _mark_dirty(self) -> None:
+        """Record a change and schedule the write unless a batch is open."""
+        self._dirty = True
+        if self._batch_depth:
+            return
+        if self.auto_flush_delay <= 0:
+            self.flush()
+            return
+
+        # Restart the debounce timer
+        self._cancel_flush_timer()
+        self._flush_timer = threading.Timer(self.auto_flush_delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        """Stop a pending auto-flush."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
     def save(self, config_file: Optional[str] = None) -> bool:
         """
         Alias for save_config method for backward compatibility.
@@ -654,8 +821,10 @@ class ConfigManager(IConfigManager):
     def reset_to_defaults(self) -> None:
         """Reset the configuration to default values."""
         self._create_default_config()
+        self._revision += 1
         self.save_config()
         self._create_default_directories()
+        self._notify_changed()
 
     def get_value(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -0,0 +1,138 @@
+"""
+config_settings.py
+
+Description: Typed, read-only snapshot of frequently used configuration values
+Usage:
+    from src.services.config_manager import ConfigManager
+
+    settings = ConfigManager().settings
+    if settings.validation.case_sensitive:
+        ...
+    threshold = settings.validation.fuzzy_threshold / 100.0
+"""
+
+import configparser
+from dataclasses import dataclass, field, fields
+from typing import Any, Type, TypeVar
+
+
+# Strings that ConfigManager.get_boolean reads as True
+TRUE_STRINGS = ("true", "1", "yes", "y", "t")
+
+SectionT = TypeVar("SectionT")
+
+
+@dataclass(frozen=True)
+class ValidationSettings:
+    """
+    Values of the [Validation] section.
+
+    Attributes:
+        enabled (bool): Whether validation is enabled
+        case_sensitive (bool): Whether exact matches must have the same case
+        enable_fuzzy_matching (bool): Whether fuzzy matching is enabled for validation
+        fuzzy_threshold (float): Fuzzy matching threshold in percent (0-100)
+        auto_validate (bool): Whether entries are validated after loading
+    """
+
+    enabled: bool = True
+    case_sensitive: bool = False
+    enable_fuzzy_matching: bool = False
+    fuzzy_threshold: float = 75.0
+    auto_validate: bool = True
+
+
+@dataclass(frozen=True)
+class CorrectionSettings:
+    """
+    Values of the [Correction] section.
+
+    Attributes:
+        fuzzy_matching_enabled (bool): Whether fuzzy matching is enabled for corrections
+        fuzzy_match_threshold (float): Fuzzy matching threshold (0-1)
+        auto_apply_corrections (bool): Whether corrections are applied after loading
+    """
+
+    fuzzy_matching_enabled: bool = True
+    fuzzy_match_threshold: float = 0.85
+    auto_apply_corrections: bool = True
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Snapshot of the typed configuration values.
+
+    Attributes:
+        revision (int): ConfigManager revision the snapshot was built from
+        validation (ValidationSettings): Values of the [Validation] section
+        correction (CorrectionSettings): Values of the [Correction] section
+
+    Implementation Notes:
+        - Each option is named like its field; missing or malformed values
+          use the field default
+        - Values are parsed like ConfigManager.get_boolean/get_float
+    """
+
+    revision: int = 0
+    validation: ValidationSettings = field(default_factory=ValidationSettings)
+    correction: CorrectionSettings = field(default_factory=CorrectionSettings)
+
+    @classmethod
+    def from_parser(cls, parser: configparser.ConfigParser, revision: int = 0) -> "Settings":
+        """
+        Build a snapshot from a config parser.
+
+        Args:
+            parser: Parser holding the configuration
+            revision: Revision of the configuration
+
+        Returns:
+            Settings: The snapshot
+        """
+        return cls(
+            revision=revision,
+            validation=read_section(parser, "Validation", ValidationSettings),
+            correction=read_section(parser, "Correction", CorrectionSettings),
+        )
+
+
+def read_section(
+    parser: configparser.ConfigParser, section: str, settings_cls: Type[SectionT]
+) -> SectionT:
+    """
+    Read the options of a section into a settings dataclass.
+
+    Args:
+        parser: Parser holding the configuration
+        section: Section name
+        settings_cls: Dataclass whose field names are the option names
+
+    Returns:
+        Instance of settings_cls
+    """
+    values = {}
+    for settings_field in fields(settings_cls):
+        raw = parser.get(section, settings_field.name, fallback=None)
+        if raw is not None:
+            values[settings_field.name] = _convert(raw, settings_field.default)
+    return settings_cls(**values)
+
+
+def _convert(raw: str, default: Any) -> Any:
+    """
+    Convert an option string to the type of the field default.
+
+    Args:
+        raw: Option value
+        default: Field default
+
+    Returns:
+        Converted value, or the default if the value is malformed
+    """
+    if isinstance(default, bool):
+        return raw.lower() in TRUE_STRINGS
+    try:
+        return type(default)(raw)
+    except ValueError:
+        return default
@@ -17,8 +17,45 @@ from pathlib import Path
 from src.interfaces.i_correction_service import ICorrectionService
 from src.interfaces.i_data_store import IDataStore
 from src.interfaces.events import EventType, EventHandler, EventData
+from src.models.correction_rule import CorrectionRule
+from src.utils.logging_config import LogSampler
+from src.utils.metrics import instrumented, timed
 
 
+def rules_by_field(rules_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give rules that only have a category the entry field they apply to.
+
+    Rules read from files (see src.services.rule_reader) have a category
+    instead of a field; "general" rules apply to every field and become one
+    rule per field. Disabled rules are dropped.
+
+    Args:
+        rules_df: Rules with from_text, to_text and category columns
+
+    Returns:
+        pd.DataFrame: Rules with a field column
+    """
+    if "enabled" in rules_df.columns:
+        rules_df = rules_df[rules_df["enabled"].fillna(True).astype(bool)]
+
+    fields_by_category: Dict[str, List[str]] = {}
+    for field, category in CorrectionRule.FIELD_TO_CATEGORY.items():
+        if field is not None:
+            fields_by_category.setdefault(category, []).append(field)
+    all_fields = [field for fields in fields_by_category.values() for field in fields]
+    # Categories named like the field they apply to
+    for field in all_fields:
+        fields_by_category.setdefault(field, [field])
+
+    categories = rules_df.get("category", pd.Series("general", index=rules_df.index))
+    fields = categories.fillna("general").map(
+        lambda category: fields_by_category.get(category, all_fields)
+    )
+    return rules_df.assign(field=fields).explode("field")
+
+
+@instrumented
 class CorrectionService(ICorrectionService):
     """
     Service for applying corrections to entries.
@@ -50,6 +87,7 @@ class CorrectionService(ICorrectionService):
         self._logger = logging.getLogger(__name__)
         self._logger.info("CorrectionService initialized")
 
+    @timed()
     def apply_corrections(self, specific_entries: Optional[List[int]] = None) -> Dict[str, int]:
         """
         Apply all enabled correction rules to entries.
@@ -58,7 +96,8 @@ class CorrectionService(ICorrectionService):
             specific_entries: Optional list of entry IDs to correct (corrects all if None)
 
         Returns:
-            Dict[str, int]: Correction statistics (applied, total)
+            Dict[str, int]: Correction statistics (applied, errors, total), where
+            errors counts corrections that failed and were skipped
         """
         # Get entries and rules from DataFrameStore
         entries_df = self._store.get_entries()
@@ -66,18 +105,21 @@ class CorrectionService(ICorrectionService):
 
         if entries_df.empty:
             self._logger.warning("No entries to correct")
-            return {"applied": 0, "total": 0}
+            return {"applied": 0, "errors": 0, "total": 0}
 
         if rules_df.empty:
             self._logger.warning("No correction rules to apply")
-            return {"applied": 0, "total": 0}
+            return {"applied": 0, "errors": 0, "total": 0}
+
+        if "field" not in rules_df.columns:
+            rules_df = rules_by_field(rules_df)
 
         # Filter entries if specific_entries is provided
         if specific_entries:
             entries_df = entries_df.loc[entries_df.index.isin(specific_entries)]
             if entries_df.empty:
                 self._logger.warning("No matching entries found for correction")
-                return {"applied": 0, "total": 0}
+                return {"applied": 0, "errors": 0, "total": 0}
 
         # Start a transaction
         self._store.begin_transaction()
@@ -88,9 +130,15 @@ class CorrectionService(ICorrectionService):
 
             # Track number of corrections applied
             total_corrections = 0
+            failed_corrections = 0
             entries_affected = 0
             entries_affected_set = set()
 
+            # One message per matching rule and per failed entry would flood the log
+            # on large imports; the first few are logged, the rest counted
+            rule_sampler = LogSampler(self._logger, "Applying rule")
+            error_sampler = LogSampler(self._logger, "Error applying correction", logging.ERROR)
+
             # Apply the rules one by one
             for rule_id, rule in rules_df.iterrows():
                 field = rule["field"]
@@ -115,6 +163,15 @@ class CorrectionService(ICorrectionService):
                 if matching_entries.empty:
                     continue
 
+                rule_sampler.log(
+                    "Applying rule %s to %d entries: %s '%s' -> '%s'",
+                    rule_id,
+                    len(matching_entries),
+                    field,
+                    pattern,
+                    replacement,
+                )
+
                 # Apply the correction to each matching entry
                 for entry_id in matching_entries.index:
                     try:
@@ -152,9 +209,13 @@ class CorrectionService(ICorrectionService):
                         total_corrections += 1
 
                     except Exception as e:
-                        self._logger.error(f"Error applying correction to entry {entry_id}: {e}")
+                        error_sampler.log("Error applying correction to entry %s: %s", entry_id, e)
+                        failed_corrections += 1
                         continue
 
+            rule_sampler.flush()
+            error_sampler.flush()
+
             # Update the entries in DataFrameStore if we made changes
             if total_corrections > 0:
                 entries_affected = len(entries_affected_set)
@@ -176,25 +237,29 @@ class CorrectionService(ICorrectionService):
                     )
                 except KeyError:
                     self._logger.warning(
-                        f"No handlers registered for {EventType.CORRECTION_APPLIED}"
+                        "No handlers registered for %s", EventType.CORRECTION_APPLIED
                     )
                 except Exception as emit_error:
-                    self._logger.warning(f"Error emitting event: {emit_error}")
+                    self._logger.warning("Error emitting event: %s", emit_error)
 
                 self._logger.info(
-                    f"Applied {total_corrections} corrections to {entries_affected} entries"
+                    "Applied %d corrections to %d entries", total_corrections, entries_affected
                 )
             else:
                 # Rollback the transaction since we didn't make any changes
                 self._store.rollback_transaction()
                 self._logger.info("No corrections applied")
 
-            return {"applied": total_corrections, "total": len(new_entries_df)}
+            return {
+                "applied": total_corrections,
+                "errors": failed_corrections,
+                "total": len(new_entries_df),
+            }
 
         except Exception as e:
             # Rollback the transaction on error
             self._store.rollback_transaction()
-            self._logger.error(f"Error applying corrections: {e}")
+            self._logger.error("Error applying corrections: %s", e)
 
             # Emit error event
             try:
@@ -202,12 +267,13 @@ class CorrectionService(ICorrectionService):
                     EventType.ERROR_OCCURRED, {"type": "correction", "error": str(e)}
                 )
             except KeyError:
-                self._logger.warning(f"No handlers registered for {EventType.ERROR_OCCURRED}")
+                self._logger.warning("No handlers registered for %s", EventType.ERROR_OCCURRED)
             except Exception as emit_error:
-                self._logger.warning(f"Error emitting event: {emit_error}")
+                self._logger.warning("Error emitting event: %s", emit_error)
 
             raise
 
+    @timed()
     def apply_specific_correction(
         self, entry_id: int, field: str, from_text: str, to_text: str
     ) -> bool:
@@ -225,7 +291,7 @@ class CorrectionService(ICorrectionService):
         """
         # Validate field
         if field not in ["chest_type", "player", "source"]:
-            self._logger.error(f"Invalid field for correction: {field}")
+            self._logger.error("Invalid field for correction: %s", field)
             return False
 
         # Get entries from DataFrameStore
@@ -233,12 +299,12 @@ class CorrectionService(ICorrectionService):
 
         # Check if entry exists
         if entry_id not in entries_df.index:
-            self._logger.warning(f"Entry with ID {entry_id} not found")
+            self._logger.warning("Entry with ID %s not found", entry_id)
             return False
 
         # Check if field value matches from_text
         if entries_df.at[entry_id, field] != from_text:
-            self._logger.warning(f"Field {field} value doesn't match expected value")
+            self._logger.warning("Field %s value doesn't match expected value", field)
             return False
 
         # Start a transaction
@@ -276,17 +342,21 @@ class CorrectionService(ICorrectionService):
                     {"count": 1, "entries_affected": 1},
                 )
             except KeyError:
-                self._logger.warning(f"No handlers registered for {EventType.CORRECTION_APPLIED}")
+                self._logger.warning("No handlers registered for %s", EventType.CORRECTION_APPLIED)
 
             self._logger.info(
-                f"Applied correction to entry {entry_id}: {field} '{from_text}' -> '{to_text}'"
+                "Applied correction to entry %s: %s '%s' -> '%s'",
+                entry_id,
+                field,
+                from_text,
+                to_text,
             )
             return True
 
         except Exception as e:
             # Rollback the transaction on error
             self._store.rollback_transaction()
-            self._logger.error(f"Error applying correction: {e}")
+            self._logger.error("Error applying correction: %s", e)
 
             # Emit error event
             try:
@@ -294,12 +364,13 @@ class CorrectionService(ICorrectionService):
                     EventType.ERROR_OCCURRED, {"type": "correction", "error": str(e)}
                 )
             except KeyError:
-                self._logger.warning(f"No handlers registered for {EventType.ERROR_OCCURRED}")
+                self._logger.warning("No handlers registered for %s", EventType.ERROR_OCCURRED)
             except Exception as emit_error:
-                self._logger.warning(f"Error emitting event: {emit_error}")
+                self._logger.warning("Error emitting event: %s", emit_error)
 
             return False
 
+    @timed()
     def reset_corrections(self, entry_ids: Optional[List[int]] = None) -> Dict[str, int]:
         """
         Reset corrections by restoring original values.
@@ -376,7 +447,7 @@ class CorrectionService(ICorrectionService):
                 # Emit corrections reset event
                 self._store._emit_event(EventType.CORRECTIONS_RESET, {"count": reset_count})
 
-                self._logger.info(f"Reset corrections for {reset_count} entries")
+                self._logger.info("Reset corrections for %s entries", reset_count)
             else:
                 # Rollback the transaction since we didn't make any changes
                 self._store.rollback_transaction()
@@ -387,7 +458,7 @@ class CorrectionService(ICorrectionService):
         except Exception as e:
             # Rollback the transaction on error
             self._store.rollback_transaction()
-            self._logger.error(f"Error resetting corrections: {e}")
+            self._logger.error("Error resetting corrections: %s", e)
 
             # Emit error event
             self._store._emit_event(
@@ -421,14 +492,14 @@ class CorrectionService(ICorrectionService):
         """
         # Validate field
         if field not in ["chest_type", "player", "source"]:
-            self._logger.error(f"Invalid field for correction rule: {field}")
+            self._logger.error("Invalid field for correction rule: %s", field)
             return False
 
         # Validate match_type
         valid_match_types = ["exact", "contains", "startswith", "endswith", "regex"]
         if match_type not in valid_match_types:
             self._logger.error(
-                f"Invalid match type: {match_type}. Valid types: {valid_match_types}"
+                "Invalid match type: %s. Valid types: %s", match_type, valid_match_types
             )
             return False
 
@@ -462,10 +533,17 @@ class CorrectionService(ICorrectionService):
                 EventType.CORRECTION_RULES_UPDATED, {"count": len(combined_rules)}
             )
         except KeyError:
-            self._logger.warning(f"No handlers registered for {EventType.CORRECTION_RULES_UPDATED}")
+            self._logger.warning(
+                "No handlers registered for %s", EventType.CORRECTION_RULES_UPDATED
+            )
 
         self._logger.info(
-            f"Added correction rule: {field} '{incorrect_value}' -> '{correct_value}' "
-            f"(match: {match_type}, case sensitive: {case_sensitive}, enabled: {enabled})"
+            "Added correction rule: %s '%s' -> '%s' (match: %s, case sensitive: %s, enabled: %s)",
+            field,
+            incorrect_value,
+            correct_value,
+            match_type,
+            case_sensitive,
+            enabled,
         )
         return True
@@ -15,6 +15,7 @@ from src.models.chest_entry import ChestEntry
 from src.models.correction_rule import CorrectionRule
 from src.services.config_manager import ConfigManager
 from src.services.fuzzy_matcher import FuzzyMatcher
+from src.utils.logging_config import LogSampler
 
 
 class CorrectionResult:
@@ -133,7 +134,7 @@ class Corrector:
 
             data_manager = DataManager.get_instance()
             rules = data_manager.get_correction_rules()
-            self._logger.info(f"Using {len(rules)} rules from DataManager")
+            self._logger.info("Using %s rules from DataManager", len(rules))
 
         # Store the rules
         self._rules: List[CorrectionRule] = rules if rules else []
@@ -145,7 +146,7 @@ class Corrector:
         Args:
             rules: List of correction rules
         """
-        self._logger.info(f"Setting {len(rules)} correction rules in Corrector")
+        self._logger.info("Setting %s correction rules in Corrector", len(rules))
         self._rules = rules
 
     def get_rules(self) -> List[CorrectionRule]:
@@ -190,12 +191,12 @@ class Corrector:
             logger.warning("No entries provided to apply_corrections")
             return []
 
-        logger.info(f"Applying corrections to {len(entries)} entries")
+        logger.info("Applying corrections to %d entries", len(entries))
 
         # If no rules provided, use the stored rules
         if rules is None:
             rules = self._rules
-            logger.info(f"Using {len(rules) if rules else 0} stored rules")
+            logger.info("Using %d stored rules", len(rules) if rules else 0)
 
             # If still no rules, try to get from DataManager as last resort
             if not rules:
@@ -203,7 +204,7 @@ class Corrector:
 
                 data_manager = DataManager.get_instance()
                 rules = data_manager.get_correction_rules()
-                logger.info(f"Fetched {len(rules) if rules else 0} rules from DataManager")
+                logger.info("Fetched %d rules from DataManager", len(rules) if rules else 0)
 
         # Final check - if we still don't have rules, return empty results
         if not rules:
@@ -218,11 +219,14 @@ class Corrector:
         sorted_rules = sorted(rules, key=lambda r: r.priority, reverse=True)
 
         # Log rule counts
-        logger.info(f"Applying {len(sorted_rules)} rules to {len(entries)} entries")
+        logger.info("Applying %d rules to %d entries", len(sorted_rules), len(entries))
 
         # Initialize results
         results = []
 
+        # Per-correction messages are sampled; the summary is logged by _log_correction_results
+        error_sampler = LogSampler(logger, "Error applying rule", logging.ERROR)
+
         # Apply each rule to each entry
         for i, entry in enumerate(entries):
             for field in fields:
@@ -256,7 +260,7 @@ class Corrector:
                     try:
                         # Apply the rule based on its type
                         corrected_value, match_score = self._apply_rule(
-                            rule, current_value, entry, field
+                            rule, current_value, entry, field, error_sampler
                         )
 
                         # Skip if no change was made
@@ -276,18 +280,21 @@ class Corrector:
                             match_score=match_score,
                         )
 
-                        logger.debug(f"Applied correction: {result}")
                         results.append(result)
                     except Exception as e:
-                        logger.error(f"Error applying rule to entry {i}, field {field}: {str(e)}")
+                        error_sampler.log(
+                            "Error applying rule to entry %d, field %s: %s", i, field, e
+                        )
                         continue
 
                     # Skip processing further rules for this field if a correction was applied
                     break
 
+        error_sampler.flush()
+
         # Store the results
         self._last_correction_results = results
-        logger.info(f"Applied {len(results)} corrections to {len(entries)} entries")
+        logger.info("Applied %d corrections to %d entries", len(results), len(entries))
 
         # Log the results for debugging
         self._log_correction_results()
@@ -295,7 +302,12 @@ class Corrector:
         return results
 
     def _apply_rule(
-        self, rule: CorrectionRule, value: str, entry: ChestEntry, field: str
+        self,
+        rule: CorrectionRule,
+        value: str,
+        entry: ChestEntry,
+        field: str,
+        error_sampler: Optional[LogSampler] = None,
     ) -> Tuple[str, float]:
         """
         Apply a correction rule to a string value.
@@ -305,6 +317,7 @@ class Corrector:
             value: String value to correct
             entry: Chest entry to update
             field: Field being corrected
+            error_sampler: Sampler for errors in hot loops (errors are logged directly if None)
 
         Returns:
             Tuple of (corrected value, match score)
@@ -325,10 +338,11 @@ class Corrector:
             return value, 0.0
 
         except Exception as e:
-            self._logger.error(
-                f"Error applying rule to value: {str(e)}, "
-                f"value='{value}', rule='{rule}', field='{field}'"
-            )
+            message = "Error applying rule to value: %s, value='%s', rule='%s', field='%s'"
+            if error_sampler is not None:
+                error_sampler.log(message, e, value, rule, field)
+            else:
+                self._logger.error(message, e, value, rule, field)
             return value, 0.0
 
     def _apply_rule_to_value(self, value: str, rule: CorrectionRule) -> Tuple[str, bool, float]:
@@ -384,7 +398,7 @@ class Corrector:
 
         else:
             # Unknown rule type
-            self._logger.warning(f"Unknown rule type: {rule.rule_type}")
+            self._logger.warning("Unknown rule type: %s", rule.rule_type)
             return value, False, 0.0
 
     def _log_correction_results(self):
@@ -393,12 +407,15 @@ class Corrector:
             self._logger.info("No corrections were applied")
             return
 
-        self._logger.info(f"Applied {len(self._last_correction_results)} corrections:")
+        self._logger.info("Applied %d corrections:", len(self._last_correction_results))
 
         # Group by rule type for more concise logging
         rule_type_counts: Dict[str, int] = {}
         field_counts: Dict[str, int] = {}
 
+        # Details of the first corrections at debug level, formatted only if logged
+        sampler = LogSampler(self._logger, "Applied correction")
+
         for result in self._last_correction_results:
             rule_type = (
                 result.rule.rule_type
@@ -408,21 +425,20 @@ class Corrector:
             rule_type_counts[rule_type] = rule_type_counts.get(rule_type, 0) + 1
             field_counts[result.field] = field_counts.get(result.field, 0) + 1
 
-            # Log detailed information at debug level
-            rule_type_name = (
-                result.rule.rule_type
-                if isinstance(result.rule.rule_type, str)
-                else result.rule.rule_type.name
-            )
-            self._logger.debug(
-                f"  {result.entry_index:3d}: {result.field:10s} "
-                f"'{result.original_value}' -> '{result.corrected_value}' "
-                f"({rule_type_name}, score={result.match_score:.2f})"
+            sampler.log(
+                "  %3d: %-10s '%s' -> '%s' (%s, score=%.2f)",
+                result.entry_index,
+                result.field,
+                result.original_value,
+                result.corrected_value,
+                rule_type,
+                result.match_score,
             )
+        sampler.flush()
 
         # Log summary at info level
         for rule_type, count in rule_type_counts.items():
-            self._logger.info(f"  {rule_type}: {count}")
+            self._logger.info("  %s: %d", rule_type, count)
 
         for field, count in field_counts.items():
-            self._logger.info(f"  {field}: {count}")
+            self._logger.info("  %s: %d", field, count)
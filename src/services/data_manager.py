@@ -115,9 +115,10 @@ class DataManager(QObject):
                 folder_path = str(Path(file_path_str).parent)
 
                 # Use the new path API for saving configs
-                self._config.set_path("correction_rules_file", file_path_str)
-                self._config.set_path("last_folder", folder_path)
-                self._config.set_path("corrections_dir", folder_path)
+                with self._config.batch():
+                    self._config.set_path("correction_rules_file", file_path_str)
+                    self._config.set_path("last_folder", folder_path)
+                    self._config.set_path("corrections_dir", folder_path)
 
             # Emit signal to notify components
             self._logger.info(f"Emitting correction_rules_changed signal with {len(rules)} rules")
@@ -159,22 +160,20 @@ class DataManager(QObject):
             # Store the lists
             self._validation_lists = lists.copy()
 
-            # Save list paths to config
-            for list_type, validation_list in lists.items():
-                if hasattr(validation_list, "file_path") and validation_list.file_path:
-                    file_path_str = str(validation_list.file_path)
-                    self._config.set("General", f"{list_type}_list_path", file_path_str)
-
-                    # Also save in other config locations for consistency
-                    if list_type == "player":
-                        self._config.set("Validation", "player_list", file_path_str)
-                    elif list_type == "chest_type":
-                        self._config.set("Validation", "chest_type_list", file_path_str)
-                    elif list_type == "source":
-                        self._config.set("Validation", "source_list", file_path_str)
-
-            # Save config changes
-            self._config.save()
+            # Save list paths to config in a single write
+            with self._config.batch():
+                for list_type, validation_list in lists.items():
+                    if hasattr(validation_list, "file_path") and validation_list.file_path:
+                        file_path_str = str(validation_list.file_path)
+                        self._config.set("General", f"{list_type}_list_path", file_path_str)
+
+                        # Also save in other config locations for consistency
+                        if list_type == "player":
+                            self._config.set("Validation", "player_list", file_path_str)
+                        elif list_type == "chest_type":
+                            self._config.set("Validation", "chest_type_list", file_path_str)
+                        elif list_type == "source":
+                            self._config.set("Validation", "source_list", file_path_str)
 
             # Emit signal to notify components
             self._logger.info(f"Emitting validation_lists_changed signal with {len(lists)} lists")
@@ -16,7 +16,7 @@ Usage:
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any, Callable, TypeVar, Generic, Union
+from typing import Dict, Iterable, List, Optional, Set, Any, Callable, TypeVar, Generic, Union
 import functools
 import threading
 import uuid
@@ -27,12 +27,18 @@ import pandas as pd
 # Import standardized EventType
 from src.interfaces.events import EventType, EventHandler, EventData
 from src.interfaces.i_data_store import IDataStore
+from src.services.date_index import DateSearchIndex, normalize_date_columns
+from src.services.entry_reader import build_entries_frame
+from src.services.text_index import TextSearchIndex
+from src.services.value_catalog import ValueCatalog
+from src.utils.metrics import event_type_key, instrumented, timed
 
 # Type variables for generic caching
 T = TypeVar("T")
 U = TypeVar("U")
 
 
+@instrumented
 class DataFrameStore(IDataStore):
     """
     Singleton class for centralized data management using pandas DataFrames.
@@ -96,6 +102,21 @@ class DataFrameStore(IDataStore):
         # Cache for expensive operations
         self._cache = {}
 
+        # Incremented on every change to the entries DataFrame
+        self._entries_version = 0
+
+        # Search index over the entries text columns, rebuilt lazily per version
+        self._text_index = TextSearchIndex()
+        self._text_index.reset(self._entries_df, self._entries_version)
+
+        # Sorted indexes over the entries date columns, rebuilt lazily per version
+        self._date_index = DateSearchIndex()
+        self._date_index.reset(self._entries_df, self._entries_version)
+
+        # Value -> count catalogs for filter dropdowns, updated from change deltas
+        self._value_catalog = ValueCatalog()
+        self._value_catalog.reset(self._entries_df)
+
         self._logger.info("DataFrameStore initialized")
 
     def _initialize_dataframes(self):
@@ -188,6 +209,7 @@ class DataFrameStore(IDataStore):
         if handler in self._event_handlers[event_type]:
             self._event_handlers[event_type].remove(handler)
 
+    @timed("DataFrameStore.emit", key=event_type_key)
     def _emit_event(self, event_type: EventType, data: EventData = None) -> None:
         """
         Emit an event to all subscribers.
@@ -272,6 +294,8 @@ class DataFrameStore(IDataStore):
         self._entries_df = self._transaction_changes["entries_df"]
         self._correction_rules_df = self._transaction_changes["correction_rules_df"]
         self._validation_lists = self._transaction_changes["validation_lists"]
+        self._value_catalog.reset(self._entries_df)
+        self._on_entries_changed()
 
         # Clear transaction state
         self._transaction_active = False
@@ -338,6 +362,56 @@ class DataFrameStore(IDataStore):
         """
         return self._entries_df.copy()
 
+    def get_entries_version(self) -> int:
+        """
+        Get the version counter of the entries DataFrame.
+
+        Returns:
+            int: Current entries version, incremented on every entries change
+        """
+        return self._entries_version
+
+    def get_text_index(self) -> TextSearchIndex:
+        """
+        Get the search index over the entries text columns.
+
+        Returns:
+            TextSearchIndex: Index describing the current entries version
+        """
+        return self._text_index
+
+    def get_date_index(self) -> DateSearchIndex:
+        """
+        Get the sorted index over the entries date columns.
+
+        Returns:
+            DateSearchIndex: Index describing the current entries version
+        """
+        return self._date_index
+
+    def get_value_counts(self, column: str) -> Dict[Any, int]:
+        """
+        Get the value -> count catalog of an entries column.
+
+        The catalog is maintained incrementally, so this costs O(distinct values).
+        List columns such as validation_errors are flattened.
+
+        Args:
+            column: Column name
+
+        Returns:
+            Dict mapping each distinct value to its number of rows
+        """
+        return self._value_catalog.get_counts(column)
+
+    def _on_entries_changed(self) -> None:
+        """Bump the entries version and update structures derived from the entries."""
+        self._entries_version += 1
+        self._text_index.reset(self._entries_df, self._entries_version)
+        self._date_index.reset(self._entries_df, self._entries_version)
+        self._value_catalog.set_source(self._entries_df)
+
+    @timed()
     def set_entries(
         self, entries_df: pd.DataFrame, source: str = "", emit_event: bool = True
     ) -> bool:
@@ -349,6 +423,47 @@ class DataFrameStore(IDataStore):
             source: Source of the update (optional, for tracking)
             emit_event: Whether to emit an event after updating (optional)
 
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # Store a copy to ensure immutability
+        return self._replace_entries(entries_df.copy(), source, emit_event)
+
+    @timed()
+    def set_entries_from_chunks(
+        self, chunks: Iterable[Dict[str, List[str]]], source: str = "", emit_event: bool = True
+    ) -> bool:
+        """
+        Set the entries from streamed column chunks.
+
+        The entries DataFrame is built directly from the column lists and
+        stored without the defensive copy made by set_entries.
+
+        Args:
+            chunks: Chunks mapping "chest_type", "player" and "source" to lists of values,
+                e.g. from src.services.entry_reader.iter_entry_chunks
+            source: Source of the update (optional, for tracking)
+            emit_event: Whether to emit an event after updating (optional)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            entries_df = build_entries_frame(chunks)
+        except Exception as e:
+            self._logger.error(f"Error building entries from chunks: {e}")
+            return False
+        return self._replace_entries(entries_df, source, emit_event)
+
+    def _replace_entries(self, entries_df: pd.DataFrame, source: str, emit_event: bool) -> bool:
+        """
+        Replace the entries DataFrame with a DataFrame owned by the store.
+
+        Args:
+            entries_df: New entries DataFrame, not shared with the caller
+            source: Source of the update
+            emit_event: Whether to emit an event after updating
+
         Returns:
             bool: True if successful, False otherwise
         """
@@ -360,11 +475,12 @@ class DataFrameStore(IDataStore):
                 self._logger.error(f"Missing required columns in entries DataFrame: {missing}")
                 return False
 
-            # Store a copy to ensure immutability
-            self._entries_df = entries_df.copy()
+            self._entries_df = normalize_date_columns(entries_df)
+            self._value_catalog.reset(self._entries_df)
 
             # Clear cache
             self._cache.clear()
+            self._on_entries_changed()
 
             # Emit event
             if emit_event:
@@ -381,6 +497,7 @@ class DataFrameStore(IDataStore):
             self._logger.error(f"Error setting entries: {e}")
             return False
 
+    @timed()
     def add_entry(
         self, entry_data: Dict[str, Any], source: str = "", emit_event: bool = True
     ) -> int:
@@ -428,10 +545,13 @@ class DataFrameStore(IDataStore):
             new_row.set_index("id", inplace=True)
 
         # Append to existing DataFrame
+        normalize_date_columns(new_row)
         self._entries_df = pd.concat([self._entries_df, new_row])
+        self._value_catalog.add_rows(new_row)
 
         # Clear cache
         self._cache.clear()
+        self._on_entries_changed()
 
         # Emit event
         if emit_event:
@@ -445,6 +565,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Added new entry with ID {entry_id}")
         return entry_id
 
+    @timed()
     def update_entry(
         self, entry_id: int, entry_data: Dict[str, Any], source: str = "", emit_event: bool = True
     ) -> bool:
@@ -464,6 +585,9 @@ class DataFrameStore(IDataStore):
             self._logger.error(f"Entry with ID {entry_id} not found")
             return False
 
+        # Uncount the old values before they are overwritten
+        self._value_catalog.remove_rows(self._entries_df.loc[[entry_id]])
+
         # Update fields
         for key, value in entry_data.items():
             self._entries_df.at[entry_id, key] = value
@@ -472,9 +596,11 @@ class DataFrameStore(IDataStore):
         import datetime
 
         self._entries_df.at[entry_id, "modified_at"] = pd.Timestamp(datetime.datetime.now())
+        self._value_catalog.add_rows(self._entries_df.loc[[entry_id]])
 
         # Clear cache
         self._cache.clear()
+        self._on_entries_changed()
 
         # Emit event
         if emit_event:
@@ -487,6 +613,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Updated entry with ID {entry_id}")
         return True
 
+    @timed()
     def delete_entry(self, entry_id: int, source: str = "", emit_event: bool = True) -> bool:
         """
         Delete an entry from the entries DataFrame.
@@ -504,10 +631,12 @@ class DataFrameStore(IDataStore):
             return False
 
         # Delete entry
+        self._value_catalog.remove_rows(self._entries_df.loc[[entry_id]])
         self._entries_df = self._entries_df.drop(entry_id)
 
         # Clear cache
         self._cache.clear()
+        self._on_entries_changed()
 
         # Emit event
         if emit_event:
@@ -531,6 +660,7 @@ class DataFrameStore(IDataStore):
         """
         return self._correction_rules_df.copy()
 
+    @timed()
     def set_correction_rules(self, rules_df: pd.DataFrame, emit_event: bool = True) -> bool:
         """
         Set the correction rules DataFrame.
@@ -573,6 +703,7 @@ class DataFrameStore(IDataStore):
             self._logger.error(f"Error setting correction rules: {e}")
             return False
 
+    @timed()
     def add_correction_rule(self, rule_data: Dict[str, Any], emit_event: bool = True) -> int:
         """
         Add a new correction rule to the correction rules DataFrame.
@@ -628,6 +759,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Added new correction rule with ID {rule_id}")
         return rule_id
 
+    @timed()
     def update_correction_rule(
         self, rule_id: int, rule_data: Dict[str, Any], emit_event: bool = True
     ) -> bool:
@@ -666,6 +798,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Updated correction rule with ID {rule_id}")
         return True
 
+    @timed()
     def delete_correction_rule(self, rule_id: int, emit_event: bool = True) -> bool:
         """
         Delete a correction rule from the correction rules DataFrame.
@@ -713,6 +846,7 @@ class DataFrameStore(IDataStore):
 
         return self._validation_lists[list_type].copy()
 
+    @timed()
     def set_validation_list(
         self, list_type: str, entries_df: pd.DataFrame, emit_event: bool = True
     ) -> bool:
@@ -767,6 +901,7 @@ class DataFrameStore(IDataStore):
             self._logger.error(f"Error updating validation list: {e}")
             return False
 
+    @timed()
     def add_validation_entry(self, list_type: str, entry: str, emit_event: bool = True) -> bool:
         """
         Add a new entry to a validation list.
@@ -814,6 +949,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Added '{entry}' to {list_type} validation list")
         return True
 
+    @timed()
     def delete_validation_entry(self, list_type: str, entry: str, emit_event: bool = True) -> bool:
         """
         Delete an entry from a validation list.
@@ -850,6 +986,7 @@ class DataFrameStore(IDataStore):
         self._logger.info(f"Deleted '{entry}' from {list_type} validation list")
         return True
 
+    @timed()
     def update_validation_list(
         self, list_type: str, validation_list: Any, emit_event: bool = True
     ) -> bool:
@@ -910,6 +1047,7 @@ class DataFrameStore(IDataStore):
             self._logger.error(f"Error updating validation list: {e}")
             return False
 
+    @timed()
     def remove_validation_entry(self, list_type: str, entry: str) -> bool:
         """
         Remove an entry from a validation list.
@@ -0,0 +1,193 @@
+"""
+date_index.py
+
+Description: Sorted indexes over the datetime columns of the entries DataFrame, plus ingest normalization
+Usage:
+    from src.services.date_index import DateSearchIndex, normalize_date_columns
+
+    entries_df = normalize_date_columns(entries_df)
+    index = DateSearchIndex()
+    index.reset(entries_df, version=1)
+    mask = index.column("date").range_mask(start, end)
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.services.column_index import ColumnIndexSet
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_date_column_name(name: str) -> bool:
+    """
+    Check whether a column name denotes a date or time column.
+
+    Args:
+        name: Column name
+
+    Returns:
+        True for names like "date", "import_date", "modified_at" or "timestamp"
+    """
+    name = str(name).lower()
+    return "date" in name or "time" in name or name.endswith("_at")
+
+
+def normalize_date_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert date columns to datetime64[ns] so filters never parse at query time.
+
+    A column is converted only if every non-missing value parses; otherwise it
+    is left unchanged. Timezone-aware columns are converted to naive UTC.
+
+    Args:
+        df: DataFrame to normalize (modified in place)
+
+    Returns:
+        The same DataFrame
+    """
+    for column in df.columns:
+        if not is_date_column_name(column):
+            continue
+
+        values = df[column]
+        if pd.api.types.is_datetime64_ns_dtype(values) and getattr(values.dt, "tz", None) is None:
+            continue
+
+        try:
+            if pd.api.types.is_datetime64_dtype(values):
+                # Naive datetimes in another unit only need a cast
+                df[column] = values.astype("datetime64[ns]")
+                continue
+            if isinstance(values.dtype, pd.DatetimeTZDtype):
+                converted = values.dt.tz_convert("UTC").dt.tz_localize(None)
+            else:
+                converted = pd.to_datetime(values, errors="coerce")
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Column '{column}' not converted to datetime: {e}")
+            continue
+
+        # Leave the column alone if any value failed to parse
+        if converted.isna().sum() > values.isna().sum():
+            logger.debug(f"Column '{column}' has values that are not dates, not converted")
+            continue
+
+        df[column] = converted.astype("datetime64[ns]")
+
+    return df
+
+
+class SortedDateColumn:
+    """
+    Sorted view of one datetime column.
+
+    Range queries are two searchsorted calls. When the column is already in
+    chronological order (e.g. daily imports appended in order) the matching
+    rows form a contiguous slice of the DataFrame.
+
+    Attributes:
+        _row_count (int): Number of rows in the column
+        _sorted_values (np.ndarray): Non-missing values in ascending order
+        _order (Optional[np.ndarray]): Row position of each sorted value, None if already sorted
+    """
+
+    def __init__(self, values: pd.Series):
+        """
+        Build the sorted view.
+
+        Args:
+            values: datetime64 column values
+        """
+        array = values.to_numpy(dtype="datetime64[ns]")
+        self._row_count = len(array)
+
+        positions = np.flatnonzero(~np.isnat(array))
+        valid = array[positions]
+
+        if len(positions) == self._row_count and (
+            self._row_count < 2 or bool(np.all(valid[1:] >= valid[:-1]))
+        ):
+            self._sorted_values = valid
+            self._order = None
+        else:
+            order = np.argsort(valid, kind="stable")
+            self._sorted_values = valid[order]
+            self._order = positions[order]
+
+    @property
+    def is_monotonic(self) -> bool:
+        """
+        Check whether the rows are already in chronological order.
+
+        Returns:
+            True if range results are contiguous row slices
+        """
+        return self._order is None
+
+    def range_bounds(self, start: Optional[datetime], end: Optional[datetime]) -> slice:
+        """
+        Get the positions in the sorted values that lie in a range.
+
+        Args:
+            start: Inclusive lower bound, or None
+            end: Inclusive upper bound, or None
+
+        Returns:
+            Slice into the sorted values (a row slice if is_monotonic)
+        """
+        lo = 0
+        hi = len(self._sorted_values)
+        if start is not None:
+            lo = int(np.searchsorted(self._sorted_values, np.datetime64(start, "ns"), side="left"))
+        if end is not None:
+            hi = int(np.searchsorted(self._sorted_values, np.datetime64(end, "ns"), side="right"))
+        return slice(lo, max(lo, hi))
+
+    def range_mask(self, start: Optional[datetime], end: Optional[datetime]) -> np.ndarray:
+        """
+        Find the rows whose date lies in a range.
+
+        Args:
+            start: Inclusive lower bound, or None
+            end: Inclusive upper bound, or None
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        bounds = self.range_bounds(start, end)
+        mask = np.zeros(self._row_count, dtype=bool)
+        if self._order is None:
+            mask[bounds] = True
+        else:
+            mask[self._order[bounds]] = True
+        return mask
+
+
+class DateSearchIndex(ColumnIndexSet):
+    """
+    Sorted date indexes for one version of the entries DataFrame.
+
+    Only datetime columns are indexed; see ColumnIndexSet for the lifecycle.
+    """
+
+    def _build_column(self, name: str, values: pd.Series) -> Optional[SortedDateColumn]:
+        """
+        Build the sorted view of one column.
+
+        Args:
+            name: Column name
+            values: Column values
+
+        Returns:
+            Sorted column, or None if the column is not a datetime column
+        """
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            return None
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+        return SortedDateColumn(values)
@@ -0,0 +1,649 @@
+"""
+entry_reader.py
+
+Description: Canonical streaming loader for chest export text files, with pluggable row sinks
+Usage:
+    from src.services.entry_reader import ChestEntrySink, DataFrameSink, load_entries
+
+    entries_df = load_entries("data/input/chests_2025-03-17.txt", DataFrameSink())
+    entries = load_entries("data/input/chests_2025-03-17.txt", ChestEntrySink())
+
+    for chunk in iter_entry_chunks("data/input/chests_2025-03-17.txt"):
+        chunk["chest_type"], chunk["player"], chunk["source"]  # parallel lists
+
+Grammar (one line per symbol; lines are compared after stripping whitespace,
+prefixes are case-insensitive):
+
+    file       := { skipped | entry }
+    skipped    := blank | from_line | source_line      (outside an entry)
+    entry      := chest_line from_line source_any
+    chest_line := any non-blank line not starting with "From:" or "Source:"
+    from_line  := "From:" player
+    source_any := "Source:" source | source             (the prefix is optional)
+
+    - A chest line followed by anything but a from_line is dropped; the
+      following line is then read as a possible chest line.
+    - Entries whose player or source is empty are dropped (logged).
+    - An entry cut off by the end of the file is dropped (logged).
+    - Entry IDs are abs(hash((chest_type, player, source))) % 10**8, as in ChestEntry.
+"""
+
+import codecs
+import datetime
+import logging
+import mmap
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from src.models.chest_entry import ChestEntry
+
+
+logger = logging.getLogger(__name__)
+
+# Columns produced for each entry
+ENTRY_COLUMNS = ("chest_type", "player", "source")
+
+# Entries per yielded chunk
+DEFAULT_CHUNK_SIZE = 50000
+
+# Bytes decoded at a time
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Encodings tried, in order, for files without a byte order mark
+DEFAULT_ENCODINGS = ("utf-8", "latin-1", "utf-16", "cp1252")
+
+# Byte order marks, longest first so UTF-32 is not mistaken for UTF-16
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Line break characters that str.splitlines() recognizes
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+EntryChunk = Dict[str, List[str]]
+
+
+def iter_file_blocks(
+    file_path: Union[str, Path], block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[bytes]:
+    """
+    Read a file as a sequence of byte blocks.
+
+    The file is memory-mapped when possible and read through a buffered
+    reader otherwise (e.g. empty files, which cannot be mapped).
+
+    Args:
+        file_path: Path to the file
+        block_size: Maximum size of each block in bytes
+
+    Yields:
+        Consecutive blocks of the file
+    """
+    with open(file_path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+
+        if mapped is None:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    return
+                yield block
+        else:
+            with mapped:
+                for start in range(0, len(mapped), block_size):
+                    yield mapped[start : start + block_size]
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    """
+    Check whether an encoding stores ASCII text as plain ASCII bytes.
+
+    Args:
+        encoding: Encoding name
+
+    Returns:
+        True for encodings like utf-8 or cp1252, False for utf-16/utf-32
+    """
+    return codecs.lookup(encoding).name.replace("_", "-") not in (
+        "utf-16",
+        "utf-32",
+        "utf-16-le",
+        "utf-16-be",
+        "utf-32-le",
+        "utf-32-be",
+    )
+
+
+def iter_decoded_blocks(
+    blocks: Iterable[bytes], encodings: Optional[Sequence[str]] = None
+) -> Iterator[str]:
+    """
+    Decode byte blocks, detecting the encoding in a single pass.
+
+    A byte order mark selects its encoding. Otherwise each block is decoded
+    with the first ASCII-compatible encoding that has not failed yet; when a
+    block fails, decoding switches to the next encoding for that block and
+    the rest of the file. Blocks decoded before the switch were valid in the
+    earlier encoding, which for chest exports means plain ASCII, so no block
+    is ever decoded twice.
+
+    Args:
+        blocks: Byte blocks of the file
+        encodings: Encodings to try, in order (default: DEFAULT_ENCODINGS)
+
+    Yields:
+        Decoded text of each block
+
+    Raises:
+        ValueError: If a block cannot be decoded with any of the encodings
+    """
+    encodings = list(encodings or DEFAULT_ENCODINGS)
+    blocks = iter(blocks)
+
+    first = next(blocks, b"")
+    candidates = [encoding for encoding in encodings if _is_ascii_compatible(encoding)]
+    for bom, encoding in _BOMS:
+        if first.startswith(bom):
+            candidates = [encoding]
+            break
+
+    index = 0
+    decoder = codecs.getincrementaldecoder(candidates[index])() if candidates else None
+    block: Optional[bytes] = first
+    while block is not None:
+        next_block = next(blocks, None)
+        final = next_block is None
+        while True:
+            if decoder is None:
+                raise ValueError(
+                    f"Could not decode file with any of the supported encodings: {', '.join(encodings)}"
+                )
+            pending = decoder.getstate()[0]
+            try:
+                yield decoder.decode(block, final)
+                break
+            except UnicodeDecodeError:
+                index += 1
+                if index >= len(candidates):
+                    decoder = None
+                    continue
+                logger.info(f"Switching to {candidates[index]} encoding")
+                decoder = codecs.getincrementaldecoder(candidates[index])()
+                block = pending + block
+        block = next_block
+
+
+def iter_line_batches(texts: Iterable[str]) -> Iterator[List[str]]:
+    """
+    Split decoded blocks into lines, joining lines that span block boundaries.
+
+    Concatenating the batches gives the same lines as "".join(texts).splitlines().
+
+    Args:
+        texts: Decoded text blocks
+
+    Yields:
+        Lists of lines without line breaks, one list per block
+    """
+    carry = ""
+    for text in texts:
+        if not text:
+            continue
+        lines = (carry + text).splitlines()
+        # Keep an unterminated last line, and a trailing "\r" that may be half of "\r\n"
+        if text[-1] not in _LINE_BREAKS or text[-1] == "\r":
+            carry = lines.pop() if lines else ""
+            if text[-1] == "\r":
+                carry += "\r"
+        else:
+            carry = ""
+        if lines:
+            yield lines
+    if carry:
+        yield carry.splitlines()
+
+
+class EntryLineParser:
+    """
+    Incremental parser from chest export lines to entry column chunks.
+
+    Implements the grammar in the module docstring. Batches made only of well-formed entries (optionally separated by blank
+    lines) are split with list slicing; anything else goes through a
+    line-by-line state machine implementing the same grammar.
+
+    Attributes:
+        _chunk_size (int): Maximum number of entries per yielded chunk
+        _columns (Dict[str, List[str]]): Parsed entries not yet yielded
+        _pending (List[str]): Lines of an entry that continues in the next batch
+        _state (int): 0 = expecting chest type, 1 = expecting "From:", 2 = expecting source
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the parser.
+
+        Args:
+            chunk_size: Maximum number of entries per yielded chunk
+        """
+        self._chunk_size = max(1, chunk_size)
+        self._columns: Dict[str, List[str]] = {column: [] for column in ENTRY_COLUMNS}
+        self._pending: List[str] = []
+        self._state = 0
+        self._chest_type = ""
+        self._player = ""
+        self._line_number = 0
+
+    def feed(self, lines: List[str]) -> Iterator[EntryChunk]:
+        """
+        Parse a batch of lines.
+
+        Args:
+            lines: Consecutive lines of the input
+
+        Yields:
+            Full chunks of chunk_size entries
+        """
+        if self._pending:
+            lines = self._pending + lines
+            self._line_number -= len(self._pending)
+            self._pending = []
+
+        consumed = self._take_well_formed(lines) if self._state == 0 else 0
+        if consumed < len(lines):
+            rest = lines[consumed:]
+            if consumed and self._state == 0:
+                # Only the start of an entry is left; wait for the rest of it
+                self._pending = rest
+                self._line_number += consumed + len(rest)
+            else:
+                self._line_number += consumed
+                self._parse_lines(rest)
+        else:
+            self._line_number += consumed
+
+        yield from self._drain(final=False)
+
+    def finish(self) -> Iterator[EntryChunk]:
+        """
+        Parse any remaining lines and yield the last, possibly short, chunk.
+
+        Yields:
+            Remaining chunks
+        """
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._line_number -= len(pending)
+            self._parse_lines(pending)
+
+        if self._state != 0:
+            logger.warning(f"Incomplete entry at end of input (line {self._line_number})")
+            self._state = 0
+
+        yield from self._drain(final=True)
+
+    def _drain(self, final: bool) -> Iterator[EntryChunk]:
+        """
+        Yield parsed entries in chunks.
+
+        Args:
+            final: Also yield a last chunk shorter than chunk_size
+
+        Yields:
+            Entry column chunks
+        """
+        size = self._chunk_size
+        count = len(self._columns["chest_type"])
+        end = count if final else count - count % size
+        if not end:
+            return
+
+        columns = self._columns
+        self._columns = {column: values[end:] for column, values in columns.items()}
+        for start in range(0, end, size):
+            yield {column: values[start : start + size] for column, values in columns.items()}
+
+    def _take_well_formed(self, lines: List[str]) -> int:
+        """
+        Parse the batch with list slicing if it consists of well-formed entries.
+
+        Args:
+            lines: Lines of the batch, starting at an entry boundary
+
+        Returns:
+            Number of lines consumed (0 if the batch needs the state machine)
+        """
+        stripped = [line.strip() for line in lines]
+        blanks = [i for i, line in enumerate(stripped) if not line]
+        if blanks:
+            # Blank lines are only harmless between entries
+            if any((position - count) % 3 for count, position in enumerate(blanks)):
+                return 0
+            stripped = [line for line in stripped if line]
+
+        usable = len(stripped) - len(stripped) % 3
+        if not usable:
+            return 0
+
+        chest_types = stripped[0:usable:3]
+        from_lines = stripped[1:usable:3]
+        source_lines = stripped[2:usable:3]
+
+        if any(prefix.lower() != "from:" for prefix in {line[:5] for line in from_lines}):
+            return 0
+        if any(
+            prefix[:5].lower() == "from:" or prefix.lower() == "source:"
+            for prefix in {line[:7] for line in chest_types}
+        ):
+            return 0
+
+        players = [line[5:].strip() for line in from_lines]
+        source_prefixes = {line[:7] for line in source_lines}
+        if all(prefix.lower() == "source:" for prefix in source_prefixes):
+            sources = [line[7:].strip() for line in source_lines]
+        else:
+            sources = [
+                line[7:].strip() if line[:7].lower() == "source:" else line for line in source_lines
+            ]
+        if "" in players or "" in sources:
+            return 0
+
+        self._columns["chest_type"].extend(chest_types)
+        self._columns["player"].extend(players)
+        self._columns["source"].extend(sources)
+
+        if usable == len(stripped):
+            return len(lines)
+        # Position of the first unused non-blank line in the original batch
+        return [i for i, line in enumerate(lines) if line.strip()][usable]
+
+    def _parse_lines(self, lines: List[str]) -> None:
+        """
+        Parse lines one at a time with the grammar state machine.
+
+        Args:
+            lines: Consecutive lines of the input
+        """
+        chest_types = self._columns["chest_type"]
+        players = self._columns["player"]
+        sources = self._columns["source"]
+
+        for raw in lines:
+            self._line_number += 1
+            line = raw.strip()
+            lower_prefix = line[:7].lower()
+
+            if self._state == 0:
+                if not line or lower_prefix.startswith("from:") or lower_prefix == "source:":
+                    continue
+                self._chest_type = line
+                self._state = 1
+
+            elif self._state == 1:
+                if lower_prefix.startswith("from:"):
+                    self._player = line[5:].strip()
+                    self._state = 2
+                    continue
+
+                logger.warning(f"Invalid entry at line {self._line_number - 1}: no 'From:' line")
+                if not line or lower_prefix == "source:":
+                    self._state = 0
+                else:
+                    self._chest_type = line
+
+            else:
+                self._state = 0
+                source = line[7:].strip() if lower_prefix == "source:" else line
+                if not self._player or not source:
+                    logger.error(
+                        f"Error parsing entry at line {self._line_number - 2}: empty player or source"
+                    )
+                    continue
+
+                chest_types.append(self._chest_type)
+                players.append(self._player)
+                sources.append(source)
+
+
+def parse_entry_lines(
+    lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[EntryChunk]:
+    """
+    Parse chest export lines into entry column chunks.
+
+    See EntryLineParser for the grammar.
+
+    Args:
+        lines: Lines of the input
+        chunk_size: Maximum number of entries per chunk
+
+    Yields:
+        Dicts mapping each of ENTRY_COLUMNS to a list of values
+    """
+    parser = EntryLineParser(chunk_size)
+    yield from parser.feed(list(lines))
+    yield from parser.finish()
+
+
+def _observe_blocks(blocks: Iterable[bytes], on_block: Callable[[int], None]) -> Iterator[bytes]:
+    """
+    Pass blocks through, reporting the size of each one.
+
+    Args:
+        blocks: Byte blocks
+        on_block: Called with the size of each block before it is yielded
+
+    Yields:
+        The same blocks
+    """
+    for block in blocks:
+        on_block(len(block))
+        yield block
+
+
+def iter_entry_chunks(
+    file_path: Union[str, Path],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encodings: Optional[Sequence[str]] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    on_block: Optional[Callable[[int], None]] = None,
+) -> Iterator[EntryChunk]:
+    """
+    Stream the entries of a chest export text file as column chunks.
+
+    Args:
+        file_path: Path to the text file
+        chunk_size: Maximum number of entries per chunk
+        encodings: Encodings to try for files without a byte order mark
+        block_size: Bytes read and decoded at a time
+        on_block: Called with the size of each block read, e.g. for progress
+            reporting; an exception raised by it aborts the read
+
+    Yields:
+        Dicts mapping each of ENTRY_COLUMNS to a list of values
+
+    Raises:
+        ValueError: If the file cannot be decoded with any of the encodings
+    """
+    blocks = iter_file_blocks(file_path, block_size)
+    if on_block is not None:
+        blocks = _observe_blocks(blocks, on_block)
+    texts = iter_decoded_blocks(blocks, encodings)
+    parser = EntryLineParser(chunk_size)
+    for lines in iter_line_batches(texts):
+        yield from parser.feed(lines)
+    yield from parser.finish()
+
+
+def entry_id(chest_type: str, player: str, source: str) -> int:
+    """
+    Get the content-based ID of an entry.
+
+    Args:
+        chest_type: Chest type
+        player: Player name
+        source: Chest source
+
+    Returns:
+        Entry ID, the same as ChestEntry assigns
+    """
+    return abs(hash((chest_type, player, source))) % (10**8)
+
+
+class EntrySink(ABC):
+    """
+    Receiver for the entry column chunks produced by the loader.
+    """
+
+    @abstractmethod
+    def add_chunk(self, chunk: EntryChunk) -> None:
+        """
+        Receive a chunk of entries.
+
+        Args:
+            chunk: Dict mapping each of ENTRY_COLUMNS to a list of values
+        """
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        """
+        Get the loaded entries.
+
+        Returns:
+            The entries in the sink's representation
+        """
+        pass
+
+
+class DataFrameSink(EntrySink):
+    """
+    Sink that builds the entries DataFrame stored by DataFrameStore.
+
+    Attributes:
+        _columns (Dict[str, List[str]]): Column values received so far
+    """
+
+    def __init__(self):
+        """Initialize an empty sink."""
+        self._columns: Dict[str, List[str]] = {column: [] for column in ENTRY_COLUMNS}
+
+    def add_chunk(self, chunk: EntryChunk) -> None:
+        """
+        Append a chunk of entries to the columns.
+
+        Args:
+            chunk: Dict mapping each of ENTRY_COLUMNS to a list of values
+        """
+        for column in ENTRY_COLUMNS:
+            self._columns[column].extend(chunk[column])
+
+    def result(self) -> pd.DataFrame:
+        """
+        Build the entries DataFrame.
+
+        Returns:
+            DataFrame indexed by "id" with the entry, status and validation columns
+        """
+        columns = self._columns
+        count = len(columns["chest_type"])
+        entries_df = pd.DataFrame(columns)
+        entries_df["status"] = "Pending"
+        entries_df["validation_errors"] = [[] for _ in range(count)]
+        entries_df["original_values"] = [{} for _ in range(count)]
+        entries_df.index = pd.Index(
+            [
+                entry_id(*key)
+                for key in zip(columns["chest_type"], columns["player"], columns["source"])
+            ],
+            name="id",
+        )
+        entries_df["modified_at"] = pd.Timestamp(datetime.datetime.now()).as_unit("ns")
+        return entries_df
+
+
+class ChestEntrySink(EntrySink):
+    """
+    Sink that creates ChestEntry objects.
+
+    Attributes:
+        _entries (List[ChestEntry]): Entries received so far
+    """
+
+    def __init__(self):
+        """Initialize an empty sink."""
+        self._entries: List[ChestEntry] = []
+
+    def add_chunk(self, chunk: EntryChunk) -> None:
+        """
+        Create entries for a chunk.
+
+        Args:
+            chunk: Dict mapping each of ENTRY_COLUMNS to a list of values
+        """
+        self._entries.extend(
+            ChestEntry(chest_type=chest_type, player=player, source=source)
+            for chest_type, player, source in zip(
+                chunk["chest_type"], chunk["player"], chunk["source"]
+            )
+        )
+
+    def result(self) -> List[ChestEntry]:
+        """
+        Get the created entries.
+
+        Returns:
+            List of chest entries
+        """
+        return self._entries
+
+
+def load_entries(
+    file_path: Union[str, Path],
+    sink: EntrySink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encodings: Optional[Sequence[str]] = None,
+) -> Any:
+    """
+    Load a chest export text file into a sink.
+
+    Args:
+        file_path: Path to the text file
+        sink: Receiver of the entries, e.g. DataFrameSink or ChestEntrySink
+        chunk_size: Maximum number of entries per chunk passed to the sink
+        encodings: Encodings to try for files without a byte order mark
+
+    Returns:
+        sink.result()
+
+    Raises:
+        ValueError: If the file cannot be decoded with any of the encodings
+    """
+    for chunk in iter_entry_chunks(file_path, chunk_size, encodings):
+        sink.add_chunk(chunk)
+    return sink.result()
+
+
+def build_entries_frame(chunks: Iterable[EntryChunk]) -> pd.DataFrame:
+    """
+    Build an entries DataFrame, as stored by DataFrameStore, from column chunks.
+
+    Args:
+        chunks: Entry column chunks, e.g. from iter_entry_chunks
+
+    Returns:
+        DataFrame indexed by "id" with the entry, status and validation columns
+    """
+    sink = DataFrameSink()
+    for chunk in chunks:
+        sink.add_chunk(chunk)
+    return sink.result()
@@ -0,0 +1,284 @@
+"""
+entry_writer.py
+
+Description: Vectorized export of entries to text, CSV and Parquet files with atomic writes
+Usage:
+    from src.services.entry_writer import write_entries
+
+    write_entries(data_store.get_entries(), "data/output/chests_2025-03-17.txt")
+    write_entries(data_store.get_entries(), "data/output/chests.csv")
+    write_entries(data_store.get_entries(), "data/output/chests.parquet")
+"""
+
+import json
+import logging
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from src.models.chest_entry import ChestEntry
+from src.services.entry_reader import DEFAULT_CHUNK_SIZE, ENTRY_COLUMNS
+
+
+logger = logging.getLogger(__name__)
+
+# Export formats by file extension
+EXPORT_FORMATS = {".txt": "text", ".csv": "csv", ".parquet": "parquet"}
+
+# Write buffer for text and CSV exports
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Compression codec for Parquet exports
+PARQUET_COMPRESSION = "zstd"
+
+_encode_json = json.JSONEncoder().encode
+
+
+@contextmanager
+def atomic_path(file_path: Union[str, Path]) -> Iterator[Path]:
+    """
+    Provide a temporary path that replaces the target file on success.
+
+    The temporary file is created next to the target so the final rename
+    stays on one file system. If the body raises, the target is left
+    untouched and the temporary file is removed.
+
+    Args:
+        file_path: Target file
+
+    Yields:
+        Path to write the content to
+    """
+    file_path = Path(file_path)
+    temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def entries_to_frame(entries: Sequence[ChestEntry]) -> pd.DataFrame:
+    """
+    Build an entries DataFrame from ChestEntry objects.
+
+    Args:
+        entries: Chest entries
+
+    Returns:
+        DataFrame with chest_type, player, source and status columns
+    """
+    return pd.DataFrame(
+        {
+            "chest_type": [entry.chest_type for entry in entries],
+            "player": [entry.player for entry in entries],
+            "source": [entry.source for entry in entries],
+            "status": [entry.status for entry in entries],
+        }
+    )
+
+
+def _prefixed(values: pd.Series, prefix: str) -> List[str]:
+    """
+    Add a line prefix like "From: " to values that do not start with it.
+
+    Values repeat a lot (players, chest types), so the check runs once per
+    distinct value and the result is spread back with the factorized codes.
+
+    Args:
+        values: Column values
+        prefix: Prefix including the trailing space
+
+    Returns:
+        Prefixed values
+    """
+    codes, uniques = pd.factorize(values.fillna("").astype(str))
+    label = prefix[:-1].lower()
+    prefixed = [
+        value if value[: len(label)].lower() == label else prefix + value for value in uniques
+    ]
+    return np.asarray(prefixed, dtype=object)[codes].tolist()
+
+
+def format_entries_text(entries_df: pd.DataFrame, blank_lines: bool = False) -> str:
+    """
+    Format entries in the chest export text format.
+
+    Produces the same text as ChestEntry.to_text for each entry.
+
+    Args:
+        entries_df: Entries with chest_type, player and source columns
+        blank_lines: End every entry with a blank line instead of only
+            separating entries with a line break
+
+    Returns:
+        File content
+    """
+    if entries_df.empty:
+        return ""
+
+    # Interleave the columns into one list of lines and join it once
+    width = 4 if blank_lines else 3
+    lines = [""] * (len(entries_df) * width)
+    lines[0::width] = entries_df["chest_type"].fillna("").astype(str).tolist()
+    lines[1::width] = _prefixed(entries_df["player"], "From: ")
+    lines[2::width] = _prefixed(entries_df["source"], "Source: ")
+    text = "\n".join(lines)
+    return text + "\n" if blank_lines else text
+
+
+def _export_frame(entries_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare entries for a tabular export.
+
+    The index becomes an "id" column (if it holds entry IDs) and list or
+    dict columns such as validation_errors are encoded as JSON text.
+
+    Args:
+        entries_df: Entries DataFrame
+
+    Returns:
+        DataFrame with scalar columns only
+    """
+    if entries_df.index.name == "id":
+        entries_df = entries_df.reset_index()
+    else:
+        entries_df = entries_df.reset_index(drop=True)
+
+    for column in entries_df.columns:
+        if entries_df[column].dtype != object:
+            continue
+        sample = entries_df[column].dropna()
+        if len(sample) and isinstance(sample.iloc[0], (list, dict)):
+            # Most cells are empty, so skip the encoder for those
+            entries_df[column] = [
+                (_encode_json(value) if value else "[]" if isinstance(value, list) else "{}")
+                if isinstance(value, (list, dict))
+                else value
+                for value in entries_df[column]
+            ]
+    return entries_df
+
+
+def write_entries_text(
+    entries_df: pd.DataFrame,
+    file_path: Union[str, Path],
+    blank_lines: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Write entries to a text file in the chest export format.
+
+    Args:
+        entries_df: Entries with chest_type, player and source columns
+        file_path: Target file
+        blank_lines: End every entry with a blank line (see format_entries_text)
+        chunk_size: Entries formatted at a time, to bound memory use
+
+    Returns:
+        Number of entries written
+    """
+    count = len(entries_df)
+    with atomic_path(file_path) as temp_path:
+        with open(temp_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            for start in range(0, count, chunk_size):
+                if start and not blank_lines:
+                    f.write("\n")
+                f.write(
+                    format_entries_text(entries_df.iloc[start : start + chunk_size], blank_lines)
+                )
+    return count
+
+
+def write_entries_csv(entries_df: pd.DataFrame, file_path: Union[str, Path]) -> int:
+    """
+    Write entries to a CSV file with a header row.
+
+    Args:
+        entries_df: Entries DataFrame
+        file_path: Target file
+
+    Returns:
+        Number of entries written
+    """
+    export_df = _export_frame(entries_df)
+    with atomic_path(file_path) as temp_path:
+        with open(temp_path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_SIZE) as f:
+            export_df.to_csv(f, index=False, date_format="%Y-%m-%d %H:%M:%S")
+    return len(export_df)
+
+
+def write_entries_parquet(entries_df: pd.DataFrame, file_path: Union[str, Path]) -> int:
+    """
+    Write entries to a compressed Parquet file.
+
+    Requires the optional pyarrow dependency.
+
+    Args:
+        entries_df: Entries DataFrame
+        file_path: Target file
+
+    Returns:
+        Number of entries written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    export_df = _export_frame(entries_df)
+    table = pa.Table.from_pandas(export_df, preserve_index=False)
+    with atomic_path(file_path) as temp_path:
+        pq.write_table(table, str(temp_path), compression=PARQUET_COMPRESSION)
+    return len(export_df)
+
+
+def write_entries(
+    entries_df: pd.DataFrame,
+    file_path: Union[str, Path],
+    export_format: Optional[str] = None,
+    blank_lines: bool = False,
+) -> int:
+    """
+    Write entries to a file in the format given by its extension.
+
+    Args:
+        entries_df: Entries DataFrame
+        file_path: Target file
+        export_format: "text", "csv" or "parquet"; taken from the extension if None
+        blank_lines: For text exports, end every entry with a blank line
+
+    Returns:
+        Number of entries written
+
+    Raises:
+        ValueError: If the format is not supported or required columns are missing
+    """
+    file_path = Path(file_path)
+    if export_format is None:
+        export_format = EXPORT_FORMATS.get(file_path.suffix.lower())
+    if export_format not in EXPORT_FORMATS.values():
+        raise ValueError(
+            f"Unsupported export format for {file_path.name}. "
+            f"Supported formats: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    if export_format == "text":
+        missing = [column for column in ENTRY_COLUMNS if column not in entries_df.columns]
+        if missing:
+            raise ValueError(f"Entries are missing columns: {', '.join(missing)}")
+        count = write_entries_text(entries_df, file_path, blank_lines)
+    elif export_format == "csv":
+        count = write_entries_csv(entries_df, file_path)
+    else:
+        count = write_entries_parquet(entries_df, file_path)
+
+    logger.info(f"Exported {count} entries to {file_path}")
+    return count
@@ -24,8 +24,10 @@ import threading
 from typing import Dict, Set, Any, Callable
 
 from src.interfaces.events import EventType, EventHandler, EventData
+from src.utils.metrics import event_type_key, instrumented, timed
 
 
+@instrumented
 class EventManager:
     """
     Centralized event handling system for the application.
@@ -104,6 +106,7 @@ class EventManager:
             return False
 
     @classmethod
+    @timed("EventManager.emit", key=event_type_key)
     def emit(cls, event_type: EventType, event_data: EventData = None) -> int:
         """
         Emit an event to all subscribed handlers.
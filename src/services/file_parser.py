@@ -6,18 +6,38 @@ Usage:
     from src.services.file_parser import FileParser
     parser = FileParser()
     entries = parser.parse_entry_file("data/input/chests_2023-01-01.txt")
+    data_store.set_entries_from_chunks(parser.iter_entry_chunks("data/input/chests_2023-01-01.txt"))
     rules = parser.parse_correction_file("data/corrections/rules.csv")
+    data_store.set_correction_rules(parser.parse_correction_frame("data/corrections/rules.csv"))
 """
 
 import csv
 import re
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Tuple
 import traceback
 
+import pandas as pd
+
 from src.models.chest_entry import ChestEntry
 from src.models.correction_rule import CorrectionRule
+from src.services.entry_reader import (
+    DEFAULT_CHUNK_SIZE,
+    ChestEntrySink,
+    EntryChunk,
+    iter_entry_chunks,
+    load_entries,
+    parse_entry_lines,
+)
+from src.services.entry_writer import (
+    EXPORT_FORMATS,
+    entries_to_frame,
+    write_entries,
+    write_entries_text,
+)
+from src.services.rule_reader import read_rules_frame, rules_from_frame
+from src.utils.logging_config import LogSampler
 
 
 class FileParser:
@@ -42,7 +62,7 @@ class FileParser:
         }
 
         self._correction_formats = {
-            ".csv": self._parse_csv_file,
+            ".csv": self._read_csv_rules_frame,
         }
 
         # Supported encodings
@@ -66,11 +86,11 @@ class FileParser:
             ValueError: If the file format is not supported
         """
         file_path = Path(file_path)
-        self.logger.info(f"Parsing entry file: {file_path}")
+        self.logger.info("Parsing entry file: %s", file_path)
 
         # Check if file exists
         if not file_path.exists():
-            self.logger.error(f"File not found: {file_path}")
+            self.logger.error("File not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Get file extension
@@ -78,7 +98,7 @@ class FileParser:
 
         # Check if format is supported
         if extension not in self._entry_formats:
-            self.logger.error(f"Unsupported file format: {extension}")
+            self.logger.error("Unsupported file format: %s", extension)
             raise ValueError(
                 f"Unsupported file format: {extension}. Supported formats: {', '.join(self._entry_formats.keys())}"
             )
@@ -86,13 +106,45 @@ class FileParser:
         # Parse the file using the appropriate parser
         try:
             entries = self._entry_formats[extension](file_path)
-            self.logger.info(f"Successfully parsed {len(entries)} entries from {file_path}")
+            self.logger.info("Successfully parsed %s entries from %s", len(entries), file_path)
             return entries
         except Exception as e:
-            self.logger.error(f"Error parsing entry file {file_path}: {str(e)}")
+            self.logger.error("Error parsing entry file %s: %s", file_path, e)
             self.logger.error(traceback.format_exc())
             raise
 
+    def iter_entry_chunks(
+        self, file_path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[EntryChunk]:
+        """
+        Stream the entries of a text file as column chunks, without creating ChestEntry objects.
+
+        The chunks can be passed to IDataStore.set_entries_from_chunks.
+
+        Args:
+            file_path: Path to the file
+            chunk_size: Maximum number of entries per chunk
+
+        Returns:
+            Iterator of dicts mapping "chest_type", "player" and "source" to lists of values
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is not supported
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            self.logger.error("File not found: %s", file_path)
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        extension = file_path.suffix.lower()
+        if extension != ".txt":
+            self.logger.error("Unsupported file format for streaming: %s", extension)
+            raise ValueError(f"Unsupported file format: {extension}. Supported formats: .txt")
+
+        return iter_entry_chunks(file_path, chunk_size, self._encodings)
+
     def parse_correction_file(self, file_path: Union[str, Path]) -> List[CorrectionRule]:
         """
         Parse a file containing correction rules.
@@ -103,16 +155,34 @@ class FileParser:
         Returns:
             List of parsed correction rules
 
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file format is not supported
+        """
+        return rules_from_frame(self.parse_correction_frame(file_path))
+
+    def parse_correction_frame(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Parse a file containing correction rules into a DataFrame, without creating rule objects.
+
+        The result can be passed to IDataStore.set_correction_rules.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            DataFrame with from_text, to_text, category and enabled columns
+
         Raises:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file format is not supported
         """
         file_path = Path(file_path)
-        self.logger.info(f"Parsing correction file: {file_path}")
+        self.logger.info("Parsing correction file: %s", file_path)
 
         # Check if file exists
         if not file_path.exists():
-            self.logger.error(f"File not found: {file_path}")
+            self.logger.error("File not found: %s", file_path)
             raise FileNotFoundError(f"File not found: {file_path}")
 
         # Get file extension
@@ -120,18 +190,18 @@ class FileParser:
 
         # Check if format is supported
         if extension not in self._correction_formats:
-            self.logger.error(f"Unsupported file format: {extension}")
+            self.logger.error("Unsupported file format: %s", extension)
             raise ValueError(
                 f"Unsupported file format: {extension}. Supported formats: {', '.join(self._correction_formats.keys())}"
             )
 
         # Parse the file using the appropriate parser
         try:
-            rules = self._correction_formats[extension](file_path)
-            self.logger.info(f"Successfully parsed {len(rules)} rules from {file_path}")
-            return rules
+            rules_df = self._correction_formats[extension](file_path)
+            self.logger.info("Successfully parsed %s rules from %s", len(rules_df), file_path)
+            return rules_df
         except Exception as e:
-            self.logger.error(f"Error parsing correction file {file_path}: {str(e)}")
+            self.logger.error("Error parsing correction file %s: %s", file_path, e)
             self.logger.error(traceback.format_exc())
             raise
 
@@ -157,6 +227,9 @@ class FileParser:
         """
         Save chest entries to a file.
 
+        The format is taken from the extension: text (.txt), CSV (.csv) or
+        compressed Parquet (.parquet). The file is replaced atomically.
+
         Args:
             entries: List of chest entries
             file_path: Path to save the file
@@ -165,25 +238,26 @@ class FileParser:
             ValueError: If the file format is not supported
         """
         file_path = Path(file_path)
-        self.logger.info(f"Saving {len(entries)} entries to {file_path}")
+        self.logger.info("Saving %s entries to %s", len(entries), file_path)
 
         # Get file extension
         extension = file_path.suffix.lower()
 
         # Check if format is supported
-        if extension not in self._entry_formats:
-            self.logger.error(f"Unsupported file format: {extension}")
+        if extension not in EXPORT_FORMATS:
+            self.logger.error("Unsupported file format: %s", extension)
             raise ValueError(
-                f"Unsupported file format: {extension}. Supported formats: {', '.join(self._entry_formats.keys())}"
+                f"Unsupported file format: {extension}. Supported formats: {', '.join(EXPORT_FORMATS)}"
             )
 
-        # Save to text file
         try:
             if extension == ".txt":
                 self._save_entries_to_text(entries, file_path)
-                self.logger.info(f"Successfully saved entries to {file_path}")
+            else:
+                write_entries(entries_to_frame(entries), file_path)
+            self.logger.info("Successfully saved entries to %s", file_path)
         except Exception as e:
-            self.logger.error(f"Error saving entries to {file_path}: {str(e)}")
+            self.logger.error("Error saving entries to %s: %s", file_path, e)
             self.logger.error(traceback.format_exc())
             raise
 
@@ -199,14 +273,14 @@ class FileParser:
             ValueError: If the file format is not supported
         """
         file_path = Path(file_path)
-        self.logger.info(f"Saving {len(rules)} rules to {file_path}")
+        self.logger.info("Saving %s rules to %s", len(rules), file_path)
 
         # Get file extension
         extension = file_path.suffix.lower()
 
         # Check if format is supported
         if extension not in self._correction_formats:
-            self.logger.error(f"Unsupported file format: {extension}")
+            self.logger.error("Unsupported file format: %s", extension)
             raise ValueError(
                 f"Unsupported file format: {extension}. Supported formats: {', '.join(self._correction_formats.keys())}"
             )
@@ -215,9 +289,9 @@ class FileParser:
         try:
             if extension == ".csv":
                 self._save_rules_to_csv(rules, file_path)
-                self.logger.info(f"Successfully saved rules to {file_path}")
+                self.logger.info("Successfully saved rules to %s", file_path)
         except Exception as e:
-            self.logger.error(f"Error saving rules to {file_path}: {str(e)}")
+            self.logger.error("Error saving rules to %s: %s", file_path, e)
             self.logger.error(traceback.format_exc())
             raise
 
@@ -246,6 +320,9 @@ class FileParser:
         """
         Parse a text file containing chest entries.
 
+        Uses the canonical loader in src.services.entry_reader; the file is
+        streamed once and the encoding is detected while decoding.
+
         Args:
             file_path: Path to the text file
 
@@ -255,26 +332,7 @@ class FileParser:
         Raises:
             ValueError: If the file encoding is not supported
         """
-        # Try different encodings
-        for encoding in self._encodings:
-            try:
-                self.logger.info(f"Attempting to parse text file with encoding: {encoding}")
-                with open(file_path, "r", encoding=encoding) as f:
-                    text = f.read()
-                entries = self._parse_text_content(text)
-                self.logger.info(f"Successfully parsed text file with encoding: {encoding}")
-                return entries
-            except UnicodeDecodeError:
-                self.logger.warning(f"Failed to decode with {encoding} encoding, trying next...")
-                continue
-            except Exception as e:
-                self.logger.error(f"Error parsing text file with {encoding} encoding: {str(e)}")
-                self.logger.error(traceback.format_exc())
-                raise
-
-        error_msg = f"Could not decode file with any of the supported encodings: {', '.join(self._encodings)}"
-        self.logger.error(error_msg)
-        raise ValueError(error_msg)
+        return load_entries(file_path, ChestEntrySink(), encodings=self._encodings)
 
     def _parse_text_content(self, text: str) -> List[ChestEntry]:
         """
@@ -287,78 +345,14 @@ class FileParser:
             List of parsed chest entries
         """
         lines = text.splitlines()
-        entries = []
-        current_id = 1  # Counter for entry IDs
-        self.logger.info(f"Parsing text content with {len(lines)} lines")
-
-        # Group lines into 3-line entries
-        i = 0
-        while i < len(lines):
-            # Skip empty lines
-            if not lines[i].strip():
-                i += 1
-                continue
-
-            # We need to detect a potential chest entry
-            # A chest entry starts with a line that doesn't have "From:" or "Source:" prefix
-            current_line = lines[i].strip()
-
-            # If the line starts with "From:" or "Source:", it's probably not a chest type
-            if current_line.lower().startswith("from:") or current_line.lower().startswith(
-                "source:"
-            ):
-                self.logger.debug(f"Skipping line {i + 1} - not a chest type: {current_line}")
-                i += 1
-                continue
-
-            # Ensure we have at least 2 more lines
-            if i + 2 >= len(lines):
-                self.logger.warning(
-                    f"Not enough lines remaining for a complete entry at line {i + 1}"
-                )
-                break
-
-            # Extract the 3 lines
-            chest_type = current_line
-            player_line = lines[i + 1].strip()
-            source_line = lines[i + 2].strip()
-
-            # Verify this is likely a valid entry (player line should start with "From:")
-            if not player_line.lower().startswith("from:"):
-                # This might not be a valid entry, try to recover or skip
-                self.logger.warning(
-                    f"Invalid entry format at line {i + 1} - player line doesn't start with 'From:'"
-                )
-                i += 1
-                continue
-
-            # Create a ChestEntry
-            try:
-                entry_text = f"{chest_type}\n{player_line}\n{source_line}"
-                # Only log occasionally (first entry, every 100th entry)
-                if current_id == 1 or current_id % 100 == 0:
-                    self.logger.debug(f"Creating entry #{current_id} from text: {entry_text}")
-
-                # IDs are now auto-generated in the ChestEntry class
-                entry = ChestEntry.from_text(entry_text)
-                entries.append(entry)
-
-                # Only log occasionally (first entry, every 100th entry)
-                if current_id == 1 or current_id % 100 == 0:
-                    self.logger.debug(
-                        f"Created entry #{current_id}: {entry.chest_type}, {entry.player}, {entry.source}"
-                    )
-
-                current_id += 1
-            except ValueError as e:
-                # Log the error or handle malformed entries
-                self.logger.error(f"Error parsing entry at line {i + 1}: {e}")
-                self.logger.error(f"Entry text: {chest_type}\n{player_line}\n{source_line}")
-
-            # Move to the next entry (skip 3 lines)
-            i += 3
-
-        self.logger.info(f"Parsed {len(entries)} entries from text content")
+        self.logger.info("Parsing text content with %s lines", len(lines))
+
+        sink = ChestEntrySink()
+        for chunk in parse_entry_lines(lines):
+            sink.add_chunk(chunk)
+        entries = sink.result()
+
+        self.logger.info("Parsed %s entries from text content", len(entries))
         return entries
 
     def _save_entries_to_text(self, entries: List[ChestEntry], file_path: Path) -> None:
@@ -369,19 +363,12 @@ class FileParser:
             entries: List of chest entries
             file_path: Path to save the file
         """
-        self.logger.info(f"Saving {len(entries)} entries to text file: {file_path}")
+        self.logger.info("Saving %s entries to text file: %s", len(entries), file_path)
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                for i, entry in enumerate(entries):
-                    # Add a blank line between entries (except for the first one)
-                    if i > 0:
-                        f.write("\n")
-
-                    # Write the entry as text
-                    f.write(entry.to_text())
-            self.logger.info(f"Successfully saved {len(entries)} entries to {file_path}")
+            write_entries_text(entries_to_frame(entries), file_path)
+            self.logger.info("Successfully saved %s entries to %s", len(entries), file_path)
         except Exception as e:
-            self.logger.error(f"Error saving entries to text file: {e}")
+            self.logger.error("Error saving entries to text file: %s", e)
             self.logger.error(traceback.format_exc())
             raise
 
@@ -398,155 +385,34 @@ class FileParser:
         Raises:
             ValueError: If the CSV file is missing required headers or cannot be parsed
         """
-        rules = []
-        self.logger.info(f"Parsing CSV file: {file_path}")
+        return rules_from_frame(self._read_csv_rules_frame(file_path))
 
-        # Check if file is empty
-        if file_path.stat().st_size == 0:
-            self.logger.warning(f"CSV file is empty: {file_path}")
-            return []
+    def _read_csv_rules_frame(self, file_path: Path) -> pd.DataFrame:
+        """
+        Read a CSV file containing correction rules into a rules DataFrame.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            DataFrame with from_text, to_text, category and enabled columns
+
+        Raises:
+            ValueError: If the CSV file is missing required headers or cannot be parsed
+        """
+        self.logger.info("Parsing CSV file: %s", file_path)
+        try:
+            rules_df = read_rules_frame(file_path, self._encodings)
+        except ValueError as e:
+            self.logger.error("Error reading CSV file %s: %s", file_path, e)
+            raise
+        except Exception as e:
+            self.logger.error("Error reading CSV file %s: %s", file_path, e)
+            self.logger.error(traceback.format_exc())
+            raise ValueError(f"Could not parse CSV file {file_path}: {e}") from e
 
-        # Define possible delimiters to try
-        delimiters = [";", ",", "\t"]
-
-        # Try different encodings
-        for encoding in self._encodings:
-            try:
-                self.logger.info(f"Attempting to parse CSV with encoding: {encoding}")
-
-                # First, try to read the file to detect the delimiter
-                with open(file_path, "r", encoding=encoding, newline="") as f:
-                    # Read the first line to detect the delimiter
-                    first_line = f.readline().strip()
-
-                    # If file is empty or first line is empty, skip
-                    if not first_line:
-                        self.logger.warning(
-                            f"CSV file has no content or first line is empty: {file_path}"
-                        )
-                        continue
-
-                    # Try each delimiter and use the one that results in the most columns
-                    best_delimiter = None
-                    most_columns = 0
-
-                    for delimiter in delimiters:
-                        column_count = first_line.count(delimiter) + 1
-                        self.logger.debug(f"Delimiter '{delimiter}' gives {column_count} columns")
-                        if column_count > most_columns:
-                            most_columns = column_count
-                            best_delimiter = delimiter
-
-                    # If we couldn't determine a delimiter, default to comma
-                    if not best_delimiter or most_columns < 2:
-                        self.logger.warning(f"Could not determine delimiter, defaulting to comma")
-                        best_delimiter = ","
-
-                    self.logger.info(
-                        f"Using delimiter: '{best_delimiter}' with {most_columns} columns"
-                    )
-
-                # Now read the file with the detected delimiter
-                with open(file_path, "r", encoding=encoding, newline="") as f:
-                    # Try to read the CSV with the best delimiter
-                    reader = csv.DictReader(f, delimiter=best_delimiter)
-
-                    # Check if reader.fieldnames is None (empty file or no headers)
-                    if not reader.fieldnames:
-                        self.logger.warning(f"CSV file has no headers: {file_path}")
-                        continue
-
-                    self.logger.info(f"CSV headers: {reader.fieldnames}")
-
-                    # Convert fieldnames to lowercase for case-insensitive comparison
-                    lowercase_fieldnames = [
-                        field.lower() if field else "" for field in (reader.fieldnames or [])
-                    ]
-
-                    # Standard header mapping (case-insensitive)
-                    header_map = {
-                        "from": "From",
-                        "to": "To",
-                        "category": "Category",
-                        "enabled": "Enabled",
-                    }
-
-                    # Check if required headers are present (case-insensitive)
-                    if "from" in lowercase_fieldnames and "to" in lowercase_fieldnames:
-                        self.logger.info("Found required headers (case-insensitive)")
-
-                        # Parse rules with lowercase header mapping
-                        for row_num, row in enumerate(
-                            reader, start=2
-                        ):  # Start at 2 to account for header row
-                            try:
-                                # Skip empty rows
-                                if not any(row.values()):
-                                    self.logger.debug(f"Skipping empty row {row_num}")
-                                    continue
-
-                                # Map headers to standard case
-                                mapped_row = {
-                                    header_map.get(key.lower(), key): value
-                                    for key, value in row.items()
-                                }
-
-                                # Log the row for debugging
-                                self.logger.debug(f"Processing row {row_num}: {mapped_row}")
-
-                                # Skip rows where From or To is empty
-                                if not mapped_row.get("From") or not mapped_row.get("To"):
-                                    self.logger.warning(
-                                        f"Skipping row {row_num} - missing From or To value: {mapped_row}"
-                                    )
-                                    continue
-
-                                # Create rule
-                                try:
-                                    rule = CorrectionRule.from_csv_row(mapped_row)
-                                    rules.append(rule)
-                                    self.logger.debug(
-                                        f"Created rule: {rule.from_text} -> {rule.to_text} (category: {rule.category})"
-                                    )
-                                except Exception as rule_error:
-                                    self.logger.error(
-                                        f"Error creating rule from row {row_num}: {rule_error}"
-                                    )
-                                    self.logger.error(f"Row data: {mapped_row}")
-                                    # Continue processing other rows
-                            except Exception as row_error:
-                                self.logger.error(f"Error processing row {row_num}: {row_error}")
-                                self.logger.error(traceback.format_exc())
-                                # Continue with next row
-                                continue
-
-                        # If we got here, we successfully read the file
-                        self.logger.info(f"Successfully parsed {len(rules)} rules from CSV")
-                        return rules
-                    else:
-                        # Log the missing headers
-                        required_headers = set(["From", "To"])
-                        found_headers = set(
-                            [header_map.get(h.lower(), h) for h in lowercase_fieldnames if h]
-                        )
-                        missing = required_headers - found_headers
-                        error_msg = f"CSV file is missing required headers: {', '.join(missing)}"
-                        self.logger.error(error_msg)
-                        self.logger.error(f"Found headers: {found_headers}")
-                        raise ValueError(error_msg)
-
-            except UnicodeDecodeError:
-                self.logger.warning(f"Failed to decode with {encoding} encoding, trying next...")
-                continue
-            except Exception as e:
-                self.logger.error(f"Error reading CSV with {encoding} encoding: {str(e)}")
-                self.logger.error(traceback.format_exc())
-                continue
-
-        # If we got here, we couldn't decode the file with any encoding
-        error_msg = f"Could not decode file with any of the supported encodings: {', '.join(self._encodings)}"
-        self.logger.error(error_msg)
-        raise ValueError(error_msg)
+        self.logger.info("Successfully parsed %s rules from CSV", len(rules_df))
+        return rules_df
 
     def _save_rules_to_csv(self, rules: List[CorrectionRule], file_path: Path) -> None:
         """
@@ -556,7 +422,7 @@ class FileParser:
             rules: List of correction rules
             file_path: Path to save the file
         """
-        self.logger.info(f"Saving {len(rules)} rules to CSV file: {file_path}")
+        self.logger.info("Saving %s rules to CSV file: %s", len(rules), file_path)
 
         try:
             # Determine the appropriate delimiter based on file extension or name
@@ -568,7 +434,7 @@ class FileParser:
             elif ";" in file_str:  # If the filename contains a semicolon, use semicolon
                 delimiter = ";"
 
-            self.logger.info(f"Using delimiter: '{delimiter}' for file: {file_path}")
+            self.logger.info("Using delimiter: '%s' for file: %s", delimiter, file_path)
 
             with open(file_path, "w", encoding="utf-8", newline="") as f:
                 # Create a CSV writer with the required headers
@@ -581,15 +447,17 @@ class FileParser:
                 self.logger.debug("Wrote CSV header row")
 
                 # Write each rule as a row
+                sampler = LogSampler(self.logger, "Wrote rule")
                 for rule in rules:
                     # Convert rule to a row dictionary using the to_csv_row method
                     row = rule.to_csv_row()
                     writer.writerow(row)
-                    self.logger.debug(f"Wrote rule: {rule.from_text} -> {rule.to_text}")
+                    sampler.log("Wrote rule: %s -> %s", rule.from_text, rule.to_text)
+                sampler.flush()
 
-                self.logger.info(f"Successfully saved {len(rules)} rules to CSV")
+                self.logger.info("Successfully saved %d rules to CSV", len(rules))
         except Exception as e:
-            self.logger.error(f"Error saving rules to CSV: {str(e)}")
+            self.logger.error("Error saving rules to CSV: %s", e)
             self.logger.error(traceback.format_exc())
             raise
 
@@ -605,48 +473,54 @@ class FileParser:
             List of parsed chest entries
         """
         logger = logging.getLogger(__name__)
-        logger.info(f"DEBUG: Starting entry file parsing with detailed logging: {file_path}")
+        logger.info("DEBUG: Starting entry file parsing with detailed logging: %s", file_path)
 
         try:
             # Check if file exists
             file_path_obj = Path(file_path)
             if not file_path_obj.exists():
-                logger.error(f"DEBUG: File not found: {file_path}")
+                logger.error("DEBUG: File not found: %s", file_path)
                 return []
 
             # Get file info
             file_size = file_path_obj.stat().st_size
-            logger.info(f"DEBUG: File size: {file_size} bytes")
+            logger.info("DEBUG: File size: %s bytes", file_size)
 
             # Parse the file
             entries = self.parse_entry_file(file_path)
 
             # Log details about entries
-            logger.info(f"DEBUG: Successfully parsed {len(entries)} entries")
+            logger.info("DEBUG: Successfully parsed %s entries", len(entries))
             if entries:
                 # Log the first entry as an example
                 first_entry = entries[0]
                 logger.info(
-                    f"DEBUG: First entry: {first_entry.chest_type} | {first_entry.player} | {first_entry.source}"
+                    "DEBUG: First entry: %s | %s | %s",
+                    first_entry.chest_type,
+                    first_entry.player,
+                    first_entry.source,
                 )
 
                 # Log the last entry as an example
                 last_entry = entries[-1]
                 logger.info(
-                    f"DEBUG: Last entry: {last_entry.chest_type} | {last_entry.player} | {last_entry.source}"
+                    "DEBUG: Last entry: %s | %s | %s",
+                    last_entry.chest_type,
+                    last_entry.player,
+                    last_entry.source,
                 )
 
                 # Check if entries have ID values
                 has_ids = all(entry.id is not None for entry in entries)
-                logger.info(f"DEBUG: All entries have IDs: {has_ids}")
+                logger.info("DEBUG: All entries have IDs: %s", has_ids)
 
             return entries
 
         except Exception as e:
-            logger.error(f"DEBUG: Error in parse_entry_file_debug: {str(e)}")
+            logger.error("DEBUG: Error in parse_entry_file_debug: %s", e)
             import traceback
 
-            logger.error(f"DEBUG: Traceback: {traceback.format_exc()}")
+            logger.error("DEBUG: Traceback: %s", traceback.format_exc())
             return []
 
 
@@ -7,18 +7,36 @@ Usage:
     from src.interfaces.i_file_service import IFileService
     file_service = service_factory.get_service(IFileService)
     file_service.load_entries(Path('path/to/file.txt'))
+    file_service.load_entry_files("data/input/chests_2025-03-*.txt")
+
+    # Read rules and validation lists in the background, publish them later
+    warm_up = file_service.start_warm_up({"correction_rules": rules_path, "player": players_path})
+    warm_up.wait()
 """
 
 import csv
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Set, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 import re
 import pandas as pd
 
 from src.interfaces.i_file_service import IFileService
 from src.interfaces.i_data_store import IDataStore
 from src.interfaces.events import EventType, EventHandler, EventData
+from src.services.bulk_import import (
+    FileImportResult,
+    PathSpec,
+    ProgressCallback,
+    import_entry_files,
+)
+from src.services.entry_reader import DataFrameSink, load_entries
+from src.services.entry_writer import write_entries
+from src.services.rule_reader import read_rules_frame
+from src.services.session_cache import VALIDATION_LIST_TYPES
+from src.services.warm_up import WarmUp
+from src.utils.startup_profiler import profile_phase
 
 
 class FileService(IFileService):
@@ -35,6 +53,8 @@ class FileService(IFileService):
     Implementation Notes:
         - Loads files directly into DataStore
         - Provides robust error handling for file operations
+        - start_warm_up reads rules and validation lists on a thread pool;
+          loading a source the warm-up is still reading waits for that read
     """
 
     def __init__(self, data_store: IDataStore):
@@ -49,108 +69,293 @@ class FileService(IFileService):
 
         # Setup logging
         self._logger = logging.getLogger(__name__)
+
+        # Background reads of startup data, and the resolved path per source
+        self._warm_up: Optional[WarmUp] = None
+        self._warm_up_paths: Dict[str, str] = {}
+
+        # Inputs whose content is already in the store from a restored session or the warm-up:
+        # source name -> (resolved path, mtime_ns, size)
+        self._restored_sources: Dict[str, Tuple[str, int, int]] = {}
+        self._tracking_restored = False
+
         self._logger.info("FileService initialized")
 
+    def set_restored_sources(self, sources: Mapping[str, Optional[Union[str, Path]]]) -> None:
+        """
+        Record the inputs whose content the store already holds from a session cache.
+
+        Until the store data of a source changes, loading the same unchanged
+        file again is skipped. Source names are "entries", "correction_rules"
+        and the validation list types.
+
+        Args:
+            sources: Mapping of source name to input file
+        """
+        self._restored_sources = {}
+        for name, path in sources.items():
+            if path and Path(path).is_file():
+                self._remember_source(name, self._source_signature(Path(path)))
+
+    @staticmethod
+    def _source_signature(file_path: Path) -> Tuple[str, int, int]:
+        """
+        Get the resolved path, mtime and size of an input file.
+
+        Args:
+            file_path: Input file
+
+        Returns:
+            Tuple[str, int, int]: (resolved path, mtime_ns, size)
+        """
+        stat = file_path.stat()
+        return str(file_path.resolve()), stat.st_mtime_ns, stat.st_size
+
+    def _remember_source(self, name: str, signature: Tuple[str, int, int]) -> None:
+        """
+        Record an input whose content the store holds, so loading it again is skipped.
+
+        Args:
+            name: Source name
+            signature: Signature of the file when it was read
+        """
+        self._restored_sources[name] = signature
+
+        if not self._tracking_restored:
+            self._tracking_restored = True
+            self._store.subscribe(
+                EventType.ENTRIES_UPDATED, lambda data: self._forget_restored(["entries"])
+            )
+            self._store.subscribe(
+                EventType.CORRECTION_RULES_UPDATED,
+                lambda data: self._forget_restored(["correction_rules"]),
+            )
+            self._store.subscribe(
+                EventType.VALIDATION_LISTS_UPDATED, self._on_validation_lists_updated
+            )
+
+    def _on_validation_lists_updated(self, data: EventData) -> None:
+        """
+        Forget restored validation lists that changed.
+
+        Args:
+            data: Event data, either {list_type: df} or {"list_type": list_type, ...}
+        """
+        data = data or {}
+        if "list_type" in data:
+            self._forget_restored([data["list_type"]])
+        else:
+            self._forget_restored(list(data))
+
+    def _forget_restored(self, names: List[str]) -> None:
+        """
+        Stop skipping loads for sources whose store data changed.
+
+        Args:
+            names: Source names
+        """
+        for name in names:
+            self._restored_sources.pop(name, None)
+
+    def _is_restored(self, name: str, file_path: Path) -> bool:
+        """
+        Check whether a file's content is already in the store and unchanged.
+
+        Args:
+            name: Source name
+            file_path: File about to be loaded
+
+        Returns:
+            bool: True if the load can be skipped
+        """
+        restored = self._restored_sources.get(name)
+        if restored is None:
+            return False
+        if restored != self._source_signature(file_path):
+            return False
+        self._logger.info(f"Skipping load of {file_path}, its content is already in the store")
+        return True
+
+    def start_warm_up(
+        self,
+        sources: Mapping[str, Optional[Union[str, Path]]],
+        max_workers: Optional[int] = None,
+    ) -> WarmUp:
+        """
+        Start reading correction rules and validation lists on a thread pool.
+
+        The results are stored when the returned WarmUp is asked to publish
+        them. Sources without a file, sources restored from the session
+        cache and unknown source names are skipped.
+
+        Args:
+            sources: Mapping of "correction_rules" or a validation list type to its file
+            max_workers: Reader threads (default: one per file, at most 4)
+
+        Returns:
+            WarmUp: The started warm-up
+        """
+        tasks = {}
+        self._warm_up_paths = {}
+        for name, path in sources.items():
+            if name == "correction_rules":
+                reader = read_rules_frame
+            elif name in VALIDATION_LIST_TYPES:
+                reader = self.read_validation_list
+            else:
+                continue
+            if not path or not Path(path).is_file() or self._is_restored(name, Path(path)):
+                continue
+            tasks[name] = partial(self._read_source, reader, Path(path))
+            self._warm_up_paths[name] = str(Path(path).resolve())
+
+        self._warm_up = WarmUp(tasks, self._publish_source, max_workers)
+        self._warm_up.start()
+        self._logger.info(f"Warming up {', '.join(tasks) or 'nothing'}")
+        return self._warm_up
+
+    def _read_source(
+        self, reader: Callable[[Path], pd.DataFrame], file_path: Path
+    ) -> Tuple[Tuple[str, int, int], pd.DataFrame]:
+        """
+        Read a warm-up source on a worker thread.
+
+        Args:
+            reader: Function reading the file into a DataFrame
+            file_path: Input file
+
+        Returns:
+            Tuple: (signature of the file before reading, DataFrame)
+        """
+        with profile_phase("warm_up_read", file=file_path.name):
+            signature = self._source_signature(file_path)
+            return signature, reader(file_path)
+
+    def _publish_source(self, name: str, result: Tuple[Tuple[str, int, int], pd.DataFrame]) -> bool:
+        """
+        Store a warm-up result.
+
+        Args:
+            name: "correction_rules" or a validation list type
+            result: Result of _read_source
+
+        Returns:
+            bool: True if the data was stored
+        """
+        signature, data_df = result
+        with profile_phase("warm_up_publish", source=name):
+            if name == "correction_rules":
+                stored = self._store.set_correction_rules(data_df)
+            else:
+                stored = self._store.set_validation_list(name, data_df)
+        if stored is False:
+            return False
+
+        # Remember the file after the store event, so loading it again is skipped
+        self._remember_source(name, signature)
+        self._logger.info(f"Loaded {len(data_df)} rows for {name} from {signature[0]}")
+        return True
+
+    def _is_warming_up(self, name: str, file_path: Path) -> bool:
+        """
+        Check whether the warm-up is still reading this file for a source.
+
+        Loading another file for the source cancels its warm-up instead.
+
+        Args:
+            name: Source name
+            file_path: File about to be loaded
+
+        Returns:
+            bool: True if the load should wait for the warm-up
+        """
+        if self._warm_up is None or not self._warm_up.is_pending(name):
+            return False
+        if self._warm_up_paths.get(name) != str(file_path.resolve()):
+            self._warm_up.cancel(name)
+            return False
+        return True
+
     def load_entries(self, file_path: Path) -> bool:
         """
         Load entries from a file.
 
+        Uses the canonical loader in src.services.entry_reader, so the
+        grammar and entry IDs match FileParser.parse_entry_file.
+
         Args:
             file_path: Path to the file
 
         Returns:
             bool: True if successful, False otherwise
         """
+        file_path = Path(file_path)
         if not file_path.exists():
             self._logger.error(f"File not found: {file_path}")
             return False
+        if self._is_restored("entries", file_path):
+            return True
 
         try:
-            entries_data = []
-            current_entry = None
-
-            # Read file and parse entries
-            with open(file_path, "r", encoding="utf-8") as file:
-                line_count = 0
-                for line in file:
-                    line = line.strip()
-                    line_count += 1
-
-                    # Skip empty lines
-                    if not line:
-                        continue
-
-                    # First line of entry is the chest type
-                    if current_entry is None:
-                        current_entry = {"chest_type": line}
-
-                    # Second line is the player (prefixed with "From: ")
-                    elif "player" not in current_entry:
-                        # Extract player name from "From: Player" format
-                        if line.startswith("From:"):
-                            player = line[5:].strip()
-                            current_entry["player"] = player
-                        else:
-                            # Handle case where "From:" prefix is missing
-                            current_entry["player"] = line
-
-                    # Third line is the source (prefixed with "Source: ")
-                    elif "source" not in current_entry:
-                        # Extract source from "Source: Location" format
-                        if line.startswith("Source:"):
-                            source = line[7:].strip()
-                            current_entry["source"] = source
-                        else:
-                            # Handle case where "Source:" prefix is missing
-                            current_entry["source"] = line
-
-                        # Complete entry, add to list and reset
-                        entries_data.append(current_entry)
-                        current_entry = None
-
-            # Convert to DataFrame
-            if entries_data:
-                entries_df = pd.DataFrame(entries_data)
-
-                # Add status column
-                entries_df["status"] = "Pending"
-
-                # Add empty columns for validation data
-                entries_df["validation_errors"] = [[] for _ in range(len(entries_df))]
-                entries_df["original_values"] = [{} for _ in range(len(entries_df))]
-
-                # Generate IDs
-                entries_df["id"] = entries_df.apply(
-                    lambda row: abs(hash((row["chest_type"], row["player"], row["source"])))
-                    % (10**8),
-                    axis=1,
-                )
-
-                # Set index
-                entries_df.set_index("id", inplace=True)
-
-                # Add timestamp
-                import datetime
-
-                entries_df["modified_at"] = pd.Timestamp(datetime.datetime.now())
-
-                # Store in DataStore
-                self._store.set_entries(entries_df)
-
-                self._logger.info(f"Loaded {len(entries_df)} entries from {file_path}")
-                return True
-            else:
+            entries_df = load_entries(file_path, DataFrameSink())
+
+            if entries_df.empty:
                 self._logger.warning(f"No entries found in {file_path}")
                 return False
 
+            # Store in DataStore
+            self._store.set_entries(entries_df, source=str(file_path))
+
+            self._logger.info(f"Loaded {len(entries_df)} entries from {file_path}")
+            return True
+
         except Exception as e:
             self._logger.error(f"Error loading entries from {file_path}: {e}")
             return False
 
+    def load_entry_files(
+        self,
+        paths: PathSpec,
+        max_workers: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> List[FileImportResult]:
+        """
+        Load entries from many files at once.
+
+        Files are parsed in parallel, each row is tagged with the date from its
+        file name, and the merged entries replace the store's entries in a
+        single set_entries call.
+
+        Args:
+            paths: Files, directories or glob patterns, e.g. "data/input/chests_2025-03-*.txt"
+            max_workers: Number of worker processes (default: one per file, up to the CPU count)
+            progress: Called after each file with (result, files done, total files)
+
+        Returns:
+            List[FileImportResult]: One result per file (empty if nothing matched)
+        """
+        try:
+            entries_df, results = import_entry_files(paths, max_workers, progress)
+        except Exception as e:
+            self._logger.error(f"Error importing entry files: {e}")
+            return []
+
+        if entries_df.empty:
+            self._logger.warning(f"No entries found in {len(results)} files")
+            return results
+
+        self._store.set_entries(entries_df, source="bulk import")
+        self._logger.info(f"Loaded {len(entries_df)} entries from {len(results)} files")
+        return results
+
     def save_entries(self, file_path: Path) -> bool:
         """
         Save entries to a file.
 
+        Text files use the original chest export format with a blank line
+        after each entry; .csv and .parquet files get all entry columns.
+        The file is replaced atomically.
+
         Args:
             file_path: Path to the file
 
@@ -165,13 +370,7 @@ class FileService(IFileService):
                 self._logger.warning("No entries to save")
                 return False
 
-            # Convert to original format and write to file
-            with open(file_path, "w", encoding="utf-8") as file:
-                for _, row in entries_df.iterrows():
-                    file.write(f"{row['chest_type']}\n")
-                    file.write(f"From: {row['player']}\n")
-                    file.write(f"Source: {row['source']}\n")
-                    file.write("\n")  # Add blank line between entries
+            write_entries(entries_df, file_path, blank_lines=True)
 
             self._logger.info(f"Saved {len(entries_df)} entries to {file_path}")
             return True
@@ -180,6 +379,32 @@ class FileService(IFileService):
             self._logger.error(f"Error saving entries to {file_path}: {e}")
             return False
 
+    def export_entries_to_csv(
+        self, file_path: Union[str, Path], entries_df: Optional[pd.DataFrame] = None
+    ) -> bool:
+        """
+        Export entries to a CSV file.
+
+        Args:
+            file_path: Path to the file
+            entries_df: Entries to export (defaults to all entries in the DataStore)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            if entries_df is None:
+                entries_df = self._store.get_entries()
+
+            write_entries(entries_df, file_path, export_format="csv")
+
+            self._logger.info(f"Exported {len(entries_df)} entries to {file_path}")
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error exporting entries to {file_path}: {e}")
+            return False
+
     def load_validation_list(self, list_type: str, file_path: Path) -> bool:
         """
         Load a validation list from a file.
@@ -191,37 +416,20 @@ class FileService(IFileService):
         Returns:
             bool: True if successful, False otherwise
         """
+        file_path = Path(file_path)
         if not file_path.exists():
             self._logger.error(f"Validation list file not found: {file_path}")
             return False
+        if self._is_restored(list_type, file_path):
+            return True
+        if self._is_warming_up(list_type, file_path):
+            return self._warm_up.wait([list_type]).get(list_type, False)
 
         try:
-            # Determine file type and parse accordingly
-            if file_path.suffix.lower() == ".csv":
-                # Read CSV file
-                entries_df = pd.read_csv(file_path)
-
-                # Rename first column to 'entry' if not already named
-                if "entry" not in entries_df.columns and len(entries_df.columns) > 0:
-                    entries_df.rename(columns={entries_df.columns[0]: "entry"}, inplace=True)
-
-                # Set validation list
-                self._store.set_validation_list(list_type, entries_df)
-
-            else:
-                # Read text file - one entry per line
-                entries = []
-                with open(file_path, "r", encoding="utf-8") as file:
-                    for line in file:
-                        entry = line.strip()
-                        if entry:
-                            entries.append(entry)
-
-                # Create DataFrame
-                entries_df = pd.DataFrame({"entry": entries})
+            entries_df = self.read_validation_list(file_path)
 
-                # Set validation list
-                self._store.set_validation_list(list_type, entries_df)
+            # Set validation list
+            self._store.set_validation_list(list_type, entries_df)
 
             self._logger.info(
                 f"Loaded {len(entries_df)} entries for '{list_type}' validation list from {file_path}"
@@ -232,6 +440,39 @@ class FileService(IFileService):
             self._logger.error(f"Error loading validation list from {file_path}: {e}")
             return False
 
+    @staticmethod
+    def read_validation_list(file_path: Path) -> pd.DataFrame:
+        """
+        Read a validation list file without storing it.
+
+        Args:
+            file_path: Path to a CSV file (first column) or a text file (one entry per line)
+
+        Returns:
+            pd.DataFrame: Entries in an "entry" column
+        """
+        file_path = Path(file_path)
+
+        # Determine file type and parse accordingly
+        if file_path.suffix.lower() == ".csv":
+            # Read CSV file
+            entries_df = pd.read_csv(file_path)
+
+            # Rename first column to 'entry' if not already named
+            if "entry" not in entries_df.columns and len(entries_df.columns) > 0:
+                entries_df.rename(columns={entries_df.columns[0]: "entry"}, inplace=True)
+            return entries_df
+
+        # Read text file - one entry per line
+        entries = []
+        with open(file_path, "r", encoding="utf-8") as file:
+            for line in file:
+                entry = line.strip()
+                if entry:
+                    entries.append(entry)
+
+        return pd.DataFrame({"entry": entries})
+
     def save_validation_list(self, list_type: str, file_path: Path) -> bool:
         """
         Save a validation list to a file.
@@ -286,43 +527,14 @@ class FileService(IFileService):
         if not file_path.exists():
             self._logger.error(f"Correction rules file not found: {file_path}")
             return False
+        if self._is_restored("correction_rules", file_path):
+            return True
+        if self._is_warming_up("correction_rules", file_path):
+            return self._warm_up.wait(["correction_rules"]).get("correction_rules", False)
 
         try:
-            # Read CSV file
-            rules_df = pd.read_csv(file_path, sep=None, engine="python")
-
-            # Standardize column names (case-insensitive matching)
-            column_mapping = {}
-            for col in rules_df.columns:
-                if col.lower() in ["from", "field", "pattern"]:
-                    column_mapping[col] = "from_text"
-                elif col.lower() in ["to", "replacement"]:
-                    column_mapping[col] = "to_text"
-                elif col.lower() == "category":
-                    column_mapping[col] = "category"
-                elif col.lower() == "enabled":
-                    column_mapping[col] = "enabled"
-
-            # Rename columns if needed
-            if column_mapping:
-                rules_df = rules_df.rename(columns=column_mapping)
-
-            # Ensure required columns exist
-            required_columns = ["from_text", "to_text"]
-            missing_columns = [col for col in required_columns if col not in rules_df.columns]
-
-            if missing_columns:
-                self._logger.error(
-                    f"Missing required columns in correction rules file: {missing_columns}"
-                )
-                return False
-
-            # Add any missing columns with default values
-            if "category" not in rules_df.columns:
-                rules_df["category"] = "text"
-
-            if "enabled" not in rules_df.columns:
-                rules_df["enabled"] = True
+            # Read CSV file into a rules DataFrame (headers matched case-insensitively)
+            rules_df = read_rules_frame(file_path)
 
             # Store correction rules
             self._store.set_correction_rules(rules_df)
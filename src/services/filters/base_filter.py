@@ -6,13 +6,13 @@ Usage:
     from src.services.filters.base_filter import BaseFilter
 
     class MyFilter(BaseFilter):
-        def apply(self, df):
-            # Filter implementation
+        def mask(self, df):
+            # Boolean mask implementation
 """
 
 import logging
 from abc import abstractmethod
-from typing import Optional
+from typing import Hashable, Optional
 
 import pandas as pd
 
@@ -98,6 +98,31 @@ class BaseFilter(IFilter):
         pass
 
     @abstractmethod
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Compute the rows of a DataFrame that pass the filter.
+
+        Args:
+            df: DataFrame to evaluate
+
+        Returns:
+            Boolean Series aligned with df.index (all True if the filter is inactive)
+        """
+        pass
+
+    def get_state_key(self) -> Optional[Hashable]:
+        """
+        Get a hashable key describing the filter criteria.
+
+        FilterManager uses the key to reuse a cached mask while neither the
+        data nor the criteria have changed. Subclasses should return a tuple
+        of every setting that affects mask(); None disables caching.
+
+        Returns:
+            Hashable state key, or None if the mask must not be cached
+        """
+        return None
+
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply filter to a DataFrame and return filtered result.
@@ -108,7 +133,28 @@ class BaseFilter(IFilter):
         Returns:
             Filtered DataFrame
         """
-        pass
+        if not self.is_active():
+            return df
+
+        try:
+            result_df = df[self.mask(df)]
+            self._logger.debug(f"Filter applied: {len(result_df)} of {len(df)} rows remaining")
+            return result_df
+        except Exception as e:
+            self._logger.error(f"Error applying filter: {e}")
+            return df
+
+    def _all_rows(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Create a mask that keeps every row.
+
+        Args:
+            df: DataFrame the mask is for
+
+        Returns:
+            Boolean Series of True aligned with df.index
+        """
+        return pd.Series(True, index=df.index)
 
     @abstractmethod
     def clear(self) -> None:
@@ -11,13 +11,14 @@ Usage:
 """
 
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, date
 
 import pandas as pd
 
 from src.interfaces.i_config_manager import IConfigManager
 from src.services.filters.base_filter import BaseFilter
+from src.services.date_index import DateSearchIndex
 
 
 class DateFilter(BaseFilter):
@@ -31,6 +32,7 @@ class DateFilter(BaseFilter):
         _start_date (Optional[datetime]): Start date of the range (inclusive)
         _end_date (Optional[datetime]): End date of the range (inclusive)
         _date_format (str): Format string for parsing date strings
+        _date_index (Optional[DateSearchIndex]): Sorted index used when it covers the filtered data
     """
 
     def __init__(
@@ -50,8 +52,18 @@ class DateFilter(BaseFilter):
         self._start_date: Optional[datetime] = None
         self._end_date: Optional[datetime] = None
         self._date_format = date_format
+        self._date_index: Optional[DateSearchIndex] = None
         self._logger = logging.getLogger(f"filters.date.{filter_id}")
 
+    def set_date_index(self, date_index: Optional[DateSearchIndex]) -> None:
+        """
+        Attach a sorted date index, such as DataFrameStore.get_date_index().
+
+        Args:
+            date_index: Index to use, or None to always compare the column
+        """
+        self._date_index = date_index if isinstance(date_index, DateSearchIndex) else None
+
     def set_date_range(
         self, start_date: Optional[str] = None, end_date: Optional[str] = None
     ) -> None:
@@ -155,47 +167,109 @@ class DateFilter(BaseFilter):
             return None
         return dt.strftime(self._date_format)
 
-    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_state_key(self) -> Tuple[Any, ...]:
         """
-        Apply filter to a DataFrame and return filtered result.
+        Get a hashable key describing the date range.
+
+        Returns:
+            Tuple of all settings that affect the mask
+        """
+        return (self._enabled, self._column_name, self._start_date, self._end_date)
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Compute the rows of a DataFrame whose date lies in the range.
+
+        With a sorted date index covering df the range is found with two
+        binary searches; otherwise the column is compared directly.
 
         Args:
-            df: DataFrame to filter
+            df: DataFrame to evaluate
 
         Returns:
-            Filtered DataFrame
+            Boolean Series aligned with df.index
         """
         if not self.is_active() or self._column_name not in df.columns:
-            return df
+            return self._all_rows(df)
 
         try:
-            # Create a copy of the DataFrame
-            result_df = df.copy()
+            if self._date_index is not None and self._date_index.covers(df):
+                sorted_column = self._date_index.column(self._column_name)
+                if sorted_column is not None:
+                    return pd.Series(
+                        sorted_column.range_mask(self._start_date, self._end_date), index=df.index
+                    )
+
+            dates = df[self._column_name]
 
-            # Ensure the column is datetime
-            if not pd.api.types.is_datetime64_any_dtype(result_df[self._column_name]):
-                # Try to convert to datetime
+            # Columns are normalized at ingest; parse only data that bypassed the store
+            if not pd.api.types.is_datetime64_any_dtype(dates):
                 self._logger.debug(f"Converting column {self._column_name} to datetime")
                 try:
-                    result_df[self._column_name] = pd.to_datetime(result_df[self._column_name])
+                    dates = pd.to_datetime(dates)
                 except Exception as e:
                     self._logger.error(f"Error converting to datetime: {e}")
-                    return df
+                    return self._all_rows(df)
+
+            mask = pd.Series(True, index=df.index)
 
             # Apply start date filter if set
             if self._start_date is not None:
-                result_df = result_df[result_df[self._column_name] >= self._start_date]
+                mask &= dates >= self._start_date
 
             # Apply end date filter if set
             if self._end_date is not None:
-                result_df = result_df[result_df[self._column_name] <= self._end_date]
+                mask &= dates <= self._end_date
 
-            self._logger.debug(f"Filter applied: {len(result_df)} of {len(df)} rows remaining")
+            return mask
+        except Exception as e:
+            self._logger.error(f"Error computing filter mask: {e}")
+            return self._all_rows(df)
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply filter to a DataFrame and return filtered result.
 
-            return result_df
+        Returns a positional slice of df when the matching rows are contiguous,
+        and falls back to the mask otherwise.
+
+        Args:
+            df: DataFrame to filter
+
+        Returns:
+            Filtered DataFrame
+        """
+        try:
+            bounds = self.row_slice(df)
         except Exception as e:
-            self._logger.error(f"Error applying filter: {e}")
-            return df
+            self._logger.error(f"Error computing date slice: {e}")
+            bounds = None
+
+        if bounds is not None:
+            return df.iloc[bounds]
+        return super().apply(df)
+
+    def row_slice(self, df: pd.DataFrame) -> Optional[slice]:
+        """
+        Get the rows in the range as a positional slice, if they are contiguous.
+
+        This is the case when the sorted date index covers df and the rows
+        are in chronological order, e.g. daily imports appended in order.
+
+        Args:
+            df: DataFrame to evaluate
+
+        Returns:
+            Slice for df.iloc, or None if the rows are not known to be contiguous
+        """
+        if not self.is_active() or self._date_index is None or not self._date_index.covers(df):
+            return None
+
+        sorted_column = self._date_index.column(self._column_name)
+        if sorted_column is None or not sorted_column.is_monotonic:
+            return None
+
+        return sorted_column.range_bounds(self._start_date, self._end_date)
 
     def clear(self) -> None:
         """Clear the date range."""
@@ -7,31 +7,39 @@ Usage:
 
     manager = FilterManager()
     manager.register_filter("search", search_filter)
-    filtered_df = manager.apply_filters(df)
+    filtered_df = manager.apply_filters(df, data_version=store.get_entries_version())
 """
 
 import logging
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, Hashable, List, Set, Any, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.interfaces.i_config_manager import IConfigManager
 from src.services.filters.base_filter import BaseFilter
+from src.utils.metrics import instrumented, metrics, timed
 
 
+@instrumented
 class FilterManager:
     """
     Manager for filter implementations.
 
     Manages multiple filter implementations and applies them to a DataFrame.
+    Each active filter contributes a boolean mask; the masks are combined and
+    the DataFrame is indexed once.
 
     Attributes:
         _filters (Dict[str, BaseFilter]): Dictionary of registered filters
+        _mask_cache (Dict[str, Tuple[Tuple[Hashable, Hashable], pd.Series]]):
+            Last mask per filter, keyed by (data version, filter state key)
     """
 
     def __init__(self):
         """Initialize the filter manager."""
         self._filters: Dict[str, BaseFilter] = {}
+        self._mask_cache: Dict[str, Tuple[Tuple[Hashable, Hashable], pd.Series]] = {}
         self._logger = logging.getLogger("filters.manager")
 
     def register_filter(self, filter_id: str, filter_obj: BaseFilter) -> None:
@@ -46,6 +54,7 @@ class FilterManager:
             self._logger.warning(f"Filter with ID '{filter_id}' already registered, replacing")
 
         self._filters[filter_id] = filter_obj
+        self._mask_cache.pop(filter_id, None)
         self._logger.debug(f"Registered filter '{filter_id}'")
 
     def unregister_filter(self, filter_id: str) -> None:
@@ -57,6 +66,7 @@ class FilterManager:
         """
         if filter_id in self._filters:
             del self._filters[filter_id]
+            self._mask_cache.pop(filter_id, None)
             self._logger.debug(f"Unregistered filter '{filter_id}'")
         else:
             self._logger.warning(f"No filter with ID '{filter_id}' found to unregister")
@@ -73,14 +83,20 @@ class FilterManager:
         """
         return self._filters.get(filter_id)
 
-    def apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+    @timed()
+    def apply_filters(self, df: pd.DataFrame, data_version: Optional[int] = None) -> pd.DataFrame:
         """
         Apply all active filters to a DataFrame.
 
-        Filters are applied in the order they were registered.
+        The masks of all active filters are ANDed and the DataFrame is indexed
+        once. When a data version is given, each filter's mask is cached under
+        (data_version, filter state), so changing one filter only recomputes
+        that filter's mask.
 
         Args:
             df: DataFrame to filter
+            data_version: Version of the data in df (e.g. DataFrameStore.get_entries_version());
+                None disables mask caching
 
         Returns:
             Filtered DataFrame
@@ -88,28 +104,78 @@ class FilterManager:
         if df is None or df.empty:
             return df
 
-        result_df = df.copy()
-
+        combined_mask: Optional[np.ndarray] = None
         active_filters = 0
 
-        # Apply each filter in the order they were registered
         for filter_id, filter_obj in self._filters.items():
             if filter_obj.is_active():
                 active_filters += 1
                 try:
-                    result_df = filter_obj.apply(result_df)
-                    self._logger.debug(
-                        f"Applied filter '{filter_id}': {len(result_df)} of {len(df)} rows remaining"
+                    # Combine positionally; index alignment is unnecessary for same-shaped masks
+                    mask = self._get_mask(filter_id, filter_obj, df, data_version).to_numpy(
+                        dtype=bool
                     )
+                    combined_mask = mask if combined_mask is None else combined_mask & mask
                 except Exception as e:
                     self._logger.error(f"Error applying filter '{filter_id}': {e}")
 
+        if combined_mask is None:
+            result_df = df.copy()
+        else:
+            result_df = df[combined_mask]
+
         self._logger.info(
             f"Applied {active_filters} active filters: {len(result_df)} of {len(df)} rows remaining"
         )
 
         return result_df
 
+    def _get_mask(
+        self,
+        filter_id: str,
+        filter_obj: BaseFilter,
+        df: pd.DataFrame,
+        data_version: Optional[int],
+    ) -> pd.Series:
+        """
+        Get a filter's mask, reusing the cached one if data and state are unchanged.
+
+        Args:
+            filter_id: Identifier of the filter
+            filter_obj: Filter to evaluate
+            df: DataFrame to evaluate
+            data_version: Version of the data in df, or None to bypass the cache
+
+        Returns:
+            Boolean Series aligned with df.index
+        """
+        state_key = filter_obj.get_state_key() if hasattr(filter_obj, "get_state_key") else None
+        if data_version is None or state_key is None:
+            return filter_obj.mask(df)
+
+        cache_key = (data_version, state_key)
+        cached = self._mask_cache.get(filter_id)
+        if cached is not None and cached[0] == cache_key and len(cached[1]) == len(df):
+            self._logger.debug(f"Reusing cached mask for filter '{filter_id}'")
+            if metrics.enabled:
+                metrics.counter("FilterManager.mask_cache.hits").inc()
+            return cached[1]
+
+        if metrics.enabled:
+            metrics.counter("FilterManager.mask_cache.misses").inc()
+
+        mask = filter_obj.mask(df)
+        self._mask_cache[filter_id] = (cache_key, mask)
+        self._logger.debug(
+            f"Computed mask for filter '{filter_id}': {int(mask.sum())} of {len(df)} rows match"
+        )
+        return mask
+
+    def clear_mask_cache(self) -> None:
+        """Drop all cached filter masks."""
+        self._mask_cache.clear()
+        self._logger.debug("Mask cache cleared")
+
     def clear_all_filters(self) -> None:
         """Clear all filters in the manager."""
         for filter_id, filter_obj in self._filters.items():
@@ -151,9 +217,10 @@ class FilterManager:
             return
 
         try:
-            # Save each filter's state
-            for filter_id, filter_obj in self._filters.items():
-                filter_obj.save_state(config)
+            # Save each filter's state, written to disk once
+            with config.batch():
+                for filter_id, filter_obj in self._filters.items():
+                    filter_obj.save_state(config)
 
             self._logger.debug(f"Saved state for {len(self._filters)} filters")
         except Exception as e:
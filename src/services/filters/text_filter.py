@@ -12,12 +12,22 @@ Usage:
 
 import logging
 import re
-from typing import List, Set, Dict, Any, Optional
+import time
+from typing import List, Set, Dict, Any, Optional, Pattern, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.interfaces.i_config_manager import IConfigManager
 from src.services.filters.base_filter import BaseFilter
+from src.services.text_index import (
+    ColumnTextIndex,
+    SearchTimeoutError,
+    TextSearchIndex,
+    compile_pattern,
+    is_backtracking_prone,
+    search_values,
+)
 
 
 class TextFilter(BaseFilter):
@@ -32,8 +42,13 @@ class TextFilter(BaseFilter):
         _case_sensitive (bool): Whether search is case-sensitive
         _whole_word (bool): Whether to match whole words only
         _regex_enabled (bool): Whether to use regex for matching
+        _text_index (Optional[TextSearchIndex]): Index used when it covers the filtered data
+        _time_budget (float): Seconds a regex or whole-word search may take before it is aborted
+        _last_search_timed_out (bool): Whether the last search was aborted
     """
 
+    DEFAULT_TIME_BUDGET = 0.5
+
     def __init__(
         self,
         filter_id: str,
@@ -60,6 +75,9 @@ class TextFilter(BaseFilter):
         self._case_sensitive = case_sensitive
         self._whole_word = whole_word
         self._regex_enabled = regex_enabled
+        self._text_index: Optional[TextSearchIndex] = None
+        self._time_budget = self.DEFAULT_TIME_BUDGET
+        self._last_search_timed_out = False
         self._logger = logging.getLogger(f"filters.text.{filter_id}")
 
     @property
@@ -167,6 +185,47 @@ class TextFilter(BaseFilter):
         self._regex_enabled = value
         self._logger.debug(f"Regex enabled set to: {value}")
 
+    @property
+    def time_budget(self) -> float:
+        """
+        Get the time budget for regex and whole-word searches.
+
+        Returns:
+            Time budget in seconds
+        """
+        return self._time_budget
+
+    @time_budget.setter
+    def time_budget(self, value: float) -> None:
+        """
+        Set the time budget for regex and whole-word searches.
+
+        Args:
+            value: Time budget in seconds
+        """
+        self._time_budget = value
+
+    @property
+    def last_search_timed_out(self) -> bool:
+        """
+        Check whether the last search was aborted for exceeding its time budget.
+
+        Regexes rejected as prone to catastrophic backtracking count as timed out.
+
+        Returns:
+            True if the last search timed out, False otherwise
+        """
+        return self._last_search_timed_out
+
+    def set_text_index(self, text_index: Optional[TextSearchIndex]) -> None:
+        """
+        Attach a text index, such as DataFrameStore.get_text_index().
+
+        Args:
+            text_index: Index to use, or None to always scan
+        """
+        self._text_index = text_index if isinstance(text_index, TextSearchIndex) else None
+
     def set_search_text(self, text: str) -> None:
         """
         Set the search text.
@@ -192,95 +251,156 @@ class TextFilter(BaseFilter):
         self._search_text = ""
         self._logger.debug("Filter cleared")
 
-    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_state_key(self) -> Tuple[Any, ...]:
+        """
+        Get a hashable key describing the search criteria.
+
+        Returns:
+            Tuple of all settings that affect the mask
+        """
+        return (
+            self._enabled,
+            self._search_text,
+            tuple(self._target_columns),
+            self._case_sensitive,
+            self._whole_word,
+            self._regex_enabled,
+        )
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
         """
-        Apply filter to a DataFrame and return filtered result.
+        Compute the rows of a DataFrame that match the search text.
+
+        Uses the text index when one is attached and describes the rows of df;
+        otherwise scans the columns.
 
         Args:
-            df: DataFrame to filter
+            df: DataFrame to evaluate
 
         Returns:
-            Filtered DataFrame
+            Boolean Series aligned with df.index
         """
         if not self.is_active():
-            return df
+            return self._all_rows(df)
 
         try:
-            # Create a copy of the DataFrame
-            result_df = df.copy()
-
             # Determine which columns to search in
-            columns_to_search = self._target_columns if self._target_columns else result_df.columns
+            columns_to_search = self._target_columns if self._target_columns else df.columns
 
             # Ensure all specified columns exist in the DataFrame
-            columns_to_search = [col for col in columns_to_search if col in result_df.columns]
+            columns_to_search = [col for col in columns_to_search if col in df.columns]
 
             if not columns_to_search:
                 self._logger.warning("No valid columns to search in")
-                return df
+                return self._all_rows(df)
 
             # Prepare search pattern
-            search_text = self._search_text
-
-            if self._regex_enabled:
-                try:
-                    if not self._case_sensitive:
-                        pattern = re.compile(search_text, re.IGNORECASE)
-                    else:
-                        pattern = re.compile(search_text)
-                except re.error as e:
-                    self._logger.error(f"Invalid regex pattern: {e}")
-                    return df
-
-                # Create a mask for regex matching
-                mask = pd.Series(False, index=result_df.index)
-                for column in columns_to_search:
-                    if pd.api.types.is_string_dtype(result_df[column]):
-                        column_mask = result_df[column].str.contains(pattern, regex=True, na=False)
-                        mask = mask | column_mask
-
-            else:  # Plain text search
-                if self._whole_word:
-                    # For whole word search, need to use regex with word boundaries
-                    word_pattern = r"\b" + re.escape(search_text) + r"\b"
-                    if not self._case_sensitive:
-                        pattern = re.compile(word_pattern, re.IGNORECASE)
-                    else:
-                        pattern = re.compile(word_pattern)
-
-                    # Create a mask for whole word matching
-                    mask = pd.Series(False, index=result_df.index)
-                    for column in columns_to_search:
-                        if pd.api.types.is_string_dtype(result_df[column]):
-                            column_mask = result_df[column].str.contains(
-                                pattern, regex=True, na=False
-                            )
-                            mask = mask | column_mask
-
-                else:  # Simple substring match
-                    # Create a mask for substring matching
-                    mask = pd.Series(False, index=result_df.index)
-                    for column in columns_to_search:
-                        if pd.api.types.is_string_dtype(result_df[column]):
-                            if not self._case_sensitive:
-                                column_mask = (
-                                    result_df[column]
-                                    .str.lower()
-                                    .str.contains(search_text.lower(), na=False)
-                                )
-                            else:
-                                column_mask = result_df[column].str.contains(search_text, na=False)
-                            mask = mask | column_mask
-
-            # Apply the mask
-            result_df = result_df[mask]
-
-            self._logger.debug(f"Filter applied: {len(result_df)} of {len(df)} rows remaining")
-
-            return result_df
+            self._last_search_timed_out = False
+            pattern = self._compile_search_pattern()
+            if self._regex_enabled and pattern is None:
+                return self._all_rows(df)
+            deadline = time.monotonic() + self._time_budget if pattern is not None else None
+
+            text_index = self._text_index
+            if text_index is not None and not text_index.covers(df):
+                text_index = None
+
+            mask = np.zeros(len(df), dtype=bool)
+            for column in columns_to_search:
+                if not pd.api.types.is_string_dtype(df[column]):
+                    continue
+
+                column_index = text_index.column(column) if text_index is not None else None
+                if column_index is not None:
+                    mask |= self._index_mask(column_index, pattern, deadline)
+                else:
+                    mask |= self._scan_mask(df[column], pattern, deadline).to_numpy(dtype=bool)
+
+            return pd.Series(mask, index=df.index)
+        except SearchTimeoutError as e:
+            self._last_search_timed_out = True
+            self._logger.warning(f"{e}; search aborted, filter not applied")
+            return self._all_rows(df)
         except Exception as e:
-            self._logger.error(f"Error applying filter: {e}")
-            return df
+            self._logger.error(f"Error computing filter mask: {e}")
+            return self._all_rows(df)
+
+    def _compile_search_pattern(self) -> Optional[Pattern]:
+        """
+        Get the compiled pattern for regex and whole-word mode.
+
+        Patterns come from an LRU cache keyed by (text, flags). Regexes that
+        can backtrack exponentially on a single value cannot be interrupted by
+        the time budget, so they are rejected and the search counts as timed out.
+
+        Returns:
+            Compiled pattern, or None for plain substring mode or a rejected regex
+        """
+        flags = 0 if self._case_sensitive else re.IGNORECASE
+
+        if self._regex_enabled:
+            try:
+                if is_backtracking_prone(self._search_text):
+                    self._last_search_timed_out = True
+                    self._logger.warning(
+                        f"Regex pattern rejected, repeated group with alternation "
+                        f"or nested quantifier: {self._search_text}"
+                    )
+                    return None
+                return compile_pattern(self._search_text, flags)
+            except re.error as e:
+                self._logger.error(f"Invalid regex pattern: {e}")
+                return None
+
+        if self._whole_word:
+            # For whole word search, need to use regex with word boundaries
+            return compile_pattern(r"\b" + re.escape(self._search_text) + r"\b", flags)
+
+        return None
+
+    def _index_mask(
+        self, column_index: ColumnTextIndex, pattern: Optional[Pattern], deadline: Optional[float]
+    ) -> np.ndarray:
+        """
+        Match one column through its text index.
+
+        Args:
+            column_index: Index of the column
+            pattern: Compiled pattern for regex mode, None otherwise
+            deadline: time.monotonic() value after which the search is aborted
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        if self._regex_enabled:
+            return column_index.regex_mask(pattern, deadline)
+        if self._whole_word:
+            return column_index.whole_word_mask(self._search_text, self._case_sensitive, deadline)
+        return column_index.substring_mask(self._search_text, self._case_sensitive)
+
+    def _scan_mask(
+        self, values: pd.Series, pattern: Optional[Pattern], deadline: Optional[float]
+    ) -> pd.Series:
+        """
+        Match one column without an index.
+
+        Patterns are matched against the distinct values of the column only.
+
+        Args:
+            values: Column values
+            pattern: Compiled pattern for regex and whole-word mode, None otherwise
+            deadline: time.monotonic() value after which the search is aborted
+
+        Returns:
+            Boolean Series aligned with the column
+        """
+        if pattern is not None:
+            distinct = [value for value in values.dropna().unique() if isinstance(value, str)]
+            matched = [distinct[i] for i in search_values(distinct, pattern, deadline=deadline)]
+            return values.isin(matched)
+        if not self._case_sensitive:
+            return values.str.lower().str.contains(self._search_text.lower(), regex=False, na=False)
+        return values.str.contains(self._search_text, regex=False, na=False)
 
     def save_state(self, config: IConfigManager) -> None:
         """
@@ -11,7 +11,7 @@ Usage:
 """
 
 import logging
-from typing import List, Set, Dict, Any, Optional
+from typing import List, Set, Dict, Any, Optional, Tuple
 
 import pandas as pd
 
@@ -162,49 +162,50 @@ class ValidationListFilter(BaseFilter):
         self._selected_values.clear()
         self._logger.debug("Filter cleared")
 
-    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_state_key(self) -> Tuple[Any, ...]:
         """
-        Apply filter to a DataFrame and return filtered result.
+        Get a hashable key describing the selection.
+
+        Returns:
+            Tuple of all settings that affect the mask
+        """
+        return (
+            self._enabled,
+            self._column_name,
+            frozenset(self._selected_values),
+            self._selection_type,
+            self._case_sensitive,
+        )
+
+    def mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Compute the rows of a DataFrame whose column value is (not) selected.
 
         Args:
-            df: DataFrame to filter
+            df: DataFrame to evaluate
 
         Returns:
-            Filtered DataFrame
+            Boolean Series aligned with df.index
         """
         if not self.is_active() or self._column_name not in df.columns:
-            return df
+            return self._all_rows(df)
 
         try:
-            # Create a copy of the DataFrame
-            result_df = df.copy()
-
             # Handle case sensitivity
             if not self._case_sensitive:
                 # Convert selected values to lowercase
                 lowercase_selected = {value.lower() for value in self._selected_values}
-
-                # Create a mask based on case-insensitive matching
-                if self._selection_type == "include":
-                    mask = result_df[self._column_name].str.lower().isin(lowercase_selected)
-                else:  # exclude
-                    mask = ~result_df[self._column_name].str.lower().isin(lowercase_selected)
+                mask = df[self._column_name].str.lower().isin(lowercase_selected)
             else:
-                # Case-sensitive matching
-                if self._selection_type == "include":
-                    mask = result_df[self._column_name].isin(self._selected_values)
-                else:  # exclude
-                    mask = ~result_df[self._column_name].isin(self._selected_values)
-
-            # Apply the mask
-            result_df = result_df[mask]
+                mask = df[self._column_name].isin(self._selected_values)
 
-            self._logger.debug(f"Filter applied: {len(result_df)} of {len(df)} rows remaining")
+            if self._selection_type == "exclude":
+                mask = ~mask
 
-            return result_df
+            return mask
         except Exception as e:
-            self._logger.error(f"Error applying filter: {e}")
-            return df
+            self._logger.error(f"Error computing filter mask: {e}")
+            return self._all_rows(df)
 
     def save_state(self, config: IConfigManager) -> None:
         """
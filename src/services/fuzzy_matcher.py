@@ -10,8 +10,6 @@ Usage:
 
 from typing import Dict, List, Optional, Tuple, Union
 
-from fuzzywuzzy import fuzz
-
 
 class FuzzyMatcher:
     """
@@ -48,6 +46,9 @@ class FuzzyMatcher:
         Returns:
             float: Similarity score (0.0-1.0)
         """
+        # Imported on first use to keep fuzzywuzzy out of application startup
+        from fuzzywuzzy import fuzz
+
         # Use token_sort_ratio for better handling of word order
         ratio = fuzz.token_sort_ratio(str1, str2) / 100.0
         return ratio
@@ -0,0 +1,184 @@
+"""
+rule_reader.py
+
+Description: Vectorized loading of correction rule CSV files into DataFrames
+Usage:
+    from src.services.rule_reader import read_rules_frame, rules_from_frame
+
+    rules_df = read_rules_frame("data/corrections/standard_corrections.csv")
+    data_store.set_correction_rules(rules_df)
+    rules = rules_from_frame(rules_df)  # only when CorrectionRule objects are needed
+"""
+
+import io
+import logging
+from pathlib import Path
+from typing import List, Optional, Sequence, Union
+
+import pandas as pd
+
+from src.models.correction_rule import CorrectionRule
+from src.services.entry_reader import iter_decoded_blocks, iter_file_blocks
+
+logger = logging.getLogger(__name__)
+
+# Columns of the rules DataFrame, as DataFrameStore.set_correction_rules expects them
+RULE_COLUMNS = ("from_text", "to_text", "category", "enabled")
+
+# Delimiters tried on the header line, in order of preference on ties
+RULE_DELIMITERS = (";", ",", "\t")
+
+# Header names (lowercased) and the rule column they map to
+RULE_HEADER_MAP = {
+    "from": "from_text",
+    "field": "from_text",
+    "pattern": "from_text",
+    "to": "to_text",
+    "replacement": "to_text",
+    "category": "category",
+    "enabled": "enabled",
+    "disabled": "disabled",
+}
+
+RULE_CATEGORIES = ("chest", "player", "source", "general")
+
+# Values of the Enabled/Disabled columns that count as set
+TRUE_VALUES = ("true", "yes", "1", "t")
+
+# The bundled rule files write "enabled" into the Enabled column
+ENABLED_VALUES = TRUE_VALUES + ("enabled",)
+
+
+def sniff_delimiter(header: str) -> str:
+    """
+    Pick the delimiter that splits the header line into the most columns.
+
+    Args:
+        header: First line of the file
+
+    Returns:
+        Delimiter, "," if none of the candidates occurs
+    """
+    counts = [header.count(delimiter) for delimiter in RULE_DELIMITERS]
+    best = max(counts)
+    return RULE_DELIMITERS[counts.index(best)] if best else ","
+
+
+def normalize_rules_frame(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn a CSV table with From/To/Category/Enabled headers into a rules DataFrame.
+
+    Headers are matched case-insensitively. Values are stripped, rows with
+    an empty From or To value are dropped, unknown categories become
+    "general", and the enabled flag comes from an Enabled column (or the
+    inverse of a legacy Disabled column), defaulting to True when empty.
+
+    Args:
+        raw_df: Table with string cells as read from the file
+
+    Returns:
+        DataFrame with the RULE_COLUMNS
+
+    Raises:
+        ValueError: If the From or To header is missing
+    """
+    columns = {}
+    for header in raw_df.columns:
+        target = RULE_HEADER_MAP.get(str(header).strip().lower())
+        if target and target not in columns:
+            # A plain comprehension is several times faster than .str.strip()
+            values = raw_df[header].fillna("").astype(str).tolist()
+            columns[target] = pd.Series([value.strip() for value in values], dtype=object)
+
+    required = (("From", "from_text"), ("To", "to_text"))
+    missing = [header for header, column in required if column not in columns]
+    if missing:
+        raise ValueError(f"CSV file is missing required headers: {', '.join(missing)}")
+
+    keep = (columns["from_text"] != "") & (columns["to_text"] != "")
+    count = int(keep.sum())
+
+    if "category" in columns:
+        category = columns["category"][keep].str.lower()
+        category = category.where(category.isin(RULE_CATEGORIES), "general")
+    else:
+        category = pd.Series("general", index=keep.index[keep])
+
+    if "enabled" in columns:
+        flag = columns["enabled"][keep].str.lower()
+        enabled = (flag == "") | flag.isin(ENABLED_VALUES)
+    elif "disabled" in columns:
+        enabled = ~columns["disabled"][keep].str.lower().isin(TRUE_VALUES)
+    else:
+        enabled = pd.Series(True, index=keep.index[keep])
+
+    return pd.DataFrame(
+        {
+            "from_text": columns["from_text"][keep].to_numpy(),
+            "to_text": columns["to_text"][keep].to_numpy(),
+            "category": category.to_numpy(),
+            "enabled": enabled.to_numpy(dtype=bool),
+        },
+        index=pd.RangeIndex(count),
+    )
+
+
+def read_rules_frame(
+    file_path: Union[str, Path], encodings: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Read a correction rules CSV file into a rules DataFrame.
+
+    The file is read and decoded once; the delimiter is taken from the
+    header line of the decoded text, which is then parsed by pd.read_csv.
+
+    Args:
+        file_path: Path to the CSV file
+        encodings: Encodings to try for files without a byte order mark
+
+    Returns:
+        DataFrame with the RULE_COLUMNS (empty for an empty file)
+
+    Raises:
+        ValueError: If the file cannot be decoded or lacks the From/To headers
+    """
+    text = "".join(iter_decoded_blocks(iter_file_blocks(file_path), encodings))
+    header = text.split("\n", 1)[0].strip()
+    if not header:
+        logger.warning(f"CSV file has no content or first line is empty: {file_path}")
+        return pd.DataFrame({column: pd.Series(dtype=object) for column in RULE_COLUMNS})
+
+    raw_df = pd.read_csv(
+        io.StringIO(text),
+        sep=sniff_delimiter(header),
+        dtype=str,
+        keep_default_na=False,
+        skip_blank_lines=True,
+    )
+    return normalize_rules_frame(raw_df)
+
+
+def rules_from_frame(rules_df: pd.DataFrame) -> List[CorrectionRule]:
+    """
+    Build CorrectionRule objects from a rules DataFrame.
+
+    Args:
+        rules_df: DataFrame with the RULE_COLUMNS
+
+    Returns:
+        One rule per row
+    """
+    return [
+        CorrectionRule(
+            from_text=from_text,
+            to_text=to_text,
+            category=category,  # type: ignore
+            disabled=not enabled,
+        )
+        for from_text, to_text, category, enabled in zip(
+            rules_df["from_text"].tolist(),
+            rules_df["to_text"].tolist(),
+            rules_df["category"].tolist(),
+            rules_df["enabled"].tolist(),
+        )
+    ]
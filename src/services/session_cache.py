@@ -0,0 +1,370 @@
+"""
+session_cache.py
+
+Description: Columnar session cache that snapshots DataFrameStore to Arrow files keyed by input hash
+Usage:
+    from src.services.session_cache import SessionCache
+
+    cache = SessionCache("data/cache/session")
+    sources = {"correction_rules": rules_path, "player": players_path}
+    if not cache.restore(data_store, sources):
+        ...  # parse the inputs as usual
+    cache.save(data_store, sources)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import pandas as pd
+
+from src.interfaces.i_data_store import IDataStore
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the file layout changes; older sessions are ignored
+SESSION_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+VALIDATION_LIST_TYPES = ("player", "chest_type", "source")
+
+SourceMap = Mapping[str, Optional[Union[str, Path]]]
+
+
+def is_available() -> bool:
+    """
+    Check whether the optional pyarrow dependency is installed.
+
+    Returns:
+        True if session files can be written and read
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Hash the content of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest of the file content
+    """
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def sources_fingerprint(sources: SourceMap) -> str:
+    """
+    Hash the content of all input files of a session.
+
+    Missing files and unset sources are part of the key, so adding or
+    removing an input invalidates the session as well.
+
+    Args:
+        sources: Mapping of source name (e.g. "correction_rules") to file path
+
+    Returns:
+        Hex SHA-256 digest over the names, paths and contents
+    """
+    digest = hashlib.sha256(f"v{SESSION_FORMAT_VERSION}".encode())
+    for name in sorted(sources):
+        path = sources[name]
+        if path and Path(path).is_file():
+            content = file_digest(path)
+            path = str(Path(path).resolve())
+        else:
+            content = "missing"
+        digest.update(f"\0{name}\0{path or ''}\0{content}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _json_columns(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Find object columns holding lists or dicts, which are stored as JSON text.
+
+    Args:
+        df: DataFrame to inspect
+
+    Returns:
+        Mapping of column name to "list" or "dict"
+    """
+    columns = {}
+    for column in df.columns:
+        if df[column].dtype != object:
+            continue
+        sample = df[column].dropna()
+        if len(sample) and isinstance(sample.iloc[0], (list, dict)):
+            columns[column] = "list" if isinstance(sample.iloc[0], list) else "dict"
+    return columns
+
+
+def _encode_json(value: Any) -> Optional[str]:
+    """
+    Encode a list or dict cell; empty containers become null so restore can skip them.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        JSON text, or None for an empty container
+    """
+    if isinstance(value, (list, dict)) and not value:
+        return None
+    return json.dumps(value)
+
+
+def _decode_json(values: pd.Series, kind: str) -> List[Any]:
+    """
+    Decode a column written with _encode_json.
+
+    Args:
+        values: Column of JSON text and nulls
+        kind: "list" or "dict", the type of the empty containers
+
+    Returns:
+        Decoded values, with a new empty container for each null
+    """
+    empty = list if kind == "list" else dict
+    return [empty() if value is None else json.loads(value) for value in values]
+
+
+class SessionCache:
+    """
+    Snapshot of the data store state in Arrow IPC (Feather) files.
+
+    A session holds the entries (with status, validation errors and
+    original values), the correction rules and the validation lists,
+    together with a fingerprint of the input files they came from. It is
+    only restored while those inputs are unchanged.
+
+    Attributes:
+        _cache_dir (Path): Directory holding the manifest and session files
+        _logger (logging.Logger): Logger instance
+
+    Implementation Notes:
+        - Requires pyarrow; without it save() and restore() return False
+        - Tables are written uncompressed so they can be memory-mapped on restore
+        - List and dict columns are stored as JSON text
+        - Each session is written to a new directory and the manifest is
+          replaced last, so a crash never leaves a half-written session active
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize the session cache.
+
+        Args:
+            cache_dir: Directory for the session files (created on save)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def cache_dir(self) -> Path:
+        """
+        Get the cache directory.
+
+        Returns:
+            Directory holding the session files
+        """
+        return self._cache_dir
+
+    def save(self, store: IDataStore, sources: SourceMap) -> bool:
+        """
+        Write the current store state as the session for the given inputs.
+
+        Args:
+            store: Data store to snapshot
+            sources: Mapping of source name to the input file it was loaded from
+
+        Returns:
+            bool: True if the session was written, False otherwise
+        """
+        if not is_available():
+            self._logger.info("pyarrow is not installed, session cache disabled")
+            return False
+
+        try:
+            fingerprint = sources_fingerprint(sources)
+            session_dir = self._cache_dir / f"session-{fingerprint[:16]}-{uuid.uuid4().hex[:8]}"
+            session_dir.mkdir(parents=True)
+
+            tables = {
+                "entries": store.get_entries(),
+                "correction_rules": store.get_correction_rules(),
+            }
+            for list_type in VALIDATION_LIST_TYPES:
+                tables[f"validation_{list_type}"] = store.get_validation_list(list_type)
+
+            json_columns = {}
+            for name, df in tables.items():
+                json_columns[name] = self._write_table(df, session_dir / f"{name}.arrow")
+
+            manifest = {
+                "version": SESSION_FORMAT_VERSION,
+                "fingerprint": fingerprint,
+                "directory": session_dir.name,
+                "sources": {name: str(path) if path else None for name, path in sources.items()},
+                "json_columns": json_columns,
+            }
+            self._write_manifest(manifest)
+            self._remove_stale_sessions(session_dir.name)
+
+            self._logger.info(
+                f"Saved session with {len(tables['entries'])} entries to {session_dir}"
+            )
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error saving session to {self._cache_dir}: {e}")
+            return False
+
+    def restore(self, store: IDataStore, sources: SourceMap) -> bool:
+        """
+        Load the saved session into the store if the inputs are unchanged.
+
+        Args:
+            store: Data store to fill
+            sources: Mapping of source name to the input file it would be loaded from
+
+        Returns:
+            bool: True if the session was restored, False if there is no
+            matching session (the caller loads the inputs as usual)
+        """
+        if not is_available():
+            return False
+
+        manifest = self._read_manifest()
+        if manifest is None:
+            return False
+        if manifest.get("version") != SESSION_FORMAT_VERSION:
+            self._logger.info("Ignoring session cache written by another version")
+            return False
+
+        try:
+            if manifest.get("fingerprint") != sources_fingerprint(sources):
+                self._logger.info("Inputs changed since the session was saved, not restoring")
+                return False
+
+            session_dir = self._cache_dir / manifest["directory"]
+            json_columns = manifest.get("json_columns", {})
+            tables = {
+                name: self._read_table(session_dir / f"{name}.arrow", json_columns.get(name, {}))
+                for name in json_columns
+            }
+
+            restored = store.set_correction_rules(tables["correction_rules"])
+            for list_type in VALIDATION_LIST_TYPES:
+                restored &= store.set_validation_list(list_type, tables[f"validation_{list_type}"])
+            restored &= store.set_entries(tables["entries"], source="session cache")
+            if not restored:
+                self._logger.error("Data store rejected the cached session")
+                return False
+
+            self._logger.info(
+                f"Restored session with {len(tables['entries'])} entries from {session_dir}"
+            )
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error restoring session from {self._cache_dir}: {e}")
+            return False
+
+    def clear(self) -> None:
+        """Delete all session files."""
+        if self._cache_dir.exists():
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def _write_table(self, df: pd.DataFrame, path: Path) -> Dict[str, str]:
+        """
+        Write a DataFrame to an uncompressed Arrow IPC file.
+
+        Args:
+            df: DataFrame to write (the index is kept)
+            path: Target file
+
+        Returns:
+            Mapping of the columns stored as JSON text to "list" or "dict"
+        """
+        import pyarrow as pa
+        from pyarrow import feather
+
+        encoded = _json_columns(df)
+        if encoded:
+            df = df.copy()
+            for column in encoded:
+                df[column] = [_encode_json(value) for value in df[column]]
+
+        table = pa.Table.from_pandas(df, preserve_index=True)
+        feather.write_feather(table, str(path), compression="uncompressed")
+        return encoded
+
+    def _read_table(self, path: Path, json_columns: Dict[str, str]) -> pd.DataFrame:
+        """
+        Read a DataFrame from a memory-mapped Arrow IPC file.
+
+        Args:
+            path: File written by _write_table
+            json_columns: Columns to decode from JSON text, mapped to "list" or "dict"
+
+        Returns:
+            DataFrame with its original index
+        """
+        from pyarrow import feather
+
+        df = feather.read_table(str(path), memory_map=True).to_pandas()
+        for column, kind in json_columns.items():
+            df[column] = _decode_json(df[column], kind)
+        return df
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the manifest of the active session.
+
+        Returns:
+            Manifest dict, or None if there is no readable manifest
+        """
+        manifest_path = self._cache_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            self._logger.warning(f"Ignoring unreadable session manifest {manifest_path}: {e}")
+            return None
+
+    def _write_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Replace the manifest atomically.
+
+        Args:
+            manifest: Manifest dict
+        """
+        manifest_path = self._cache_dir / MANIFEST_FILE
+        temp_path = manifest_path.with_name(f"{MANIFEST_FILE}.{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(temp_path, manifest_path)
+
+    def _remove_stale_sessions(self, keep: str) -> None:
+        """
+        Delete session directories other than the active one.
+
+        Args:
+            keep: Directory name of the active session
+        """
+        for path in self._cache_dir.glob("session-*"):
+            if path.is_dir() and path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
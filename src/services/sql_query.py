@@ -0,0 +1,246 @@
+"""
+sql_query.py
+
+Description: Compiles pandas-style query strings into parameterized SQL WHERE clauses
+Usage:
+    from src.services.sql_query import compile_query
+
+    where, params = compile_query("player == 'Moony' and date >= '2025-03-01'", {"player", "date"})
+    cursor.execute(f"SELECT * FROM entries WHERE {where}", params)
+"""
+
+import ast
+from typing import Any, Collection, List, Tuple
+
+
+_COMPARISONS = {
+    ast.Eq: "=",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+# Operators with the operands swapped, for "'x' == column"
+_FLIPPED = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE}
+
+
+def compile_query(query_str: str, columns: Collection[str]) -> Tuple[str, List[Any]]:
+    """
+    Compile a query in the pandas DataFrame.query syntax into SQL.
+
+    Supported: comparisons between a column and a literal (chains like
+    "a < col <= b" included), "in"/"not in" with a literal list,
+    and/or/not (also &, | and ~), col.str.contains/startswith/endswith
+    with a literal, and col.isna()/notna(). String matching is case-sensitive
+    like pandas.
+
+    Args:
+        query_str: Query string
+        columns: Column names that may be referenced
+
+    Returns:
+        Tuple of the WHERE clause and its parameters
+
+    Raises:
+        ValueError: If the query is invalid or uses unsupported syntax
+    """
+    try:
+        tree = ast.parse(query_str.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid query syntax: {e}") from e
+
+    params: List[Any] = []
+    sql = _Compiler(set(columns), params).visit(tree.body)
+    return sql, params
+
+
+class _Compiler:
+    """
+    Walks a parsed query expression and emits SQL.
+
+    Attributes:
+        _columns (set): Column names that may be referenced
+        _params (List[Any]): Collected parameters, in placeholder order
+    """
+
+    def __init__(self, columns: set, params: List[Any]):
+        """
+        Initialize the compiler.
+
+        Args:
+            columns: Column names that may be referenced
+            params: List the parameters are appended to
+        """
+        self._columns = columns
+        self._params = params
+
+    def visit(self, node: ast.AST) -> str:
+        """
+        Compile an expression node.
+
+        Args:
+            node: Expression node
+
+        Returns:
+            SQL for the expression
+
+        Raises:
+            ValueError: If the node is not supported
+        """
+        if isinstance(node, ast.BoolOp):
+            joiner = " AND " if isinstance(node.op, ast.And) else " OR "
+            return "(" + joiner.join(self.visit(value) for value in node.values) + ")"
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+            joiner = " AND " if isinstance(node.op, ast.BitAnd) else " OR "
+            return f"({self.visit(node.left)}{joiner}{self.visit(node.right)})"
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+            return f"(NOT {self.visit(node.operand)})"
+
+        if isinstance(node, ast.Compare):
+            return self._compare(node)
+
+        if isinstance(node, ast.Call):
+            return self._call(node)
+
+        raise ValueError(f"Unsupported query expression: {ast.unparse(node)}")
+
+    def _column(self, node: ast.AST) -> str:
+        """
+        Get the column a node refers to.
+
+        Args:
+            node: Name node
+
+        Returns:
+            Quoted column name
+
+        Raises:
+            ValueError: If the node is not a known column
+        """
+        if isinstance(node, ast.Name) and node.id in self._columns:
+            return f'"{node.id}"'
+        raise ValueError(f"Unknown column in query: {ast.unparse(node)}")
+
+    def _literal(self, node: ast.AST) -> Any:
+        """
+        Evaluate a literal operand.
+
+        Args:
+            node: Constant, or a list/tuple of constants
+
+        Returns:
+            Literal value
+
+        Raises:
+            ValueError: If the node is not a literal
+        """
+        try:
+            return ast.literal_eval(node)
+        except ValueError as e:
+            raise ValueError(f"Expected a literal in query: {ast.unparse(node)}") from e
+
+    def _compare(self, node: ast.Compare) -> str:
+        """
+        Compile a (possibly chained) comparison.
+
+        Args:
+            node: Compare node
+
+        Returns:
+            SQL for the comparison
+        """
+        parts = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            parts.append(self._compare_pair(left, type(op), right))
+            left = right
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def _compare_pair(self, left: ast.AST, op: type, right: ast.AST) -> str:
+        """
+        Compile one comparison between a column and a literal.
+
+        Args:
+            left: Left operand
+            op: Comparison operator type
+            right: Right operand
+
+        Returns:
+            SQL for the comparison
+        """
+        if not isinstance(left, ast.Name):
+            if op in (ast.In, ast.NotIn):
+                raise ValueError("'in' needs a column on the left")
+            left, right = right, left
+            op = _FLIPPED.get(op, op)
+
+        column = self._column(left)
+        value = self._literal(right)
+
+        # pandas treats "col == [a, b]" like "col in [a, b]"
+        if isinstance(value, (list, tuple, set)) and op in (ast.Eq, ast.NotEq):
+            op = ast.In if op is ast.Eq else ast.NotIn
+
+        if op in (ast.In, ast.NotIn):
+            values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+            if not values:
+                return "(1 = 0)" if op is ast.In else "(1 = 1)"
+            self._params.extend(values)
+            placeholders = ", ".join("?" for _ in values)
+            negate = "NOT " if op is ast.NotIn else ""
+            return f"{column} {negate}IN ({placeholders})"
+
+        if op not in _COMPARISONS:
+            raise ValueError(f"Unsupported comparison operator: {op.__name__}")
+        if value is None:
+            if op is ast.Eq:
+                return f"{column} IS NULL"
+            if op is ast.NotEq:
+                return f"{column} IS NOT NULL"
+        self._params.append(value)
+        return f"{column} {_COMPARISONS[op]} ?"
+
+    def _call(self, node: ast.Call) -> str:
+        """
+        Compile a method call on a column.
+
+        Args:
+            node: Call node, e.g. player.str.contains('Moon') or player.isna()
+
+        Returns:
+            SQL for the call
+        """
+        func = node.func
+        if not isinstance(func, ast.Attribute):
+            raise ValueError(f"Unsupported function call: {ast.unparse(node)}")
+
+        if func.attr in ("isna", "isnull", "notna", "notnull") and not node.args:
+            column = self._column(func.value)
+            negate = "NOT " if func.attr.startswith("not") else ""
+            return f"{column} IS {negate}NULL"
+
+        owner = func.value
+        if (
+            isinstance(owner, ast.Attribute)
+            and owner.attr == "str"
+            and func.attr in ("contains", "startswith", "endswith")
+            and len(node.args) == 1
+            and not node.keywords
+        ):
+            column = self._column(owner.value)
+            text = self._literal(node.args[0])
+            if not isinstance(text, str):
+                raise ValueError(f"Expected a string in query: {ast.unparse(node)}")
+            if func.attr == "contains":
+                self._params.append(text)
+                return f"instr({column}, ?) > 0"
+            self._params.extend([text, text])
+            if func.attr == "startswith":
+                return f"substr({column}, 1, length(?)) = ?"
+            return f"substr({column}, -length(?)) = ?"
+
+        raise ValueError(f"Unsupported function call: {ast.unparse(node)}")
@@ -0,0 +1,600 @@
+"""
+sqlite_store.py
+
+Description: IDataStore backend that keeps the entry history of all imports in SQLite
+Usage:
+    from src.services.sqlite_store import SQLiteDataStore
+
+    data_store = SQLiteDataStore("data/history.db")
+    data_store.set_entries(entries_df, source="data/input/chests_2025-03-17.txt")
+    moony = data_store.query_entries("player == 'Moony' and date >= '2025-03-01'")
+    counts = data_store.count_entries(["player"], "date >= '2025-03-01'")
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.date_index import normalize_date_columns
+from src.services.file_parser import FileParser
+from src.services.sql_query import compile_query
+
+
+# Columns of an entry row in the history table, in insert order
+HISTORY_COLUMNS = (
+    "id",
+    "chest_type",
+    "player",
+    "source",
+    "status",
+    "date",
+    "validation_errors",
+    "original_values",
+    "modified_at",
+)
+
+# Columns usable in query_entries and count_entries ("origin" is the import the row came from)
+QUERY_COLUMNS = HISTORY_COLUMNS[:6] + ("modified_at", "origin")
+
+# Columns stored as JSON text, with the container type of their empty value
+_JSON_COLUMNS = {"validation_errors": list, "original_values": dict}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS imports (
+    import_id INTEGER PRIMARY KEY,
+    origin TEXT NOT NULL UNIQUE,
+    imported_at TEXT NOT NULL,
+    entry_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS entries (
+    row_id INTEGER PRIMARY KEY,
+    import_id INTEGER NOT NULL REFERENCES imports(import_id),
+    id INTEGER NOT NULL,
+    chest_type TEXT,
+    player TEXT,
+    source TEXT,
+    status TEXT,
+    date TEXT,
+    validation_errors TEXT,
+    original_values TEXT,
+    modified_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_entries_import ON entries(import_id, id);
+CREATE INDEX IF NOT EXISTS idx_entries_player ON entries(player);
+CREATE INDEX IF NOT EXISTS idx_entries_chest_type ON entries(chest_type);
+CREATE INDEX IF NOT EXISTS idx_entries_source ON entries(source);
+CREATE INDEX IF NOT EXISTS idx_entries_date ON entries(date);
+"""
+
+_SELECT = (
+    "SELECT "
+    + ", ".join(f"e.{column}" for column in HISTORY_COLUMNS)
+    + ", i.origin FROM entries e JOIN imports i ON i.import_id = e.import_id"
+)
+
+_INSERT = (
+    f"INSERT INTO entries (import_id, {', '.join(HISTORY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in range(len(HISTORY_COLUMNS) + 1))})"
+)
+
+
+def _iso_values(values: pd.Series, fmt: str) -> List[Optional[str]]:
+    """
+    Format a date column as ISO text for SQLite.
+
+    Args:
+        values: Datetime or string column
+        fmt: strftime format for datetime values
+
+    Returns:
+        List of strings, None for missing values
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        values = values.dt.strftime(fmt)
+    return [None if pd.isna(value) else str(value) for value in values]
+
+
+def _encode_json(values: pd.Series) -> List[Optional[str]]:
+    """
+    Encode a list or dict column as JSON text; empty and missing values become NULL.
+
+    Args:
+        values: Column of lists or dicts
+
+    Returns:
+        List of JSON strings and None
+    """
+    return [
+        json.dumps(value) if isinstance(value, (list, dict)) and value else None for value in values
+    ]
+
+
+class SQLiteDataStore(DataFrameStore):
+    """
+    Data store that adds a persistent, indexed SQLite history to DataFrameStore.
+
+    The current import is held in memory exactly like DataFrameStore, so the
+    UI, services, events and indexes work unchanged. Every change to it is
+    also written to the history database, where the entries of all imports
+    are kept. query_entries, count_entries and iter_query_entries run on the
+    history in SQL, so reports over millions of rows only load the result.
+
+    Attributes:
+        _db_path (str): Path of the SQLite database
+        _connection (sqlite3.Connection): Database connection
+        _db_lock (threading.RLock): Serializes database access
+        _current_import_id (Optional[int]): History import holding the in-memory entries
+        _current_ids (pd.Index): Entry IDs of the current import when it was last written
+
+    Implementation Notes:
+        - WAL journal mode with synchronous=NORMAL; writes use executemany in one transaction
+        - Indexes on player, chest_type, source and date
+        - A set_entries call with the same entry IDs (e.g. after validation
+          or correction) rewrites the current import; new IDs start an import
+          named after the source, replacing an earlier import of that source
+        - Rows without a date column take the date from the source file name
+        - Correction rules and validation lists stay in memory
+    """
+
+    def __init__(self, db_path: Union[str, Path] = ":memory:"):
+        """
+        Initialize the store and open (or create) the history database.
+
+        Args:
+            db_path: Database file, or ":memory:" for a temporary database
+        """
+        super().__init__()
+        self._db_path = str(db_path)
+        if self._db_path != ":memory:":
+            Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._db_lock = threading.RLock()
+        self._connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        self._current_import_id: Optional[int] = None
+        self._current_ids = pd.Index([])
+        self._logger.info(f"SQLite history opened at {self._db_path}")
+
+    def close(self) -> None:
+        """Close the history database."""
+        with self._db_lock:
+            self._connection.close()
+
+    # --- Writes ---
+
+    def _replace_entries(self, entries_df: pd.DataFrame, source: str, emit_event: bool) -> bool:
+        """
+        Replace the in-memory entries and write them to the history.
+
+        Args:
+            entries_df: New entries DataFrame, not shared with the caller
+            source: Source of the update; names the import when the entries are new
+            emit_event: Whether to emit an event after updating
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not super()._replace_entries(entries_df, source, emit_event):
+            return False
+        return self._write_current(source)
+
+    def rollback_transaction(self) -> bool:
+        """
+        Roll back the current transaction, in memory and in the history.
+
+        Returns:
+            bool: True if the transaction was rolled back, False if no transaction in progress
+        """
+        if not super().rollback_transaction():
+            return False
+        return self._write_current("", keep_import=True)
+
+    def add_entry(
+        self, entry_data: Dict[str, Any], source: str = "", emit_event: bool = True
+    ) -> int:
+        """
+        Add an entry to the current import.
+
+        Args:
+            entry_data: Dictionary with entry data
+            source: Source of the update (optional, for tracking)
+            emit_event: Whether to emit an event after updating
+
+        Returns:
+            int: ID of the added entry
+        """
+        entry_id = super().add_entry(entry_data, source, emit_event)
+        if self._current_import_id is None:
+            self._write_current(source)
+        else:
+            self._write_rows(self._entries_df.iloc[[-1]])
+        return entry_id
+
+    def update_entry(
+        self, entry_id: int, entry_data: Dict[str, Any], source: str = "", emit_event: bool = True
+    ) -> bool:
+        """
+        Update an entry of the current import.
+
+        Args:
+            entry_id: ID of the entry to update
+            entry_data: Dictionary with updated entry data
+            source: Source of the update (optional, for tracking)
+            emit_event: Whether to emit an event after updating
+
+        Returns:
+            bool: True if entry was updated, False otherwise
+        """
+        if not super().update_entry(entry_id, entry_data, source, emit_event):
+            return False
+        return self._write_rows(self._entries_df.loc[[entry_id]], replace_id=entry_id)
+
+    def delete_entry(self, entry_id: int, source: str = "", emit_event: bool = True) -> bool:
+        """
+        Delete an entry from the current import.
+
+        Args:
+            entry_id: ID of the entry to delete
+            source: Source of the update (optional, for tracking)
+            emit_event: Whether to emit an event after updating
+
+        Returns:
+            bool: True if entry was deleted, False otherwise
+        """
+        if not super().delete_entry(entry_id, source, emit_event):
+            return False
+        return self._write_rows(self._entries_df.iloc[[]], replace_id=entry_id)
+
+    def append_import(self, entries_df: pd.DataFrame, source: str) -> bool:
+        """
+        Write entries to the history as the import of a source, without loading them.
+
+        An earlier import of the same source is replaced. The in-memory
+        entries and the current import are not changed.
+
+        Args:
+            entries_df: Entries indexed by entry ID
+            source: Source of the entries, e.g. the path of the file they were read from
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            with self._db_lock, self._connection:
+                import_id = self._start_import(source)
+                if import_id == self._current_import_id:
+                    self._current_import_id = None
+                self._connection.executemany(
+                    _INSERT,
+                    self._history_rows(entries_df, import_id, self._import_origin(import_id)),
+                )
+                self._update_import_count(import_id)
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error appending entries to history: {e}")
+            return False
+
+    def _write_current(self, source: str, keep_import: bool = False) -> bool:
+        """
+        Write the in-memory entries to the history.
+
+        Args:
+            source: Source of the update
+            keep_import: Rewrite the current import even if the entry IDs changed
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        entries_df = self._entries_df
+        same_import = self._current_import_id is not None and (
+            keep_import or entries_df.index.equals(self._current_ids)
+        )
+        if not same_import and entries_df.empty:
+            self._current_import_id = None
+            self._current_ids = entries_df.index.copy()
+            return True
+
+        try:
+            with self._db_lock, self._connection:
+                if same_import:
+                    import_id = self._current_import_id
+                else:
+                    import_id = self._start_import(source)
+                self._connection.execute("DELETE FROM entries WHERE import_id = ?", (import_id,))
+                self._connection.executemany(
+                    _INSERT,
+                    self._history_rows(entries_df, import_id, self._import_origin(import_id)),
+                )
+                self._update_import_count(import_id)
+
+            self._current_import_id = import_id
+            self._current_ids = entries_df.index.copy()
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error writing entries to history: {e}")
+            return False
+
+    def _write_rows(self, rows_df: pd.DataFrame, replace_id: Optional[int] = None) -> bool:
+        """
+        Write single rows of the current import to the history.
+
+        Args:
+            rows_df: Rows to insert
+            replace_id: Entry ID whose existing rows are deleted first
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self._current_import_id is None:
+            return True
+
+        try:
+            import_id = self._current_import_id
+            with self._db_lock, self._connection:
+                if replace_id is not None:
+                    # numpy integers would be bound as blobs and match nothing
+                    self._connection.execute(
+                        "DELETE FROM entries WHERE import_id = ? AND id = ?",
+                        (import_id, int(replace_id)),
+                    )
+                self._connection.executemany(
+                    _INSERT, self._history_rows(rows_df, import_id, self._import_origin(import_id))
+                )
+                self._update_import_count(import_id)
+
+            self._current_ids = self._entries_df.index.copy()
+            return True
+
+        except Exception as e:
+            self._logger.error(f"Error writing entry to history: {e}")
+            return False
+
+    def _start_import(self, source: str) -> int:
+        """
+        Create the history import for a source, dropping an earlier import of it.
+
+        Must be called inside a transaction.
+
+        Args:
+            source: Source of the entries; a timestamped name is used if empty
+
+        Returns:
+            Import ID
+        """
+        now = datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
+        origin = source or f"import {now}"
+        row = self._connection.execute(
+            "SELECT import_id FROM imports WHERE origin = ?", (origin,)
+        ).fetchone()
+        if row is not None:
+            self._connection.execute("DELETE FROM entries WHERE import_id = ?", (row[0],))
+            self._connection.execute(
+                "UPDATE imports SET imported_at = ? WHERE import_id = ?", (now, row[0])
+            )
+            return row[0]
+
+        cursor = self._connection.execute(
+            "INSERT INTO imports (origin, imported_at) VALUES (?, ?)", (origin, now)
+        )
+        return cursor.lastrowid
+
+    def _update_import_count(self, import_id: int) -> None:
+        """
+        Refresh the entry count of an import.
+
+        Args:
+            import_id: Import ID
+        """
+        self._connection.execute(
+            "UPDATE imports SET entry_count = "
+            "(SELECT COUNT(*) FROM entries WHERE import_id = ?) WHERE import_id = ?",
+            (import_id, import_id),
+        )
+
+    def _import_origin(self, import_id: int) -> str:
+        """
+        Get the origin of an import.
+
+        Args:
+            import_id: Import ID
+
+        Returns:
+            Origin, or "" if the import does not exist
+        """
+        row = self._connection.execute(
+            "SELECT origin FROM imports WHERE import_id = ?", (import_id,)
+        ).fetchone()
+        return row[0] if row else ""
+
+    def _history_rows(
+        self, entries_df: pd.DataFrame, import_id: int, origin: str
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Convert entries to history table rows.
+
+        Args:
+            entries_df: Entries to convert
+            import_id: Import the rows belong to
+            origin: Origin of the import, used for the date if there is no date column
+
+        Returns:
+            Iterator of row tuples in _INSERT order
+        """
+        count = len(entries_df)
+
+        def column(name: str) -> List[Any]:
+            if name in entries_df.columns:
+                return entries_df[name].tolist()
+            return [None] * count
+
+        if "date" in entries_df.columns:
+            dates = _iso_values(entries_df["date"], "%Y-%m-%d")
+        else:
+            dates = [FileParser().extract_date_from_filename(origin) if origin else None] * count
+
+        modified_at = (
+            _iso_values(entries_df["modified_at"], "%Y-%m-%d %H:%M:%S")
+            if "modified_at" in entries_df.columns
+            else [None] * count
+        )
+
+        return zip(
+            repeat(import_id),
+            [int(entry_id) for entry_id in entries_df.index],
+            column("chest_type"),
+            column("player"),
+            column("source"),
+            column("status"),
+            dates,
+            _encode_json(entries_df["validation_errors"])
+            if "validation_errors" in entries_df.columns
+            else [None] * count,
+            _encode_json(entries_df["original_values"])
+            if "original_values" in entries_df.columns
+            else [None] * count,
+            modified_at,
+        )
+
+    # --- History queries ---
+
+    def query_entries(self, query_str: str) -> pd.DataFrame:
+        """
+        Query the entry history of all imports using pandas query syntax.
+
+        The query is compiled to SQL (see src.services.sql_query.compile_query),
+        so only the matching rows are loaded.
+
+        Args:
+            query_str: Query string, e.g. "player == 'Moony' and date >= '2025-03-01'"
+
+        Returns:
+            DataFrame: Matching entries indexed by "id", with an "origin" column
+
+        Raises:
+            ValueError: If the query is invalid or not supported in SQL
+        """
+        where, params = self._compile(query_str)
+        with self._db_lock:
+            result = pd.read_sql_query(
+                f"{_SELECT} WHERE {where} ORDER BY e.row_id", self._connection, params=params
+            )
+        self._logger.debug(f"Query '{query_str}' returned {len(result)} results")
+        return self._to_entries_frame(result)
+
+    def iter_query_entries(
+        self, query_str: str = "", chunk_size: int = 100_000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the entry history in chunks.
+
+        Args:
+            query_str: Query string (empty for all entries)
+            chunk_size: Rows per chunk
+
+        Yields:
+            DataFrames of at most chunk_size entries
+        """
+        where, params = self._compile(query_str) if query_str else ("1 = 1", [])
+        with self._db_lock:
+            cursor = self._connection.execute(f"{_SELECT} WHERE {where} ORDER BY e.row_id", params)
+            columns = [description[0] for description in cursor.description]
+
+        while True:
+            # Hold the lock per chunk only, so writes can run between chunks
+            with self._db_lock:
+                rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield self._to_entries_frame(pd.DataFrame.from_records(rows, columns=columns))
+
+    def count_entries(self, group_by: Sequence[str], query_str: str = "") -> pd.DataFrame:
+        """
+        Count history entries per group in SQL.
+
+        Args:
+            group_by: Columns to group by (see QUERY_COLUMNS)
+            query_str: Optional query string to filter the entries first
+
+        Returns:
+            DataFrame with the group columns and a "count" column, largest first
+
+        Raises:
+            ValueError: If a group column or the query is invalid
+        """
+        unknown = [column for column in group_by if column not in QUERY_COLUMNS]
+        if not group_by or unknown:
+            raise ValueError(f"Invalid group columns: {unknown or list(group_by)}")
+
+        where, params = self._compile(query_str) if query_str else ("1 = 1", [])
+        groups = ", ".join(f'"{column}"' for column in group_by)
+        sql = (
+            f"SELECT {groups}, COUNT(*) AS count FROM ({_SELECT}) "
+            f"WHERE {where} GROUP BY {groups} ORDER BY count DESC"
+        )
+        with self._db_lock:
+            return pd.read_sql_query(sql, self._connection, params=params)
+
+    def get_imports(self) -> pd.DataFrame:
+        """
+        List the imports in the history.
+
+        Returns:
+            DataFrame with origin, imported_at and entry_count, indexed by import_id
+        """
+        with self._db_lock:
+            return pd.read_sql_query(
+                "SELECT import_id, origin, imported_at, entry_count FROM imports "
+                "ORDER BY import_id",
+                self._connection,
+                index_col="import_id",
+            )
+
+    def _compile(self, query_str: str) -> Tuple[str, List[Any]]:
+        """
+        Compile a query string for the history table.
+
+        Args:
+            query_str: Query string
+
+        Returns:
+            Tuple of the WHERE clause and its parameters
+
+        Raises:
+            ValueError: If the query is invalid or not supported
+        """
+        try:
+            return compile_query(query_str, QUERY_COLUMNS)
+        except ValueError as e:
+            self._logger.error(f"Error executing query '{query_str}': {e}")
+            raise ValueError(f"Invalid query: {e}")
+
+    def _to_entries_frame(self, result: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert history rows to the entries DataFrame layout.
+
+        Args:
+            result: Rows as read from SQL
+
+        Returns:
+            DataFrame indexed by "id" with decoded JSON and datetime columns
+        """
+        for column, empty in _JSON_COLUMNS.items():
+            result[column] = pd.Series(
+                [empty() if value is None else json.loads(value) for value in result[column]],
+                index=result.index,
+                dtype=object,
+            )
+        result = result.set_index("id")
+        return normalize_date_columns(result)
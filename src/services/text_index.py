@@ -0,0 +1,346 @@
+"""
+text_index.py
+
+Description: Trigram inverted index over the text columns of the entries DataFrame
+Usage:
+    from src.services.text_index import TextSearchIndex
+
+    index = TextSearchIndex()
+    index.reset(entries_df, version=1)
+    if index.covers(df):
+        mask = index.column("player").substring_mask("moon")
+"""
+
+import functools
+import re
+import re._constants as sre_constants
+import re._parser as sre_parser
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Set
+
+import numpy as np
+import pandas as pd
+
+from src.services.column_index import ColumnIndexSet
+
+
+# Length of the n-grams stored in the inverted index
+NGRAM_SIZE = 3
+
+
+# Number of values matched between two deadline checks
+_DEADLINE_CHECK_INTERVAL = 64
+
+
+class SearchTimeoutError(Exception):
+    """Raised when a search exceeds its time budget."""
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(text: str, flags: int = 0) -> Pattern:
+    """
+    Compile a regular expression, reusing earlier compilations.
+
+    Args:
+        text: Pattern text
+        flags: re flags
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(text, flags)
+
+
+def _repeated_bodies(parsed: sre_parser.SubPattern, repeated: bool) -> bool:
+    """
+    Check a parsed pattern for alternation or quantifiers inside a repeated group.
+
+    Args:
+        parsed: Parsed (sub)pattern
+        repeated: Whether the subpattern is the body of a quantifier repeating more than once
+
+    Returns:
+        True if a repeated body contains an alternation or another quantifier
+    """
+    for op, av in parsed:
+        if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            if repeated:
+                return True
+            if _repeated_bodies(av[2], av[1] > 1):
+                return True
+        elif op is sre_constants.BRANCH:
+            if repeated:
+                return True
+            if any(_repeated_bodies(branch, repeated) for branch in av[1]):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _repeated_bodies(av[3], repeated):
+                return True
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            if _repeated_bodies(av[1], repeated):
+                return True
+        elif op is sre_constants.GROUPREF_EXISTS:
+            if any(_repeated_bodies(branch, repeated) for branch in av[1:] if branch):
+                return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def is_backtracking_prone(text: str) -> bool:
+    """
+    Check whether a regular expression can backtrack exponentially.
+
+    The re module cannot interrupt a running match, so a time budget only
+    applies between values; patterns like (a+)+ or (a|aa)+ that take
+    exponential time on a single value are detected up front instead. A
+    repeated group is rejected when it contains an alternation or another
+    quantifier. Possessive quantifiers and atomic groups never backtrack and
+    are allowed.
+
+    Args:
+        text: Pattern text
+
+    Returns:
+        True if the pattern is prone to catastrophic backtracking
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return _repeated_bodies(sre_parser.parse(text), False)
+
+
+def search_values(
+    values: Sequence[str],
+    pattern: Pattern,
+    candidates: Optional[Iterable[int]] = None,
+    deadline: Optional[float] = None,
+) -> List[int]:
+    """
+    Find the values that a pattern matches.
+
+    Args:
+        values: Values to search
+        pattern: Compiled pattern
+        candidates: Positions to check (all positions if None)
+        deadline: time.monotonic() value after which the search is aborted
+
+    Returns:
+        Positions of the matching values
+
+    Raises:
+        SearchTimeoutError: If the deadline passes before all values are checked
+    """
+    positions = range(len(values)) if candidates is None else candidates
+    matches = []
+    for checked, position in enumerate(positions):
+        if deadline is not None and checked % _DEADLINE_CHECK_INTERVAL == 0:
+            if time.monotonic() > deadline:
+                raise SearchTimeoutError(f"Search for '{pattern.pattern}' exceeded its time budget")
+        if pattern.search(values[position]):
+            matches.append(position)
+    return matches
+
+
+def _ngrams(text: str) -> Set[str]:
+    """
+    Split a string into its distinct n-grams.
+
+    Args:
+        text: String to split
+
+    Returns:
+        Set of n-grams (empty if the string is shorter than NGRAM_SIZE)
+    """
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class ColumnTextIndex:
+    """
+    Inverted n-gram index over the distinct values of one column.
+
+    Rows are stored as codes into the list of distinct values, so every query
+    runs over distinct values only and is mapped back to rows in one vectorized
+    lookup. Queries intersect the posting sets of the needle's n-grams to get
+    candidates and then verify each candidate.
+
+    Attributes:
+        _codes (np.ndarray): Distinct-value code per row (-1 for missing values)
+        _values (List[str]): Distinct values
+        _lower_values (List[str]): Lowercased distinct values (the cached lowercase column)
+        _postings (Dict[str, Set[int]]): n-gram to distinct-value ids containing it
+    """
+
+    def __init__(self, values: pd.Series):
+        """
+        Build the index for a column.
+
+        Args:
+            values: Column values (strings or missing values)
+        """
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        self._codes = np.asarray(codes)
+        self._values: List[str] = [str(value) for value in uniques]
+        self._lower_values: List[str] = [value.lower() for value in self._values]
+
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        for value_id, value in enumerate(self._lower_values):
+            for gram in _ngrams(value):
+                self._postings[gram].add(value_id)
+
+    @property
+    def distinct_count(self) -> int:
+        """
+        Get the number of distinct values in the column.
+
+        Returns:
+            Number of distinct values
+        """
+        return len(self._values)
+
+    def _candidates(self, needle_lower: str) -> Iterable[int]:
+        """
+        Get the distinct values that may contain a lowercase needle.
+
+        Args:
+            needle_lower: Lowercased search text
+
+        Returns:
+            Candidate distinct-value ids (all ids if the needle is too short to index)
+        """
+        grams = _ngrams(needle_lower)
+        if not grams:
+            return range(len(self._values))
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return ()
+
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return candidates
+
+    def _rows(self, value_ids: Iterable[int]) -> np.ndarray:
+        """
+        Map matching distinct values back to a row mask.
+
+        Args:
+            value_ids: Matching distinct-value ids
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        # The extra trailing slot is False and absorbs the -1 code of missing values
+        hits = np.zeros(len(self._values) + 1, dtype=bool)
+        ids = list(value_ids)
+        if ids:
+            hits[ids] = True
+        return hits[self._codes]
+
+    def substring_mask(self, text: str, case_sensitive: bool = False) -> np.ndarray:
+        """
+        Find the rows whose value contains the text.
+
+        Args:
+            text: Text to search for
+            case_sensitive: Whether matching is case-sensitive
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        needle_lower = text.lower()
+        candidates = self._candidates(needle_lower)
+        if case_sensitive:
+            matches = [i for i in candidates if text in self._values[i]]
+        else:
+            matches = [i for i in candidates if needle_lower in self._lower_values[i]]
+        return self._rows(matches)
+
+    def prefix_mask(self, text: str, case_sensitive: bool = False) -> np.ndarray:
+        """
+        Find the rows whose value starts with the text.
+
+        Args:
+            text: Prefix to search for
+            case_sensitive: Whether matching is case-sensitive
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        needle_lower = text.lower()
+        candidates = self._candidates(needle_lower)
+        if case_sensitive:
+            matches = [i for i in candidates if self._values[i].startswith(text)]
+        else:
+            matches = [i for i in candidates if self._lower_values[i].startswith(needle_lower)]
+        return self._rows(matches)
+
+    def whole_word_mask(
+        self, text: str, case_sensitive: bool = False, deadline: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Find the rows whose value contains the text as a whole word.
+
+        Args:
+            text: Word to search for
+            case_sensitive: Whether matching is case-sensitive
+            deadline: time.monotonic() value after which the search is aborted
+
+        Returns:
+            Boolean array with one entry per row
+
+        Raises:
+            SearchTimeoutError: If the deadline passes
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        pattern = compile_pattern(r"\b" + re.escape(text) + r"\b", flags)
+        candidates = self._candidates(text.lower())
+        return self._rows(search_values(self._values, pattern, candidates, deadline))
+
+    def regex_mask(self, pattern: Pattern, deadline: Optional[float] = None) -> np.ndarray:
+        """
+        Find the rows whose value matches a compiled regular expression.
+
+        Regular expressions cannot use the n-gram index, so every distinct
+        value is scanned once.
+
+        Args:
+            pattern: Compiled pattern
+            deadline: time.monotonic() value after which the search is aborted
+
+        Returns:
+            Boolean array with one entry per row
+
+        Raises:
+            SearchTimeoutError: If the deadline passes
+        """
+        return self._rows(search_values(self._values, pattern, deadline=deadline))
+
+
+class TextSearchIndex(ColumnIndexSet):
+    """
+    Per-column text indexes for one version of the entries DataFrame.
+
+    Only string columns are indexed; see ColumnIndexSet for the lifecycle.
+    """
+
+    def _build_column(self, name: str, values: pd.Series) -> Optional[ColumnTextIndex]:
+        """
+        Build the text index for one column.
+
+        Args:
+            name: Column name
+            values: Column values
+
+        Returns:
+            Column index, or None if the column is not a text column
+        """
+        if not pd.api.types.is_string_dtype(values):
+            return None
+        return ColumnTextIndex(values)
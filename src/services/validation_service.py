@@ -17,8 +17,10 @@ from pathlib import Path
 from src.interfaces.i_validation_service import IValidationService
 from src.interfaces.i_data_store import IDataStore
 from src.interfaces.events import EventType, EventHandler, EventData
+from src.utils.metrics import instrumented, timed
 
 
+@instrumented
 class ValidationService(IValidationService):
     """
     Service for validating entries against validation lists.
@@ -50,6 +52,7 @@ class ValidationService(IValidationService):
         self._logger = logging.getLogger(__name__)
         self._logger.info("ValidationService initialized")
 
+    @timed()
     def validate_entries(self, specific_entries: Optional[List[int]] = None) -> Dict[str, int]:
         """
         Validate all entries or specific entries against validation lists.
@@ -223,6 +226,7 @@ class ValidationService(IValidationService):
             return errors
         return []
 
+    @timed()
     def validate_entry(self, entry_id: int) -> bool:
         """
         Validate a specific entry against validation lists.
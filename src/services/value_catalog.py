@@ -0,0 +1,192 @@
+"""
+value_catalog.py
+
+Description: Per-column value -> count catalogs for the entries DataFrame, maintained from change deltas
+Usage:
+    from src.services.value_catalog import ValueCatalog
+
+    catalog = ValueCatalog()
+    catalog.reset(entries_df)
+    counts = catalog.get_counts("player")  # {"Engelchen": 12, ...}
+    catalog.remove_rows(old_rows)
+    catalog.add_rows(new_rows)
+"""
+
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+
+# Pseudo-value counted for rows with a non-empty list (e.g. validation_errors)
+HAS_ITEMS = "<Has Items>"
+
+
+def _list_item_values(items: Iterable[Any]) -> set:
+    """
+    Get the catalog values for the items of a list cell.
+
+    Args:
+        items: Items of the list (e.g. validation errors)
+
+    Returns:
+        Set of distinct values; dicts contribute their "type" entry
+    """
+    values = set()
+    for item in items:
+        if isinstance(item, dict) and "type" in item:
+            values.add(item["type"])
+        elif isinstance(item, str):
+            values.add(item)
+        else:
+            values.add(str(item))
+    return values
+
+
+def count_values(values: pd.Series) -> Counter:
+    """
+    Count the distinct values of a column.
+
+    Hashable columns are counted with value_counts. Columns holding lists
+    are flattened: each list item counts once per row, and rows with a
+    non-empty list are also counted under HAS_ITEMS. Other unhashable
+    values are counted by their string representation.
+
+    Args:
+        values: Column values
+
+    Returns:
+        Counter mapping value to number of rows
+    """
+    values = values.dropna()
+    try:
+        return Counter(values.value_counts().to_dict())
+    except TypeError:
+        pass
+
+    counts: Counter = Counter()
+    for value in values:
+        if isinstance(value, list):
+            counts.update(_list_item_values(value))
+            if value:
+                counts[HAS_ITEMS] += 1
+        elif isinstance(value, (dict, set)):
+            counts[str(value)] += 1
+        else:
+            counts[value] += 1
+    return counts
+
+
+class ValueCatalog:
+    """
+    Value -> count catalogs for the object columns of the entries DataFrame.
+
+    A column's catalog is built on first request and then kept up to date by
+    applying the rows added and removed by each change, so reading it costs
+    O(distinct values) instead of a scan over the entries.
+
+    Attributes:
+        _df (Optional[pd.DataFrame]): Entries DataFrame used to build catalogs on demand
+        _counts (Dict[str, Counter]): Catalogs built so far, by column
+        _lock (threading.Lock): Guards catalog builds and updates
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self._df: Optional[pd.DataFrame] = None
+        self._counts: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger(__name__)
+
+    def reset(self, df: pd.DataFrame) -> None:
+        """
+        Replace the catalogued data and drop all built catalogs.
+
+        Args:
+            df: Entries DataFrame
+        """
+        with self._lock:
+            self._df = df
+            self._counts = {}
+
+    def set_source(self, df: pd.DataFrame) -> None:
+        """
+        Point at the current entries DataFrame without dropping built catalogs.
+
+        Call after applying the deltas of a change that replaced the DataFrame object.
+
+        Args:
+            df: Entries DataFrame
+        """
+        with self._lock:
+            self._df = df
+
+    def add_rows(self, rows: pd.DataFrame) -> None:
+        """
+        Count rows that were added to the entries.
+
+        Args:
+            rows: Added rows
+        """
+        with self._lock:
+            for column, counts in self._counts.items():
+                if column in rows.columns:
+                    counts.update(count_values(rows[column]))
+
+    def remove_rows(self, rows: pd.DataFrame) -> None:
+        """
+        Uncount rows that are about to be removed from the entries.
+
+        Args:
+            rows: Removed rows
+        """
+        with self._lock:
+            for column, counts in self._counts.items():
+                if column in rows.columns:
+                    counts.subtract(count_values(rows[column]))
+                    for value in [value for value, count in counts.items() if count <= 0]:
+                        del counts[value]
+
+    def get_counts(self, column: str) -> Dict[Any, int]:
+        """
+        Get the value -> count catalog of a column.
+
+        Args:
+            column: Column name
+
+        Returns:
+            Dict mapping each distinct value to its number of rows (empty if the
+            column does not exist or is not an object column)
+        """
+        with self._lock:
+            counts = self._counts.get(column)
+            if counts is None:
+                counts = self._build(column)
+            return dict(counts)
+
+    def _build(self, column: str) -> Counter:
+        """
+        Build and store the catalog of a column (lock must be held).
+
+        Args:
+            column: Column name
+
+        Returns:
+            Counter for the column
+        """
+        if self._df is None or column not in self._df.columns:
+            return Counter()
+        if self._df[column].dtype != "object":
+            return Counter()
+
+        try:
+            counts = count_values(self._df[column])
+        except Exception as e:
+            self._logger.error(f"Error building value catalog for column '{column}': {e}")
+            return Counter()
+
+        self._counts[column] = counts
+        self._logger.debug(f"Built value catalog for column '{column}': {len(counts)} values")
+        return counts
@@ -0,0 +1,248 @@
+"""
+warm_up.py
+
+Description: Background loading of startup data on a thread pool, published to the store on demand
+Usage:
+    from src.services.warm_up import WarmUp, get_warm_up
+
+    warm_up = WarmUp({"correction_rules": read_rules}, publish=store_rules)
+    warm_up.start()
+    ...
+    warm_up.publish_ready()  # on the GUI thread, e.g. from a ready callback
+    warm_up.wait()  # or block until everything is published
+
+    warm_up = get_warm_up(service_factory)  # the one AppBootstrapper started, or None
+"""
+
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the reader threads; startup reads a handful of files
+DEFAULT_MAX_WORKERS = 4
+
+
+class WarmUp:
+    """
+    Runs named read tasks concurrently and publishes their results when asked.
+
+    Reading happens on worker threads; publishing (which usually updates the
+    data store and emits events) happens on the thread that calls
+    publish_ready() or wait(), so the GUI can keep the store on its own thread.
+
+    Attributes:
+        _tasks: Read task per source name
+        _publish: Callback storing a read result, returns success
+        _futures: Future per source name once started
+        _published: Source names that were published, cancelled or failed
+
+    Implementation Notes:
+        - Each result is published at most once; cancel() drops a source
+        - Ready callbacks run on the worker thread after every finished read
+        - A failing read or publish is logged and reported as False
+    """
+
+    def __init__(
+        self,
+        tasks: Mapping[str, Callable[[], Any]],
+        publish: Callable[[str, Any], bool],
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the warm-up.
+
+        Args:
+            tasks: Read task per source name
+            publish: Callback storing the result of a source, returns success
+            max_workers: Reader threads (default: one per task, at most DEFAULT_MAX_WORKERS)
+        """
+        self._tasks = dict(tasks)
+        self._publish = publish
+        self._max_workers = max_workers or min(len(self._tasks), DEFAULT_MAX_WORKERS) or 1
+        self._futures: Dict[str, concurrent.futures.Future] = {}
+        self._published: Dict[str, bool] = {}
+        self._ready_callbacks: List[Callable[[], None]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def sources(self) -> List[str]:
+        """
+        Get the names of all sources.
+
+        Returns:
+            List[str]: Source names
+        """
+        return list(self._tasks)
+
+    @property
+    def is_loading(self) -> bool:
+        """
+        Check whether any source has not been published yet.
+
+        Returns:
+            bool: True while sources are being read or wait to be published
+        """
+        return bool(self.pending)
+
+    @property
+    def pending(self) -> List[str]:
+        """
+        Get the sources that have not been published yet.
+
+        Returns:
+            List[str]: Source names
+        """
+        with self._lock:
+            return [name for name in self._tasks if name not in self._published]
+
+    def is_pending(self, name: str) -> bool:
+        """
+        Check whether a source has not been published yet.
+
+        Args:
+            name: Source name
+
+        Returns:
+            bool: True if the source is part of the warm-up and not yet published
+        """
+        with self._lock:
+            return name in self._tasks and name not in self._published
+
+    def add_ready_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback run after each read finishes.
+
+        The callback runs on the worker thread; GUI code should use it to
+        schedule publish_ready() on its own thread. Reads that finished
+        before the callback was added do not call it.
+
+        Args:
+            callback: Function without arguments
+        """
+        with self._lock:
+            self._ready_callbacks.append(callback)
+
+    def start(self) -> None:
+        """Submit all read tasks to a thread pool."""
+        with self._lock:
+            if self._futures or not self._tasks:
+                return
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="warm-up"
+            )
+            for name, task in self._tasks.items():
+                future = executor.submit(task)
+                future.add_done_callback(self._on_read_finished)
+                self._futures[name] = future
+            # Let the threads exit once the reads are done
+            executor.shutdown(wait=False)
+
+    def cancel(self, name: str) -> None:
+        """
+        Drop a source so its result is never published.
+
+        Args:
+            name: Source name
+        """
+        with self._lock:
+            if self.is_pending(name):
+                self._published[name] = False
+                future = self._futures.get(name)
+                if future is not None:
+                    future.cancel()
+
+    def publish_ready(self) -> Dict[str, bool]:
+        """
+        Publish the sources whose reads have finished.
+
+        Returns:
+            Dict[str, bool]: Success per source published by this call
+        """
+        with self._lock:
+            ready = [
+                name
+                for name in self.pending
+                if name in self._futures and self._futures[name].done()
+            ]
+            return {name: self._publish_source(name) for name in ready}
+
+    def wait(
+        self, names: Optional[Iterable[str]] = None, timeout: Optional[float] = None
+    ) -> Dict[str, bool]:
+        """
+        Wait for reads to finish and publish them.
+
+        Starts the warm-up if it has not been started.
+
+        Args:
+            names: Sources to wait for (default: all pending sources)
+            timeout: Maximum seconds to wait, None to wait until done
+
+        Returns:
+            Dict[str, bool]: Success per source published by this call
+        """
+        self.start()
+        with self._lock:
+            names = [name for name in (names or self.pending) if self.is_pending(name)]
+            futures = [self._futures[name] for name in names]
+
+        concurrent.futures.wait(futures, timeout=timeout)
+
+        with self._lock:
+            ready = [name for name in names if self.is_pending(name) and self._futures[name].done()]
+            return {name: self._publish_source(name) for name in ready}
+
+    def _publish_source(self, name: str) -> bool:
+        """
+        Publish the result of a finished read.
+
+        Args:
+            name: Source name
+
+        Returns:
+            bool: True if the result was read and published
+        """
+        self._published[name] = False
+        try:
+            result = self._futures[name].result()
+            self._published[name] = bool(self._publish(name, result))
+        except Exception as e:
+            logger.error(f"Error warming up {name}: {e}")
+        return self._published[name]
+
+    def _on_read_finished(self, future: concurrent.futures.Future) -> None:
+        """
+        Run the ready callbacks after a read finished.
+
+        Args:
+            future: Finished read
+        """
+        with self._lock:
+            callbacks = list(self._ready_callbacks)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in warm-up ready callback: {e}")
+
+
+def get_warm_up(service_factory: Any) -> Optional[WarmUp]:
+    """
+    Get the warm-up registered with a service factory.
+
+    Args:
+        service_factory: Service factory
+
+    Returns:
+        Optional[WarmUp]: The warm-up, or None if none was started
+    """
+    try:
+        warm_up = service_factory.get_service(WarmUp)
+    except ValueError:
+        return None
+    # Test doubles of the factory return mocks for any type
+    return warm_up if isinstance(warm_up, WarmUp) else None
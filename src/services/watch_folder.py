@@ -0,0 +1,327 @@
+"""
+watch_folder.py
+
+Description: Polls an input folder for new or changed export files, tracked in a manifest
+Usage:
+    from src.services.watch_folder import FolderWatcher, WatchManifest
+
+    manifest = WatchManifest("data/cache/watch_manifest.json")
+    watcher = FolderWatcher("data/input", manifest)
+    for pending in watcher.scan():
+        ...  # process pending.path
+        manifest.record(pending, entries=entry_count)
+    manifest.save()
+
+    watcher.watch(handle_files)  # poll until stopped, calling handle_files with each batch
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+from src.services.entry_writer import atomic_path
+from src.services.session_cache import file_digest
+
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the manifest layout changes; older manifests are ignored
+MANIFEST_FORMAT_VERSION = 1
+
+# Files picked up in the input folder
+DEFAULT_PATTERN = "chests_*.txt"
+
+# Seconds between polls
+DEFAULT_INTERVAL = 5.0
+
+# Seconds a file must be unmodified before it is processed, so partial writes are skipped
+DEFAULT_SETTLE_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """
+    Identity of a file's content.
+
+    Attributes:
+        mtime (float): Modification time
+        size (int): Size in bytes
+        hash (str): SHA-256 of the content
+    """
+
+    mtime: float
+    size: int
+    hash: str
+
+
+@dataclass(frozen=True)
+class PendingFile:
+    """
+    A new or changed file found by a scan.
+
+    Attributes:
+        path (Path): The file
+        fingerprint (FileFingerprint): Its content identity when scanned
+    """
+
+    path: Path
+    fingerprint: FileFingerprint
+
+
+@dataclass
+class ManifestRecord:
+    """
+    Processing state of one file.
+
+    Attributes:
+        mtime (float): Modification time when processed
+        size (int): Size in bytes when processed
+        hash (str): SHA-256 of the processed content
+        processed_at (str): When the file was processed
+        entries (int): Number of entries stored
+        error (Optional[str]): Error message if processing failed
+    """
+
+    mtime: float
+    size: int
+    hash: str
+    processed_at: str
+    entries: int = 0
+    error: Optional[str] = None
+
+
+class WatchManifest:
+    """
+    Persistent record of the files that were processed.
+
+    Attributes:
+        path (Path): JSON file of the manifest
+        _records: Record per resolved file path
+
+    Implementation Notes:
+        - A file is unchanged if its mtime and size match, without hashing it
+        - Failed files are recorded too, so they are only retried once they change
+        - Saved atomically; an unreadable manifest starts empty
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the manifest, loading it if the file exists.
+
+        Args:
+            path: JSON file of the manifest
+        """
+        self.path = Path(path)
+        self._records: Dict[str, ManifestRecord] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        """
+        Get the number of recorded files.
+
+        Returns:
+            int: Number of files
+        """
+        return len(self._records)
+
+    def get(self, path: Union[str, Path]) -> Optional[ManifestRecord]:
+        """
+        Get the record of a file.
+
+        Args:
+            path: The file
+
+        Returns:
+            Optional[ManifestRecord]: The record, or None if the file was never processed
+        """
+        return self._records.get(self._key(path))
+
+    def record(self, pending: PendingFile, entries: int = 0, error: Optional[str] = None) -> None:
+        """
+        Record a processed file.
+
+        Args:
+            pending: The file as found by the scan
+            entries: Number of entries stored
+            error: Error message if processing failed
+        """
+        with self._lock:
+            self._records[self._key(pending.path)] = ManifestRecord(
+                mtime=pending.fingerprint.mtime,
+                size=pending.fingerprint.size,
+                hash=pending.fingerprint.hash,
+                processed_at=datetime.now().isoformat(sep=" ", timespec="seconds"),
+                entries=entries,
+                error=error,
+            )
+
+    def touch(self, path: Union[str, Path], mtime: float, size: int) -> None:
+        """
+        Update the stat values of a file whose content did not change.
+
+        Args:
+            path: The file
+            mtime: New modification time
+            size: New size in bytes
+        """
+        with self._lock:
+            record = self._records.get(self._key(path))
+            if record is not None:
+                record.mtime, record.size = mtime, size
+
+    def save(self) -> bool:
+        """
+        Write the manifest.
+
+        Returns:
+            bool: True if the manifest was written, False otherwise
+        """
+        try:
+            with self._lock:
+                data = {
+                    "version": MANIFEST_FORMAT_VERSION,
+                    "files": {key: asdict(record) for key, record in self._records.items()},
+                }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_path(self.path) as temp_path:
+                temp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving watch manifest {self.path}: {e}")
+            return False
+
+    def _load(self) -> None:
+        """Read the manifest file, starting empty if it is missing or unreadable."""
+        if not self.path.is_file():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_FORMAT_VERSION:
+                logger.warning(f"Ignoring watch manifest {self.path} of another version")
+                return
+            self._records = {key: ManifestRecord(**record) for key, record in data["files"].items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable watch manifest {self.path}: {e}")
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        """
+        Get the manifest key of a file.
+
+        Args:
+            path: The file
+
+        Returns:
+            str: Resolved path
+        """
+        return str(Path(path).resolve())
+
+
+class FolderWatcher:
+    """
+    Finds new and changed files in a folder by polling.
+
+    Attributes:
+        folder (Path): Folder to watch
+        manifest (WatchManifest): Processed files
+        pattern (str): Glob pattern of the files to watch
+        interval (float): Seconds between polls
+        settle_seconds (float): Seconds a file must be unmodified before it is reported
+
+    Implementation Notes:
+        - Polling, so it works on every platform and on network shares
+        - Only files whose mtime or size differ from the manifest are hashed;
+          same content under a new mtime just updates the manifest
+        - Files are reported in name order, which is date order for chest exports
+    """
+
+    def __init__(
+        self,
+        folder: Union[str, Path],
+        manifest: WatchManifest,
+        pattern: str = DEFAULT_PATTERN,
+        interval: float = DEFAULT_INTERVAL,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            folder: Folder to watch
+            manifest: Processed files
+            pattern: Glob pattern of the files to watch
+            interval: Seconds between polls
+            settle_seconds: Seconds a file must be unmodified before it is reported
+        """
+        self.folder = Path(folder)
+        self.manifest = manifest
+        self.pattern = pattern
+        self.interval = interval
+        self.settle_seconds = settle_seconds
+
+    def scan(self) -> List[PendingFile]:
+        """
+        Find the files that are new or changed since they were processed.
+
+        Returns:
+            List[PendingFile]: Files to process, in name order
+        """
+        pending = []
+        now = time.time()
+        for path in sorted(self.folder.glob(self.pattern)):
+            try:
+                stat = path.stat()
+                if not path.is_file() or now - stat.st_mtime < self.settle_seconds:
+                    continue
+
+                record = self.manifest.get(path)
+                if record and (record.mtime, record.size) == (stat.st_mtime, stat.st_size):
+                    continue
+
+                digest = file_digest(path)
+                if record and record.hash == digest:
+                    self.manifest.touch(path, stat.st_mtime, stat.st_size)
+                    continue
+
+                pending.append(
+                    PendingFile(path, FileFingerprint(stat.st_mtime, stat.st_size, digest))
+                )
+            except OSError as e:
+                # Deleted or locked between listing and reading; retried on the next poll
+                logger.warning(f"Cannot read {path}: {e}")
+        return pending
+
+    def watch(
+        self,
+        handle: Callable[[List[PendingFile]], None],
+        stop: Optional[threading.Event] = None,
+        max_polls: Optional[int] = None,
+    ) -> None:
+        """
+        Poll the folder and hand every batch of new or changed files to a callback.
+
+        The callback is expected to record the files in the manifest.
+
+        Args:
+            handle: Called with the files found by a poll, if any
+            stop: Event ending the loop (default: run until interrupted)
+            max_polls: Number of polls after which to stop, None for no limit
+        """
+        stop = stop or threading.Event()
+        logger.info(f"Watching {self.folder / self.pattern} every {self.interval:g} s")
+        polls = 0
+        while not stop.is_set():
+            pending = self.scan()
+            if pending:
+                logger.info(f"Found {len(pending)} new or changed files")
+                handle(pending)
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            stop.wait(self.interval)
@@ -5,7 +5,7 @@ Description: Adapter to connect filter UI with filter manager and data store
 """
 
 import logging
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, Any, Optional
 
 from PySide6.QtCore import QObject, Signal
 
@@ -44,7 +44,7 @@ class FilterAdapter(QObject):
         self._data_store = data_store
         self._filter_manager = FilterManager()
         self._filter_panel: Optional[FilterPanel] = None
-        self._unique_values: Dict[str, Set[str]] = {}
+        self._unique_values: Dict[str, Dict[Any, int]] = {}
         self._config_manager: Optional[IConfigManager] = None
         self._logger = logging.getLogger("ui.filter_adapter")
 
@@ -97,6 +97,7 @@ class FilterAdapter(QObject):
         """Create and set up the text search filter."""
         # Create text filter
         search_filter = TextFilter("global_search", "Global Search")
+        search_filter.set_text_index(self._data_store.get_text_index())
         self._filter_manager.register_filter("global_search", search_filter)
 
         # Create search bar
@@ -114,7 +115,9 @@ class FilterAdapter(QObject):
             return
 
         # Apply filters
-        filtered_df = self._filter_manager.apply_filters(df)
+        filtered_df = self._filter_manager.apply_filters(
+            df, data_version=self._data_store.get_entries_version()
+        )
 
         # Emit filtered data
         result = {
@@ -207,70 +210,26 @@ class FilterAdapter(QObject):
             self.register_date_filter(column, title)
 
     def _update_filter_values(self) -> None:
-        """Update validation filter values based on the current data."""
+        """Update validation filter values from the data store's value catalogs."""
         if not self._filter_panel:
             return
 
-        df = self._data_store.get_entries()
-        if df is None or df.empty:
-            return
-
-        # Process each column for unique values
-        for column in df.columns:
-            # Skip non-string columns
-            if df[column].dtype != "object":
+        for filter_id in list(self._filter_panel.get_dropdown_filters()):
+            filter_obj = self._filter_manager.get_filter(filter_id)
+            if not isinstance(filter_obj, ValidationListFilter):
                 continue
 
+            column = filter_obj.column_name
             try:
-                # Get unique values - handle both string and non-string types
-                unique_values_array = df[column].dropna().unique()
-
-                # Convert unhashable types to strings if needed
-                unique_values = set()
-                for val in unique_values_array:
-                    if isinstance(val, (list, dict, set)):
-                        # Special handling for lists (like validation_errors)
-                        if isinstance(val, list):
-                            self._process_validation_errors_column(val, unique_values)
-                        else:
-                            # Convert complex types to string representation
-                            unique_values.add(str(val))
-                    else:
-                        unique_values.add(val)
-
-                # If we have a filter for this column, update it
-                filter_id = f"{column}_filter"
-                if self._filter_panel and filter_id in self._filter_panel.get_dropdown_filters():
-                    self._filter_panel.update_filter_values(filter_id, sorted(unique_values))
+                counts = self._data_store.get_value_counts(column)
+                values = sorted(counts, key=str)
+                self._filter_panel.update_filter_values(filter_id, values, counts)
 
                 # Store for future reference
-                self._unique_values[column] = unique_values
+                self._unique_values[column] = counts
             except Exception as e:
                 self._logger.error(f"Error processing column {column}: {e}")
 
-    def _process_validation_errors_column(
-        self, error_list: List[Any], unique_values: Set[str]
-    ) -> None:
-        """
-        Process validation errors column to extract unique error types.
-
-        Args:
-            error_list: List of validation errors
-            unique_values: Set to add unique values to
-        """
-        for item in error_list:
-            # Extract error type
-            if isinstance(item, dict) and "type" in item:
-                unique_values.add(item["type"])
-            elif isinstance(item, str):
-                unique_values.add(item)
-            else:
-                unique_values.add(str(item))
-
-        # Add special "<Has Items>" entry if there are any errors
-        if error_list and len(error_list) > 0:
-            unique_values.add("<Has Items>")
-
     def register_validation_filter(
         self, column_name: str, display_name: Optional[str] = None
     ) -> None:
@@ -328,6 +287,7 @@ class FilterAdapter(QObject):
 
         # Create filter object
         filter_obj = DateFilter(filter_id, title, column_name)
+        filter_obj.set_date_index(self._data_store.get_date_index())
 
         # Add to filter panel
         self._filter_panel.add_date_filter(filter_id, filter_obj, title)
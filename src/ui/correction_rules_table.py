@@ -38,6 +38,7 @@ from PySide6.QtWidgets import (
 from src.models.correction_rule import CorrectionRule
 from src.services.config_manager import ConfigManager
 from src.services.data_manager import DataManager
+from src.ui.helpers.search_controller import SearchController
 
 
 class CorrectionRulesModel(QSortFilterProxyModel):
@@ -79,6 +80,7 @@ class CorrectionRulesModel(QSortFilterProxyModel):
         self._rules: List[CorrectionRule] = []
         self._enabled_rules: Set[Tuple[str, str]] = set()
         self._filter_text = ""
+        self._visible_rows: Optional[Set[int]] = None
 
         # Create a dummy source model (required for QSortFilterProxyModel)
         self._source_model = QStandardItemModel(self)
@@ -469,6 +471,10 @@ class CorrectionRulesModel(QSortFilterProxyModel):
         Returns:
             Whether row should be included
         """
+        # Precomputed search result from the table's search controller
+        if self._visible_rows is not None:
+            return source_row in self._visible_rows
+
         if not self._filter_text:
             return True
 
@@ -486,6 +492,30 @@ class CorrectionRulesModel(QSortFilterProxyModel):
             or self._filter_text.lower() in rule.rule_type.lower()
         )
 
+    def set_visible_rows(self, rows: Optional[Set[int]]):
+        """
+        Replace the set of visible rows with a precomputed search result.
+
+        Args:
+            rows: Row indices to show, or None to show all rows
+        """
+        self._visible_rows = rows
+        self.invalidateFilter()
+
+    def get_search_columns(self) -> Dict[str, List[str]]:
+        """
+        Get the searchable rule fields, used to build the search cache.
+
+        Returns:
+            Dict mapping field name to the list of values in row order
+        """
+        return {
+            "from_text": [rule.from_text for rule in self._rules],
+            "to_text": [rule.to_text for rule in self._rules],
+            "category": [rule.category for rule in self._rules],
+            "rule_type": [rule.rule_type for rule in self._rules],
+        }
+
     def filter_rules(self, text: str):
         """
         Filter rules by text.
@@ -779,6 +809,15 @@ class CorrectionRulesTable(QTableView):
         # Create the model
         self._model = CorrectionRulesModel(self)
 
+        # Debounced background search over cached rule fields
+        self._search_controller = SearchController(parent=self)
+        self._search_controller.results_ready.connect(self._on_search_results)
+
+        # Rule changes shift or rewrite the rows the search result refers to
+        self._model.rowsInserted.connect(self._on_rules_changed)
+        self._model.rowsRemoved.connect(self._on_rules_changed)
+        self._model.dataChanged.connect(self._on_rules_changed)
+
         # Set up UI
         self._setup_ui()
 
@@ -1004,8 +1043,10 @@ class CorrectionRulesTable(QTableView):
         # Reset sorting
         self.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
 
-        # Reset filter
+        # Reset filter and rebuild the search cache
         self._filter_text = ""
+        self._search_controller.search_now("")
+        self._search_controller.set_columns(self._model.get_search_columns())
 
         # Update UI
         self.update()
@@ -1406,6 +1447,43 @@ class CorrectionRulesTable(QTableView):
         finally:
             self._processing_signal = False
 
+    def set_filter(self, text: str):
+        """
+        Filter rules by text as the user types.
+
+        The search is debounced and runs on a worker thread; only the result
+        for the latest text is applied to the table.
+
+        Args:
+            text: Filter text
+        """
+        self._filter_text = text
+        self._search_controller.search(text)
+
+    def _on_rules_changed(self, *args):
+        """
+        Rebuild the search cache after rules were added, removed or edited.
+
+        An active filter is searched again at once, so the visible row set
+        never refers to shifted or outdated rows.
+
+        Args:
+            *args: Arguments of the model signal (unused)
+        """
+        self._search_controller.set_columns(self._model.get_search_columns())
+        if self._filter_text:
+            self._search_controller.search_now(self._filter_text)
+
+    def _on_search_results(self, text: str, rows: Optional[Set[int]]):
+        """
+        Apply a finished search to the model in one step.
+
+        Args:
+            text: Search text the result belongs to
+            rows: Matching rule rows, or None to show all rows
+        """
+        self._model.set_visible_rows(rows)
+
     def _delayed_refresh(self):
         """Handle delayed refresh to ensure UI updates properly."""
         import logging
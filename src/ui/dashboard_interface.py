@@ -71,6 +71,8 @@ from src.ui.adapters.entry_table_adapter import EntryTableAdapter
 
 from src.services.dataframe_store import IDataStore
 from src.services.event_manager import EventType, EventManager
+from src.services.warm_up import get_warm_up
+from src.utils.startup_profiler import profile_phase
 
 
 class DashboardInterface(QWidget):
@@ -133,6 +135,9 @@ class DashboardInterface(QWidget):
             IFilterManager, self._service_factory.get_service(IFilterManager)
         )
 
+        # Saved rules and lists still being read in the background are not loaded again
+        self._warm_up = get_warm_up(self._service_factory)
+
         # Create filter adapter
         self._filter_adapter = FilterAdapter(self._data_store)
         self._filter_adapter.set_config_manager(self._config_manager)
@@ -170,8 +175,10 @@ class DashboardInterface(QWidget):
             self._logger.warning("No parent statusBar available, status_bar will be None")
 
         # Load saved rules and validation lists
-        self._load_saved_correction_rules()
-        self._load_saved_validation_lists()
+        with profile_phase("window.page.load_saved_correction_rules"):
+            self._load_saved_correction_rules()
+        with profile_phase("window.page.load_saved_validation_lists"):
+            self._load_saved_validation_lists()
 
         self._logger.info("DashboardInterface initialized")
 
@@ -368,6 +375,10 @@ class DashboardInterface(QWidget):
 
     def _load_saved_correction_rules(self):
         """Load saved correction rules."""
+        if self._warm_up is not None and self._warm_up.is_pending("correction_rules"):
+            self._logger.info("Correction rules are being loaded in the background")
+            return
+
         try:
             # Get correction rules file path from config
             correction_rules_path = self._config_manager.get_path("correction_rules_file")
@@ -443,6 +454,16 @@ class DashboardInterface(QWidget):
                 "source": source_list_file,
             }
 
+            # Lists the warm-up is still reading are published by the main window
+            if self._warm_up is not None:
+                validation_files = {
+                    list_type: file_path
+                    for list_type, file_path in validation_files.items()
+                    if not self._warm_up.is_pending(list_type)
+                }
+                if not validation_files:
+                    return
+
             # Load each validation list file if it exists
             for list_type, file_path in validation_files.items():
                 if file_path and Path(file_path).exists():
@@ -461,18 +482,14 @@ class DashboardInterface(QWidget):
         """
         Handle entries loaded signal from the file import widget.
 
+        The widget has already published the entries to the data store, whose
+        ENTRIES_UPDATED event refreshes the table adapter.
+
         Args:
             entries: List of ChestEntry objects
         """
         self._logger.debug(f"File imported event received: {len(entries)} entries")
-        # Convert entries to DataFrame and update the data store
         if entries:
-            entries_df = pd.DataFrame([entry.to_dict() for entry in entries])
-            self._data_store.set_entries(entries_df)
-
-            # Update the table view with entries
-            self._table_adapter.set_entries(entries_df)
-
             # Update statistics
             self._stats_widget.set_entries(entries)
 
@@ -1232,7 +1249,9 @@ class DashboardInterface(QWidget):
     def _on_data_filtered(self):
         """Handle when data is filtered."""
         # Update the table view with filtered data
-        filtered_df = self._filter_manager.apply_filters(self._data_store.get_entries())
+        filtered_df = self._filter_manager.apply_filters(
+            self._data_store.get_entries(), data_version=self._data_store.get_entries_version()
+        )
         self._table_view.set_entries(filtered_df.to_dict("records"))
 
         # Update statistics
@@ -1516,9 +1535,9 @@ class DashboardInterface(QWidget):
     def _on_export_data(self) -> None:
         """Handle exporting data when the export button is clicked."""
         # Get current entries from data store
-        entries = self._data_store.get_all_entries()
+        entries = self._data_store.get_entries()
 
-        if not entries:
+        if entries.empty:
             QMessageBox.warning(self, "Export Warning", "No data to export.")
             return
 
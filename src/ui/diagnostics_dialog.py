@@ -0,0 +1,191 @@
+"""
+diagnostics_dialog.py
+
+Description: Hidden dialog showing the hot path metrics recorded in this session
+Usage:
+    from src.ui.diagnostics_dialog import DiagnosticsDialog
+    dialog = DiagnosticsDialog(parent)
+    dialog.show()  # opened from the main window with Ctrl+Shift+D
+"""
+
+from typing import Any, Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from src.utils.metrics import histogram_rows, metrics
+
+
+# Columns of the table and the row keys they show
+COLUMNS = [
+    ("Metric", "name"),
+    ("Count", "count"),
+    ("Total", "total"),
+    ("Mean", "mean"),
+    ("p50", "p50"),
+    ("p90", "p90"),
+    ("p99", "p99"),
+    ("Max", "max"),
+]
+
+# Milliseconds between table refreshes while the dialog is open
+REFRESH_INTERVAL_MS = 1000
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Dialog listing counters and timings from the metrics registry.
+
+    Attributes:
+        _record_checkbox: Turns recording on and off
+        _table: One row per metric, slowest total first
+        _timer: Refreshes the table while the dialog is visible
+
+    Implementation Notes:
+        - Not reachable from the sidebar; opened with a shortcut for support sessions
+        - Recording can be switched on here without restarting with --metrics
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize the dialog.
+
+        Args:
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(900, 500)
+
+        layout = QVBoxLayout(self)
+
+        self._record_checkbox = QCheckBox("Record metrics")
+        self._record_checkbox.setChecked(metrics.enabled)
+        self._record_checkbox.toggled.connect(self._on_record_toggled)
+        self._status_label = QLabel()
+        header = QHBoxLayout()
+        header.addWidget(self._record_checkbox)
+        header.addStretch()
+        header.addWidget(self._status_label)
+        layout.addLayout(header)
+
+        self._table = QTableWidget(0, len(COLUMNS))
+        self._table.setHorizontalHeaderLabels([label for label, _ in COLUMNS])
+        self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self._table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        layout.addWidget(self._table)
+
+        buttons = QHBoxLayout()
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self._on_reset)
+        save_button = QPushButton("Save JSON...")
+        save_button.clicked.connect(self._on_save)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(reset_button)
+        buttons.addWidget(save_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+
+        self.refresh()
+
+    def showEvent(self, event) -> None:
+        """Refresh periodically while the dialog is shown."""
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event) -> None:
+        """Stop refreshing while the dialog is hidden."""
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self) -> None:
+        """Fill the table from the current metrics."""
+        snapshot = metrics.snapshot()
+        rows = histogram_rows(snapshot)
+
+        self._table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            unit = row.get("unit", "")
+            for column, (_, key) in enumerate(COLUMNS):
+                value = row.get(key)
+                item = QTableWidgetItem(self._format(value, unit if column > 1 else ""))
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self._table.setItem(row_index, column, item)
+
+        state = "recording" if snapshot["enabled"] else "not recording"
+        since = f" since {snapshot['started']}" if snapshot["started"] else ""
+        self._status_label.setText(f"{len(rows)} metrics, {state}{since}")
+
+    @staticmethod
+    def _format(value: Any, unit: str) -> str:
+        """
+        Format a cell value.
+
+        Args:
+            value: Value to show
+            unit: Unit appended to numbers
+
+        Returns:
+            str: Cell text
+        """
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            return f"{value:,.2f} {unit}".strip()
+        if isinstance(value, int):
+            return f"{value:,}"
+        return str(value)
+
+    def _on_record_toggled(self, checked: bool) -> None:
+        """
+        Turn recording on or off.
+
+        Args:
+            checked: Whether to record
+        """
+        if checked:
+            metrics.enable()
+        else:
+            metrics.disable()
+        self.refresh()
+
+    def _on_reset(self) -> None:
+        """Remove all recorded metrics."""
+        metrics.reset()
+        self.refresh()
+
+    def _on_save(self, file_path: Optional[str] = None) -> None:
+        """
+        Write the metrics to a JSON file.
+
+        Args:
+            file_path: Target file; asked from the user if not given
+        """
+        if not file_path:
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Save Metrics", "metrics.json", "JSON Files (*.json)"
+            )
+            if not file_path:
+                return
+        saved = metrics.dump(file_path)
+        self._status_label.setText(f"Saved to {saved}")
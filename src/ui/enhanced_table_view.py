@@ -37,6 +37,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.models.chest_entry import ChestEntry
+from src.ui.helpers.search_controller import RowSetFilterProxyModel, SearchController
 
 
 class ChestEntryTableModel(QAbstractTableModel):
@@ -128,6 +129,25 @@ class ChestEntryTableModel(QAbstractTableModel):
         # Otherwise treat as object with attributes
         return getattr(entry, key, default)
 
+    def get_search_columns(self) -> Dict[str, List[Any]]:
+        """
+        Get the displayed values of every column, used to build the search cache.
+
+        Returns:
+            Dict mapping column key to the list of values in row order
+        """
+        columns = {}
+        for column in self._columns:
+            key = column["key"]
+            if key == "id":
+                ids = [self._get_value(entry, "id", None) for entry in self._entries]
+                columns[key] = [row if entry_id is None else entry_id for row, entry_id in enumerate(ids)]
+            elif key == "status":
+                columns[key] = [self._get_value(entry, "status", "Pending") for entry in self._entries]
+            else:
+                columns[key] = [self._get_value(entry, key) for entry in self._entries]
+        return columns
+
     def data(self, index, role=Qt.DisplayRole):
         """
         Return data for the given role at the given index.
@@ -589,6 +609,10 @@ class EnhancedTableView(QTableView):
         self._test_mode = test_mode
         self._signal_history = {"entry_selected": [], "entry_edited": []}
 
+        # Debounced background search over cached column values
+        self._search_controller = SearchController(parent=self)
+        self._search_controller.results_ready.connect(self._on_search_results)
+
         # Set up the view
         self._setup_view()
 
@@ -689,7 +713,7 @@ class EnhancedTableView(QTableView):
 
             # Initialize with empty model
             model = ChestEntryTableModel([])
-            self._proxy_model = QSortFilterProxyModel()
+            self._proxy_model = RowSetFilterProxyModel()
             self._proxy_model.setSourceModel(model)
             self._proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
             self._proxy_model.setFilterKeyColumn(-1)  # Filter on all columns
@@ -1144,13 +1168,17 @@ class EnhancedTableView(QTableView):
 
             # Update or create proxy model
             if not hasattr(self, "_proxy_model") or self._proxy_model is None:
-                self._proxy_model = QSortFilterProxyModel()
+                self._proxy_model = RowSetFilterProxyModel()
                 self._proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
                 self._proxy_model.setFilterKeyColumn(-1)  # Filter on all columns
                 self.setModel(self._proxy_model)
 
             # Set the source model for the proxy
             self._proxy_model.setSourceModel(model)
+            model.dataChanged.connect(self._on_model_data_changed)
+
+            # Rebuild the search cache; an active search is re-run on the new rows
+            self._search_controller.set_columns(model.get_search_columns())
 
             # Ensure selection signals are connected
             if self.selectionModel():
@@ -1172,13 +1200,51 @@ class EnhancedTableView(QTableView):
 
     def filter_entries(self, text):
         """
-        Filter entries by text.
+        Filter entries by text immediately.
 
         Args:
             text: Text to filter by
         """
-        if self._proxy_model:
-            self._proxy_model.setFilterFixedString(text)
+        self._search_controller.search_now(text)
+
+    def set_filter(self, text):
+        """
+        Filter entries by text as the user types.
+
+        The search is debounced and runs on a worker thread; only the result
+        for the latest text is applied to the view.
+
+        Args:
+            text: Text to filter by
+        """
+        self._search_controller.search(text)
+
+    def _on_model_data_changed(self, *args):
+        """
+        Rebuild the search cache after a cell was edited in place.
+
+        An active search is run again at once, so it matches the new values.
+
+        Args:
+            *args: Arguments of the dataChanged signal (unused)
+        """
+        model = self._proxy_model.sourceModel() if self._proxy_model is not None else None
+        if not isinstance(model, ChestEntryTableModel):
+            return
+        self._search_controller.set_columns(model.get_search_columns())
+        if self._search_controller.current_text:
+            self._search_controller.search_now(self._search_controller.current_text)
+
+    def _on_search_results(self, text, rows):
+        """
+        Apply a finished search to the proxy model in one step.
+
+        Args:
+            text: Search text the result belongs to
+            rows: Matching source rows, or None to show all rows
+        """
+        if isinstance(self._proxy_model, RowSetFilterProxyModel):
+            self._proxy_model.set_visible_rows(rows)
 
     def get_selected_row(self):
         """
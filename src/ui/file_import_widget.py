@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QVBoxLayout,
     QWidget,
@@ -27,10 +28,17 @@ from PySide6.QtWidgets import (
 
 from src.models.chest_entry import ChestEntry
 from src.models.correction_rule import CorrectionRule
-from src.services.config_manager import ConfigManager
+from src.interfaces.i_config_manager import IConfigManager
+from src.interfaces.i_data_store import IDataStore
 from src.services.file_parser import FileParser
 from src.services.service_factory import ServiceFactory
-from src.services.i_config_manager import IConfigManager
+from src.ui.helpers.import_worker import (
+    STAGE_READING,
+    ImportController,
+    ImportOutcome,
+    ImportProgress,
+    correction_stage,
+)
 
 
 class FileImportWidget(QWidget):
@@ -55,6 +63,9 @@ class FileImportWidget(QWidget):
         - Corrections can be applied automatically when entries are loaded
         - Supports file format selection
         - Provides visual feedback for loading status
+        - Parsing and correction run on a worker thread (ImportController); the
+          result is published to the data store in one step on the GUI thread
+        - A running import can be cancelled; nothing is published then
     """
 
     # Signals
@@ -102,6 +113,13 @@ class FileImportWidget(QWidget):
             "last_correction_directory", fallback=Path.home()
         )
         self._processing_signal = False
+        self._auto_loading = False
+
+        # Background import of entries and correction rules
+        self._entry_import = ImportController(self)
+        self._rules_import = ImportController(self)
+        self._pending_import_path = ""
+        self._pending_rules_path = ""
 
         # Set up UI
         self._setup_ui()
@@ -220,6 +238,20 @@ class FileImportWidget(QWidget):
         status_layout.addWidget(self._entries_status_label, 1)
 
         entries_layout.addLayout(status_layout)
+
+        # Progress of a running import
+        progress_layout = QHBoxLayout()
+        self._import_progress_bar = QProgressBar()
+        self._import_progress_bar.setRange(0, 100)
+        self._import_progress_bar.setVisible(False)
+        progress_layout.addWidget(self._import_progress_bar, 1)
+
+        self._cancel_import_button = QPushButton("Cancel")
+        self._cancel_import_button.setToolTip("Cancel the running import")
+        self._cancel_import_button.setVisible(False)
+        progress_layout.addWidget(self._cancel_import_button)
+
+        entries_layout.addLayout(progress_layout)
         main_layout.addLayout(entries_layout)
 
         # Separator line
@@ -276,6 +308,13 @@ class FileImportWidget(QWidget):
         """Connect signals to slots."""
         self._import_entries_button.clicked.connect(self.import_entries)
         self._import_corrections_button.clicked.connect(self.import_corrections)
+        self._cancel_import_button.clicked.connect(self.cancel_import)
+        self._entry_import.progress.connect(self._on_import_progress)
+        self._entry_import.finished.connect(self._on_entries_imported)
+        self._entry_import.failed.connect(self._on_import_failed)
+        self._entry_import.cancelled.connect(self._on_import_cancelled)
+        self._rules_import.finished.connect(self._on_rules_imported)
+        self._rules_import.failed.connect(self._on_rules_import_failed)
         self._corrections_checkbox.toggled.connect(self._on_corrections_toggled)
         self._entry_format_combo.currentIndexChanged.connect(self._on_entry_format_changed)
         self._correction_format_combo.currentIndexChanged.connect(
@@ -490,11 +529,11 @@ class FileImportWidget(QWidget):
     def set_test_mode(self, enabled=True):
         """
         Enable test mode for headless testing.
-        
-        In test mode, the widget bypasses file dialogs and uses the paths set with 
+
+        In test mode, the widget bypasses file dialogs and uses the paths set with
         set_test_entries_file() and set_test_corrections_file() instead. This allows
         for automated testing in environments where user interaction is not possible.
-        
+
         Args:
             enabled (bool): Whether to enable test mode
         """
@@ -503,11 +542,11 @@ class FileImportWidget(QWidget):
     def set_test_entries_file(self, file_path):
         """
         Set a test file path for entries import.
-        
+
         When in test mode, this file path will be used instead of showing a file dialog
         when import_entries() is called. This allows for automated testing of the import
         functionality without requiring user interaction.
-        
+
         Args:
             file_path (str): Path to the test entries file
         """
@@ -516,11 +555,11 @@ class FileImportWidget(QWidget):
     def set_test_corrections_file(self, file_path):
         """
         Set a test file path for corrections import.
-        
+
         When in test mode, this file path will be used instead of showing a file dialog
         when import_corrections() is called. This allows for automated testing of the import
         functionality without requiring user interaction.
-        
+
         Args:
             file_path (str): Path to the test corrections file
         """
@@ -554,26 +593,141 @@ class FileImportWidget(QWidget):
                     "last_entries_directory", str(Path(file_path).parent)
                 )
                 self._config.set_last_used_path("last_entries_file", file_path)
+                self.start_entry_import(file_path)
+        except Exception as e:
+            self._show_status_message(f"Error importing entries: {str(e)}", "error")
+
+    def start_entry_import(self, file_path: str):
+        """
+        Start importing entries on the worker thread.
+
+        Corrections are applied on the worker as well when they are enabled
+        and rules are loaded.
+
+        Args:
+            file_path: Path of the entries file
+        """
+        stages = []
+        if self._corrections_enabled and self._correction_rules:
+            stages.append(correction_stage(list(self._correction_rules)))
+
+        self._pending_import_path = str(file_path)
+        self._import_progress_bar.setValue(0)
+        self._import_progress_bar.setFormat("Reading... %p%")
+        self._import_progress_bar.setVisible(True)
+        self._cancel_import_button.setVisible(True)
+        self._import_entries_button.setEnabled(False)
+        self._show_status_message(f"Importing entries from {file_path}...")
+
+        self._entry_import.start(self._pending_import_path, stages)
+
+    @Slot()
+    def cancel_import(self):
+        """Cancel the running entry import."""
+        self._entry_import.cancel()
+
+    def wait_for_import(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the import threads are idle.
+
+        Args:
+            timeout_ms: Maximum time to wait (-1 waits forever)
+
+        Returns:
+            True if all imports finished, False on timeout
+        """
+        return self._entry_import.wait_for_done(timeout_ms) and self._rules_import.wait_for_done(
+            timeout_ms
+        )
+
+    @Slot(object)
+    def _on_import_progress(self, progress: ImportProgress):
+        """
+        Show the progress of the running import.
+
+        Args:
+            progress: Progress snapshot
+        """
+        if progress.stage == STAGE_READING:
+            self._import_progress_bar.setValue(progress.percent)
+            self._import_progress_bar.setFormat(
+                f"Reading... %p% ({progress.entries_parsed} entries)"
+            )
+        else:
+            self._import_progress_bar.setValue(100)
+            self._import_progress_bar.setFormat(f"{progress.stage.capitalize()}...")
+
+    def _end_import(self):
+        """Hide the progress controls of the entry import."""
+        self._import_progress_bar.setVisible(False)
+        self._cancel_import_button.setVisible(False)
+        self._import_entries_button.setEnabled(True)
+
+    @Slot(object)
+    def _on_entries_imported(self, outcome: ImportOutcome):
+        """
+        Publish a finished entry import.
 
-                # Load entries using the correct FileParser method
-                entries = self._file_parser.parse_file(file_path)
+        The entries go to the data store with a single set_entries call, so
+        views and services see either the old or the complete new data.
 
-                if entries:
-                    self.set_entries(entries)
+        Args:
+            outcome: Import outcome from the worker
+        """
+        self._end_import()
+        file_path = self._pending_import_path
+        entries = outcome.entries
 
-                    # Show status message
-                    self._show_status_message(f"Loaded {len(entries)} entries from {file_path}")
+        if not entries:
+            self._show_status_message("No entries found in the file", "warning")
+            return
 
-                    # Apply corrections if enabled
-                    if self._corrections_enabled and self._correction_rules:
-                        self._apply_corrections()
+        data_store = self._get_data_store()
+        if data_store is not None and not data_store.set_entries(
+            outcome.entries_df, source=file_path
+        ):
+            self._show_status_message("Error publishing imported entries", "error")
+            return
 
-                    # Emit signal with file path and count
-                    self.file_loaded.emit(file_path, len(entries))
-                else:
-                    self._show_status_message("No entries found in the file", "warning")
+        self._entries = entries
+        self._entries_status_label.setText(f"{len(entries)} entries loaded")
+        self._entries_status_label.setStyleSheet("color: #007700;")
+        self.entries_loaded.emit(entries)
+        if self._corrections_enabled and self._correction_rules:
+            self.corrections_applied.emit(entries)
+
+        self._show_status_message(f"Loaded {len(entries)} entries from {file_path}")
+        self.file_loaded.emit(file_path, len(entries))
+
+    @Slot(str)
+    def _on_import_failed(self, message: str):
+        """
+        Report a failed entry import.
+
+        Args:
+            message: Error message
+        """
+        self._end_import()
+        self._show_status_message(f"Error importing entries: {message}", "error")
+
+    @Slot()
+    def _on_import_cancelled(self):
+        """Report a cancelled entry import."""
+        self._end_import()
+        self._show_status_message("Import cancelled", "warning")
+
+    def _get_data_store(self) -> Optional[IDataStore]:
+        """
+        Get the data store imported entries are published to.
+
+        Returns:
+            Data store, or None if none is registered
+        """
+        try:
+            return self._service_factory.get_service(IDataStore)
         except Exception as e:
-            self._show_status_message(f"Error importing entries: {str(e)}", "error")
+            self.logger.warning(f"No data store available for imported entries: {e}")
+            return None
 
     @Slot()
     def import_corrections(self):
@@ -604,24 +758,45 @@ class FileImportWidget(QWidget):
                 )
                 self._config.set_last_used_path("last_correction_file", file_path)
 
-                # Load correction rules using the correct FileParser method
-                rules = self._file_parser.parse_correction_file(file_path)
+                # Parse the rules on the worker thread
+                self._pending_rules_path = file_path
+                self._import_corrections_button.setEnabled(False)
+                self._show_status_message(f"Importing correction rules from {file_path}...")
+                parser = self._file_parser
+                self._rules_import.start_job(
+                    lambda context: parser.parse_correction_file(file_path)
+                )
+        except Exception as e:
+            self._show_status_message(f"Error importing correction rules: {str(e)}", "error")
 
-                if rules:
-                    self.set_correction_rules(rules)
+    @Slot(object)
+    def _on_rules_imported(self, rules: List[CorrectionRule]):
+        """
+        Apply correction rules parsed on the worker thread.
 
-                    # Show status message
-                    self._show_status_message(
-                        f"Loaded {len(rules)} correction rules from {file_path}"
-                    )
+        Args:
+            rules: Parsed correction rules
+        """
+        self._import_corrections_button.setEnabled(True)
+        file_path = self._pending_rules_path
+        if rules:
+            self.set_correction_rules(rules)
 
-                    # Apply corrections if enabled
-                    if self._corrections_enabled and self._entries:
-                        self._apply_corrections()
-                else:
-                    self._show_status_message("No correction rules found in the file", "warning")
-        except Exception as e:
-            self._show_status_message(f"Error importing correction rules: {str(e)}", "error")
+            # Show status message
+            self._show_status_message(f"Loaded {len(rules)} correction rules from {file_path}")
+        else:
+            self._show_status_message("No correction rules found in the file", "warning")
+
+    @Slot(str)
+    def _on_rules_import_failed(self, message: str):
+        """
+        Report a failed correction rule import.
+
+        Args:
+            message: Error message
+        """
+        self._import_corrections_button.setEnabled(True)
+        self._show_status_message(f"Error importing correction rules: {message}", "error")
 
     @Slot()
     def _on_corrections_toggled(self, enabled: bool):
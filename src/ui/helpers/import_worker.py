@@ -0,0 +1,496 @@
+"""
+import_worker.py
+
+Description: Cancellable background import of chest export files with staged progress reporting
+Usage:
+    controller = ImportController(parent=widget)
+    controller.progress.connect(widget.on_import_progress)
+    controller.finished.connect(widget.on_import_finished)
+    controller.start(["data/input/chests_2025-03-17.txt"], stages=[("correcting", correct)])
+    cancel_button.clicked.connect(controller.cancel)
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from src.models.chest_entry import ChestEntry
+from src.models.correction_rule import CorrectionRule
+from src.services.bulk_import import DATE_COLUMN, FileImportResult, PathSpec, resolve_entry_paths
+from src.services.corrector import Corrector
+from src.services.entry_reader import ChestEntrySink, DataFrameSink, iter_entry_chunks
+from src.services.file_parser import FileParser
+
+
+logger = logging.getLogger(__name__)
+
+# Stage names reported through ImportProgress.stage
+STAGE_READING = "reading"
+STAGE_CORRECTING = "correcting"
+STAGE_VALIDATING = "validating"
+
+
+class ImportCancelledError(Exception):
+    """Raised inside the worker when the import was cancelled."""
+
+
+@dataclass
+class ImportProgress:
+    """
+    Progress of a running import.
+
+    Attributes:
+        stage (str): Current stage (STAGE_READING or a custom stage name)
+        bytes_read (int): Bytes read so far over all files
+        total_bytes (int): Total size of all files
+        entries_parsed (int): Entries parsed so far
+        file_path (str): File being read, if any
+    """
+
+    stage: str
+    bytes_read: int = 0
+    total_bytes: int = 0
+    entries_parsed: int = 0
+    file_path: str = ""
+
+    @property
+    def percent(self) -> int:
+        """
+        Get the share of bytes read.
+
+        Returns:
+            Percentage between 0 and 100
+        """
+        if self.total_bytes <= 0:
+            return 100
+        return min(100, self.bytes_read * 100 // self.total_bytes)
+
+
+@dataclass
+class ImportOutcome:
+    """
+    Result of a finished import, handed to the GUI thread for publishing.
+
+    Attributes:
+        entries_df (pd.DataFrame): Entries in DataFrameStore layout, with a "date" column
+        entries (List[ChestEntry]): The same entries as objects, in the same order
+        results (List[FileImportResult]): One result per file
+    """
+
+    entries_df: pd.DataFrame
+    entries: List[ChestEntry] = field(default_factory=list)
+    results: List[FileImportResult] = field(default_factory=list)
+
+
+class ImportContext:
+    """
+    Handle passed to import stages for progress reporting and cancellation checks.
+
+    Attributes:
+        _cancel_event (threading.Event): Set when the import is cancelled
+        _report (Callable[[ImportProgress], None]): Delivers progress to the controller
+        progress (ImportProgress): Latest progress snapshot
+    """
+
+    def __init__(self, cancel_event: threading.Event, report: Callable[[ImportProgress], None]):
+        """
+        Initialize the context.
+
+        Args:
+            cancel_event: Event that is set when the import is cancelled
+            report: Called with a copy of every progress update
+        """
+        self._cancel_event = cancel_event
+        self._report = report
+        self.progress = ImportProgress(stage=STAGE_READING)
+
+    def check_cancelled(self) -> None:
+        """
+        Abort the import if it was cancelled.
+
+        Raises:
+            ImportCancelledError: If the cancel event is set
+        """
+        if self._cancel_event.is_set():
+            raise ImportCancelledError()
+
+    def report(self, **changes) -> None:
+        """
+        Update the progress snapshot and deliver a copy of it.
+
+        Args:
+            **changes: ImportProgress fields to change
+        """
+        for name, value in changes.items():
+            setattr(self.progress, name, value)
+        self._report(ImportProgress(**vars(self.progress)))
+
+
+# A named step run on the worker after reading, e.g. ("correcting", apply_rules)
+ImportStage = Tuple[str, Callable[[ImportOutcome, ImportContext], None]]
+
+
+def read_entry_files(paths: PathSpec, context: ImportContext) -> ImportOutcome:
+    """
+    Read chest export files into one DataFrame and matching ChestEntry objects.
+
+    Each file is streamed block by block; every block updates bytes_read and
+    is a cancellation point. Rows carry the date from their file name.
+
+    Args:
+        paths: Files, directories or glob patterns (see resolve_entry_paths)
+        context: Progress and cancellation handle
+
+    Returns:
+        Import outcome
+
+    Raises:
+        ImportCancelledError: If the import was cancelled
+    """
+    files = resolve_entry_paths(paths)
+    parser = FileParser()
+    frame_sink = DataFrameSink()
+    entry_sink = ChestEntrySink()
+    results: List[FileImportResult] = []
+    dates: List[Optional[str]] = []
+
+    context.report(stage=STAGE_READING, total_bytes=sum(path.stat().st_size for path in files))
+
+    def on_block(size: int) -> None:
+        context.check_cancelled()
+        context.report(bytes_read=context.progress.bytes_read + size)
+
+    for path in files:
+        result = FileImportResult(path=str(path), date=parser.extract_date_from_filename(path))
+        results.append(result)
+        context.report(file_path=str(path))
+        try:
+            for chunk in iter_entry_chunks(path, on_block=on_block):
+                frame_sink.add_chunk(chunk)
+                entry_sink.add_chunk(chunk)
+                result.entry_count += len(chunk["chest_type"])
+                context.report(
+                    entries_parsed=context.progress.entries_parsed + len(chunk["player"])
+                )
+        except ImportCancelledError:
+            raise
+        except Exception as e:
+            result.error = str(e)
+            logger.error(f"Error importing {path}: {e}")
+            continue
+        dates.extend([result.date] * result.entry_count)
+
+    entries_df = frame_sink.result()
+    entries = entry_sink.result()
+    if any(not result.ok for result in results):
+        # Drop rows of files that failed part-way so the frame matches the dates
+        ok_counts = [result.entry_count if result.ok else 0 for result in results]
+        entries_df, entries = _keep_ok_rows(entries_df, entries, results, ok_counts)
+    entries_df[DATE_COLUMN] = dates
+    return ImportOutcome(entries_df=entries_df, entries=entries, results=results)
+
+
+def _keep_ok_rows(
+    entries_df: pd.DataFrame,
+    entries: List[ChestEntry],
+    results: List[FileImportResult],
+    ok_counts: List[int],
+) -> Tuple[pd.DataFrame, List[ChestEntry]]:
+    """
+    Remove the rows of failed files from the merged entries.
+
+    Args:
+        entries_df: Merged entries
+        entries: Merged entry objects
+        results: File results in merge order
+        ok_counts: Rows to keep per file (0 for failed files)
+
+    Returns:
+        Tuple of the filtered DataFrame and entry list
+    """
+    keep: List[int] = []
+    start = 0
+    for result, count in zip(results, ok_counts):
+        if count:
+            keep.extend(range(start, start + count))
+        start += result.entry_count
+    return entries_df.iloc[keep].copy(), [entries[i] for i in keep]
+
+
+def correction_stage(rules: List[CorrectionRule]) -> ImportStage:
+    """
+    Build a stage that applies correction rules to the imported entries.
+
+    The corrected values are written back to the DataFrame, and the values
+    before correction are kept in its original_* columns.
+
+    Args:
+        rules: Correction rules to apply
+
+    Returns:
+        Stage named STAGE_CORRECTING
+    """
+
+    def apply(outcome: ImportOutcome, context: ImportContext) -> None:
+        Corrector(rules).apply_corrections(outcome.entries)
+        context.check_cancelled()
+        for field_name in ("chest_type", "player", "source"):
+            outcome.entries_df[field_name] = [
+                getattr(entry, field_name) for entry in outcome.entries
+            ]
+        outcome.entries_df["original_values"] = [
+            dict(entry.original_values) for entry in outcome.entries
+        ]
+
+    return STAGE_CORRECTING, apply
+
+
+# Work run on the import thread; its return value is delivered by ImportController.finished
+ImportJob = Callable[[ImportContext], object]
+
+
+def entry_import_job(paths: PathSpec, stages: Sequence[ImportStage] = ()) -> ImportJob:
+    """
+    Build a job that reads entry files and then runs the given stages.
+
+    Args:
+        paths: Files, directories or glob patterns (see resolve_entry_paths)
+        stages: Named steps run after reading, in order
+
+    Returns:
+        Job returning an ImportOutcome
+    """
+    stages = list(stages)
+
+    def run(context: ImportContext) -> ImportOutcome:
+        outcome = read_entry_files(paths, context)
+        for stage, run_stage in stages:
+            context.check_cancelled()
+            context.report(stage=stage)
+            run_stage(outcome, context)
+        return outcome
+
+    return run
+
+
+class _ImportSignals(QObject):
+    """
+    Signals emitted by an import task.
+
+    QRunnable is not a QObject, so the task owns one of these to report back
+    to the controller. The connections are queued, so the slots run on the GUI thread.
+    """
+
+    progress = Signal(int, object)  # generation, ImportProgress
+    finished = Signal(int, object)  # generation, job result
+    failed = Signal(int, str)  # generation, error message
+    cancelled = Signal(int)  # generation
+
+
+class _ImportTask(QRunnable):
+    """
+    Worker that runs an import job.
+
+    Attributes:
+        _generation (int): Generation counter value when the task was started
+        _job (ImportJob): Job to run
+        _cancel_event (threading.Event): Set when the import is cancelled
+        signals (_ImportSignals): Signal holder used to deliver progress and the result
+    """
+
+    def __init__(self, generation: int, job: ImportJob, cancel_event: threading.Event):
+        """
+        Initialize the import task.
+
+        Args:
+            generation: Generation counter value for this import
+            job: Job to run
+            cancel_event: Event that is set when the import is cancelled
+        """
+        super().__init__()
+        self._generation = generation
+        self._job = job
+        self._cancel_event = cancel_event
+        self.signals = _ImportSignals()
+
+    def run(self) -> None:
+        """Run the job and deliver its result, the error or the cancellation."""
+        context = ImportContext(
+            self._cancel_event,
+            lambda progress: self.signals.progress.emit(self._generation, progress),
+        )
+        try:
+            result = self._job(context)
+            context.check_cancelled()
+        except ImportCancelledError:
+            self.signals.cancelled.emit(self._generation)
+            return
+        except Exception as e:
+            logger.error(f"Error running import: {e}")
+            self.signals.failed.emit(self._generation, str(e))
+            return
+
+        self.signals.finished.emit(self._generation, result)
+
+
+class ImportController(QObject):
+    """
+    Runs one import at a time on a worker thread.
+
+    Parsing and the import stages (correction, validation) run off the GUI
+    thread. The outcome is delivered on the GUI thread so the caller can
+    publish it to the data store in one step; nothing is published for a
+    cancelled or failed import.
+
+    Signals:
+        progress (object): ImportProgress, at least once per block read
+        finished (object): Result of a completed job (ImportOutcome for start())
+        failed (str): Error message
+        cancelled (): Emitted once the worker has stopped after cancel()
+
+    Attributes:
+        _pool (QThreadPool): Single-thread pool running the import task
+        _generation (int): Incremented for every start and cancel
+        _cancel_event (Optional[threading.Event]): Cancel token of the running import
+
+    Implementation Notes:
+        - Starting a new import cancels the running one
+        - Signals from superseded imports are dropped by comparing generations
+    """
+
+    progress = Signal(object)
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the import controller.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._generation = 0
+        self._cancel_event: Optional[threading.Event] = None
+
+    def is_running(self) -> bool:
+        """
+        Check whether an import is in progress.
+
+        Returns:
+            True if an import was started and has not finished, failed or been cancelled
+        """
+        return self._cancel_event is not None
+
+    def start(self, paths: PathSpec, stages: Sequence[ImportStage] = ()) -> None:
+        """
+        Start importing entry files on the worker thread.
+
+        Args:
+            paths: Files, directories or glob patterns (see resolve_entry_paths)
+            stages: Named steps run on the worker after reading, in order
+        """
+        self.start_job(entry_import_job(paths, stages))
+
+    def start_job(self, job: ImportJob) -> None:
+        """
+        Start any import job on the worker thread.
+
+        Args:
+            job: Callable taking an ImportContext; its return value is emitted by finished
+        """
+        self._supersede()
+        self._cancel_event = threading.Event()
+        task = _ImportTask(self._generation, job, self._cancel_event)
+        task.signals.progress.connect(self._on_task_progress)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        task.signals.cancelled.connect(self._on_task_cancelled)
+        self._pool.start(task)
+
+    def cancel(self) -> None:
+        """Ask the running import to stop at its next block or stage boundary."""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the worker thread is idle.
+
+        Results are still delivered through the event loop afterwards.
+
+        Args:
+            timeout_ms: Maximum time to wait (-1 waits forever)
+
+        Returns:
+            True if all tasks finished, False on timeout
+        """
+        return self._pool.waitForDone(timeout_ms)
+
+    def _supersede(self) -> None:
+        """Cancel the running import and drop everything it still delivers."""
+        self._generation += 1
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    @Slot(int, object)
+    def _on_task_progress(self, generation: int, progress: ImportProgress) -> None:
+        """
+        Forward progress of the current import.
+
+        Args:
+            generation: Generation the task was started with
+            progress: Progress snapshot
+        """
+        if generation == self._generation:
+            self.progress.emit(progress)
+
+    @Slot(int, object)
+    def _on_task_finished(self, generation: int, outcome: object) -> None:
+        """
+        Publish the result of the current import.
+
+        Args:
+            generation: Generation the task was started with
+            outcome: Job result
+        """
+        if generation != self._generation:
+            logger.debug("Dropping result of a superseded import")
+            return
+        self._cancel_event = None
+        self.finished.emit(outcome)
+
+    @Slot(int, str)
+    def _on_task_failed(self, generation: int, message: str) -> None:
+        """
+        Report a failed import.
+
+        Args:
+            generation: Generation the task was started with
+            message: Error message
+        """
+        if generation == self._generation:
+            self._cancel_event = None
+            self.failed.emit(message)
+
+    @Slot(int)
+    def _on_task_cancelled(self, generation: int) -> None:
+        """
+        Report a cancelled import.
+
+        Args:
+            generation: Generation the task was started with
+        """
+        if generation == self._generation:
+            self._cancel_event = None
+            self.cancelled.emit()
@@ -0,0 +1,398 @@
+"""
+search_controller.py
+
+Description: Debounced, cancellable search-as-you-type for the entry and rule tables
+Usage:
+    controller = SearchController(parent=table_view)
+    controller.set_columns({"player": players, "source": sources})
+    controller.results_ready.connect(proxy_model.apply_search_result)
+    line_edit.textChanged.connect(controller.search)
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of rows scanned between two cancellation checks in the worker
+_CANCEL_CHECK_INTERVAL = 2048
+
+
+class _SearchSignals(QObject):
+    """
+    Signals emitted by a search task.
+
+    QRunnable is not a QObject, so the task owns one of these to report back
+    to the controller. The connection is queued, so the slot runs on the GUI thread.
+    """
+
+    finished = Signal(int, str, object)  # generation, text, matching rows (set of row indices)
+
+
+class _SearchTask(QRunnable):
+    """
+    Worker that matches a search text against a snapshot of cached lowercase columns.
+
+    Attributes:
+        _generation (int): Generation counter value when the task was started
+        _text (str): Original search text
+        _columns (List[List[str]]): Snapshot of the lowercase column values
+        _cancel_event (threading.Event): Set when a newer search supersedes this one
+        signals (_SearchSignals): Signal holder used to deliver the result
+    """
+
+    def __init__(
+        self,
+        generation: int,
+        text: str,
+        columns: List[List[str]],
+        cancel_event: threading.Event,
+    ):
+        """
+        Initialize the search task.
+
+        Args:
+            generation: Generation counter value for this search
+            text: Search text as typed by the user
+            columns: Lowercase column values (one list per column, equal lengths)
+            cancel_event: Event that is set when the search becomes stale
+        """
+        super().__init__()
+        self._generation = generation
+        self._text = text
+        self._columns = columns
+        self._cancel_event = cancel_event
+        self.signals = _SearchSignals()
+
+    def run(self) -> None:
+        """Run the match and deliver the result unless the search was cancelled."""
+        try:
+            rows = match_rows(self._columns, self._text, self._cancel_event)
+        except Exception as e:
+            logger.error(f"Error running search for '{self._text}': {e}")
+            return
+
+        if rows is None or self._cancel_event.is_set():
+            return
+
+        self.signals.finished.emit(self._generation, self._text, rows)
+
+
+def match_rows(
+    columns: List[List[str]], text: str, cancel_event: Optional[threading.Event] = None
+) -> Optional[Set[int]]:
+    """
+    Find the rows where any column contains the search text (case-insensitive).
+
+    Args:
+        columns: Lowercase column values (one list per column, equal lengths)
+        text: Search text
+        cancel_event: Optional event that aborts the scan when set
+
+    Returns:
+        Set of matching row indices, or None if the scan was cancelled
+    """
+    needle = text.lower()
+    if not columns:
+        return set()
+
+    row_count = len(columns[0])
+    matches: Set[int] = set()
+    for column in columns:
+        for start in range(0, row_count, _CANCEL_CHECK_INTERVAL):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            stop = min(start + _CANCEL_CHECK_INTERVAL, row_count)
+            for row in range(start, stop):
+                if row not in matches and needle in column[row]:
+                    matches.add(row)
+
+    return matches
+
+
+class SearchController(QObject):
+    """
+    Debounced, cancellable search controller.
+
+    Collects keystrokes, waits until typing pauses, then runs the match on a
+    worker thread against cached lowercase columns. A newer keystroke cancels
+    any running search, and only the result for the latest text is published.
+
+    Signals:
+        search_started (str): Emitted on the GUI thread when the debounce interval elapses
+        results_ready (str, object): Emitted with the search text and the set of matching
+            row indices, or None when the search text is empty (show all rows)
+
+    Attributes:
+        _timer (QTimer): Single-shot debounce timer
+        _pool (QThreadPool): Thread pool running the search tasks
+        _columns (List[List[str]]): Cached lowercase column values
+        _pending_text (str): Text waiting for the debounce timer
+        _generation (int): Incremented for every search and every data change
+        _cancel_event (Optional[threading.Event]): Cancel token of the running search
+
+    Implementation Notes:
+        - Without cached columns the controller only debounces (search_started)
+        - Stale results are dropped by comparing generations on the GUI thread
+        - The pool has a single thread; cancelled tasks return at the next check
+    """
+
+    search_started = Signal(str)
+    results_ready = Signal(str, object)
+
+    DEFAULT_DEBOUNCE_MS = 200
+
+    def __init__(self, debounce_ms: int = DEFAULT_DEBOUNCE_MS, parent: Optional[QObject] = None):
+        """
+        Initialize the search controller.
+
+        Args:
+            debounce_ms: Milliseconds to wait after the last keystroke
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._start_search)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._columns: List[List[str]] = []
+        self._pending_text = ""
+        self._current_text = ""
+        self._generation = 0
+        self._cancel_event: Optional[threading.Event] = None
+
+    @property
+    def debounce_ms(self) -> int:
+        """
+        Get the debounce interval.
+
+        Returns:
+            Debounce interval in milliseconds
+        """
+        return self._timer.interval()
+
+    @debounce_ms.setter
+    def debounce_ms(self, value: int) -> None:
+        """
+        Set the debounce interval.
+
+        Args:
+            value: Debounce interval in milliseconds
+        """
+        self._timer.setInterval(value)
+
+    @property
+    def current_text(self) -> str:
+        """
+        Get the text of the last search that was started.
+
+        Returns:
+            Search text
+        """
+        return self._current_text
+
+    def set_columns(self, columns: Dict[str, Sequence[Any]]) -> None:
+        """
+        Cache the searchable columns as lowercase strings.
+
+        Any running search is cancelled, and the current text is searched again
+        against the new data so the view stays consistent.
+
+        Args:
+            columns: Mapping of column name to column values (equal lengths)
+        """
+        self._columns = [
+            ["" if value is None else str(value).lower() for value in values]
+            for values in columns.values()
+        ]
+        self._cancel_running()
+
+        if self._current_text and not self._timer.isActive():
+            self._pending_text = self._current_text
+            self._start_search()
+
+    def has_columns(self) -> bool:
+        """
+        Check whether searchable columns have been cached.
+
+        Returns:
+            True if columns are cached, False otherwise
+        """
+        return bool(self._columns)
+
+    @Slot(str)
+    def search(self, text: str) -> None:
+        """
+        Request a search; restarts the debounce timer.
+
+        Args:
+            text: Search text
+        """
+        self._pending_text = text
+        self._cancel_running()
+        self._timer.start()
+
+    def search_now(self, text: str) -> None:
+        """
+        Run a search synchronously, bypassing the debounce timer and the worker.
+
+        Used for programmatic filtering where callers expect the result to be
+        applied before the call returns.
+
+        Args:
+            text: Search text
+        """
+        self._timer.stop()
+        self._pending_text = text
+        self._current_text = text
+        self._cancel_running()
+        self.search_started.emit(text)
+
+        if not text:
+            self.results_ready.emit(text, None)
+            return
+
+        self.results_ready.emit(text, match_rows(self._columns, text))
+
+    def flush(self) -> None:
+        """Start the pending search immediately instead of waiting for the timer."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._start_search()
+
+    def cancel(self) -> None:
+        """Cancel the pending and the running search."""
+        self._timer.stop()
+        self._cancel_running()
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """
+        Block until the worker thread is idle.
+
+        Results are still delivered through the event loop afterwards.
+
+        Args:
+            timeout_ms: Maximum time to wait (-1 waits forever)
+
+        Returns:
+            True if all tasks finished, False on timeout
+        """
+        return self._pool.waitForDone(timeout_ms)
+
+    def _cancel_running(self) -> None:
+        """Invalidate the running search so its result is dropped."""
+        self._generation += 1
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    @Slot()
+    def _start_search(self) -> None:
+        """Start the search for the pending text (GUI thread)."""
+        text = self._pending_text
+        self._current_text = text
+        self._cancel_running()
+        self.search_started.emit(text)
+
+        if not self._columns:
+            return
+
+        if not text:
+            self.results_ready.emit(text, None)
+            return
+
+        self._cancel_event = threading.Event()
+        task = _SearchTask(self._generation, text, self._columns, self._cancel_event)
+        task.signals.finished.connect(self._on_task_finished)
+        self._pool.start(task)
+
+    @Slot(int, str, object)
+    def _on_task_finished(self, generation: int, text: str, rows: Set[int]) -> None:
+        """
+        Publish a finished search if it is still the latest one.
+
+        Args:
+            generation: Generation the task was started with
+            text: Search text of the task
+            rows: Matching row indices
+        """
+        if generation != self._generation:
+            logger.debug(f"Dropping stale search result for '{text}'")
+            return
+
+        self._cancel_event = None
+        self.results_ready.emit(text, rows)
+
+
+class RowSetFilterProxyModel(QSortFilterProxyModel):
+    """
+    Proxy model that shows a precomputed set of source rows.
+
+    The row set is swapped in one step and the filter is invalidated once,
+    so a search result is applied atomically.
+
+    Attributes:
+        _visible_rows (Optional[Set[int]]): Visible source rows, or None for all rows
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        Initialize the proxy model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._visible_rows: Optional[Set[int]] = None
+
+    def set_visible_rows(self, rows: Optional[Set[int]]) -> None:
+        """
+        Replace the set of visible source rows.
+
+        Args:
+            rows: Source row indices to show, or None to show all rows
+        """
+        self._visible_rows = rows
+        self.invalidateFilter()
+
+    @Slot(str, object)
+    def apply_search_result(self, text: str, rows: Optional[Set[int]]) -> None:
+        """
+        Apply a result from SearchController.results_ready.
+
+        Args:
+            text: Search text the result belongs to
+            rows: Matching source rows, or None to show all rows
+        """
+        self.set_visible_rows(rows)
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        """
+        Check whether a source row is visible.
+
+        Args:
+            source_row: Row index in the source model
+            source_parent: Parent index in the source model
+
+        Returns:
+            True if the row is visible
+        """
+        if self._visible_rows is not None and source_row not in self._visible_rows:
+            return False
+        return super().filterAcceptsRow(source_row, source_parent)
@@ -18,7 +18,7 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any, cast
 
-from PySide6.QtCore import QSize, Qt, Signal, Slot, QByteArray
+from PySide6.QtCore import QSize, Qt, Signal, Slot, QByteArray, QTimer
 from PySide6.QtGui import QAction, QCloseEvent, QIcon, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
@@ -26,6 +26,7 @@ from PySide6.QtWidgets import (
     QMenu,
     QMenuBar,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QStatusBar,
     QTabWidget,
@@ -49,13 +50,10 @@ from src.interfaces import (
     IConfigManager,
 )
 from src.interfaces.events import EventType, EventHandler, EventData
+from src.services.warm_up import get_warm_up
+from src.utils.startup_profiler import profile_phase
 
-# Import interface-based components
-from src.ui.report_panel_interface import ReportPanelInterface
-from src.ui.settings_panel_interface import SettingsPanelInterface
-from src.ui.dashboard_interface import DashboardInterface
-from src.ui.correction_manager_interface import CorrectionManagerInterface
-from src.ui.validation_panel_interface import ValidationPanelInterface
+# Content pages are imported when they are first shown, see _ensure_page
 from src.ui.styles import COLORS, SIDEBAR_STYLE
 
 
@@ -78,10 +76,17 @@ class MainWindowInterface(QMainWindow):
         - Uses dependency injection for services
         - Uses sidebar navigation instead of menu bar
         - Uses stackable content area for different views
+        - Only the active page is built at startup; the other pages are
+          imported and built on first navigation, behind placeholder widgets
+        - Rules and validation lists read by the startup warm-up are published
+          on the GUI thread as each read finishes, with a busy indicator meanwhile
         - Uses interface-based services for all data operations
         - Implements event-based communication
     """
 
+    # Emitted from warm-up threads; queued to the GUI thread
+    _warm_up_read_finished = Signal()
+
     def __init__(self, service_factory: IServiceFactory):
         """
         Initialize the main window with dependency injection.
@@ -115,7 +120,18 @@ class MainWindowInterface(QMainWindow):
         self._correction_manager = None
         self._validation_panel = None
         self._report_panel = None
+        self._settings_panel = None
         self._connected_events = set()  # Track connected events
+        self._diagnostics_dialog = None
+
+        # Page setup methods in sidebar order, and the pages built so far
+        self._page_setups = [
+            self._setup_dashboard_page,
+            self._setup_correction_manager_page,
+            self._setup_reports_page,
+            self._setup_settings_page,
+        ]
+        self._built_pages: Set[int] = set()
 
         # Set window properties
         self.setWindowTitle("Chest Tracker Correction Tool")
@@ -125,6 +141,7 @@ class MainWindowInterface(QMainWindow):
         self._setup_actions()
         self._setup_sidebar()
         self._setup_status_bar()
+        self._setup_warm_up()
         self._setup_content()
 
         # Connect events
@@ -162,6 +179,12 @@ class MainWindowInterface(QMainWindow):
         self._settings_action.setStatusTip("Edit application settings")
         self._settings_action.triggered.connect(lambda: self._on_sidebar_button_clicked(3))
 
+        # Hidden diagnostics: only reachable by shortcut, so it is added to the window itself
+        self._diagnostics_action = QAction("Diagnostics", self)
+        self._diagnostics_action.setShortcut(QKeySequence("Ctrl+Shift+D"))
+        self._diagnostics_action.triggered.connect(self._on_show_diagnostics)
+        self.addAction(self._diagnostics_action)
+
     def _setup_sidebar(self):
         """Set up the sidebar."""
         # Create central widget with horizontal splitter
@@ -245,7 +268,8 @@ class MainWindowInterface(QMainWindow):
         self._reports_btn.setChecked(page_index == 2)
         self._settings_btn.setChecked(page_index == 3)
 
-        # Switch content page
+        # Build the page on first visit, then switch to it
+        self._ensure_page(page_index)
         self._content_widget.setCurrentIndex(page_index)
 
         # Save active tab (convert to string)
@@ -257,16 +281,59 @@ class MainWindowInterface(QMainWindow):
         self.setStatusBar(self._status_bar)
         self._status_bar.showMessage("Ready")
 
+    def _setup_warm_up(self):
+        """Show the loading state and publish warm-up results as they arrive."""
+        self._warm_up = get_warm_up(self._service_factory)
+        self._warm_up_failed: List[str] = []
+        self._loading_indicator = QProgressBar()
+        self._loading_indicator.setRange(0, 0)
+        self._loading_indicator.setMaximumWidth(120)
+        self._loading_indicator.setVisible(False)
+        self._status_bar.addPermanentWidget(self._loading_indicator)
+
+        if self._warm_up is None or not self._warm_up.is_loading:
+            return
+
+        self._loading_indicator.setVisible(True)
+        self._status_bar.showMessage("Loading correction rules and validation lists...")
+        self._warm_up_read_finished.connect(self._on_warm_up_read_finished)
+        self._warm_up.add_ready_callback(self._warm_up_read_finished.emit)
+
+        # Reads that finished before the callback was added
+        QTimer.singleShot(0, self._on_warm_up_read_finished)
+
+    @Slot()
+    def _on_warm_up_read_finished(self):
+        """Publish finished warm-up reads to the store."""
+        if self._warm_up is None:
+            return
+
+        published = self._warm_up.publish_ready()
+        failed = [name for name, success in published.items() if not success]
+        if failed:
+            self._logger.error(f"Error loading saved data: {', '.join(failed)}")
+            self._warm_up_failed.extend(failed)
+
+        if self._warm_up.is_loading or not self._loading_indicator.isVisible():
+            return
+
+        self._loading_indicator.setVisible(False)
+        if self._warm_up_failed:
+            self._status_bar.showMessage("Error loading saved data, see the log for details")
+        else:
+            self._status_bar.showMessage("Loaded correction rules and validation lists", 5000)
+
     def _setup_content(self):
         """Set up the content area."""
-        # Create content pages
-        self._setup_dashboard_page()
-        self._setup_correction_manager_page()
-        self._setup_reports_page()
-        self._setup_settings_page()
+        # Reserve a slot per page; pages replace their placeholder when first shown
+        for _ in self._page_setups:
+            self._content_widget.addWidget(QWidget())
 
         # Set initial page
         active_tab = self._config_manager.get_int("Window", "active_tab", fallback=0)
+        if not 0 <= active_tab < len(self._page_setups):
+            active_tab = 0
+        self._ensure_page(active_tab)
         self._content_widget.setCurrentIndex(active_tab)
 
         # Update button states
@@ -275,37 +342,90 @@ class MainWindowInterface(QMainWindow):
         self._reports_btn.setChecked(active_tab == 2)
         self._settings_btn.setChecked(active_tab == 3)
 
-    def _setup_dashboard_page(self):
-        """Set up the dashboard page."""
+    def _ensure_page(self, page_index: int) -> bool:
+        """
+        Build a content page if it has not been built yet.
+
+        Args:
+            page_index: Index of the page in the content stack
+
+        Returns:
+            True if the page is available, False if building it failed
+        """
+        if page_index in self._built_pages:
+            return True
+
+        setup = self._page_setups[page_index]
+        try:
+            with profile_phase("window.page", page=setup.__name__[len("_setup_") :]):
+                page = setup()
+        except Exception as e:
+            self._logger.error(f"Error building page {page_index}: {e}", exc_info=True)
+            self._status_bar.showMessage("Error loading page, see the log for details")
+            return False
+
+        # Swap the placeholder for the page without changing the current page
+        current_index = self._content_widget.currentIndex()
+        placeholder = self._content_widget.widget(page_index)
+        self._content_widget.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._content_widget.insertWidget(page_index, page)
+        self._content_widget.setCurrentIndex(current_index)
+
+        self._built_pages.add(page_index)
+        return True
+
+    def _setup_dashboard_page(self) -> QWidget:
+        """
+        Set up the dashboard page.
+
+        Returns:
+            The dashboard
+        """
+        from src.ui.dashboard_interface import DashboardInterface
+
         # Create dashboard with interfaces
         self._dashboard = DashboardInterface(self._service_factory, parent=self)
+        return self._dashboard
 
-        # Add to content stack
-        self._content_widget.addWidget(self._dashboard)
+    def _setup_correction_manager_page(self) -> QWidget:
+        """
+        Set up the correction manager page.
+
+        Returns:
+            The correction manager
+        """
+        from src.ui.correction_manager_interface import CorrectionManagerInterface
 
-    def _setup_correction_manager_page(self):
-        """Set up the correction manager page."""
         # Create correction manager with interfaces
         self._correction_manager = CorrectionManagerInterface(self._service_factory, parent=self)
+        return self._correction_manager
+
+    def _setup_reports_page(self) -> QWidget:
+        """
+        Set up the reports page.
 
-        # Add to content stack
-        self._content_widget.addWidget(self._correction_manager)
+        Returns:
+            The reports panel
+        """
+        from src.ui.report_panel_interface import ReportPanelInterface
 
-    def _setup_reports_page(self):
-        """Set up the reports page."""
         # Create reports panel
         self._report_panel = ReportPanelInterface(self._service_factory, parent=self)
+        return self._report_panel
+
+    def _setup_settings_page(self) -> QWidget:
+        """
+        Set up the settings page.
 
-        # Add to content stack
-        self._content_widget.addWidget(self._report_panel)
+        Returns:
+            The settings panel
+        """
+        from src.ui.settings_panel_interface import SettingsPanelInterface
 
-    def _setup_settings_page(self):
-        """Set up the settings page."""
         # Create settings panel
         self._settings_panel = SettingsPanelInterface(self._service_factory, parent=self)
-
-        # Add to content stack
-        self._content_widget.addWidget(self._settings_panel)
+        return self._settings_panel
 
     def _connect_events(self):
         """Connect to events from services."""
@@ -365,6 +485,16 @@ class MainWindowInterface(QMainWindow):
         # Accept the event
         event.accept()
 
+    @Slot()
+    def _on_show_diagnostics(self):
+        """Show the metrics of this session."""
+        if self._diagnostics_dialog is None:
+            from src.ui.diagnostics_dialog import DiagnosticsDialog
+
+            self._diagnostics_dialog = DiagnosticsDialog(self)
+        self._diagnostics_dialog.show()
+        self._diagnostics_dialog.raise_()
+
     @Slot()
     def _on_new(self):
         """Handle the new action."""
@@ -376,14 +506,14 @@ class MainWindowInterface(QMainWindow):
     def _on_open(self):
         """Handle the open action."""
         # Redirect to dashboard open
-        if self._dashboard:
+        if self._ensure_page(0):
             self._dashboard.open_file()
 
     @Slot()
     def _on_save(self):
         """Handle the save action."""
         # Redirect to dashboard save
-        if self._dashboard:
+        if self._ensure_page(0):
             self._dashboard.save_file()
 
     def _on_entries_loaded(self, event_data: Dict[str, Any]) -> None:
@@ -4,7 +4,7 @@ filter_dropdown.py
 Description: Dropdown filter widget for selecting values from a list
 """
 
-from typing import List, Set, Optional
+from typing import Dict, List, Set, Optional
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -221,7 +221,7 @@ class FilterDropdown(QWidget):
         Args:
             item: The list widget item that changed
         """
-        value = item.text()
+        value = self._item_value(item)
         is_checked = item.checkState() == Qt.Checked
 
         if is_checked and value not in self._selected_items:
@@ -261,7 +261,7 @@ class FilterDropdown(QWidget):
         # Filter items
         for i in range(self._list_widget.count()):
             item = self._list_widget.item(i)
-            item_text = item.text().lower()
+            item_text = self._item_value(item).lower()
             item.setHidden(search_text not in item_text)
 
     def _clear_search(self) -> None:
@@ -312,12 +312,13 @@ class FilterDropdown(QWidget):
         """Update the associated filter with selected values."""
         self._filter.set_selected_values(list(self._selected_items))
 
-    def set_items(self, items: List[str]) -> None:
+    def set_items(self, items: List[str], counts: Optional[Dict[str, int]] = None) -> None:
         """
         Set the list of items in the dropdown.
 
         Args:
             items: List of items to display
+            counts: Optional number of rows per item, shown next to each item
         """
         self._all_items = items.copy()
         self._list_widget.clear()
@@ -328,8 +329,15 @@ class FilterDropdown(QWidget):
         # Clear selected items
         self._selected_items.clear()
 
-        for item_text in items:
-            item = QListWidgetItem(item_text)
+        for value in items:
+            item_text = str(value)
+            label = item_text
+            if counts is not None and value in counts:
+                label = f"{item_text} ({counts[value]})"
+
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, item_text)
+
             # Check the item if it was previously selected
             is_selected = item_text in previously_selected
             item.setCheckState(Qt.Checked if is_selected else Qt.Unchecked)
@@ -350,6 +358,19 @@ class FilterDropdown(QWidget):
         # Update filter
         self._update_filter()
 
+    def _item_value(self, item: QListWidgetItem) -> str:
+        """
+        Get the filter value of a list item (its text without the count suffix).
+
+        Args:
+            item: The list widget item
+
+        Returns:
+            The item's value
+        """
+        value = item.data(Qt.UserRole)
+        return value if value is not None else item.text()
+
     def set_selected_values(self, values: List[str]) -> None:
         """
         Set the selected values programmatically.
@@ -362,7 +383,7 @@ class FilterDropdown(QWidget):
         # Update checkboxes in the list
         for i in range(self._list_widget.count()):
             item = self._list_widget.item(i)
-            is_selected = item.text() in self._selected_items
+            is_selected = self._item_value(item) in self._selected_items
             item.setCheckState(Qt.Checked if is_selected else Qt.Unchecked)
 
         self._update_filter()
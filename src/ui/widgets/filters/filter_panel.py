@@ -195,16 +195,19 @@ class FilterPanel(QWidget):
         # Register with filter manager
         self._filter_manager.register_filter(filter_id, filter_obj)
 
-    def update_filter_values(self, filter_id: str, values: List[str]) -> None:
+    def update_filter_values(
+        self, filter_id: str, values: List[str], counts: Optional[Dict[str, int]] = None
+    ) -> None:
         """
         Update the values for a dropdown filter.
 
         Args:
             filter_id: The filter identifier
             values: List of values to set
+            counts: Optional number of rows per value, shown next to each value
         """
         if filter_id in self._dropdown_filters:
-            self._dropdown_filters[filter_id].set_items(values)
+            self._dropdown_filters[filter_id].set_items(values, counts)
 
     def get_dropdown_filters(self) -> Dict[str, FilterDropdown]:
         """
@@ -20,6 +20,7 @@ from PySide6.QtWidgets import (
 )
 
 from src.services.filters import TextFilter
+from src.ui.helpers.search_controller import SearchController
 
 
 class FilterSearchBar(QWidget):
@@ -53,6 +54,9 @@ class FilterSearchBar(QWidget):
         self._filter = filter_obj
         self._columns = columns or []
 
+        # Debounces search_changed while the user is typing
+        self._search_controller = SearchController(parent=self)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -124,6 +128,7 @@ class FilterSearchBar(QWidget):
         """Connect widget signals to slots."""
         self._search_edit.textChanged.connect(self._on_search_text_changed)
         self._clear_button.clicked.connect(self._clear_search)
+        self._search_controller.search_started.connect(self._on_search_started)
 
         # Connect options signals
         self._case_sensitive_check.stateChanged.connect(self._on_option_changed)
@@ -143,6 +148,20 @@ class FilterSearchBar(QWidget):
         """
         self._clear_button.setEnabled(bool(text))
         self._filter.set_search_text(text)
+
+        # Clearing applies at once; typing is debounced
+        if text:
+            self._search_controller.search(text)
+        else:
+            self._search_controller.search_now(text)
+
+    def _on_search_started(self, text: str) -> None:
+        """
+        Notify listeners once typing has paused.
+
+        Args:
+            text: The search text
+        """
         self.search_changed.emit()
 
     def _clear_search(self) -> None:
@@ -1,33 +1,55 @@
 """
 logging_config.py
 
-Description: Configures application-wide logging with timestamps and proper formatting
+Description: Configures application-wide logging with timestamps, written by a background thread
 Usage:
-    from src.utils.logging_config import configure_logging
+    from src.utils.logging_config import LogSampler, configure_logging
     configure_logging()
+
+    # In hot loops: log the first few messages and a count of the rest
+    sampler = LogSampler(logger, "Applied correction")
+    for result in results:
+        sampler.log("Applied correction: %s", result)
+    sampler.flush()
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Optional
+
+
+# Messages a LogSampler logs before it only counts
+DEFAULT_SAMPLE_SIZE = 10
+
+# Listener writing the queued records of configure_logging, if running
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
-def configure_logging(log_to_file=True, debug_mode=False):
+def configure_logging(log_to_file=True, debug_mode=False, async_handlers=True):
     """
     Configure logging for the application with detailed timestamps.
 
+    With async_handlers, the console and file handlers run on a QueueListener
+    thread; callers only put records on a queue, so slow disks or consoles do
+    not block the GUI thread.
+
     Args:
         log_to_file (bool): Whether to log to a file
         debug_mode (bool): Whether to set logging level to DEBUG
+        async_handlers (bool): Whether to write records on a background thread
     """
     # Create logger
     root_logger = logging.getLogger()
 
     # Clear any existing handlers
-    if root_logger.handlers:
-        for handler in root_logger.handlers:
-            root_logger.removeHandler(handler)
+    stop_logging()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
 
     # Set log level
     level = logging.DEBUG if debug_mode else logging.INFO
@@ -42,9 +64,10 @@ def configure_logging(log_to_file=True, debug_mode=False):
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if enabled)
+    log_file = None
     if log_to_file:
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
@@ -56,13 +79,24 @@ def configure_logging(log_to_file=True, debug_mode=False):
 
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-
-        # Log the path of the log file
-        root_logger.info(f"Logging to file: {log_file.absolute()}")
+        handlers.append(file_handler)
+
+    if async_handlers:
+        global _listener
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in handlers:
+            root_logger.addHandler(handler)
+
+    # Log the path of the log file
+    if log_file is not None:
+        root_logger.info("Logging to file: %s", log_file.absolute())
 
     # Log initial message
-    root_logger.info(f"Logging initialized with level: {logging.getLevelName(level)}")
+    root_logger.info("Logging initialized with level: %s", logging.getLevelName(level))
 
     # Set excepthook to log unhandled exceptions
     def exception_handler(exc_type, exc_value, exc_traceback):
@@ -70,3 +104,84 @@ def configure_logging(log_to_file=True, debug_mode=False):
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
 
     sys.excepthook = exception_handler
+
+
+def stop_logging() -> None:
+    """Write the queued records and stop the background logging thread, if running."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+# Flush queued records when the interpreter exits
+atexit.register(stop_logging)
+
+
+class LogSampler:
+    """
+    Logs the first messages of a repeated message, then only counts them.
+
+    Attributes:
+        logger: Logger to write to
+        label: Name of the message in the summary line
+        level: Level of the messages
+        sample_size: Messages logged before counting starts
+        suppressed: Messages counted but not logged
+
+    Implementation Notes:
+        - Whether the level is enabled is checked once, so a disabled sampler
+          costs one attribute check per call and never formats its arguments
+        - Arguments are formatted lazily by logging (%-style), only for logged messages
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        label: str,
+        level: int = logging.DEBUG,
+        sample_size: int = DEFAULT_SAMPLE_SIZE,
+    ):
+        """
+        Initialize the sampler.
+
+        Args:
+            logger: Logger to write to
+            label: Name of the message in the summary line
+            level: Level of the messages
+            sample_size: Messages logged before counting starts
+        """
+        self.logger = logger
+        self.label = label
+        self.level = level
+        self.sample_size = sample_size
+        self.suppressed = 0
+        self._logged = 0
+        self._enabled = logger.isEnabledFor(level)
+
+    def log(self, msg: str, *args: Any) -> None:
+        """
+        Log a message, or count it once the sample is full.
+
+        Args:
+            msg: %-style message
+            *args: Message arguments
+        """
+        if not self._enabled:
+            return
+        if self._logged < self.sample_size:
+            self._logged += 1
+            self.logger.log(self.level, msg, *args, stacklevel=2)
+        else:
+            self.suppressed += 1
+
+    def flush(self) -> None:
+        """Log how many messages were not logged, and start a new sample."""
+        if self.suppressed:
+            self.logger.log(
+                self.level, "%d more '%s' messages not logged", self.suppressed, self.label
+            )
+        self.suppressed = 0
+        self._logged = 0
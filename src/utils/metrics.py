@@ -0,0 +1,487 @@
+"""
+metrics.py
+
+Description: Process-wide counters, histograms and timers for hot paths, recorded only while enabled
+Usage:
+    from src.utils.metrics import instrumented, metrics, timed
+
+    @instrumented
+    class FilterManager:
+        @timed()  # records "FilterManager.apply_filters" durations while metrics are enabled
+        def apply_filters(self, df): ...
+
+    metrics.enable()
+    metrics.counter("filters.cache_hits").inc()
+    with metrics.timer("import.parse"):
+        ...
+    print(metrics.snapshot())
+    metrics.dump()  # writes logs/metrics_<timestamp>.json
+
+    # Record a whole session: python main.py --metrics [JSON_PATH]
+"""
+
+import argparse
+import bisect
+import contextlib
+import functools
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets; values above the last bound go to an overflow bucket.
+# Chosen for durations in milliseconds, from sub-millisecond lookups to multi-second imports.
+DEFAULT_BUCKETS = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1000, 2500, 5000, 10000, 30000,
+)  # fmt: skip
+
+# Percentiles reported by Histogram.snapshot
+PERCENTILES = (50, 90, 99)
+
+# Shared no-op context for MetricsRegistry.timer while metrics are disabled
+_NO_TIMER = contextlib.nullcontext()
+
+# Attribute under which timed stores the metric name and key function on a method
+_METRIC_ATTRIBUTE = "__metric__"
+
+
+class Counter:
+    """
+    Monotonic count of events.
+
+    Attributes:
+        name (str): Metric name
+        value (int): Current count
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the counter at zero.
+
+        Args:
+            name: Metric name
+        """
+        self.name = name
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        """
+        Increase the count.
+
+        Args:
+            amount: Number of events
+        """
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets.
+
+    Attributes:
+        name (str): Metric name
+        unit (str): Unit of the values, e.g. "ms"
+        count (int): Number of observations
+        total (float): Sum of the observations
+        min (float): Smallest observation
+        max (float): Largest observation
+
+    Implementation Notes:
+        - Memory is constant: only bucket counts are kept, not the observations
+        - Percentiles are the upper bound of the bucket they fall in, capped at max
+    """
+
+    def __init__(self, name: str, unit: str = "", buckets=DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            name: Metric name
+            unit: Unit of the values
+            buckets: Ascending upper bounds of the buckets
+        """
+        self.name = name
+        self.unit = unit
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._bounds = tuple(buckets)
+        self._bucket_counts = [0] * (len(self._bounds) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: Observed value
+        """
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.count += 1
+            self.total += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            self._bucket_counts[index] += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Estimate a percentile from the buckets.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Optional[float]: Upper bound of the bucket holding the percentile, None if empty
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            rank = percent / 100 * self.count
+            seen = 0
+            for bound, bucket_count in zip(self._bounds, self._bucket_counts):
+                seen += bucket_count
+                if seen >= rank:
+                    return min(bound, self.max)
+            return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current statistics.
+
+        Returns:
+            Dict[str, Any]: Unit, count, total, mean, min, max and percentiles
+        """
+        with self._lock:
+            count, total, smallest, largest = self.count, self.total, self.min, self.max
+        result = {
+            "unit": self.unit,
+            "count": count,
+            "total": total,
+            "mean": total / count if count else None,
+            "min": smallest if count else None,
+            "max": largest if count else None,
+        }
+        for percent in PERCENTILES:
+            result[f"p{percent}"] = self.percentile(percent)
+        return result
+
+
+class MetricsRegistry:
+    """
+    Named counters and histograms of one process.
+
+    Attributes:
+        enabled (bool): Whether timers and timed methods record anything
+        started (Optional[datetime]): When metrics were last enabled or reset
+
+    Implementation Notes:
+        - Disabled by default; timed methods are then the undecorated originals,
+          so they cost nothing and keep their signatures
+        - Enabling swaps timing wrappers into the instrumented classes, disabling restores them
+        - Metrics are created on first use, so instrumented code needs no setup
+        - Timers are histograms in milliseconds
+    """
+
+    def __init__(self):
+        """Initialize a disabled registry without metrics."""
+        self.enabled = False
+        self.started: Optional[datetime] = None
+        self._counters: Dict[str, Counter] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._instrumented: List[Tuple[type, Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording, timing the methods of instrumented classes."""
+        if not self.enabled:
+            self.started = self.started or datetime.now()
+            self.enabled = True
+            for cls, methods in self._instrumented:
+                self._install(cls, methods)
+            logger.info("Metrics recording enabled")
+
+    def disable(self) -> None:
+        """Stop recording, keeping the metrics recorded so far."""
+        if self.enabled:
+            self.enabled = False
+            for cls, methods in self._instrumented:
+                for attr, original in methods.items():
+                    setattr(cls, attr, original)
+
+    def register(self, cls: type, methods: Dict[str, Any]) -> None:
+        """
+        Register the timed methods of a class, see instrumented.
+
+        Args:
+            cls: Class defining the methods
+            methods: Original class attribute per method name
+        """
+        self._instrumented.append((cls, methods))
+        if self.enabled:
+            self._install(cls, methods)
+
+    @staticmethod
+    def _install(cls: type, methods: Dict[str, Any]) -> None:
+        """
+        Replace methods of a class with timing wrappers.
+
+        Args:
+            cls: Class defining the methods
+            methods: Original class attribute per method name
+        """
+        for attr, original in methods.items():
+            if isinstance(original, (classmethod, staticmethod)):
+                setattr(cls, attr, type(original)(_timing_wrapper(original.__func__)))
+            else:
+                setattr(cls, attr, _timing_wrapper(original))
+
+    def reset(self) -> None:
+        """Remove all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = datetime.now() if self.enabled else None
+
+    def counter(self, name: str) -> Counter:
+        """
+        Get a counter, creating it on first use.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Counter: The counter
+        """
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter(name))
+        return counter
+
+    def histogram(self, name: str, unit: str = "") -> Histogram:
+        """
+        Get a histogram, creating it on first use.
+
+        Args:
+            name: Metric name
+            unit: Unit of the values, used when the histogram is created
+
+        Returns:
+            Histogram: The histogram
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram(name, unit))
+        return histogram
+
+    def timer(self, name: str) -> ContextManager[None]:
+        """
+        Time a block of code into a histogram in milliseconds.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            ContextManager[None]: Timing context, or a shared no-op context while disabled
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return self._time(name)
+
+    @contextlib.contextmanager
+    def _time(self, name: str) -> Iterator[None]:
+        """
+        Record the duration of the block, counting exceptions separately.
+
+        Args:
+            name: Metric name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.counter(f"{name}.errors").inc()
+            raise
+        finally:
+            self.histogram(name, "ms").observe((time.perf_counter() - start) * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current value of every metric.
+
+        Returns:
+            Dict[str, Any]: Recording state, counter values and histogram statistics by name
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+        return {
+            "enabled": self.enabled,
+            "started": self.started.isoformat(timespec="seconds") if self.started else None,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "counters": {name: counter.value for name, counter in counters},
+            "histograms": {name: histogram.snapshot() for name, histogram in histograms},
+        }
+
+    def dump(self, file_path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Write a snapshot as JSON.
+
+        Args:
+            file_path: Output file (default: logs/metrics_<timestamp>.json)
+
+        Returns:
+            Path: The written file
+        """
+        if not file_path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            file_path = Path("logs") / f"metrics_{timestamp}.json"
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+        logger.info(f"Metrics written to {file_path}")
+        return file_path
+
+
+# The registry of the process
+metrics = MetricsRegistry()
+
+
+def timed(
+    name: Optional[str] = None, key: Optional[Callable[..., Any]] = None
+) -> Callable[[Callable], Callable]:
+    """
+    Mark a method to be timed while metrics are enabled.
+
+    The method is returned unchanged; its class must be decorated with instrumented.
+    Put timed below @classmethod or @staticmethod.
+
+    Args:
+        name: Metric name (default: the qualified name, e.g. "FilterManager.apply_filters")
+        key: Called with the method's arguments; its result is appended to the name,
+            giving one metric per value (e.g. per event type)
+
+    Returns:
+        Callable: The decorator
+    """
+
+    def decorator(func: Callable) -> Callable:
+        setattr(func, _METRIC_ATTRIBUTE, (name or func.__qualname__, key))
+        return func
+
+    return decorator
+
+
+def instrumented(cls: type) -> type:
+    """
+    Register the methods of a class marked with timed, so enabling metrics times them.
+
+    Args:
+        cls: Class to instrument
+
+    Returns:
+        type: The same class
+    """
+    methods = {}
+    for attr, value in vars(cls).items():
+        func = value.__func__ if isinstance(value, (classmethod, staticmethod)) else value
+        if hasattr(func, _METRIC_ATTRIBUTE):
+            methods[attr] = value
+    if methods:
+        metrics.register(cls, methods)
+    return cls
+
+
+def _timing_wrapper(func: Callable) -> Callable:
+    """
+    Wrap a timed method to record its durations, and its exceptions as an errors counter.
+
+    Args:
+        func: Method marked with timed
+
+    Returns:
+        Callable: The wrapper
+    """
+    base_name, key = getattr(func, _METRIC_ATTRIBUTE)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metric_name = f"{base_name}.{key(*args, **kwargs)}" if key else base_name
+        # Same as metrics.timer, inlined because generator contexts cost more than the call
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            metrics.counter(f"{metric_name}.errors").inc()
+            raise
+        finally:
+            metrics.histogram(metric_name, "ms").observe((time.perf_counter() - start) * 1000)
+
+    return wrapper
+
+
+def event_type_key(owner: Any, event_type: Any, *args: Any, **kwargs: Any) -> str:
+    """
+    Get the metric suffix of an emitted event, for timed(key=...) on emit methods.
+
+    Args:
+        owner: The emitting class or instance
+        event_type: The EventType being emitted
+
+    Returns:
+        str: Name of the event type
+    """
+    return getattr(event_type, "name", str(event_type))
+
+
+def add_metrics_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --metrics option to an argument parser.
+
+    Args:
+        parser: Parser of an entry point
+    """
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="JSON_PATH",
+        help="record hot path metrics and write them on exit (default: logs/metrics_<time>.json)",
+    )
+
+
+def histogram_rows(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten a snapshot into one row per metric, slowest total first, for display.
+
+    Args:
+        snapshot: Result of MetricsRegistry.snapshot
+
+    Returns:
+        List[Dict[str, Any]]: Rows with name, kind and the histogram statistics
+    """
+    rows = [
+        {"name": name, "kind": "histogram", **stats}
+        for name, stats in snapshot["histograms"].items()
+    ]
+    rows.sort(key=lambda row: row["total"], reverse=True)
+    rows += [
+        {"name": name, "kind": "counter", "count": value}
+        for name, value in snapshot["counters"].items()
+    ]
+    return rows
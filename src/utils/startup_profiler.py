@@ -0,0 +1,479 @@
+"""
+startup_profiler.py
+
+Description: Records startup phases and module import times as a Chrome trace
+Usage:
+    from src.utils.startup_profiler import profile_phase, start_profiling
+
+    profiler = start_profiling()
+    with profile_phase("bootstrap"):
+        bootstrapper.initialize()
+    profiler.finish("logs/startup_trace.json")  # writes the trace, logs a summary table
+
+    # Run with import times: python main.py --profile-startup [TRACE_PATH]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the file the re-run process writes its import times to
+IMPORTTIME_LOG_ENV = "CORRECTION_TOOL_IMPORTTIME_LOG"
+
+# Prefix of the lines -X importtime writes to stderr
+IMPORTTIME_PREFIX = "import time:"
+
+# Chrome trace thread id of the module import track
+IMPORT_TRACK_ID = 0
+
+# Number of imports listed in the summary table
+SUMMARY_IMPORTS = 10
+
+# How often and how long finish_after_startup waits for the warm-up
+WARM_UP_POLL_MS = 50
+WARM_UP_TIMEOUT_SECONDS = 30.0
+
+# Shared no-op context for profile_phase while profiling is off
+_NO_PHASE = contextlib.nullcontext()
+
+_active_profiler: Optional["StartupProfiler"] = None
+
+
+@dataclass
+class ImportRecord:
+    """
+    One line of -X importtime output.
+
+    Attributes:
+        name (str): Module name
+        self_us (int): Time spent in the module itself, in microseconds
+        cumulative_us (int): Time including nested imports, in microseconds
+        depth (int): Nesting level, 0 for imports not triggered by another import
+        children (List[ImportRecord]): Nested imports, in import order
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    children: List["ImportRecord"] = field(default_factory=list)
+
+
+def parse_import_times(lines: Iterable[str]) -> List[ImportRecord]:
+    """
+    Parse -X importtime output into a tree of imports.
+
+    Python prints an import after its nested imports, indenting each level
+    by two spaces. Other lines are ignored.
+
+    Args:
+        lines: Lines of stderr output
+
+    Returns:
+        List[ImportRecord]: Top-level imports in import order, with nested imports as children
+    """
+    pending: Dict[int, List[ImportRecord]] = {}
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len(IMPORTTIME_PREFIX) :].split("|", 2)
+            record = ImportRecord(
+                name=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name.rstrip("\n")) - len(name.strip()) - 1) // 2,
+            )
+        except ValueError:
+            # The header line ("self [us] | cumulative | imported package")
+            continue
+        record.children = pending.pop(record.depth + 1, [])
+        pending.setdefault(record.depth, []).append(record)
+
+    # Imports whose parent was not printed (yet) are treated as top-level
+    return [record for depth in sorted(pending) for record in pending[depth]]
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the --profile-startup option to an argument parser.
+
+    Args:
+        parser: Parser of an entry point
+    """
+    parser.add_argument(
+        "--profile-startup",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="TRACE_PATH",
+        help="record startup timings as a Chrome trace (default: logs/startup_trace_<time>.json)",
+    )
+
+
+def rerun_with_import_times() -> Optional[int]:
+    """
+    Run the current command again with -X importtime, capturing its stderr.
+
+    Does nothing if import times are already being recorded.
+
+    Returns:
+        Optional[int]: Exit code of the re-run process, or None if this
+        process should profile itself
+    """
+    if os.environ.get(IMPORTTIME_LOG_ENV) or sys._xoptions.get("importtime"):
+        return None
+
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    log_path = log_dir / f"importtime_{os.getpid()}.log"
+    env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+    env[IMPORTTIME_LOG_ENV] = str(log_path.resolve())
+
+    with open(log_path, "w", encoding="utf-8") as stderr:
+        exit_code = subprocess.call([sys.executable, *sys.orig_argv[1:]], stderr=stderr, env=env)
+
+    # Pass the re-run's own error output on
+    with open(log_path, encoding="utf-8", errors="replace") as stderr:
+        for line in stderr:
+            if not line.startswith(IMPORTTIME_PREFIX):
+                sys.stderr.write(line)
+    log_path.unlink(missing_ok=True)
+    return exit_code
+
+
+class StartupProfiler:
+    """
+    Collects timed startup phases and module imports.
+
+    Attributes:
+        origin (float): perf_counter value the trace timestamps are relative to
+        _spans: Recorded spans as Chrome trace "complete" events
+        _import_log: File the -X importtime output is written to, if any
+        _import_offset: Bytes of the import log that were already read
+        _imports_before: Top-level imports done before profiling started
+
+    Implementation Notes:
+        - Phases may run on any thread; each thread gets its own trace track
+        - Imports are read from the log when a main-thread phase ends and are
+          laid out from the start of that phase on a separate track, because
+          -X importtime only reports durations
+        - Imports that happened before profiling started end at the origin
+    """
+
+    def __init__(self, import_log: Optional[Union[str, Path]] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            import_log: File receiving -X importtime output, None to skip imports
+        """
+        self.origin = time.perf_counter()
+        self._spans: List[Dict[str, Any]] = []
+        self._imports: List[ImportRecord] = []
+        self._import_log = Path(import_log) if import_log else None
+        self._import_offset = 0
+        self._lock = threading.Lock()
+        self._main_thread = threading.main_thread().ident
+        self._thread_names = {IMPORT_TRACK_ID: "imports", self._main_thread: "main"}
+
+        # Imports done before profiling started, laid out to end at the origin
+        self._imports_before = self._read_imports()
+        total = sum(record.cumulative_us for record in self._imports_before) / 1e6
+        self._add_imports(self._imports_before, self.origin - total)
+
+    @contextlib.contextmanager
+    def phase(self, name: str, category: str = "startup", **args: Any) -> Iterator[None]:
+        """
+        Time a block of code.
+
+        Args:
+            name: Phase name, dotted names read as sub-phases in the summary
+            category: Trace category
+            **args: Extra values shown with the span in the trace viewer
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.add_span(name, start, end, category, **args)
+            if threading.get_ident() == self._main_thread:
+                self._add_imports(self._read_imports(), start)
+
+    def add_span(
+        self, name: str, start: float, end: float, category: str = "startup", **args: Any
+    ) -> None:
+        """
+        Record a span measured with time.perf_counter.
+
+        Args:
+            name: Span name
+            start: Start time
+            end: End time
+            category: Trace category
+            **args: Extra values shown with the span in the trace viewer
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._spans.append(event)
+            self._thread_names.setdefault(event["tid"], threading.current_thread().name)
+
+    def to_trace(self) -> Dict[str, Any]:
+        """
+        Build the Chrome trace.
+
+        Returns:
+            Dict[str, Any]: Trace in the Chrome trace event format, loadable
+            in chrome://tracing or https://ui.perfetto.dev
+        """
+        with self._lock:
+            events = list(self._spans)
+
+        # Shift so the earliest event starts at 0
+        shift = -min((event["ts"] for event in events), default=0.0)
+        events = [{**event, "ts": event["ts"] + shift} for event in events]
+
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": self._thread_names.get(tid, str(tid))},
+            }
+            for tid in sorted({event["tid"] for event in events})
+        ]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> str:
+        """
+        Format the phases and slowest imports as a table.
+
+        Returns:
+            str: Multi-line table
+        """
+        with self._lock:
+            phases = sorted(
+                (event for event in self._spans if event["tid"] != IMPORT_TRACK_ID),
+                key=lambda event: event["ts"],
+            )
+        before_origin = sum(record.cumulative_us for record in self._imports_before)
+
+        lines = [f"{'Phase':<48} {'Start ms':>10} {'Duration ms':>12}"]
+        if before_origin:
+            lines.append(
+                f"{'imports before profiling':<48} {-before_origin / 1000:>10.1f} "
+                f"{before_origin / 1000:>12.1f}"
+            )
+        for event in phases:
+            label = "  " * event["name"].count(".") + event["name"]
+            if event.get("args"):
+                label += f" ({', '.join(str(value) for value in event['args'].values())})"
+            lines.append(f"{label:<48} {event['ts'] / 1000:>10.1f} {event['dur'] / 1000:>12.1f}")
+
+        slowest = sorted(self._imports, key=lambda record: record.cumulative_us, reverse=True)
+        if slowest:
+            lines.append("")
+            lines.append(f"{'Slowest imports (cumulative)':<48} {'':>10} {'Duration ms':>12}")
+            for record in slowest[:SUMMARY_IMPORTS]:
+                lines.append(f"{record.name:<48} {'':>10} {record.cumulative_us / 1000:>12.1f}")
+        return "\n".join(lines)
+
+    def finish(self, trace_path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Write the Chrome trace and log the summary table.
+
+        Args:
+            trace_path: Output file (default: logs/startup_trace_<timestamp>.json)
+
+        Returns:
+            Path: The written trace file
+        """
+        self._add_imports(self._read_imports(), time.perf_counter())
+        if not trace_path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            trace_path = Path("logs") / f"startup_trace_{timestamp}.json"
+        trace_path = Path(trace_path)
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_trace(), f)
+
+        logger.info(f"Startup profile written to {trace_path}\n{self.summary()}")
+        return trace_path
+
+    def _read_imports(self) -> List[ImportRecord]:
+        """
+        Read the import log lines written since the last read.
+
+        Returns:
+            List[ImportRecord]: Top-level imports of the new lines
+        """
+        if self._import_log is None or not self._import_log.exists():
+            return []
+        with open(self._import_log, encoding="utf-8", errors="replace") as f:
+            f.seek(self._import_offset)
+            text = f.read()
+        # Keep a partially written last line for the next read
+        complete = text[: text.rfind("\n") + 1]
+        self._import_offset += len(complete.encode("utf-8", errors="replace"))
+        return parse_import_times(complete.splitlines())
+
+    def _add_imports(self, records: Sequence[ImportRecord], start: float) -> None:
+        """
+        Lay out imports one after another on the import track.
+
+        Args:
+            records: Top-level imports
+            start: perf_counter time the first import starts at
+        """
+        for record in records:
+            self._imports.append(record)
+            self._add_import_span(record, start)
+            start += record.cumulative_us / 1e6
+
+    def _add_import_span(self, record: ImportRecord, start: float) -> None:
+        """
+        Record an import and its nested imports as spans.
+
+        Args:
+            record: Import
+            start: perf_counter time the import starts at
+        """
+        event = {
+            "name": record.name,
+            "cat": "import",
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": float(record.cumulative_us),
+            "pid": os.getpid(),
+            "tid": IMPORT_TRACK_ID,
+            "args": {"self_us": record.self_us},
+        }
+        with self._lock:
+            self._spans.append(event)
+        for child in record.children:
+            self._add_import_span(child, start)
+            start += child.cumulative_us / 1e6
+
+
+def start_profiling() -> StartupProfiler:
+    """
+    Start recording startup phases for profile_phase.
+
+    Import times are read from the log named by IMPORTTIME_LOG_ENV, which
+    rerun_with_import_times sets.
+
+    Returns:
+        StartupProfiler: The active profiler
+    """
+    global _active_profiler
+    _active_profiler = StartupProfiler(os.environ.get(IMPORTTIME_LOG_ENV))
+    if _active_profiler._import_log is None:
+        logger.warning(
+            "Import times are not recorded; start with --profile-startup to include them"
+        )
+    return _active_profiler
+
+
+def stop_profiling() -> Optional[StartupProfiler]:
+    """
+    Stop recording startup phases.
+
+    Returns:
+        Optional[StartupProfiler]: The profiler that was active, if any
+    """
+    global _active_profiler
+    profiler, _active_profiler = _active_profiler, None
+    return profiler
+
+
+def get_profiler() -> Optional[StartupProfiler]:
+    """
+    Get the active profiler.
+
+    Returns:
+        Optional[StartupProfiler]: The profiler, or None if profiling is off
+    """
+    return _active_profiler
+
+
+def profile_phase(name: str, category: str = "startup", **args: Any) -> ContextManager[None]:
+    """
+    Time a block of code if startup profiling is on.
+
+    Args:
+        name: Phase name
+        category: Trace category
+        **args: Extra values shown with the span in the trace viewer
+
+    Returns:
+        ContextManager[None]: Timing context, or a shared no-op context while profiling is off
+    """
+    profiler = _active_profiler
+    if profiler is None:
+        return _NO_PHASE
+    return profiler.phase(name, category, **args)
+
+
+def finish_after_startup(
+    trace_path: Optional[Union[str, Path]] = None,
+    warm_up: Optional[Any] = None,
+    timeout: float = WARM_UP_TIMEOUT_SECONDS,
+) -> None:
+    """
+    Write the trace once the event loop runs and the warm-up is published.
+
+    Call after showing the main window; does nothing while profiling is off.
+
+    Args:
+        trace_path: Output file (default: logs/startup_trace_<timestamp>.json)
+        warm_up: Startup warm-up to wait for, if any
+        timeout: Maximum seconds to wait for the warm-up
+    """
+    profiler = get_profiler()
+    if profiler is None:
+        return
+
+    # Imported here so the profiler does not need Qt outside the application
+    from PySide6.QtCore import QTimer
+
+    shown = time.perf_counter()
+    deadline = shown + timeout
+
+    def finish():
+        if warm_up is not None and warm_up.is_loading and time.perf_counter() < deadline:
+            QTimer.singleShot(WARM_UP_POLL_MS, finish)
+            return
+        stop_profiling()
+        profiler.add_span("wait_for_warm_up", shown, time.perf_counter())
+        profiler.finish(trace_path)
+
+    def first_idle():
+        profiler.add_span("first_idle", shown, time.perf_counter())
+        finish()
+
+    QTimer.singleShot(0, first_idle)
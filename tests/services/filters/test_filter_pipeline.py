@@ -0,0 +1,107 @@
+"""
+test_filter_pipeline.py
+
+Description: Tests for the mask-based filter pipeline in FilterManager
+"""
+
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from src.services.filters import DateFilter, FilterManager, TextFilter, ValidationListFilter
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    """Create a sample entries DataFrame."""
+    return pd.DataFrame(
+        {
+            "player": ["Engelchen", "Moony", "Feldjäger", "Moony", "Engelchen"],
+            "chest_type": ["Cobra Chest", "Elegant Chest", "Cobra Chest", "Cobra Chest", "Rare"],
+            "source": ["Level 25 Crypt", "Level 20 Crypt", "Mercenary", "Level 25 Crypt", "Event"],
+            "date": ["2025-03-15", "2025-03-16", "2025-03-17", "2025-03-18", "2025-03-19"],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+@pytest.fixture
+def manager() -> FilterManager:
+    """Create a manager with a text, validation list and date filter."""
+    manager = FilterManager()
+    manager.register_filter("search", TextFilter("search", "Search", ["source"]))
+    manager.register_filter("player", ValidationListFilter("player", "Player", "player"))
+    manager.register_filter("date", DateFilter("date", "Date", "date"))
+    return manager
+
+
+def test_masks_match_apply(sample_df):
+    """Test that each filter's mask selects the same rows as apply."""
+    text_filter = TextFilter("search", "Search")
+    text_filter.set_search_text("crypt")
+    player_filter = ValidationListFilter("player", "Player", "player")
+    player_filter.set_selected_values(["moony"])
+    date_filter = DateFilter("date", "Date", "date")
+    date_filter.set_date_range("2025-03-16", "2025-03-18")
+
+    for filter_obj in (text_filter, player_filter, date_filter):
+        mask = filter_obj.mask(sample_df)
+        assert mask.index.equals(sample_df.index)
+        assert list(sample_df[mask].index) == list(filter_obj.apply(sample_df).index)
+
+
+def test_inactive_filter_mask_keeps_all_rows(sample_df):
+    """Test that an inactive filter keeps every row."""
+    assert TextFilter("search", "Search").mask(sample_df).all()
+
+
+def test_apply_filters_combines_masks(manager, sample_df):
+    """Test that all active masks are ANDed."""
+    manager.get_filter("search").set_search_text("crypt")
+    manager.get_filter("player").set_selected_values(["Moony"])
+    manager.get_filter("date").set_date_range("2025-03-17", None)
+
+    result = manager.apply_filters(sample_df)
+
+    assert list(result.index) == [13]
+
+
+def test_only_changed_filter_is_recomputed(manager, sample_df):
+    """Test that cached masks are reused for unchanged filters."""
+    search_filter = manager.get_filter("search")
+    player_filter = manager.get_filter("player")
+    search_filter.set_search_text("crypt")
+    player_filter.set_selected_values(["Moony"])
+
+    manager.apply_filters(sample_df, data_version=1)
+
+    with patch.object(search_filter, "mask", wraps=search_filter.mask) as search_mask, patch.object(
+        player_filter, "mask", wraps=player_filter.mask
+    ) as player_mask:
+        player_filter.set_selected_values(["Engelchen"])
+        result = manager.apply_filters(sample_df.copy(), data_version=1)
+
+    assert search_mask.call_count == 0
+    assert player_mask.call_count == 1
+    assert list(result.index) == [10]
+
+
+def test_new_data_version_recomputes_masks(manager, sample_df):
+    """Test that a new data version invalidates cached masks."""
+    search_filter = manager.get_filter("search")
+    search_filter.set_search_text("crypt")
+    manager.apply_filters(sample_df, data_version=1)
+
+    changed_df = sample_df.copy()
+    changed_df.loc[12, "source"] = "Level 5 Crypt"
+
+    assert len(manager.apply_filters(changed_df, data_version=1)) == 3
+    assert len(manager.apply_filters(changed_df, data_version=2)) == 4
+
+
+def test_no_active_filters_returns_copy(manager, sample_df):
+    """Test that the frame is returned unfiltered when nothing is active."""
+    result = manager.apply_filters(sample_df)
+
+    assert result is not sample_df
+    assert result.equals(sample_df)
@@ -4,11 +4,14 @@ test_text_filter.py
 Description: Test for TextFilter class
 """
 
+import time
+
 import pytest
 import pandas as pd
 from unittest.mock import MagicMock, patch
 
 from src.services.filters.text_filter import TextFilter
+from src.services.text_index import compile_pattern
 from src.interfaces.i_config_manager import IConfigManager
 
 
@@ -249,3 +252,51 @@ class TestTextFilter:
         assert new_filter.whole_word is True
         assert new_filter.regex_enabled is True
         assert set(new_filter.target_columns) == {"player", "chest_type"}
+
+    def test_regex_patterns_are_cached(self, filter_obj: TextFilter, sample_df: pd.DataFrame):
+        """Test that repeated searches reuse the compiled pattern."""
+        filter_obj.regex_enabled = True
+        filter_obj.set_search_text(r"^Player\d$")
+
+        compile_pattern.cache_clear()
+        filter_obj.apply(sample_df)
+        filter_obj.apply(sample_df)
+
+        assert compile_pattern.cache_info().hits >= 1
+        assert len(filter_obj.apply(sample_df)) == 3
+
+    def test_nested_quantifier_rejected(self, filter_obj: TextFilter, sample_df: pd.DataFrame):
+        """Test that patterns prone to catastrophic backtracking are not run."""
+        filter_obj.regex_enabled = True
+        filter_obj.set_search_text(r"(\w+)+$")
+
+        assert len(filter_obj.apply(sample_df)) == len(sample_df)
+
+    def test_alternation_backtracking_times_out(self, filter_obj: TextFilter):
+        """Test that a repeated alternation times out instead of blocking on one value."""
+        df = pd.DataFrame({"player": ["a" * 34 + "!", "Player1"]})
+        filter_obj.target_columns = ["player"]
+        filter_obj.regex_enabled = True
+        filter_obj.set_search_text(r"^(a|aa)+$")
+
+        start = time.monotonic()
+        result = filter_obj.apply(df)
+
+        assert time.monotonic() - start < filter_obj.time_budget
+        assert filter_obj.last_search_timed_out is True
+        assert len(result) == len(df)
+
+    def test_search_time_budget(self, filter_obj: TextFilter, sample_df: pd.DataFrame):
+        """Test that a search exceeding its time budget is aborted."""
+        filter_obj.regex_enabled = True
+        filter_obj.set_search_text("Player")
+        filter_obj.time_budget = -1
+
+        result = filter_obj.apply(sample_df)
+
+        assert filter_obj.last_search_timed_out is True
+        assert len(result) == len(sample_df)
+
+        filter_obj.time_budget = TextFilter.DEFAULT_TIME_BUDGET
+        assert len(filter_obj.apply(sample_df)) == 5
+        assert filter_obj.last_search_timed_out is False
@@ -0,0 +1,116 @@
+"""
+test_bulk_import.py
+
+Description: Tests for parallel multi-file entry import
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.services.bulk_import import import_entry_files, resolve_entry_paths
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_service import FileService
+
+
+@pytest.fixture
+def input_dir(tmp_path) -> Path:
+    """Create three daily export files and one file without a date."""
+    for day, player in [
+        ("2025-03-17", "Engelchen"),
+        ("2025-03-18", "Moony"),
+        ("2025-03-19", "Feldjäger"),
+    ]:
+        text = f"Cobra Chest\nFrom: {player}\nSource: Level 15 Crypt\n" * 3
+        (tmp_path / f"chests_{day}.txt").write_text(text, encoding="utf-8")
+    (tmp_path / "extra.txt").write_text(
+        "Elegant Chest\nFrom: Moony\nSource: Level 20 Crypt\n", encoding="utf-8"
+    )
+    (tmp_path / "notes.md").write_text("not an export", encoding="utf-8")
+    return tmp_path
+
+
+def test_resolve_entry_paths(input_dir):
+    """Test directories, globs, explicit paths and de-duplication."""
+    assert [p.name for p in resolve_entry_paths(input_dir)] == [
+        "chests_2025-03-17.txt",
+        "chests_2025-03-18.txt",
+        "chests_2025-03-19.txt",
+        "extra.txt",
+    ]
+
+    paths = resolve_entry_paths(
+        [
+            str(input_dir / "chests_2025-03-1[89].txt"),
+            input_dir / "extra.txt",
+            input_dir / "missing.txt",
+        ]
+        + [input_dir / "extra.txt"]
+    )
+    assert [p.name for p in paths] == [
+        "chests_2025-03-18.txt",
+        "chests_2025-03-19.txt",
+        "extra.txt",
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_import_tags_dates_and_reports_progress(input_dir, max_workers):
+    """Test that rows keep file order, carry their file's date and progress covers every file."""
+    progress = []
+
+    entries_df, results = import_entry_files(
+        input_dir,
+        max_workers=max_workers,
+        progress=lambda r, done, total: progress.append((r.path, done, total)),
+    )
+
+    assert len(entries_df) == 10
+    assert list(entries_df["player"].iloc[::3][:3]) == ["Engelchen", "Moony", "Feldjäger"]
+    assert list(entries_df["date"].iloc[[0, 3, 6, 9]]) == [
+        "2025-03-17",
+        "2025-03-18",
+        "2025-03-19",
+        None,
+    ]
+    assert [r.entry_count for r in results] == [3, 3, 3, 1]
+    assert sorted(done for _, done, _ in progress) == [1, 2, 3, 4]
+    assert {total for _, _, total in progress} == {4}
+
+
+def test_import_assigns_unique_ids(input_dir):
+    """Test that identical entries within and across files get distinct IDs."""
+    entries_df, _ = import_entry_files(input_dir, max_workers=2)
+
+    assert entries_df.index.name == "id"
+    assert entries_df.index.is_unique
+    assert list(entries_df.index) == list(range(10))
+
+
+def test_import_records_file_errors(input_dir):
+    """Test that a file that fails to parse is reported and the others are still imported."""
+    (input_dir / "chests_2025-03-20.txt").write_bytes(
+        "Cobra Chest\nFrom: Feldj\xe4ger\nSource: X\n".encode("cp1252")
+    )
+
+    entries_df, results = import_entry_files(input_dir, max_workers=2, encodings=["utf-8"])
+
+    failed = [r for r in results if not r.ok]
+    assert [Path(r.path).name for r in failed] == ["chests_2025-03-20.txt"]
+    assert len(entries_df) == 10
+
+
+def test_file_service_sets_entries_once(input_dir):
+    """Test that FileService merges all files into the store with one set_entries."""
+    store = DataFrameStore()
+    version = store.get_entries_version()
+
+    results = FileService(store).load_entry_files(str(input_dir / "chests_*.txt"), max_workers=2)
+
+    entries = store.get_entries()
+    assert [r.date for r in results] == ["2025-03-17", "2025-03-18", "2025-03-19"]
+    assert store.get_entries_version() == version + 1
+    assert len(entries) == 9
+    assert entries["date"].dtype == "datetime64[ns]"
+    assert entries["date"].min() == pd.Timestamp("2025-03-17")
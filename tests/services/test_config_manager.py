@@ -0,0 +1,144 @@
+"""
+test_config_manager.py
+
+Description: Tests for the write-behind saving and typed settings of ConfigManager
+"""
+
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.interfaces.events import EventType
+from src.models.validation_list import ValidationList
+from src.services.config_manager import ConfigManager
+from src.services.event_manager import EventManager
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    """Create a fresh ConfigManager on a copy of config.ini with a long auto-flush delay."""
+    shutil.copy(ConfigManager().config_path, tmp_path / "config.ini")
+    monkeypatch.setattr(ConfigManager, "_instance", None)
+    monkeypatch.setattr(ConfigManager, "auto_flush_delay", 60.0)
+    config = ConfigManager(tmp_path / "config.ini")
+    yield config
+    config.flush()
+
+
+def test_set_is_written_on_flush(config):
+    """Test that set only marks the config dirty until flush."""
+    before = config.config_path.read_text()
+
+    config.set("Validation", "case_sensitive", "True")
+
+    assert config.is_dirty
+    assert config.config_path.read_text() == before
+    assert config.flush()
+    assert not config.is_dirty
+    assert "case_sensitive = True" in config.config_path.read_text()
+    assert [p.name for p in config.config_path.parent.iterdir()] == ["config.ini"]
+
+
+def test_batch_writes_once(config):
+    """Test that a (nested) batch writes once when the outermost block ends."""
+    with patch.object(ConfigManager, "save_config", wraps=config.save_config) as save_config:
+        with config.batch():
+            for i in range(10):
+                config.set_value("Filter_test", f"key_{i}", i)
+            with config.batch():
+                config.remove_option("Filter_test", "key_0")
+            assert save_config.call_count == 0
+
+    assert save_config.call_count == 1
+    assert not config.is_dirty
+
+
+def test_auto_flush_is_debounced(config, monkeypatch):
+    """Test that a burst of changes is written once after the delay."""
+    monkeypatch.setattr(ConfigManager, "auto_flush_delay", 0.05)
+
+    with patch.object(ConfigManager, "save_config", wraps=config.save_config) as save_config:
+        for i in range(5):
+            config.set("UI", "font_size", str(10 + i))
+        deadline = time.monotonic() + 2
+        while config.is_dirty and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert save_config.call_count == 1
+    assert "font_size = 14" in config.config_path.read_text()
+
+
+def test_failed_save_keeps_previous_file(config):
+    """Test that a failing write leaves the previous file in place."""
+    before = config.config_path.read_text()
+    config.set("UI", "theme", "dark")
+
+    with patch.object(config.config, "write", side_effect=OSError("disk full")):
+        assert not config.flush()
+
+    assert config.is_dirty
+    assert config.config_path.read_text() == before
+
+
+def test_settings_snapshot_is_memoized(config):
+    """Test that the snapshot is reused until the config changes."""
+    config.set("Validation", "case_sensitive", "false")
+    config.set("Validation", "fuzzy_threshold", "80")
+    settings = config.settings
+
+    assert config.settings is settings
+    assert not settings.validation.case_sensitive
+    assert settings.validation.fuzzy_threshold == 80.0
+
+    config.set("Validation", "case_sensitive", "True")
+    config.set("Validation", "fuzzy_threshold", "not a number")
+
+    assert config.settings is not settings
+    assert config.settings.validation.case_sensitive
+    assert config.settings.validation.fuzzy_threshold == 75.0
+    assert not settings.validation.case_sensitive
+
+
+def test_settings_rebuilt_on_load_config(config, tmp_path):
+    """Test that loading another file rebuilds the snapshot."""
+    other = tmp_path / "other.ini"
+    other.write_text("[Correction]\nfuzzy_match_threshold = 0.5\nauto_apply_corrections = no\n")
+    settings = config.settings
+
+    assert config.load_config(str(other))
+
+    assert config.settings is not settings
+    assert config.settings.correction.fuzzy_match_threshold == 0.5
+    assert not config.settings.correction.auto_apply_corrections
+
+
+def test_changes_emit_config_changed(config):
+    """Test that set and remove_option publish CONFIG_CHANGED events."""
+    events = []
+
+    def on_config_changed(event_data):
+        events.append((event_data["section"], event_data["key"], event_data["revision"]))
+
+    EventManager.subscribe(EventType.CONFIG_CHANGED, on_config_changed)
+    try:
+        config.set("UI", "theme", "light")
+        config.remove_option("UI", "theme")
+    finally:
+        EventManager.unsubscribe(EventType.CONFIG_CHANGED, on_config_changed)
+
+    assert [event[:2] for event in events] == [("UI", "theme"), ("UI", "theme")]
+    assert events[-1][2] == config.revision
+
+
+def test_validation_list_follows_settings(config):
+    """Test that ValidationList picks up case_sensitive changes through the snapshot."""
+    config.set("Validation", "case_sensitive", "false")
+    validation_list = ValidationList("player", ["Moony"], config_manager=config)
+
+    assert validation_list.is_valid("moony")[0]
+
+    config.set("Validation", "case_sensitive", "true")
+
+    assert not validation_list.is_valid("moony")[0]
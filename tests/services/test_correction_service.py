@@ -0,0 +1,43 @@
+"""
+test_correction_service.py
+
+Description: Tests for applying correction rules through the data store
+"""
+
+import pandas as pd
+
+from src.services.correction_service import CorrectionService
+from src.services.dataframe_store import DataFrameStore
+
+
+def test_failed_corrections_are_counted():
+    """Test that corrections failing on single entries are reported in the statistics."""
+    store = DataFrameStore()
+    store.set_entries(
+        pd.DataFrame(
+            {
+                "chest_type": ["Cobra Chest"] * 3,
+                "player": ["Moony", "Moony", "Engelchen"],
+                "source": ["Level 15 Crypt"] * 3,
+                "status": "Pending",
+                "validation_errors": [[], [], []],
+                "original_values": [{}, {}, {}],
+            },
+            # A duplicated ID makes the per-entry update fail
+            index=pd.Index([7, 7, 8], name="id"),
+        )
+    )
+    store.set_correction_rules(
+        pd.DataFrame(
+            {
+                "from_text": ["Moony", "Engelchen"],
+                "to_text": ["Moon", "Engel"],
+                "category": ["player", "player"],
+                "enabled": [True, True],
+            }
+        )
+    )
+
+    stats = CorrectionService(store).apply_corrections()
+
+    assert stats == {"applied": 1, "errors": 2, "total": 3}
@@ -0,0 +1,105 @@
+"""
+test_date_index.py
+
+Description: Tests for ingest date normalization and the sorted date index used by DateFilter
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.date_index import SortedDateColumn, normalize_date_columns
+from src.services.filters.date_filter import DateFilter
+
+
+@pytest.fixture
+def daily_entries() -> pd.DataFrame:
+    """Create entries for ten days of imports, two chests per day, in order."""
+    days = pd.date_range("2025-03-01", periods=10, freq="D")
+    return pd.DataFrame(
+        {
+            "chest_type": ["Cobra Chest", "Elegant Chest"] * 10,
+            "player": ["Moony", "Engelchen"] * 10,
+            "source": ["Level 25 Crypt"] * 20,
+            "status": ["Pending"] * 20,
+            "date": [day.strftime("%Y-%m-%d") for day in days.repeat(2)],
+        }
+    )
+
+
+def test_normalize_date_columns():
+    """Test that only fully parseable date columns are converted."""
+    df = pd.DataFrame(
+        {
+            "date": ["2025-03-01", "2025-03-02", None],
+            "modified_at": ["2025-03-01 10:00", "oops", "2025-03-02 11:00"],
+            "player": ["2025-03-01", "Moony", "Engelchen"],
+        }
+    )
+
+    normalize_date_columns(df)
+
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["modified_at"].dtype == object
+    assert df["player"].dtype == object
+
+
+def test_store_normalizes_at_ingest(daily_entries):
+    """Test that DataFrameStore stores date columns as datetime64[ns]."""
+    store = DataFrameStore()
+    store.set_entries(daily_entries, emit_event=False)
+
+    assert store.get_entries()["date"].dtype == "datetime64[ns]"
+    assert daily_entries["date"].dtype == object
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_sorted_column_matches_comparison(shuffle):
+    """Test range masks against plain comparisons, with and without sorted input."""
+    values = pd.Series(pd.date_range("2025-01-01", periods=50, freq="12h"))
+    values[7] = pd.NaT
+    if shuffle:
+        values = values.sample(frac=1, random_state=3).reset_index(drop=True)
+
+    column = SortedDateColumn(values)
+    start, end = datetime(2025, 1, 5), datetime(2025, 1, 12)
+    expected = ((values >= start) & (values <= end)).to_numpy()
+
+    assert not column.is_monotonic
+    np.testing.assert_array_equal(column.range_mask(start, end), expected)
+    np.testing.assert_array_equal(column.range_mask(None, end), (values <= end).to_numpy())
+
+
+def test_date_filter_uses_slice_for_daily_imports(daily_entries):
+    """Test that chronological data is filtered with a slice and matches the unindexed filter."""
+    store = DataFrameStore()
+    store.set_entries(daily_entries, emit_event=False)
+    df = store.get_entries()
+
+    indexed = DateFilter("date", "Date", "date")
+    indexed.set_date_index(store.get_date_index())
+    indexed.set_date_range("2025-03-03", "2025-03-05")
+    plain = DateFilter("plain", "Date", "date")
+    plain.set_date_range("2025-03-03", "2025-03-05")
+
+    assert indexed.row_slice(df) == slice(4, 10)
+    expected = df.loc[plain.apply(daily_entries).index]
+    pd.testing.assert_frame_equal(indexed.apply(df), expected)
+    assert indexed.mask(df).tolist() == plain.mask(daily_entries).tolist()
+
+
+def test_date_filter_ignores_stale_index(daily_entries):
+    """Test that an index for other data is not used."""
+    store = DataFrameStore()
+    store.set_entries(daily_entries, emit_event=False)
+
+    date_filter = DateFilter("date", "Date", "date")
+    date_filter.set_date_index(store.get_date_index())
+    date_filter.set_date_range("2025-03-03", None)
+    subset = store.get_entries().iloc[::2]
+
+    assert date_filter.row_slice(subset) is None
+    assert len(date_filter.apply(subset)) == 8
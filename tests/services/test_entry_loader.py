@@ -0,0 +1,91 @@
+"""
+test_entry_loader.py
+
+Description: Conformance and throughput tests for the canonical entry loader over data/input
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.entry_reader import ChestEntrySink, DataFrameSink, entry_id, load_entries
+from src.services.file_parser import FileParser
+from src.services.file_service import FileService
+
+
+INPUT_DIR = Path(__file__).parents[2] / "data" / "input"
+INPUT_FILES = sorted(INPUT_DIR.glob("*.txt"))
+
+
+def reference_entries(path: Path):
+    """
+    Parse a file with a plain implementation of the documented grammar.
+
+    Args:
+        path: Chest export text file
+
+    Returns:
+        List of (chest_type, player, source) tuples
+    """
+    lines = [line.strip() for line in path.read_text(encoding="utf-8").splitlines()]
+    entries = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if not line or line.lower().startswith(("from:", "source:")):
+            i += 1
+            continue
+        if i + 2 >= len(lines):
+            break
+        if not lines[i + 1].lower().startswith("from:"):
+            i += 1
+            continue
+        player = lines[i + 1][5:].strip()
+        source = lines[i + 2]
+        if source.lower().startswith("source:"):
+            source = source[7:].strip()
+        if player and source:
+            entries.append((line, player, source))
+        i += 3
+    return entries
+
+
+@pytest.mark.parametrize("path", INPUT_FILES, ids=lambda path: path.name)
+def test_sinks_conform_to_grammar(path):
+    """Test that both sinks match the reference parse and agree on IDs."""
+    expected = reference_entries(path)
+
+    entries_df = load_entries(path, DataFrameSink())
+    entries = load_entries(path, ChestEntrySink())
+
+    assert list(zip(entries_df["chest_type"], entries_df["player"], entries_df["source"])) == expected
+    assert [(e.chest_type, e.player, e.source) for e in entries] == expected
+    assert list(entries_df.index) == [e.id for e in entries]
+    assert entries_df.index[0] == entry_id(*expected[0])
+
+
+@pytest.mark.parametrize("path", INPUT_FILES, ids=lambda path: path.name)
+def test_file_service_and_parser_agree(path):
+    """Test that FileService.load_entries and FileParser.parse_entry_file load the same entries."""
+    store = DataFrameStore()
+    assert FileService(store).load_entries(str(path))
+
+    entries_df = store.get_entries()
+    entries = FileParser().parse_entry_file(path)
+
+    assert list(entries_df.index) == [e.id for e in entries]
+    assert list(entries_df["player"]) == [e.player for e in entries]
+
+
+def test_throughput():
+    """Test that loading all input files into a DataFrame stays above 50k entries/s."""
+    load_entries(INPUT_FILES[0], DataFrameSink())
+
+    start = time.perf_counter()
+    count = sum(len(load_entries(path, DataFrameSink())) for path in INPUT_FILES)
+    elapsed = time.perf_counter() - start
+
+    assert count > 0
+    assert count / elapsed > 50_000
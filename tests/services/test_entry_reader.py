@@ -0,0 +1,123 @@
+"""
+test_entry_reader.py
+
+Description: Tests for the streaming chest export reader and chunked loading into DataFrameStore
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.entry_reader import (
+    EntryLineParser,
+    iter_entry_chunks,
+    parse_entry_lines,
+)
+from src.services.file_parser import FileParser
+
+
+INPUT_FILE = Path(__file__).parents[2] / "data" / "input" / "chests_2025-03-17.txt"
+
+ENTRY_TEXT = (
+    "Cobra Chest\nFrom: Engelchen\nSource: Level 15 Crypt\n"
+    "\n"
+    "Elegant Chest\nfrom: Moony\nSOURCE: Level 20 Crypt\n"
+    "Source: stray line\n"
+    "Broken Chest\nNot a player line\nFrom: Feldjäger\nSource: Mercenary Exchange\n"
+    "Empty Source Chest\nFrom: Moony\n\n"
+    "Rare Chest\nFrom: Engelchen\nNo Prefix Source\n"
+    "Dangling Chest\nFrom: Moony\n"
+)
+
+EXPECTED = [
+    ("Cobra Chest", "Engelchen", "Level 15 Crypt"),
+    ("Elegant Chest", "Moony", "Level 20 Crypt"),
+    ("Not a player line", "Feldjäger", "Mercenary Exchange"),
+    ("Rare Chest", "Engelchen", "No Prefix Source"),
+]
+
+
+def rows(chunks):
+    """Flatten entry chunks into (chest_type, player, source) tuples."""
+    result = []
+    for chunk in chunks:
+        result.extend(zip(chunk["chest_type"], chunk["player"], chunk["source"]))
+    return result
+
+
+def test_grammar_edge_cases():
+    """Test blank lines, stray lines, missing prefixes and malformed entries."""
+    assert rows(parse_entry_lines(ENTRY_TEXT.splitlines())) == EXPECTED
+
+
+def test_fast_path_matches_state_machine():
+    """Test that whole-batch parsing and line-by-line parsing agree."""
+    lines = INPUT_FILE.read_text(encoding="utf-8").splitlines()
+    lines = lines[:300] + [""] + lines[300:600] + ["Odd line"] + lines[600:]
+
+    parser = EntryLineParser(chunk_size=50)
+    chunks = []
+    for line in lines:
+        chunks.extend(parser.feed([line]))
+    chunks.extend(parser.finish())
+
+    assert rows(chunks) == rows(parse_entry_lines(lines))
+    assert all(len(chunk["player"]) <= 50 for chunk in chunks)
+
+
+@pytest.mark.parametrize("chunk_size, block_size", [(7, 37), (1000, 4096), (50000, 1 << 20)])
+def test_file_chunks_independent_of_sizes(chunk_size, block_size):
+    """Test that chunk and block sizes do not change the parsed entries."""
+    expected = rows(parse_entry_lines(INPUT_FILE.read_text(encoding="utf-8").splitlines()))
+
+    chunks = list(iter_entry_chunks(INPUT_FILE, chunk_size=chunk_size, block_size=block_size))
+
+    assert len(expected) == 1944
+    assert rows(chunks) == expected
+    assert all(len(chunk["player"]) <= chunk_size for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "encoding, bom", [("utf-8", b""), ("utf-8", b"\xef\xbb\xbf"), ("cp1252", b""), ("utf-16", b"")]
+)
+def test_encoding_detection(tmp_path, encoding, bom):
+    """Test byte order marks and the fallback for non-UTF-8 text found late in the file."""
+    text = "Cobra Chest\r\nFrom: Engelchen\r\nSource: Level 15 Crypt\r\n" * 20
+    text += "Elegant Chest\r\nFrom: Feldjäger\r\nSource: Level 20 Crypt\r\n"
+    path = tmp_path / "chests.txt"
+    path.write_bytes(bom + text.encode(encoding))
+
+    result = rows(iter_entry_chunks(path, block_size=64))
+
+    assert len(result) == 21
+    assert result[-1] == ("Elegant Chest", "Feldjäger", "Level 20 Crypt")
+
+
+def test_file_parser_uses_stream():
+    """Test that FileParser entries and chunks agree."""
+    parser = FileParser()
+
+    entries = parser.parse_entry_file(INPUT_FILE)
+    chunks = list(parser.iter_entry_chunks(INPUT_FILE))
+
+    assert [(e.chest_type, e.player, e.source) for e in entries] == rows(chunks)
+    assert [
+        (e.chest_type, e.player, e.source) for e in parser._parse_text_content(ENTRY_TEXT)
+    ] == EXPECTED
+
+
+def test_store_loads_chunks():
+    """Test that chunks go straight into DataFrameStore."""
+    store = DataFrameStore()
+
+    chunks = iter_entry_chunks(INPUT_FILE, chunk_size=500)
+
+    assert store.set_entries_from_chunks(chunks, emit_event=False)
+
+    entries = store.get_entries()
+    assert len(entries) == 1944
+    assert entries.index.name == "id"
+    assert (entries["status"] == "Pending").all()
+    assert entries["validation_errors"].iloc[0] == []
+    assert str(entries["modified_at"].dtype) == "datetime64[ns]"
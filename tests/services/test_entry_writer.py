@@ -0,0 +1,105 @@
+"""
+test_entry_writer.py
+
+Description: Tests for the vectorized entries exporter
+"""
+
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from src.models.chest_entry import ChestEntry
+from src.services.entry_reader import ChestEntrySink, load_entries
+from src.services.entry_writer import format_entries_text, write_entries, write_entries_text
+from src.services.file_parser import FileParser
+
+
+@pytest.fixture
+def entries_df():
+    """Create entries as the DataFrameStore holds them."""
+    return pd.DataFrame(
+        {
+            "chest_type": ["Cobra Chest", "Elegant Chest", "Orc Chest"],
+            "player": ["Engelchen", "From: Moony", "Feldjäger"],
+            "source": ["Level 15 Crypt", "source: Mercenary Exchange", "Level 10 Crypt"],
+            "status": ["Valid", "Invalid", "Pending"],
+            "validation_errors": [[], ["Invalid player"], []],
+        },
+        index=pd.Index([11, 12, 13], name="id"),
+    )
+
+
+def test_text_matches_chest_entry_to_text(entries_df):
+    """Test that the text format equals ChestEntry.to_text for every entry."""
+    entries = [
+        ChestEntry(row.chest_type, row.player, row.source) for row in entries_df.itertuples()
+    ]
+
+    assert format_entries_text(entries_df) == "\n".join(e.to_text() for e in entries)
+    assert format_entries_text(entries_df, blank_lines=True) == "".join(
+        e.to_text() + "\n\n" for e in entries
+    )
+
+
+@pytest.mark.parametrize("blank_lines", [False, True])
+def test_text_round_trip_across_chunks(tmp_path, entries_df, blank_lines):
+    """Test that chunked text exports parse back to the same entries."""
+    path = tmp_path / "chests.txt"
+    write_entries_text(entries_df, path, blank_lines=blank_lines, chunk_size=2)
+
+    parsed = load_entries(path, ChestEntrySink())
+
+    assert [e.player for e in parsed] == ["Engelchen", "Moony", "Feldjäger"]
+    assert [e.source for e in parsed][1] == "Mercenary Exchange"
+
+
+def test_csv_export(tmp_path, entries_df):
+    """Test that CSV exports keep the IDs and encode list columns as JSON."""
+    path = tmp_path / "chests.csv"
+    assert write_entries(entries_df, path) == 3
+
+    result = pd.read_csv(path)
+
+    assert list(result["id"]) == [11, 12, 13]
+    assert json.loads(result["validation_errors"][1]) == ["Invalid player"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_parquet_export(tmp_path, entries_df):
+    """Test the compressed columnar export."""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "chests.parquet"
+    write_entries(entries_df, path)
+
+    result = pd.read_parquet(path)
+
+    assert list(result["player"]) == list(entries_df["player"])
+
+
+def test_failed_write_keeps_existing_file(tmp_path, entries_df):
+    """Test that a failing export leaves the previous file and no temp file behind."""
+    path = tmp_path / "chests.csv"
+    path.write_text("previous", encoding="utf-8")
+
+    with patch.object(pd.DataFrame, "to_csv", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            write_entries(entries_df, path)
+
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_file_parser_save_formats(tmp_path):
+    """Test that FileParser saves entries by extension and rejects unknown formats."""
+    parser = FileParser()
+    entries = [ChestEntry("Cobra Chest", "Engelchen", "Level 15 Crypt")]
+
+    parser.save_entries_to_file(entries, tmp_path / "chests.txt")
+    parser.save_entries_to_file(entries, tmp_path / "chests.csv")
+
+    assert (tmp_path / "chests.txt").read_text(encoding="utf-8") == entries[0].to_text()
+    assert list(pd.read_csv(tmp_path / "chests.csv")["player"]) == ["Engelchen"]
+    with pytest.raises(ValueError):
+        parser.save_entries_to_file(entries, tmp_path / "chests.xml")
@@ -0,0 +1,89 @@
+"""
+test_rule_reader.py
+
+Description: Tests for the vectorized correction rule CSV loader
+"""
+
+import pandas as pd
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_parser import FileParser
+from src.services.file_service import FileService
+from src.services.rule_reader import read_rules_frame, rules_from_frame, sniff_delimiter
+
+
+def test_sniff_delimiter():
+    """Test that the delimiter giving the most columns wins."""
+    assert sniff_delimiter("From;To;Category") == ";"
+    assert sniff_delimiter("From,To,Category") == ","
+    assert sniff_delimiter("From\tTo") == "\t"
+    assert sniff_delimiter("From") == ","
+
+
+def test_read_rules_frame_normalizes_values(tmp_path):
+    """Test header matching, stripping, dropped rows, categories and enabled flags."""
+    path = tmp_path / "rules.csv"
+    path.write_text(
+        "FROM; to ;Category;ENABLED\n"
+        " Moony ;Moon;player;true\n"
+        ";Empty;player;true\n"
+        "\n"
+        "Cobra;Cobra Chest;unknown;no\n"
+        "Krypta;Crypt;SOURCE;\n"
+        "Mercs;Mercenaries;source;enabled\n",
+        encoding="utf-8",
+    )
+
+    rules_df = read_rules_frame(path)
+
+    assert list(rules_df["from_text"]) == ["Moony", "Cobra", "Krypta", "Mercs"]
+    assert list(rules_df["category"]) == ["player", "general", "source", "source"]
+    assert list(rules_df["enabled"]) == [True, False, True, True]
+
+
+def test_read_rules_frame_legacy_disabled_column(tmp_path):
+    """Test that a Disabled column is inverted and other encodings are decoded."""
+    path = tmp_path / "rules.csv"
+    path.write_bytes("From,To,Disabled\nFeldjäger,Feldjager,yes\nA,B,\n".encode("latin-1"))
+
+    rules_df = read_rules_frame(path)
+
+    assert list(rules_df["from_text"]) == ["Feldjäger", "A"]
+    assert list(rules_df["enabled"]) == [False, True]
+
+
+def test_read_rules_frame_missing_headers(tmp_path):
+    """Test that files without From/To headers are rejected."""
+    path = tmp_path / "rules.csv"
+    path.write_text("Name,Value\nA,B\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="From, To"):
+        read_rules_frame(path)
+
+
+def test_rules_match_frame(tmp_path):
+    """Test that parse_correction_file and parse_correction_frame agree."""
+    path = tmp_path / "rules.csv"
+    path.write_text("From,To,Category,Enabled\nMoony,Moon,player,false\n", encoding="utf-8")
+    parser = FileParser()
+
+    rules = parser.parse_correction_file(path)
+
+    assert rules == rules_from_frame(parser.parse_correction_frame(path))
+    assert (rules[0].from_text, rules[0].to_text, rules[0].category) == ("Moony", "Moon", "player")
+    assert rules[0].disabled
+
+
+def test_file_service_loads_rules_frame(tmp_path):
+    """Test that FileService stores the rules DataFrame directly."""
+    path = tmp_path / "rules.csv"
+    path.write_text("From;To\nMoony;Moon\nCobra;Cobra Chest\n", encoding="utf-8")
+    store = DataFrameStore()
+
+    assert FileService(store).load_correction_rules(path)
+
+    rules_df = store.get_correction_rules()
+    assert list(rules_df["to_text"]) == ["Moon", "Cobra Chest"]
+    assert rules_df["enabled"].all()
+    assert pd.api.types.is_bool_dtype(rules_df["enabled"])
@@ -0,0 +1,106 @@
+"""
+test_session_cache.py
+
+Description: Tests for the columnar session cache of the data store
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_service import FileService
+from src.services.session_cache import SessionCache, sources_fingerprint
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Create an entries file, a rules CSV and a player list."""
+    entries = tmp_path / "chests_2025-03-17.txt"
+    entries.write_text(
+        "Cobra Chest\nFrom: Engelchen\nSource: Level 15 Crypt\n"
+        "Elegant Chest\nFrom: Moony\nSource: Level 20 Crypt\n",
+        encoding="utf-8",
+    )
+    rules = tmp_path / "rules.csv"
+    rules.write_text("From,To,Category\nMoony,Moon,player\n", encoding="utf-8")
+    players = tmp_path / "players.txt"
+    players.write_text("Engelchen\nMoon\n", encoding="utf-8")
+    return {"entries": entries, "correction_rules": rules, "player": players}
+
+
+@pytest.fixture
+def loaded_store(inputs):
+    """Load the inputs into a store and mark one entry as validated."""
+    store = DataFrameStore()
+    file_service = FileService(store)
+    file_service.load_entries(inputs["entries"])
+    file_service.load_correction_rules(inputs["correction_rules"])
+    file_service.load_validation_list("player", inputs["player"])
+
+    entries = store.get_entries()
+    entries.loc[entries.index[1], "status"] = "Invalid"
+    entries.at[entries.index[1], "validation_errors"] = ["Invalid player: Moony"]
+    entries.at[entries.index[1], "original_values"] = {"player": "Mony"}
+    store.set_entries(entries)
+    return store
+
+
+def test_round_trip(loaded_store, inputs, tmp_path):
+    """Test that entries, status, original values, rules and lists are restored."""
+    cache = SessionCache(tmp_path / "cache")
+    assert cache.save(loaded_store, inputs)
+
+    restored = DataFrameStore()
+    assert cache.restore(restored, inputs)
+
+    entries = restored.get_entries()
+    assert entries.equals(loaded_store.get_entries())
+    assert entries["validation_errors"].iloc[1] == ["Invalid player: Moony"]
+    assert entries["original_values"].iloc[1] == {"player": "Mony"}
+    assert restored.get_correction_rules().equals(loaded_store.get_correction_rules())
+    assert list(restored.get_validation_list("player").index) == ["Engelchen", "Moon"]
+
+
+def test_changed_input_is_not_restored(loaded_store, inputs, tmp_path):
+    """Test that editing any input invalidates the session."""
+    cache = SessionCache(tmp_path / "cache")
+    cache.save(loaded_store, inputs)
+    fingerprint = sources_fingerprint(inputs)
+
+    inputs["player"].write_text("Engelchen\nMoon\nFeldjäger\n", encoding="utf-8")
+
+    assert sources_fingerprint(inputs) != fingerprint
+    assert not cache.restore(DataFrameStore(), inputs)
+
+
+def test_resave_replaces_session(loaded_store, inputs, tmp_path):
+    """Test that only the latest session is kept on disk."""
+    cache = SessionCache(tmp_path / "cache")
+    cache.save(loaded_store, inputs)
+    inputs["correction_rules"].write_text("From,To\nMoony,Moon\nEngel,Engelchen\n")
+    cache.save(loaded_store, inputs)
+
+    assert len(list(Path(cache.cache_dir).glob("session-*"))) == 1
+    assert cache.restore(DataFrameStore(), inputs)
+
+
+def test_file_service_skips_restored_inputs(loaded_store, inputs, tmp_path):
+    """Test that restored inputs are not parsed again until the store data changes."""
+    cache = SessionCache(tmp_path / "cache")
+    cache.save(loaded_store, inputs)
+    store = DataFrameStore()
+    cache.restore(store, inputs)
+    file_service = FileService(store)
+    file_service.set_restored_sources(inputs)
+    version = store.get_entries_version()
+
+    assert file_service.load_entries(inputs["entries"])
+    assert store.get_entries_version() == version
+    assert store.get_entries()["status"].iloc[1] == "Invalid"
+
+    store.set_entries(store.get_entries())
+    assert file_service.load_entries(inputs["entries"])
+    assert store.get_entries()["status"].iloc[1] == "Pending"
@@ -0,0 +1,144 @@
+"""
+test_sqlite_store.py
+
+Description: Tests for the SQLite entry history backend and the query compiler
+"""
+
+import sqlite3
+
+import pytest
+
+from src.services.file_service import FileService
+from src.services.sql_query import compile_query
+from src.services.sqlite_store import SQLiteDataStore
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    """Create two daily export files."""
+    paths = []
+    for day, players in [
+        ("2025-03-17", ["Engelchen", "Moony", "Moony"]),
+        ("2025-03-18", ["Feldjäger", "Moony"]),
+    ]:
+        path = tmp_path / f"chests_{day}.txt"
+        path.write_text(
+            "".join(f"Cobra Chest\nFrom: {p}\nSource: Level 15 Crypt\n" for p in players),
+            encoding="utf-8",
+        )
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def store(tmp_path, input_files):
+    """Create a store with both files imported."""
+    store = SQLiteDataStore(tmp_path / "history.db")
+    file_service = FileService(store)
+    for path in input_files:
+        file_service.load_entries(path)
+    yield store
+    store.close()
+
+
+def test_compile_query():
+    """Test comparisons, chains, membership, string methods and boolean operators."""
+    columns = {"player", "date", "status", "chest_type"}
+
+    where, params = compile_query(
+        "player == 'Moony' and '2025-03-01' <= date < '2025-04-01'"
+        " or status in ['Valid', 'Invalid'] and not chest_type.str.contains('Cobra')",
+        columns,
+    )
+
+    assert where == (
+        '(("player" = ? AND ("date" >= ? AND "date" < ?))'
+        ' OR ("status" IN (?, ?) AND (NOT instr("chest_type", ?) > 0)))'
+    )
+    assert params == ["Moony", "2025-03-01", "2025-04-01", "Valid", "Invalid", "Cobra"]
+
+
+@pytest.mark.parametrize(
+    "query_str", ["unknown == 1", "player == other", "player.apply(len) > 3", "player =="]
+)
+def test_compile_query_rejects_unsupported(query_str):
+    """Test that unknown columns, non-literals and other syntax are rejected."""
+    with pytest.raises(ValueError):
+        compile_query(query_str, {"player"})
+
+
+def test_history_keeps_all_imports(store):
+    """Test that the history holds every import while memory holds the last one."""
+    imports = store.get_imports()
+
+    assert len(store.get_entries()) == 2
+    assert list(imports["entry_count"]) == [3, 2]
+    counts = store.count_entries(["date"])
+    assert dict(zip(counts["date"], counts["count"])) == {"2025-03-17": 3, "2025-03-18": 2}
+
+
+def test_query_entries_pushes_filters_down(store):
+    """Test that query_entries returns matching rows from all imports."""
+    result = store.query_entries("player == 'Moony' and date >= '2025-03-18'")
+
+    assert list(result["player"]) == ["Moony"]
+    assert str(result["date"].dtype) == "datetime64[ns]"
+    assert result["validation_errors"].iloc[0] == []
+    assert result["origin"].iloc[0].endswith("chests_2025-03-18.txt")
+
+    with pytest.raises(ValueError):
+        store.query_entries("player.apply(len) > 3")
+
+
+def test_updates_rewrite_current_import(store, input_files):
+    """Test that validation updates and re-imports replace rows instead of adding them."""
+    entries = store.get_entries()
+    entries["status"] = "Valid"
+    entries["validation_errors"] = [["checked"]] * len(entries)
+    store.set_entries(entries, source="validation_service")
+    FileService(store).load_entries(input_files[0])
+
+    assert list(store.get_imports()["entry_count"]) == [3, 2]
+    valid = store.query_entries("status == 'Valid'")
+    assert list(valid["player"]) == ["Feldjäger", "Moony"]
+    assert valid["validation_errors"].iloc[0] == ["checked"]
+
+
+def test_single_entry_changes(store):
+    """Test that add, update and delete reach the history."""
+    entry_id = store.add_entry({"chest_type": "Elegant Chest", "player": "Moon", "source": "X"})
+    store.update_entry(entry_id, {"player": "Moonlight"})
+    moony_id = store.get_entries().index[1]
+    store.delete_entry(moony_id)
+
+    assert list(store.query_entries("date == '2025-03-18'")["player"]) == [
+        "Feldjäger",
+        "Moonlight",
+    ]
+
+
+def test_append_import_leaves_memory_alone(store, input_files):
+    """Test that appended imports replace the same source and do not touch the current import."""
+    entries = store.get_entries()
+    appended = entries.assign(status="Invalid")
+    appended.index = appended.index + 1
+
+    assert store.append_import(appended, source="watch/chests_2025-03-19.txt")
+    assert store.append_import(appended.iloc[:1], source="watch/chests_2025-03-19.txt")
+
+    assert list(store.get_imports()["entry_count"]) == [3, 2, 1]
+    assert store.get_entries().equals(entries)
+    assert list(store.query_entries("date == '2025-03-19'")["status"]) == ["Invalid"]
+
+
+def test_database_uses_wal_and_indexes(store, tmp_path):
+    """Test the journal mode and that player queries use an index."""
+    connection = sqlite3.connect(tmp_path / "history.db")
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM entries WHERE player = 'Moony'"
+        ).fetchall()
+        assert any("idx_entries_player" in row[-1] for row in plan)
+    finally:
+        connection.close()
@@ -0,0 +1,113 @@
+"""
+test_text_index.py
+
+Description: Tests for the trigram text index and its use by TextFilter
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.filters import TextFilter
+from src.services.text_index import ColumnTextIndex, TextSearchIndex
+
+
+@pytest.fixture
+def players() -> pd.Series:
+    """Create a player column with repeats and a missing value."""
+    return pd.Series(
+        ["Moony", "Engelchen", "Moonlight Rider", "moony", None, "Rider of Moon", "Engelchen"]
+    )
+
+
+@pytest.fixture
+def entries_df() -> pd.DataFrame:
+    """Create an entries DataFrame with the store's required columns."""
+    return pd.DataFrame(
+        {
+            "chest_type": ["Cobra Chest", "Elegant Chest", "Cobra Chest", "Rare Chest"],
+            "player": ["Moony", "Engelchen", "Moonlight Rider", "Feldjäger"],
+            "source": ["Level 25 Crypt", "Level 20 Crypt", "Mercenary Exchange", "Event"],
+            "status": ["Pending"] * 4,
+        },
+        index=pd.Index([101, 102, 103, 104], name="id"),
+    )
+
+
+def test_substring_matches_scan(players):
+    """Test that indexed substring search agrees with a pandas scan."""
+    index = ColumnTextIndex(players)
+
+    for needle in ["moon", "MOON", "rider", "en", "x", "chen", "Moon"]:
+        expected = players.str.lower().str.contains(needle.lower(), regex=False, na=False)
+        assert np.array_equal(index.substring_mask(needle), expected.to_numpy())
+
+        expected = players.str.contains(needle, regex=False, na=False)
+        assert np.array_equal(index.substring_mask(needle, case_sensitive=True), expected.to_numpy())
+
+
+def test_whole_word_and_prefix(players):
+    """Test whole-word and prefix queries."""
+    index = ColumnTextIndex(players)
+
+    assert list(np.flatnonzero(index.whole_word_mask("moon"))) == [5]
+    assert list(np.flatnonzero(index.whole_word_mask("rider"))) == [2, 5]
+    assert list(np.flatnonzero(index.prefix_mask("moon"))) == [0, 2, 3]
+    assert list(np.flatnonzero(index.prefix_mask("Moon", case_sensitive=True))) == [0, 2]
+
+
+def test_regex_scans_distinct_values(players):
+    """Test regex matching over distinct values."""
+    index = ColumnTextIndex(players)
+
+    assert index.distinct_count == 5
+    assert list(np.flatnonzero(index.regex_mask(re.compile(r"^moo.y$", re.IGNORECASE)))) == [0, 3]
+
+
+def test_store_resets_index_on_change(entries_df):
+    """Test that the store's index follows entries changes."""
+    store = DataFrameStore()
+    store.set_entries(entries_df)
+    text_index = store.get_text_index()
+
+    assert text_index.version == store.get_entries_version()
+    assert text_index.covers(store.get_entries())
+    assert text_index.column("player").substring_mask("moon").sum() == 2
+
+    store.update_entry(104, {"player": "Moonwalker"}, emit_event=False)
+
+    assert text_index.version == store.get_entries_version()
+    assert text_index.column("player").substring_mask("moon").sum() == 3
+
+
+def test_text_filter_uses_index(entries_df):
+    """Test that TextFilter gives the same result with and without the index."""
+    text_index = TextSearchIndex()
+    text_index.reset(entries_df, version=1)
+
+    for options in [{}, {"whole_word": True}, {"regex_enabled": True}, {"case_sensitive": True}]:
+        indexed = TextFilter("search", "Search", **options)
+        indexed.set_text_index(text_index)
+        scanning = TextFilter("search", "Search", **options)
+
+        for text in ["crypt", "Crypt", "level 2", "^Moon", "Chest"]:
+            indexed.set_search_text(text)
+            scanning.set_search_text(text)
+            assert indexed.mask(entries_df.copy()).equals(scanning.mask(entries_df))
+
+
+def test_text_filter_ignores_index_for_other_frames(entries_df):
+    """Test that an index describing other rows is not used."""
+    text_index = TextSearchIndex()
+    text_index.reset(entries_df, version=1)
+
+    text_filter = TextFilter("search", "Search")
+    text_filter.set_text_index(text_index)
+    text_filter.set_search_text("crypt")
+
+    subset = entries_df.iloc[:2]
+    assert not text_index.covers(subset)
+    assert text_filter.mask(subset).tolist() == [True, True]
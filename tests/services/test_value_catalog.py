@@ -0,0 +1,78 @@
+"""
+test_value_catalog.py
+
+Description: Tests for the incremental value -> count catalogs of DataFrameStore
+"""
+
+import pandas as pd
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.value_catalog import HAS_ITEMS, count_values
+
+
+@pytest.fixture
+def store() -> DataFrameStore:
+    """Create a store with a few entries."""
+    store = DataFrameStore()
+    store.set_entries(
+        pd.DataFrame(
+            {
+                "chest_type": ["Cobra Chest", "Elegant Chest", "Cobra Chest"],
+                "player": ["Moony", "Engelchen", "Moony"],
+                "source": ["Level 25 Crypt", "Level 20 Crypt", "Level 25 Crypt"],
+                "status": ["Pending", "Pending", "Valid"],
+                "validation_errors": [["Invalid player", {"type": "chest_type"}], [], []],
+            },
+            index=pd.Index([1, 2, 3], name="id"),
+        ),
+        emit_event=False,
+    )
+    return store
+
+
+def test_count_values_flattens_lists():
+    """Test that list cells are flattened and counted under HAS_ITEMS."""
+    counts = count_values(pd.Series([["a", "b"], ["a", "a"], [], None]))
+
+    assert counts == {"a": 2, "b": 1, HAS_ITEMS: 2}
+
+
+def test_catalog_counts(store):
+    """Test the initial catalogs."""
+    assert store.get_value_counts("player") == {"Moony": 2, "Engelchen": 1}
+    assert store.get_value_counts("validation_errors") == {
+        "Invalid player": 1,
+        "chest_type": 1,
+        HAS_ITEMS: 1,
+    }
+    assert store.get_value_counts("missing") == {}
+
+
+def test_catalog_follows_deltas(store):
+    """Test that add, update and delete keep the catalog in sync with a rebuild."""
+    store.get_value_counts("player")
+    store.get_value_counts("validation_errors")
+
+    store.add_entry(
+        {"id": 4, "chest_type": "Rare", "player": "Feldjäger", "source": "Event"},
+        emit_event=False,
+    )
+    store.update_entry(1, {"player": "Engelchen", "validation_errors": []}, emit_event=False)
+    store.delete_entry(3, emit_event=False)
+
+    expected_players = {"Engelchen": 2, "Feldjäger": 1}
+    assert store.get_value_counts("player") == expected_players
+    assert store.get_value_counts("validation_errors") == {}
+    assert dict(count_values(store.get_entries()["player"])) == expected_players
+
+
+def test_set_entries_resets_catalog(store):
+    """Test that replacing the entries rebuilds the catalog."""
+    store.get_value_counts("player")
+    entries = store.get_entries()
+    entries["player"] = "Moony"
+
+    store.set_entries(entries, emit_event=False)
+
+    assert store.get_value_counts("player") == {"Moony": 3}
@@ -0,0 +1,106 @@
+"""
+test_warm_up.py
+
+Description: Tests for the background warm-up of correction rules and validation lists
+"""
+
+import threading
+
+import pytest
+
+from src.services.dataframe_store import DataFrameStore
+from src.services.file_service import FileService
+from src.services.warm_up import WarmUp
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Write a rules file and three validation lists."""
+    paths = {
+        "correction_rules": tmp_path / "rules.csv",
+        "player": tmp_path / "players.txt",
+        "chest_type": tmp_path / "chest_types.txt",
+        "source": tmp_path / "sources.csv",
+    }
+    paths["correction_rules"].write_text("From;To\nMoony;Moon\n", encoding="utf-8")
+    paths["player"].write_text("Moon\nEngelchen\n\n", encoding="utf-8")
+    paths["chest_type"].write_text("Cobra Chest\n", encoding="utf-8")
+    paths["source"].write_text("entry\nLevel 15 Crypt\nMercenary Exchange\n", encoding="utf-8")
+    return paths
+
+
+def test_warm_up_publishes_on_request(sources):
+    """Test that reads are stored only when published."""
+    store = DataFrameStore()
+    file_service = FileService(store)
+
+    warm_up = file_service.start_warm_up({**sources, "entries": sources["player"]})
+
+    assert sorted(warm_up.sources) == ["chest_type", "correction_rules", "player", "source"]
+    assert warm_up.wait() == dict.fromkeys(warm_up.sources, True)
+    assert not warm_up.is_loading
+    assert list(store.get_correction_rules()["to_text"]) == ["Moon"]
+    assert list(store.get_validation_list("player").index) == ["Moon", "Engelchen"]
+    assert len(store.get_validation_list("source")) == 2
+
+
+def test_load_waits_for_pending_warm_up(sources):
+    """Test that loading a file the warm-up is reading publishes the warm-up result."""
+    store = DataFrameStore()
+    file_service = FileService(store)
+    release = threading.Event()
+    reads = []
+
+    def read_validation_list(file_path):
+        reads.append(file_path)
+        release.wait(5)
+        return FileService.read_validation_list(file_path)
+
+    file_service.read_validation_list = read_validation_list
+    warm_up = file_service.start_warm_up({"player": sources["player"]})
+    assert warm_up.publish_ready() == {}
+    assert warm_up.is_pending("player")
+
+    release.set()
+    assert file_service.load_validation_list("player", sources["player"])
+
+    assert reads == [sources["player"]]
+    assert not warm_up.is_pending("player")
+    assert list(store.get_validation_list("player").index) == ["Moon", "Engelchen"]
+
+    # The published file is not read again while it and the stored list are unchanged
+    assert file_service.load_validation_list("player", sources["player"])
+    assert reads == [sources["player"]]
+
+
+def test_load_of_other_file_cancels_warm_up(sources, tmp_path):
+    """Test that loading a different file drops the stale warm-up result."""
+    store = DataFrameStore()
+    file_service = FileService(store)
+    other = tmp_path / "other_players.txt"
+    other.write_text("Sir Met\n", encoding="utf-8")
+
+    warm_up = file_service.start_warm_up({"player": sources["player"]})
+    assert file_service.load_validation_list("player", other)
+
+    assert warm_up.wait() == {}
+    assert list(store.get_validation_list("player").index) == ["Sir Met"]
+
+
+def test_failed_read_is_reported():
+    """Test that a failing read is logged and reported without raising."""
+    published = []
+
+    def fail():
+        raise OSError("unreadable")
+
+    warm_up = WarmUp(
+        {"player": fail, "source": lambda: "ok"}, lambda *args: published.append(args) or True
+    )
+    finished = threading.Event()
+    warm_up.add_ready_callback(finished.set)
+    warm_up.start()
+
+    assert warm_up.wait() == {"player": False, "source": True}
+    assert published == [("source", "ok")]
+    assert finished.is_set()
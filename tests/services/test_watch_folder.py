@@ -0,0 +1,100 @@
+"""
+test_watch_folder.py
+
+Description: Tests for the polling folder watcher and its manifest
+"""
+
+import os
+import threading
+
+import pytest
+
+from src.services.watch_folder import FolderWatcher, WatchManifest
+
+
+@pytest.fixture
+def folder(tmp_path):
+    """Create an input folder with two exports and an unrelated file."""
+    folder = tmp_path / "input"
+    folder.mkdir()
+    for day in ("2025-03-17", "2025-03-18"):
+        (folder / f"chests_{day}.txt").write_text(
+            f"Cobra Chest\nFrom: Moony\nSource: {day}\n", encoding="utf-8"
+        )
+    (folder / "notes.txt").write_text("not an export", encoding="utf-8")
+    return folder
+
+
+def test_scan_reports_only_new_or_changed_files(folder, tmp_path):
+    """Test that processed files are skipped until their content changes, across restarts."""
+    manifest = WatchManifest(tmp_path / "manifest.json")
+    watcher = FolderWatcher(folder, manifest, settle_seconds=0)
+
+    pending = watcher.scan()
+    assert [item.path.name for item in pending] == [
+        "chests_2025-03-17.txt",
+        "chests_2025-03-18.txt",
+    ]
+    for item in pending:
+        manifest.record(item, entries=1)
+    assert manifest.save()
+
+    # A new manifest object reads the saved state
+    watcher = FolderWatcher(folder, WatchManifest(tmp_path / "manifest.json"), settle_seconds=0)
+    assert watcher.scan() == []
+
+    # Same content with a new mtime is not processed again
+    unchanged = folder / "chests_2025-03-17.txt"
+    os.utime(unchanged, (1_000_000_000, 1_000_000_000))
+    assert watcher.scan() == []
+    assert watcher.manifest.get(unchanged).mtime == 1_000_000_000
+
+    changed = folder / "chests_2025-03-18.txt"
+    changed.write_text("Cobra Chest\nFrom: Moon\nSource: X\n", encoding="utf-8")
+    (folder / "chests_2025-03-19.txt").write_text("Cobra Chest\nFrom: A\nSource: B\n")
+    assert [item.path.name for item in watcher.scan()] == [
+        "chests_2025-03-18.txt",
+        "chests_2025-03-19.txt",
+    ]
+
+
+def test_scan_waits_for_files_to_settle(folder, tmp_path):
+    """Test that files modified within the settle time are left for a later poll."""
+    watcher = FolderWatcher(folder, WatchManifest(tmp_path / "manifest.json"), settle_seconds=60)
+    assert watcher.scan() == []
+
+    for path in folder.iterdir():
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+    assert len(watcher.scan()) == 2
+
+
+def test_unreadable_manifest_starts_empty(tmp_path):
+    """Test that a corrupt manifest is ignored instead of stopping the watcher."""
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert len(WatchManifest(path)) == 0
+
+
+def test_watch_hands_batches_to_callback(folder, tmp_path):
+    """Test that watch calls the callback with new files and stops on request."""
+    manifest = WatchManifest(tmp_path / "manifest.json")
+    watcher = FolderWatcher(folder, manifest, interval=0.01, settle_seconds=0)
+    batches = []
+    stop = threading.Event()
+
+    def handle(pending):
+        batches.append([item.path.name for item in pending])
+        for item in pending:
+            manifest.record(item)
+        if len(batches) == 2:
+            stop.set()
+        else:
+            (folder / "chests_2025-03-19.txt").write_text("Cobra Chest\nFrom: A\nSource: B\n")
+
+    watcher.watch(handle, stop, max_polls=100)
+
+    assert batches == [
+        ["chests_2025-03-17.txt", "chests_2025-03-18.txt"],
+        ["chests_2025-03-19.txt"],
+    ]
@@ -0,0 +1,177 @@
+"""
+test_cli.py
+
+Description: Tests for the headless batch pipeline
+"""
+
+import argparse
+import configparser
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src import cli
+from src.cli import EXIT_ERROR, EXIT_OK, EXIT_THRESHOLD_EXCEEDED
+from src.services.correction_service import CorrectionService
+
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Create two export files, a rules file, a player list and a config without session cache."""
+    for day, player in [("2025-03-17", "Moony"), ("2025-03-18", "Sir Met")]:
+        text = f"Cobra Chest\nFrom: {player}\nSource: Level 15 Crypt\n"
+        text += "Cobra Chest\nFrom: Engelchen\nSource: Level 15 Crypt\n"
+        (tmp_path / f"chests_{day}.txt").write_text(text, encoding="utf-8")
+    (tmp_path / "rules.csv").write_text("From;To;Category\nMoony;Moon;player\n", encoding="utf-8")
+    (tmp_path / "players.txt").write_text("Moon\nEngelchen\n", encoding="utf-8")
+
+    config = configparser.ConfigParser()
+    config.read(ROOT / "config.ini", encoding="utf-8")
+    config["Session"] = {"cache_enabled": "false"}
+    with open(tmp_path / "config.ini", "w", encoding="utf-8") as f:
+        config.write(f)
+    return tmp_path
+
+
+def run_cli(inputs: Path, *args: str) -> subprocess.CompletedProcess:
+    """
+    Run the pipeline in a fresh interpreter on the test inputs.
+
+    Args:
+        inputs: Directory created by the inputs fixture
+        *args: Extra command line arguments; with --watch the inputs directory is watched
+
+    Returns:
+        The finished process
+    """
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "src.cli",
+            str(inputs) if "--watch" in args else str(inputs / "chests_*.txt"),
+            "--config",
+            str(inputs / "config.ini"),
+            "--rules",
+            str(inputs / "rules.csv"),
+            "--player-list",
+            str(inputs / "players.txt"),
+            "--output-dir",
+            str(inputs / "out"),
+            *args,
+        ],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=str(ROOT)),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def test_pipeline_exports_corrected_files(inputs):
+    """Test that every file is corrected, validated and exported on a process pool."""
+    result = run_cli(inputs, "--workers", "2")
+
+    assert result.returncode == EXIT_OK, result.stderr[-2000:]
+    stats = json.loads(result.stdout)
+    assert stats["totals"] == {
+        "files": 2,
+        "failed_files": 0,
+        "entries": 4,
+        "corrections": 1,
+        "correction_errors": 0,
+        "valid": 3,
+        "invalid": 1,
+        "invalid_ratio": 0.25,
+    }
+    assert stats["workers"] == 2
+    assert stats["thresholds_exceeded"] == []
+
+    exported = pd.read_csv(inputs / "out" / "chests_2025-03-17_corrected.csv")
+    assert list(exported["player"]) == ["Moon", "Engelchen"]
+
+
+def test_threshold_sets_exit_status(inputs):
+    """Test that too many invalid entries exit with a failure status and keep the stats."""
+    stats_path = inputs / "stats.json"
+    result = run_cli(inputs, "--max-invalid-ratio", "0.2", "--stats", str(stats_path))
+
+    assert result.returncode == EXIT_THRESHOLD_EXCEEDED
+    assert json.loads(result.stdout)["thresholds_exceeded"] == [
+        "25.00% invalid entries (max 20.00%)"
+    ]
+    assert json.loads(stats_path.read_text(encoding="utf-8")) == json.loads(result.stdout)
+
+
+def test_correction_errors_fail_the_batch(inputs, monkeypatch):
+    """Test that corrections failing on single entries are counted and fail the batch."""
+    monkeypatch.setattr(
+        CorrectionService,
+        "apply_corrections",
+        lambda self: {"applied": 1, "errors": 2, "total": 2},
+    )
+    monkeypatch.setattr(cli, "_worker_inputs", {})
+    result, _ = cli.process_file(
+        str(inputs / "chests_2025-03-17.txt"), str(inputs / "out.csv"), "csv"
+    )
+    assert (result.corrections, result.correction_errors, result.error) == (1, 2, None)
+
+    summary = cli.summarize([result], 0.0, 1)
+    args = argparse.Namespace(max_invalid=None, max_invalid_ratio=None, stats=None)
+    assert summary["totals"]["correction_errors"] == 2
+    assert cli._report(summary, args) == EXIT_ERROR
+
+
+def test_unreadable_file_fails_without_qt(inputs):
+    """Test that a file without entries is reported, and that the pipeline never loads Qt."""
+    (inputs / "chests_2025-03-19.txt").write_text("not an export\n", encoding="utf-8")
+    result = run_cli(inputs, "--workers", "1")
+
+    assert result.returncode == EXIT_ERROR
+    files = json.loads(result.stdout)["files"]
+    assert [file["error"] for file in files] == [None, None, "no entries loaded"]
+
+    imports_qt = subprocess.run(
+        [sys.executable, "-c", "import sys, src.cli; print('PySide6' in sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert imports_qt.stdout.strip() == "False"
+
+
+def test_watch_once_appends_only_new_or_changed_files(inputs):
+    """Test that watch mode appends each new or changed file to the history once."""
+    watch_args = ["--watch", "--once", "--settle", "0", "--manifest", str(inputs / "m.json")]
+    watch_args += ["--db", str(inputs / "history.db")]
+
+    first = run_cli(inputs, *watch_args)
+    assert first.returncode == EXIT_OK, first.stderr[-2000:]
+    assert json.loads(first.stdout)["totals"]["files"] == 2
+
+    second = run_cli(inputs, *watch_args)
+    assert json.loads(second.stdout)["totals"]["files"] == 0
+
+    (inputs / "chests_2025-03-18.txt").write_text(
+        "Cobra Chest\nFrom: Moony\nSource: Level 15 Crypt\n", encoding="utf-8"
+    )
+    third = run_cli(inputs, *watch_args)
+    assert [file["corrections"] for file in json.loads(third.stdout)["files"]] == [1]
+
+    with sqlite3.connect(inputs / "history.db") as connection:
+        imports = connection.execute("SELECT origin, entry_count FROM imports").fetchall()
+        players = connection.execute("SELECT player FROM entries ORDER BY date, row_id").fetchall()
+    assert [(Path(origin).name, count) for origin, count in imports] == [
+        ("chests_2025-03-17.txt", 2),
+        ("chests_2025-03-18.txt", 1),
+    ]
+    assert [player for (player,) in players] == ["Moon", "Engelchen", "Moon"]
@@ -0,0 +1,97 @@
+"""
+test_logging_config.py
+
+Description: Tests for the background logging setup and sampled hot loop logging
+"""
+
+import logging
+import logging.handlers
+import sys
+
+import pytest
+
+from src.utils.logging_config import LogSampler, configure_logging, stop_logging
+
+
+@pytest.fixture
+def restore_logging():
+    """Restore the root logger and excepthook changed by configure_logging."""
+    root_logger = logging.getLogger()
+    handlers, level, excepthook = list(root_logger.handlers), root_logger.level, sys.excepthook
+    yield root_logger
+    stop_logging()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    for handler in handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(level)
+    sys.excepthook = excepthook
+
+
+def test_records_are_written_by_background_listener(restore_logging, tmp_path, monkeypatch):
+    """Test that callers only queue records and the listener writes them to the log file."""
+    monkeypatch.chdir(tmp_path)
+    configure_logging(log_to_file=True, debug_mode=False)
+
+    assert [type(handler) for handler in restore_logging.handlers] == [
+        logging.handlers.QueueHandler
+    ]
+    logging.getLogger("test").info("Loaded %d entries", 42)
+    logging.getLogger("test").debug("Not written at INFO")
+    stop_logging()
+
+    (log_file,) = (tmp_path / "logs").glob("correction_tool_*.log")
+    text = log_file.read_text(encoding="utf-8")
+    assert "INFO - test - Loaded 42 entries" in text
+    assert "Not written" not in text
+
+
+class Unformattable:
+    """Argument that fails the test if it is ever formatted."""
+
+    def __str__(self):
+        raise AssertionError("argument was formatted")
+
+
+def test_sampler_logs_first_messages_and_a_count(caplog):
+    """Test that a sampler logs a sample, counts the rest, and skips disabled levels entirely."""
+    logger = logging.getLogger("test.sampler")
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        sampler = LogSampler(logger, "Applied correction", sample_size=2)
+        for index in range(5):
+            sampler.log("Applied correction %d", index)
+        sampler.flush()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Applied correction 0",
+        "Applied correction 1",
+        "3 more 'Applied correction' messages not logged",
+    ]
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        sampler = LogSampler(logger, "Applied correction")
+        sampler.log("Applied correction %s", Unformattable())
+        sampler.flush()
+    assert caplog.records == []
+
+
+def test_broken_rule_errors_are_sampled(caplog, monkeypatch):
+    """Test that a rule failing on every entry logs a sample and a count, not one line per entry."""
+    from src.models.chest_entry import ChestEntry
+    from src.models.correction_rule import CorrectionRule
+    from src.services.corrector import Corrector
+
+    def fail(self, value, rule):
+        raise ValueError("broken rule")
+
+    monkeypatch.setattr(Corrector, "_apply_rule_to_value", fail)
+    corrector = Corrector([CorrectionRule(from_text="Moony", to_text="Moon", category="player")])
+    entries = [ChestEntry(chest_type="Cobra Chest", player="Moony", source="Crypt")] * 50
+
+    with caplog.at_level(logging.ERROR):
+        corrector.apply_corrections(entries)
+
+    errors = [record.getMessage() for record in caplog.records]
+    assert len(errors) == 11
+    assert errors[-1] == "40 more 'Error applying rule' messages not logged"
@@ -96,7 +96,9 @@ def test_ui_setup(main_window):
     assert main_window._reports_btn is not None
     assert main_window._settings_btn is not None
 
-    # Check that content pages are created
+    # Check that content pages are created on first navigation
+    for page_index in range(main_window._content_widget.count()):
+        main_window._on_sidebar_button_clicked(page_index)
     assert main_window._dashboard is not None
     assert main_window._correction_manager is not None
     assert main_window._report_panel is not None
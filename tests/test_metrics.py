@@ -0,0 +1,101 @@
+"""
+test_metrics.py
+
+Description: Tests for the hot path metrics registry
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.interfaces.events import EventType
+from src.services.dataframe_store import DataFrameStore
+from src.services.event_manager import EventManager
+from src.utils.metrics import Histogram, instrumented, metrics, timed
+
+
+@pytest.fixture
+def recording():
+    """Record metrics from a clean registry, switching recording off afterwards."""
+    metrics.reset()
+    metrics.enable()
+    yield metrics
+    metrics.disable()
+    metrics.reset()
+
+
+def test_histogram_statistics():
+    """Test that a histogram keeps count, sum and extremes, and estimates percentiles."""
+    histogram = Histogram("parse", unit="ms", buckets=(1, 10, 100))
+    assert histogram.percentile(50) is None
+
+    for value in [0.5, 2, 3, 4, 50]:
+        histogram.observe(value)
+
+    stats = histogram.snapshot()
+    assert (stats["count"], stats["total"], stats["min"], stats["max"]) == (5, 59.5, 0.5, 50)
+    assert stats["mean"] == pytest.approx(11.9)
+    assert (stats["p50"], stats["p90"], stats["p99"]) == (10, 50, 50)
+
+
+def test_timed_methods_are_wrapped_only_while_enabled():
+    """Test that timed methods are the originals while disabled and record while enabled."""
+
+    @instrumented
+    class Job:
+        @timed("job")
+        def run(self, fail=False):
+            if fail:
+                raise ValueError("failed")
+            return "done"
+
+        @classmethod
+        @timed("job.kind", key=lambda cls, kind: kind)
+        def run_kind(cls, kind):
+            return kind
+
+    original = Job.run
+    metrics.reset()
+    assert Job().run() == "done"
+    assert metrics.snapshot()["histograms"] == {}
+
+    metrics.enable()
+    try:
+        assert Job.run is not original
+        Job().run()
+        with pytest.raises(ValueError):
+            Job().run(fail=True)
+        assert Job.run_kind("a") == "a"
+        snapshot = metrics.snapshot()
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+    assert Job.run is original
+    assert snapshot["histograms"]["job"]["count"] == 2
+    assert snapshot["histograms"]["job"]["unit"] == "ms"
+    assert snapshot["histograms"]["job.kind.a"]["count"] == 1
+    assert snapshot["counters"] == {"job.errors": 1}
+
+
+def test_store_and_events_are_instrumented(recording, tmp_path):
+    """Test that store mutators and events are timed per method and event type."""
+    store = DataFrameStore()
+    store.subscribe(EventType.ENTRIES_UPDATED, lambda data: None)
+    store.set_entries(
+        pd.DataFrame(
+            {
+                "chest_type": ["Cobra Chest"],
+                "player": ["Moony"],
+                "source": ["X"],
+                "status": ["Pending"],
+            }
+        )
+    )
+    EventManager.emit(EventType.VALIDATION_COMPLETED, {})
+
+    histograms = json.loads(recording.dump(tmp_path / "metrics.json").read_text())["histograms"]
+    assert histograms["DataFrameStore.set_entries"]["count"] == 1
+    assert histograms["DataFrameStore.emit.ENTRIES_UPDATED"]["count"] == 1
+    assert histograms["EventManager.emit.VALIDATION_COMPLETED"]["count"] == 1
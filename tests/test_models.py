@@ -4,6 +4,8 @@ test_models.py
 Description: Tests for data models
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 from src.models.chest_entry import ChestEntry
 from src.models.correction_rule import CorrectionRule
@@ -151,3 +153,86 @@ class TestValidationList:
 
         is_valid, _, _ = player_list.is_valid("Unknown")
         assert is_valid is False
+
+    def test_is_valid_case_insensitive_lookup(self) -> None:
+        """Test that the lowercase index follows adds, removes and reassignment."""
+        config = MagicMock()
+        config.get_bool.return_value = False
+        player_list = ValidationList(list_type="player", entries=["Moony"], config_manager=config)
+
+        assert player_list.is_valid("  mOONY ") == (True, 1.0, None)
+
+        player_list.add_entry("moony")
+        player_list.remove_entry("Moony")
+        assert player_list.is_valid("MOONY")[0] is True
+
+        player_list.entries = ["Engelchen"]
+        assert player_list.is_valid("moony")[0] is False
+        assert player_list.is_valid("engelchen")[0] is True
+
+    def test_case_sensitive_setting_is_cached(self) -> None:
+        """Test that the config is read once per config revision."""
+        config = MagicMock()
+        config.revision = 1
+        config.get_bool.return_value = True
+        player_list = ValidationList(list_type="player", entries=["Moony"], config_manager=config)
+
+        assert player_list.is_valid("moony")[0] is False
+        assert player_list.is_valid("Moony")[0] is True
+        assert config.get_bool.call_count == 1
+
+        config.revision = 2
+        config.get_bool.return_value = False
+        assert player_list.is_valid("moony")[0] is True
+        assert config.get_bool.call_count == 2
+
+    def test_case_sensitive_setting_without_revision(self) -> None:
+        """Test that configs without a revision are read again on every call."""
+        config = MagicMock(spec=["get_bool", "get_float"])
+        config.get_bool.return_value = True
+        player_list = ValidationList(list_type="player", entries=["Moony"], config_manager=config)
+
+        assert player_list.is_valid("moony")[0] is False
+
+        config.get_bool.return_value = False
+        assert player_list.is_valid("moony")[0] is True
+
+    def test_entries_are_read_only(self) -> None:
+        """Test that entries cannot be changed past the lookup index."""
+        config = MagicMock()
+        config.get_bool.return_value = False
+        player_list = ValidationList(list_type="player", entries=["Moony"], config_manager=config)
+
+        assert isinstance(player_list.entries, frozenset)
+        with pytest.raises(AttributeError):
+            player_list.entries.add("Engelchen")
+
+        player_list.add_entry("Engelchen")
+        assert player_list.entries == {"Moony", "Engelchen"}
+        assert player_list.is_valid("engelchen")[0] is True
+
+    def test_validate_many(self) -> None:
+        """Test batch validation with fuzzy matching only for misses."""
+        config = MagicMock()
+        config.get_bool.return_value = False
+        config.get_float.return_value = 80
+        player_list = ValidationList(
+            list_type="player",
+            entries=["Engelchen", "Moony"],
+            use_fuzzy_matching=True,
+            config_manager=config,
+        )
+
+        with patch.object(
+            player_list.fuzzy_matcher,
+            "find_best_match",
+            wraps=player_list.fuzzy_matcher.find_best_match,
+        ) as find_best_match:
+            results = player_list.validate_many(["moony", "Engelchn", "", "Engelchn", "Unknown"])
+
+        assert results[0] == (True, 1.0, None)
+        assert results[1][0] is True and results[1][2] == "Engelchen"
+        assert results[2] == (False, 0.0, None)
+        assert results[3] == results[1]
+        assert results[4][0] is False
+        assert find_best_match.call_count == 2
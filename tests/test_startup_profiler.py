@@ -0,0 +1,91 @@
+"""
+test_startup_profiler.py
+
+Description: Tests for the startup trace mode
+"""
+
+import json
+import logging
+import threading
+
+from src.utils import startup_profiler
+from src.utils.startup_profiler import StartupProfiler, parse_import_times, profile_phase
+
+
+# -X importtime output of "import a" (importing a.b, which imports c) and "import d"
+IMPORT_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     c
+import time:       200 |        300 |   a.b
+import time:       400 |        700 | a
+some other error output
+import time:        50 |         50 | d
+"""
+
+
+def test_parse_import_times():
+    """Test that nested imports become children of the import that triggered them."""
+    records = parse_import_times(IMPORT_LOG.splitlines())
+
+    assert [(record.name, record.cumulative_us) for record in records] == [("a", 700), ("d", 50)]
+    (a_b,) = records[0].children
+    assert (a_b.name, a_b.self_us, a_b.depth) == ("a.b", 200, 1)
+    assert [child.name for child in a_b.children] == ["c"]
+
+
+def test_trace_and_summary(tmp_path, caplog):
+    """Test that phases and imports are written as a Chrome trace and logged as a table."""
+    import_log = tmp_path / "importtime.log"
+    import_log.write_text(IMPORT_LOG, encoding="utf-8")
+    profiler = StartupProfiler(import_log)
+
+    with profiler.phase("bootstrap"):
+        # An import finishing during the phase
+        with open(import_log, "a", encoding="utf-8") as f:
+            f.write("import time:        10 |         10 | e\n")
+
+    def read():
+        with profiler.phase("read"):
+            pass
+
+    worker = threading.Thread(target=read, name="reader")
+    worker.start()
+    worker.join()
+
+    with caplog.at_level(logging.INFO, logger=startup_profiler.__name__):
+        trace_path = profiler.finish(tmp_path / "trace.json")
+
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    spans = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert set(spans) == {"a", "a.b", "c", "d", "e", "bootstrap", "read"}
+    assert min(event["ts"] for event in spans.values()) == 0
+    # Imports done before profiling end where the first phase may start
+    assert spans["d"]["ts"] + spans["d"]["dur"] <= spans["bootstrap"]["ts"]
+    assert spans["e"]["ts"] == spans["bootstrap"]["ts"]
+    assert spans["c"]["tid"] == spans["a"]["tid"] != spans["bootstrap"]["tid"]
+
+    thread_names = {event["args"]["name"] for event in trace["traceEvents"] if event["ph"] == "M"}
+    assert thread_names == {"imports", "main", "reader"}
+
+    summary = caplog.records[-1].getMessage()
+    assert "imports before profiling" in summary
+    assert "bootstrap" in summary
+    assert "Slowest imports" in summary
+
+
+def test_profile_phase_is_noop_when_off():
+    """Test that profile_phase only records while profiling is on."""
+    assert startup_profiler.get_profiler() is None
+    with profile_phase("ignored"):
+        pass
+
+    profiler = startup_profiler.start_profiling()
+    try:
+        with profile_phase("recorded", page="dashboard"):
+            pass
+    finally:
+        assert startup_profiler.stop_profiling() is profiler
+
+    trace = profiler.to_trace()
+    (event,) = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert (event["name"], event["args"]) == ("recorded", {"page": "dashboard"})
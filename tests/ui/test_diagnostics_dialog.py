@@ -0,0 +1,38 @@
+"""
+test_diagnostics_dialog.py
+
+Description: Tests for the hidden metrics dialog
+"""
+
+import json
+
+from src.ui.diagnostics_dialog import DiagnosticsDialog
+from src.utils.metrics import metrics
+
+
+def test_dialog_lists_and_saves_metrics(qapp, tmp_path):
+    """Test that the dialog shows recorded metrics, slowest first, and writes them as JSON."""
+    metrics.reset()
+    dialog = DiagnosticsDialog()
+    try:
+        dialog._record_checkbox.setChecked(True)
+        assert metrics.enabled
+
+        metrics.histogram("fast", "ms").observe(1.0)
+        metrics.histogram("slow", "ms").observe(20.0)
+        metrics.counter("hits").inc(3)
+        dialog.refresh()
+
+        names = [dialog._table.item(row, 0).text() for row in range(dialog._table.rowCount())]
+        assert names == ["slow", "fast", "hits"]
+        assert dialog._table.item(0, 2).text() == "20.00 ms"
+
+        dialog._on_save(str(tmp_path / "metrics.json"))
+        saved = json.loads((tmp_path / "metrics.json").read_text(encoding="utf-8"))
+        assert saved["counters"] == {"hits": 3}
+    finally:
+        dialog._record_checkbox.setChecked(False)
+        metrics.reset()
+        dialog.deleteLater()
+
+    assert not metrics.enabled
@@ -0,0 +1,110 @@
+"""
+test_import_worker.py
+
+Description: Tests for the cancellable background entry import
+"""
+
+import threading
+
+import pytest
+
+from src.models.correction_rule import CorrectionRule
+from src.services.dataframe_store import DataFrameStore
+from src.ui.helpers.import_worker import (
+    STAGE_CORRECTING,
+    STAGE_READING,
+    ImportContext,
+    ImportController,
+    correction_stage,
+    read_entry_files,
+)
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    """Create two daily export files."""
+    for day, player in [("2025-03-17", "Engelchen"), ("2025-03-18", "Moony")]:
+        text = f"Cobra Chest\nFrom: {player}\nSource: Level 15 Crypt\n" * 500
+        (tmp_path / f"chests_{day}.txt").write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def controller(qapp):
+    """Create an import controller and wait for its worker on teardown."""
+    controller = ImportController()
+    yield controller
+    controller.cancel()
+    controller.wait_for_done()
+
+
+def test_read_reports_bytes_and_entries(input_dir):
+    """Test that reading reports every byte and entry and tags rows with file dates."""
+    updates = []
+    context = ImportContext(threading.Event(), updates.append)
+
+    outcome = read_entry_files(input_dir, context)
+
+    total = sum(path.stat().st_size for path in input_dir.glob("*.txt"))
+    assert updates[-1].bytes_read == updates[-1].total_bytes == total
+    assert updates[-1].entries_parsed == 1000
+    assert len(outcome.entries) == len(outcome.entries_df) == 1000
+    assert list(outcome.entries_df["date"].iloc[[0, 999]]) == ["2025-03-17", "2025-03-18"]
+    assert [e.id for e in outcome.entries] == list(outcome.entries_df.index)
+
+
+def test_finished_outcome_is_published_once(controller, input_dir, qtbot):
+    """Test that the outcome arrives on the GUI thread and goes into the store in one step."""
+    store = DataFrameStore()
+    version = store.get_entries_version()
+    stages = []
+    controller.progress.connect(lambda progress: stages.append(progress.stage))
+    rule = CorrectionRule(from_text="Moony", to_text="Moon", category="player")
+
+    with qtbot.waitSignal(controller.finished, timeout=5000) as blocker:
+        controller.start(input_dir, [correction_stage([rule])])
+    outcome = blocker.args[0]
+    store.set_entries(outcome.entries_df, source="import")
+
+    entries = store.get_entries()
+    assert store.get_entries_version() == version + 1
+    assert stages[0] == STAGE_READING and stages[-1] == STAGE_CORRECTING
+    assert set(entries["player"]) == {"Engelchen", "Moon"}
+    assert entries["original_values"].iloc[-1] == {"player": "Moony"}
+    assert not controller.is_running()
+
+
+def test_cancel_stops_worker(controller, input_dir, qtbot):
+    """Test that a cancelled import reports cancellation and never finishes."""
+    started = threading.Event()
+    release = threading.Event()
+    finished = []
+    controller.finished.connect(finished.append)
+
+    def blocking_stage(outcome, context):
+        started.set()
+        release.wait(5)
+        context.check_cancelled()
+
+    controller.start(input_dir, [("validating", blocking_stage)])
+    assert started.wait(5)
+
+    with qtbot.waitSignal(controller.cancelled, timeout=5000):
+        controller.cancel()
+        release.set()
+
+    assert finished == []
+    assert not controller.is_running()
+
+
+def test_new_import_supersedes_running_one(controller, input_dir, qtbot):
+    """Test that only the result of the latest import is delivered."""
+    finished = []
+    controller.finished.connect(finished.append)
+
+    controller.start(input_dir)
+    with qtbot.waitSignal(controller.finished, timeout=5000):
+        controller.start(input_dir / "chests_2025-03-18.txt")
+    qtbot.wait(50)
+
+    assert [len(outcome.entries) for outcome in finished] == [500]
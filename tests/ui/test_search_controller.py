@@ -0,0 +1,152 @@
+"""
+test_search_controller.py
+
+Description: Tests for the debounced, cancellable search controller
+"""
+
+import threading
+
+import pytest
+from PySide6.QtCore import QStringListModel
+
+from src.ui.helpers.search_controller import (
+    RowSetFilterProxyModel,
+    SearchController,
+    match_rows,
+)
+
+
+@pytest.fixture
+def controller(qapp):
+    """Create a search controller with a short debounce and cached columns."""
+    controller = SearchController(debounce_ms=20)
+    controller.set_columns(
+        {
+            "player": ["Engelchen", "Moony", "Feldjäger", "Moonlight"],
+            "chest_type": ["Cobra Chest", "Elegant Chest", "Cobra Chest", "Barbarian Chest"],
+        }
+    )
+    yield controller
+    controller.cancel()
+    controller.wait_for_done()
+
+
+def test_match_rows_is_case_insensitive():
+    """Test that matching uses the lowercase cache."""
+    columns = [["engelchen", "moony"], ["cobra chest", "elegant chest"]]
+    assert match_rows(columns, "MOON") == {1}
+    assert match_rows(columns, "chest") == {0, 1}
+    assert match_rows(columns, "missing") == set()
+
+
+def test_match_rows_cancelled():
+    """Test that a cancelled scan returns None."""
+    cancel_event = threading.Event()
+    cancel_event.set()
+    assert match_rows([["a", "b"]], "a", cancel_event) is None
+
+
+def test_search_is_debounced(controller, qtbot):
+    """Test that only the last text of a burst of keystrokes is searched."""
+    results = []
+    controller.results_ready.connect(lambda text, rows: results.append((text, rows)))
+
+    for text in ["m", "mo", "moo", "moon"]:
+        controller.search(text)
+
+    qtbot.waitUntil(lambda: len(results) > 0, timeout=2000)
+    qtbot.wait(50)
+
+    assert results == [("moon", {1, 3})]
+
+
+def test_empty_search_shows_all_rows(controller, qtbot):
+    """Test that an empty search yields None (no filtering)."""
+    with qtbot.waitSignal(controller.results_ready, timeout=2000) as blocker:
+        controller.search("")
+    assert blocker.args == ["", None]
+
+
+def test_set_columns_reruns_current_search(controller, qtbot):
+    """Test that new data is searched with the current text."""
+    controller.search_now("cobra")
+
+    with qtbot.waitSignal(controller.results_ready, timeout=2000) as blocker:
+        controller.set_columns({"player": ["Cobra", "Other"]})
+    assert blocker.args == ["cobra", {0}]
+
+
+def test_proxy_applies_row_set(qapp):
+    """Test that the proxy shows exactly the given rows."""
+    proxy = RowSetFilterProxyModel()
+    proxy.setSourceModel(QStringListModel(["a", "b", "c"]))
+
+    proxy.set_visible_rows({0, 2})
+    assert proxy.rowCount() == 2
+
+    proxy.set_visible_rows(None)
+    assert proxy.rowCount() == 3
+
+
+def visible_from_texts(table) -> list:
+    """Get the from_text of the rules a CorrectionRulesTable shows, in row order."""
+    model = table._model
+    rules = model.get_rules()
+    return [rules[row].from_text for row in range(len(rules)) if model.filterAcceptsRow(row, None)]
+
+
+def test_rules_table_filter_follows_rule_changes(qapp, qtbot):
+    """Test that deleting, adding and editing rules under an active filter re-runs the search."""
+    from src.models.correction_rule import CorrectionRule
+    from src.ui.correction_rules_table import CorrectionRulesTable
+
+    table = CorrectionRulesTable()
+    qtbot.addWidget(table)
+    table.set_rules(
+        [
+            CorrectionRule(from_text="Engelchen", to_text="Engel", category="player"),
+            CorrectionRule(from_text="Moony", to_text="Moon", category="player"),
+            CorrectionRule(from_text="Moonlight", to_text="Moon Light", category="player"),
+        ]
+    )
+    table.set_filter("moon")
+    table._search_controller.flush()
+    qtbot.waitUntil(lambda: visible_from_texts(table) == ["Moony", "Moonlight"])
+
+    table._model.delete_rule(0)
+    assert visible_from_texts(table) == ["Moony", "Moonlight"]
+
+    table._model.add_rule(CorrectionRule(from_text="Moonshine", to_text="Moon", category="player"))
+    assert visible_from_texts(table) == ["Moony", "Moonlight", "Moonshine"]
+
+    # An edit changes the rule in place and reports it with dataChanged
+    edited = table._model.get_rules()[0]
+    edited.from_text, edited.to_text = "Sir Met", "Sir Met"
+    table._model.dataChanged.emit(table._model.index(0, 0), table._model.index(0, 0))
+    assert visible_from_texts(table) == ["Moonlight", "Moonshine"]
+
+    table._search_controller.cancel()
+    table._search_controller.wait_for_done()
+
+
+def test_entry_table_search_follows_edits(qapp, qtbot):
+    """Test that an in-place edit is matched by the active search."""
+    from src.ui.enhanced_table_view import EnhancedTableView
+
+    view = EnhancedTableView(test_mode=True)
+    qtbot.addWidget(view)
+    view.set_entries(
+        [
+            {"id": 1, "chest_type": "Cobra Chest", "player": "Engelchen", "source": "Crypt"},
+            {"id": 2, "chest_type": "Cobra Chest", "player": "Moony", "source": "Crypt"},
+        ]
+    )
+    view.filter_entries("moon")
+    assert view.model().rowCount() == 1
+
+    source_model = view.model().sourceModel()
+    source_model.setData(source_model.index(0, 2), "Moonlight")
+    assert view.model().rowCount() == 2
+
+    source_model.setData(source_model.index(1, 2), "Sir Met")
+    assert view.model().rowCount() == 1
@@ -198,13 +198,13 @@ def test_export_all(mock_message_box, mock_file_dialog, control_panel, tmp_path)
 @patch("src.ui.widgets.validation_lists_control_panel.QMessageBox")
 def test_find_duplicates(mock_message_box, control_panel):
     """Test finding duplicate entries."""
-    # Add duplicate entries to lists
+    # Add an existing entry again (entries are a set, so it is not duplicated)
     player_list = control_panel._validation_lists["player"].get_list()
-    player_list.entries.append("Player1")  # Create duplicate
+    player_list.add_entry("Player1")
 
     # Add same entry to another list (cross-list duplicate)
     source_list = control_panel._validation_lists["source"].get_list()
-    source_list.entries.append("Player1")
+    source_list.add_entry("Player1")
 
     # Call find duplicates method
     control_panel._on_find_duplicates()